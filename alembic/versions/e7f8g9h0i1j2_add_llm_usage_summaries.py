@@ -0,0 +1,58 @@
+"""Add llm_usage_summaries table.
+
+Revision ID: e7f8g9h0i1j2
+Revises: d6e7f8g9h0i1
+Create Date: 2026-10-16
+
+Per-minute LLM usage (calls, retries, tokens, cost and latency) per call
+name, model, tenant and store, flushed from the in-memory aggregates in
+sandwich_bot/llm_usage.py.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e7f8g9h0i1j2"
+down_revision: Union[str, None] = "d6e7f8g9h0i1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the llm_usage_summaries table."""
+    op.create_table(
+        "llm_usage_summaries",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("minute", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("model", sa.String(), nullable=False),
+        sa.Column("tenant", sa.String(), nullable=True),
+        sa.Column("store_id", sa.String(), nullable=True),
+        sa.Column("calls", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("errors", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("retries", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("sessions", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("prompt_tokens", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("cached_tokens", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("completion_tokens", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("cost_usd", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("latency_total_ms", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("latency_p95_ms", sa.Float(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_llm_usage_summaries_id", "llm_usage_summaries", ["id"])
+    op.create_index("ix_llm_usage_summaries_minute", "llm_usage_summaries", ["minute"])
+    op.create_index("ix_llm_usage_summaries_name", "llm_usage_summaries", ["name"])
+    op.create_index("ix_llm_usage_summaries_store_id", "llm_usage_summaries", ["store_id"])
+
+
+def downgrade() -> None:
+    """Drop the llm_usage_summaries table."""
+    op.drop_index("ix_llm_usage_summaries_store_id", table_name="llm_usage_summaries")
+    op.drop_index("ix_llm_usage_summaries_name", table_name="llm_usage_summaries")
+    op.drop_index("ix_llm_usage_summaries_minute", table_name="llm_usage_summaries")
+    op.drop_index("ix_llm_usage_summaries_id", table_name="llm_usage_summaries")
+    op.drop_table("llm_usage_summaries")
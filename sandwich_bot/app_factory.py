@@ -14,6 +14,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from . import __version__
+from .llm_breaker import llm_breaker
 from .middleware import TenantMiddleware
 from .tenant import get_tenant_manager, TenantManager
 
@@ -124,6 +125,7 @@ def create_app(
             "version": __version__,
             "mode": mode,
             "tenant": tenant_slug,
+            "llm": llm_breaker.get_health(),
         }
 
     # Root redirect
@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Tuple
 
 from sandwich_bot.tasks.state_machine_adapter import (
     process_message_with_state_machine,
+    process_message_with_state_machine_async,
 )
 
 logger = logging.getLogger(__name__)
@@ -51,6 +52,32 @@ def process_voice_message(
     )
 
 
+async def process_voice_message_async(
+    user_message: str,
+    order_state: Dict[str, Any],
+    history: List[Dict[str, str]],
+    session_id: str,
+    menu_index: Dict[str, Any] = None,
+    store_info: Dict[str, Any] = None,
+    returning_customer: Dict[str, Any] = None,
+) -> Tuple[str, Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Async version of process_voice_message for async endpoints.
+
+    Same arguments and return value as process_voice_message.
+    """
+    logger.info("Using state machine for voice message (async)")
+    return await process_message_with_state_machine_async(
+        user_message=user_message,
+        order_state_dict=order_state,
+        history=history,
+        session_id=session_id,
+        menu_data=menu_index,
+        store_info=store_info,
+        returning_customer=returning_customer,
+    )
+
+
 def process_chat_message(
     user_message: str,
     order_state: Dict[str, Any],
@@ -38,7 +38,38 @@ Environment Variables:
 - RATE_LIMIT_ENABLED: Enable/disable rate limiting (default: "true")
 - SESSION_TTL_SECONDS: Session cache TTL (default: 3600)
 - SESSION_MAX_CACHE_SIZE: Max cached sessions (default: 1000)
+- PARSE_MEMO_MAX_SIZE: Max memoized parser results (default: 4096)
+- PARSE_MEMO_TTL_SECONDS: Memoized parser result TTL (default: 900)
+- PARSER_FAST_PATH_MIN_CONFIDENCE: Confidence needed to skip the LLM (default: 0.9)
+- PARSE_DEADLINE_MS: Deterministic parsing budget per turn (default: 250)
+- DETERMINISTIC_PARSE_MAX_CHARS: Longest input parsed without the LLM (default: 600)
+- OPEN_INPUT_SPECULATION_THRESHOLD: Fallback score to start the LLM early at (default: 0.5)
+- OPEN_INPUT_SPECULATION_MAX_WORKERS: Threads for speculative LLM calls (default: 8)
+- OPEN_INPUT_BATCH_EXTRACTION: Send only the missed parts of multi-item orders to the LLM (default: true)
 - MAX_MESSAGE_LENGTH: Max user message length (default: 2000)
+- LLM_TIMEOUT: LLM request read timeout in seconds (default: 60)
+- LLM_CONNECT_TIMEOUT: LLM connect timeout in seconds (default: 5)
+- LLM_MAX_CONNECTIONS: Open connections per LLM connection pool (default: 20)
+- LLM_MAX_KEEPALIVE_CONNECTIONS: Idle LLM connections kept open (default: 10)
+- LLM_KEEPALIVE_EXPIRY: Seconds an idle LLM connection stays open (default: 60)
+- LLM_BASE_URL: OpenAI-compatible API base URL, e.g. a local stand-in (default: "", the OpenAI API)
+- LLM_CACHE_PATH: SQLite file for the persistent LLM response cache (default: "", disabled)
+- LLM_CACHE_MODE: LLM response cache mode: readwrite, readonly or off (default: "readwrite")
+- LLM_CACHE_TTL_SECONDS: Cached LLM response TTL (default: 604800)
+- LLM_CACHE_MAX_ENTRIES: Max cached LLM responses (default: 50000)
+- LLM_TURN_BUDGET_SECONDS: LLM time allowed per chat turn (default: 15, 0 disables)
+- VOICE_LLM_TURN_BUDGET_SECONDS: LLM time allowed per voice turn (default: 5)
+- LLM_HEDGE_PERCENTILE: Latency percentile after which a hedged request is sent (default: 95, 0 disables)
+- LLM_HEDGE_MIN_SAMPLES: Latencies observed before hedging starts (default: 20)
+- LLM_LATENCY_WINDOW: Recent latencies kept per call type (default: 200)
+- LLM_USAGE_WINDOW_MINUTES: Minutes of LLM usage kept for the usage report (default: 60)
+- LLM_USAGE_RECENT_CALLS: Most recent LLM calls listed in the usage report (default: 200)
+- LLM_BREAKER_WINDOW_SECONDS: Seconds of LLM outcomes the circuit breaker judges (default: 60)
+- LLM_BREAKER_MIN_CALLS: LLM calls in the window before the breaker can open (default: 10)
+- LLM_BREAKER_ERROR_RATE: LLM error rate that opens the breaker (default: 0.5)
+- LLM_BREAKER_P95_SECONDS: p95 LLM latency that opens the breaker (default: 8, 0 disables)
+- LLM_BREAKER_OPEN_SECONDS: Seconds the breaker stays open before probing (default: 30)
+- LLM_BREAKER_PROBES: Successful probes needed to close the breaker (default: 2)
 - CORS_ORIGINS: Comma-separated allowed origins (default: "*")
 - ADMIN_USERNAME: Admin panel username (default: "admin")
 - ADMIN_PASSWORD: Admin panel password (required for admin access)
@@ -134,6 +165,46 @@ SESSION_TTL_SECONDS: int = int(os.getenv("SESSION_TTL_SECONDS", "3600"))  # 1 ho
 SESSION_MAX_CACHE_SIZE: int = int(os.getenv("SESSION_MAX_CACHE_SIZE", "1000"))
 
 
+# =============================================================================
+# Parse Memo Configuration
+# =============================================================================
+# Parser results are memoized across sessions (see parse_memo.py), keyed on the
+# normalized input, parser arguments and menu version.
+
+# Maximum number of memoized parser results (0 disables the memo)
+PARSE_MEMO_MAX_SIZE: int = int(os.getenv("PARSE_MEMO_MAX_SIZE", "4096"))
+
+# How long a memoized result stays valid (seconds)
+PARSE_MEMO_TTL_SECONDS: int = int(os.getenv("PARSE_MEMO_TTL_SECONDS", "900"))  # 15 minutes
+
+# Deterministic fast paths in front of the configuration-phase LLM parsers
+# (see tasks/parsers/fast_paths.py) answer without the LLM at or above this
+# confidence
+PARSER_FAST_PATH_MIN_CONFIDENCE: float = float(os.getenv("PARSER_FAST_PATH_MIN_CONFIDENCE", "0.9"))
+
+# Wall-clock budget for deterministic parsing within one turn (milliseconds,
+# 0 disables). When it runs out, the remaining sub-parsers are skipped and
+# the message falls back to the LLM (see tasks/parsers/parse_budget.py)
+PARSE_DEADLINE_MS: int = int(os.getenv("PARSE_DEADLINE_MS", "250"))
+
+# Longer messages skip deterministic parsing and go straight to the LLM.
+# A single regex cannot be interrupted, so this bounds the cost of each one
+DETERMINISTIC_PARSE_MAX_CHARS: int = int(os.getenv("DETERMINISTIC_PARSE_MAX_CHARS", "600"))
+
+# Open input predicted to need the LLM at or above this score (0-1) starts the
+# LLM request alongside deterministic parsing (see tasks/parsers/speculation.py).
+# Lower values hide more latency but spend more unneeded calls; above 1 disables
+OPEN_INPUT_SPECULATION_THRESHOLD: float = float(os.getenv("OPEN_INPUT_SPECULATION_THRESHOLD", "0.5"))
+
+# Threads that run speculative LLM calls for sync callers
+OPEN_INPUT_SPECULATION_MAX_WORKERS: int = int(os.getenv("OPEN_INPUT_SPECULATION_MAX_WORKERS", "8"))
+
+# Multi-item orders with parts no deterministic parser understands send only
+# those parts to the LLM, in one request, instead of the whole message (see
+# parse_open_input in tasks/parsers/llm_parsers.py)
+OPEN_INPUT_BATCH_EXTRACTION: bool = os.getenv("OPEN_INPUT_BATCH_EXTRACTION", "true").lower() == "true"
+
+
 # =============================================================================
 # Input Validation Configuration
 # =============================================================================
@@ -144,6 +215,113 @@ SESSION_MAX_CACHE_SIZE: int = int(os.getenv("SESSION_MAX_CACHE_SIZE", "1000"))
 MAX_MESSAGE_LENGTH: int = int(os.getenv("MAX_MESSAGE_LENGTH", "2000"))
 
 
+# =============================================================================
+# LLM Client Configuration
+# =============================================================================
+# Every LLM caller shares pooled, keep-alive API clients (see llm_clients.py),
+# so fallbacks reuse open connections instead of reconnecting each time.
+
+# Timeout for reading an LLM response (seconds)
+LLM_TIMEOUT_SECONDS: float = float(os.getenv("LLM_TIMEOUT", "60"))
+
+# Timeout for opening a connection to the LLM API (seconds)
+LLM_CONNECT_TIMEOUT_SECONDS: float = float(os.getenv("LLM_CONNECT_TIMEOUT", "5"))
+
+# Maximum open connections per pool; further requests wait for a free one
+LLM_MAX_CONNECTIONS: int = int(os.getenv("LLM_MAX_CONNECTIONS", "20"))
+
+# Idle connections kept open for reuse, and for how long (seconds)
+LLM_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "10"))
+LLM_KEEPALIVE_EXPIRY_SECONDS: float = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "60"))
+
+# Base URL of the OpenAI-compatible chat completions API. Point it at a local
+# stand-in (python -m sandwich_bot.llm_standin, e.g. "http://127.0.0.1:8100/v1")
+# to run without OpenAI. Empty uses the OpenAI API (or OPENAI_BASE_URL).
+LLM_BASE_URL: str | None = os.getenv("LLM_BASE_URL", "") or None
+
+
+# =============================================================================
+# LLM Response Cache Configuration
+# =============================================================================
+# LLM completions can be kept in a SQLite file (see llm_response_cache.py), so
+# restarted or new workers answer repeated utterances without an API call.
+
+# SQLite file for cached completions (empty disables the cache)
+LLM_CACHE_PATH: str = os.getenv("LLM_CACHE_PATH", "")
+
+# "readwrite", "readonly" (replay an existing file without changing it) or "off"
+LLM_CACHE_MODE: str = os.getenv("LLM_CACHE_MODE", "readwrite").lower()
+
+# How long a cached completion stays valid (seconds)
+LLM_CACHE_TTL_SECONDS: int = int(os.getenv("LLM_CACHE_TTL_SECONDS", "604800"))  # 7 days
+
+# Maximum cached completions; the least recently used are evicted beyond this
+LLM_CACHE_MAX_ENTRIES: int = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "50000"))
+
+
+# =============================================================================
+# LLM Latency Budget Configuration
+# =============================================================================
+# Each turn gets a deadline for its LLM calls (see llm_deadline.py). Requests
+# get the time left as their timeout, slow requests are hedged with a
+# duplicate, and a turn that runs out answers with a clarifying question.
+
+# LLM time allowed per turn (seconds, 0 disables the deadline)
+LLM_TURN_BUDGET_SECONDS: float = float(os.getenv("LLM_TURN_BUDGET_SECONDS", "15"))
+
+# Voice calls get a tighter budget, since a slow reply is dead air
+VOICE_LLM_TURN_BUDGET_SECONDS: float = float(os.getenv("VOICE_LLM_TURN_BUDGET_SECONDS", "5"))
+
+# A duplicate request is sent when the first is slower than this percentile
+# of recent latencies for the same call type (0 disables hedging)
+LLM_HEDGE_PERCENTILE: float = float(os.getenv("LLM_HEDGE_PERCENTILE", "95"))
+
+# Latencies observed for a call type before its requests are hedged
+LLM_HEDGE_MIN_SAMPLES: int = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+
+# Recent latencies kept per call type for the percentile
+LLM_LATENCY_WINDOW: int = int(os.getenv("LLM_LATENCY_WINDOW", "200"))
+
+
+# =============================================================================
+# LLM Usage Accounting Configuration
+# =============================================================================
+# Every LLM call's tokens, latency, retries and cost are aggregated per minute
+# in memory (see llm_usage.py) and reported at /admin/analytics/llm-usage.
+
+# Minutes of per-minute usage kept in memory
+LLM_USAGE_WINDOW_MINUTES: int = int(os.getenv("LLM_USAGE_WINDOW_MINUTES", "60"))
+
+# Individual calls kept for the report's list of recent calls
+LLM_USAGE_RECENT_CALLS: int = int(os.getenv("LLM_USAGE_RECENT_CALLS", "200"))
+
+
+# =============================================================================
+# LLM Circuit Breaker Configuration
+# =============================================================================
+# When the LLM provider fails or slows down, the circuit breaker (see
+# llm_breaker.py) stops sending requests for a while, and turns that needed
+# the LLM get a clarifying question instead of waiting out the timeout.
+
+# Seconds of recent LLM call outcomes the error rate and p95 are taken over
+LLM_BREAKER_WINDOW_SECONDS: float = float(os.getenv("LLM_BREAKER_WINDOW_SECONDS", "60"))
+
+# Calls in the window before the breaker can open, so a single failure can't
+LLM_BREAKER_MIN_CALLS: int = int(os.getenv("LLM_BREAKER_MIN_CALLS", "10"))
+
+# Fraction of calls in the window that failed or timed out to open at
+LLM_BREAKER_ERROR_RATE: float = float(os.getenv("LLM_BREAKER_ERROR_RATE", "0.5"))
+
+# p95 latency of calls in the window to open at (seconds, 0 disables)
+LLM_BREAKER_P95_SECONDS: float = float(os.getenv("LLM_BREAKER_P95_SECONDS", "8"))
+
+# How long the breaker stays open before letting a probe request through
+LLM_BREAKER_OPEN_SECONDS: float = float(os.getenv("LLM_BREAKER_OPEN_SECONDS", "30"))
+
+# Successful probes in a row needed to close the breaker again
+LLM_BREAKER_PROBES: int = int(os.getenv("LLM_BREAKER_PROBES", "2"))
+
+
 # =============================================================================
 # CORS Configuration
 # =============================================================================
@@ -0,0 +1,318 @@
+"""
+LLM Breaker - Latency-Aware Circuit Breaker for LLM Requests.
+
+The turn deadline (see llm_deadline.py) bounds how long one turn waits for
+the LLM. When the provider is down or degraded, though, every turn that
+needs the LLM still waits out its whole budget and then fails, and voice
+callers hear that as silence. The circuit breaker watches the outcomes of
+recent LLM calls and stops sending requests when the provider is unhealthy:
+
+- closed: requests go through; their outcomes are kept for
+  LLM_BREAKER_WINDOW_SECONDS
+- open: once the window has LLM_BREAKER_MIN_CALLS calls and their error
+  rate reaches LLM_BREAKER_ERROR_RATE, or their p95 latency reaches
+  LLM_BREAKER_P95_SECONDS, requests fail at once with ``LLMCircuitOpen``.
+  The state machine answers those turns with a clarifying question (see
+  ``OrderStateMachine._degraded_result``)
+- half-open: after LLM_BREAKER_OPEN_SECONDS, one request at a time is let
+  through as a probe. LLM_BREAKER_PROBES successful probes in a row close
+  the breaker; a failed or slow probe opens it again
+
+Errors that say nothing about the provider's health, such as a response that
+fails validation, a rejected request or a turn running out of LLM budget,
+don't count against it. Callers check the turn budget before the breaker
+(``check_turn_budget`` in llm_deadline.py), so a spent one never reaches it.
+
+There is one breaker for the process, since every caller shares the same
+provider and connection pool (see llm_clients.py). The parsers' completions
+(``_complete`` in llm_parsers.py), ``parse_user_message`` and sammy's calls
+all go through it.
+
+Usage:
+    from sandwich_bot.llm_breaker import llm_breaker
+
+    with llm_breaker.guard("OpenInputResponse"):
+        ...  # raises LLMCircuitOpen without running the block when open
+
+    llm_breaker.get_status()
+    # {"state": "open", "retry_in_seconds": 12.4, "trips": 1, ...}
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from .config import (
+    LLM_BREAKER_ERROR_RATE,
+    LLM_BREAKER_MIN_CALLS,
+    LLM_BREAKER_OPEN_SECONDS,
+    LLM_BREAKER_P95_SECONDS,
+    LLM_BREAKER_PROBES,
+    LLM_BREAKER_WINDOW_SECONDS,
+)
+from .llm_deadline import LLMDeadlineExceeded
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Exception class names the OpenAI and Anthropic SDKs use for requests that
+# never got a response
+_CONNECTION_ERRORS = {"APIConnectionError", "APITimeoutError", "ConnectError", "ReadTimeout", "ConnectTimeout"}
+_TIMEOUT_ERRORS = {"APITimeoutError", "ReadTimeout", "ConnectTimeout"}
+
+
+class LLMCircuitOpen(Exception):
+    """Raised instead of making an LLM request while the circuit breaker is open."""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"LLM circuit breaker is open; not sending {name} (retry in {retry_in:.1f}s)")
+        self.name = name
+        self.retry_in = retry_in
+
+
+def is_provider_failure(exc: BaseException) -> bool:
+    """Whether an exception from an LLM request says the provider is unhealthy."""
+    if isinstance(exc, LLMDeadlineExceeded):
+        # The turn ran out of budget, and a request given only what was left
+        # of it timing out says nothing about the provider. An error the
+        # provider returned first still counts
+        cause = exc.__cause__ or exc.__context__
+        return cause is not None and not _is_timeout(cause) and is_provider_failure(cause)
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    if type(exc).__name__ in _CONNECTION_ERRORS:
+        return True
+    status = getattr(exc, "status_code", None)
+    return isinstance(status, int) and (status >= 500 or status == 429)
+
+
+def _is_timeout(exc: BaseException) -> bool:
+    return isinstance(exc, TimeoutError) or type(exc).__name__ in _TIMEOUT_ERRORS
+
+
+class CircuitBreaker:
+    """
+    Opens on a high error rate or p95 latency over recent LLM calls.
+
+    Attributes:
+        state: "closed", "open" or "half_open"
+        trips: How many times the breaker has opened
+        rejected: Requests failed fast while open
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = LLM_BREAKER_WINDOW_SECONDS,
+        min_calls: int = LLM_BREAKER_MIN_CALLS,
+        error_rate: float = LLM_BREAKER_ERROR_RATE,
+        p95_seconds: float = LLM_BREAKER_P95_SECONDS,
+        open_seconds: float = LLM_BREAKER_OPEN_SECONDS,
+        probes: int = LLM_BREAKER_PROBES,
+    ):
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.p95_seconds = p95_seconds
+        self.open_seconds = open_seconds
+        self.probes = probes
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Close the breaker and forget every outcome and count."""
+        with self._lock:
+            self.state = CLOSED
+            self.changed_at = time.monotonic()
+            self.reason: str | None = None
+            self.trips = 0
+            self.rejected = 0
+            # (finished at, failed, latency in seconds or None) per call
+            self._outcomes: deque[tuple[float, bool, float | None]] = deque()
+            self._probe_in_flight = False
+            self._probe_successes = 0
+
+    # -------------------------------------------------------------------------
+    # State
+    # -------------------------------------------------------------------------
+
+    def _set_state(self, state: str, reason: str | None = None) -> None:
+        logger.warning(
+            "LLM circuit breaker %s -> %s%s", self.state, state, f" ({reason})" if reason else "",
+        )
+        self.state = state
+        self.changed_at = time.monotonic()
+        self.reason = reason
+        self._probe_in_flight = False
+        self._probe_successes = 0
+        if state == OPEN:
+            self.trips += 1
+            self._outcomes.clear()
+
+    def _prune(self, now: float) -> None:
+        while self._outcomes and self._outcomes[0][0] < now - self.window_seconds:
+            self._outcomes.popleft()
+
+    def _p95(self) -> float | None:
+        latencies = sorted(latency for _, _, latency in self._outcomes if latency is not None)
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, math.ceil(0.95 * len(latencies)) - 1)]
+
+    def _trip_reason(self) -> str | None:
+        calls = len(self._outcomes)
+        if calls < self.min_calls:
+            return None
+        errors = sum(1 for _, failed, _ in self._outcomes if failed)
+        if errors / calls >= self.error_rate:
+            return f"error rate {errors}/{calls}"
+        p95 = self._p95()
+        if self.p95_seconds and p95 is not None and p95 >= self.p95_seconds:
+            return f"p95 latency {p95:.1f}s"
+        return None
+
+    def _retry_in(self, now: float) -> float:
+        return max(0.0, self.changed_at + self.open_seconds - now)
+
+    # -------------------------------------------------------------------------
+    # Calls
+    # -------------------------------------------------------------------------
+
+    def acquire(self, name: str) -> bool:
+        """
+        Ask to send a request.
+
+        Returns:
+            True if the request is a half-open probe
+
+        Raises:
+            LLMCircuitOpen: If the breaker is open, or half-open with a probe
+                already in flight
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self.state == OPEN and self._retry_in(now) == 0:
+                self._set_state(HALF_OPEN)
+            if self.state == CLOSED:
+                return False
+            if self.state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.rejected += 1
+            retry_in = self._retry_in(now) if self.state == OPEN else 0.0
+        raise LLMCircuitOpen(name, retry_in)
+
+    def record(self, failed: bool, latency: float | None, probe: bool = False) -> None:
+        """
+        Record the outcome of a request let through by ``acquire``.
+
+        Args:
+            failed: Whether the provider failed or timed out
+            latency: Seconds the request took, or None to not judge its latency
+            probe: Whether ``acquire`` returned True for the request
+        """
+        now = time.monotonic()
+        slow = bool(self.p95_seconds and latency is not None and latency >= self.p95_seconds)
+        with self._lock:
+            if probe:
+                if self.state != HALF_OPEN:
+                    return
+                self._probe_in_flight = False
+                if failed or slow:
+                    self._set_state(OPEN, "probe failed" if failed else f"probe took {latency:.1f}s")
+                    return
+                self._probe_successes += 1
+                if self._probe_successes >= self.probes:
+                    self._set_state(CLOSED)
+                return
+
+            if self.state != CLOSED:
+                return
+            self._outcomes.append((now, failed, latency))
+            self._prune(now)
+            reason = self._trip_reason()
+            if reason is not None:
+                self._set_state(OPEN, reason)
+
+    @contextmanager
+    def guard(self, name: str, timed: bool = True) -> Iterator[None]:
+        """
+        Run an LLM request through the breaker and record how it went.
+
+        Args:
+            name: Call type, for the LLMCircuitOpen message
+            timed: Whether the block's duration counts toward the p95 (a
+                stream's duration depends on the length of the reply)
+
+        Raises:
+            LLMCircuitOpen: Instead of running the block, when open
+        """
+        probe = self.acquire(name)
+        started = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            failed = isinstance(e, Exception) and is_provider_failure(e)
+            if failed or probe:
+                self.record(failed, time.monotonic() - started if timed else None, probe)
+            raise
+        self.record(False, time.monotonic() - started if timed else None, probe)
+
+    # -------------------------------------------------------------------------
+    # Status
+    # -------------------------------------------------------------------------
+
+    def get_status(self) -> dict[str, Any]:
+        """
+        Get the breaker's state, recent outcomes and thresholds.
+
+        Returns:
+            Dict with "state", "reason" it opened, "seconds_in_state",
+            "retry_in_seconds" while open, "trips", "rejected", and the
+            "window" of recent calls with their error rate and p95 latency.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self.state == OPEN and self._retry_in(now) == 0:
+                # Probing starts with the next request; report it already
+                self._set_state(HALF_OPEN)
+            self._prune(now)
+            calls = len(self._outcomes)
+            errors = sum(1 for _, failed, _ in self._outcomes if failed)
+            p95 = self._p95()
+            return {
+                "state": self.state,
+                "reason": self.reason,
+                "seconds_in_state": round(now - self.changed_at, 1),
+                "retry_in_seconds": round(self._retry_in(now), 1) if self.state == OPEN else None,
+                "trips": self.trips,
+                "rejected": self.rejected,
+                "window": {
+                    "calls": calls,
+                    "errors": errors,
+                    "error_rate": round(errors / calls, 4) if calls else 0.0,
+                    "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+                },
+                "thresholds": {
+                    "window_seconds": self.window_seconds,
+                    "min_calls": self.min_calls,
+                    "error_rate": self.error_rate,
+                    "p95_seconds": self.p95_seconds,
+                    "open_seconds": self.open_seconds,
+                    "probes": self.probes,
+                },
+            }
+
+    def get_health(self) -> dict[str, Any]:
+        """Short breaker status for health checks."""
+        status = self.get_status()
+        return {key: status[key] for key in ("state", "reason", "retry_in_seconds")}
+
+
+llm_breaker = CircuitBreaker()
@@ -0,0 +1,347 @@
+"""
+LLM Clients - Shared, Pooled API Clients for Every LLM Caller.
+
+Each LLM parser call used to construct a new ``OpenAI`` client and
+instructor wrapper, so every fallback paid client setup plus a fresh TCP and
+TLS handshake to the API. This module keeps one client per provider (and
+API key) for the life of the process. All of them share a keep-alive
+connection pool with connection-count limits and timeouts. The SDK clients
+and the pool are thread-safe, so request threads share them freely.
+
+Async clients get their own pool per event loop, since an asyncio
+connection cannot move between loops.
+
+Usage:
+    from sandwich_bot.llm_clients import llm_clients
+
+    client = llm_clients.instructor()          # instructor-wrapped OpenAI
+    completion = llm_clients.openai().chat.completions.create(...)
+    client = llm_clients.async_instructor()    # for async endpoints
+
+    llm_clients.get_status()                   # pool utilization
+
+Configuration (see config.py):
+    LLM_TIMEOUT: Read timeout per request in seconds
+    LLM_CONNECT_TIMEOUT: Connect timeout in seconds
+    LLM_MAX_CONNECTIONS: Open connections allowed per pool
+    LLM_MAX_KEEPALIVE_CONNECTIONS: Idle connections kept open per pool
+    LLM_KEEPALIVE_EXPIRY: Seconds an idle connection is kept open
+    LLM_BASE_URL: OpenAI-compatible API to send OpenAI requests to
+        (e.g. the local stand-in in llm_standin.py)
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import weakref
+from typing import Any, Callable
+
+import httpx
+
+from .config import (
+    LLM_BASE_URL,
+    LLM_CONNECT_TIMEOUT_SECONDS,
+    LLM_KEEPALIVE_EXPIRY_SECONDS,
+    LLM_MAX_CONNECTIONS,
+    LLM_MAX_KEEPALIVE_CONNECTIONS,
+    LLM_TIMEOUT_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class _PoolStats:
+    """Request and connection counters for one connection pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.connections_opened = 0
+        # httpcore connection pool of the transport, when it exposes one
+        self.pool: Any = None
+        # Connections already counted; weak so closed ones are dropped
+        self._seen: weakref.WeakSet = weakref.WeakSet()
+
+    def started(self) -> None:
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def finished(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            for connection in _pool_connections(self.pool):
+                if connection not in self._seen:
+                    self._seen.add(connection)
+                    self.connections_opened += 1
+
+
+def _pool_connections(pool: Any) -> list:
+    """Connections of an httpcore pool (empty if the pool is not available)."""
+    return list(getattr(pool, "connections", None) or [])
+
+
+class _CountingTransport(httpx.HTTPTransport):
+    """HTTP transport that records each request in the pool stats."""
+
+    def __init__(self, stats: _PoolStats, **kwargs):
+        super().__init__(**kwargs)
+        self.stats = stats
+        stats.pool = getattr(self, "_pool", None)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.stats.started()
+        try:
+            return super().handle_request(request)
+        finally:
+            self.stats.finished()
+
+
+class _AsyncCountingTransport(httpx.AsyncHTTPTransport):
+    """Async HTTP transport that records each request in the pool stats."""
+
+    def __init__(self, stats: _PoolStats, **kwargs):
+        super().__init__(**kwargs)
+        self.stats = stats
+        stats.pool = getattr(self, "_pool", None)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.stats.started()
+        try:
+            return await super().handle_async_request(request)
+        finally:
+            self.stats.finished()
+
+
+class LLMClientProvider:
+    """
+    Process-wide provider of pooled OpenAI, instructor and Anthropic clients.
+
+    Clients are created on first use and cached by kind and API key, so a
+    rotated key gets a new client. The sync clients share one connection
+    pool; each event loop gets its own async pool.
+    """
+
+    def __init__(
+        self,
+        timeout: float = LLM_TIMEOUT_SECONDS,
+        connect_timeout: float = LLM_CONNECT_TIMEOUT_SECONDS,
+        max_connections: int = LLM_MAX_CONNECTIONS,
+        max_keepalive_connections: int = LLM_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = LLM_KEEPALIVE_EXPIRY_SECONDS,
+        base_url: str | None = LLM_BASE_URL,
+    ):
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        # OpenAI-compatible API for the OpenAI clients (None: the SDK default)
+        self.base_url = base_url
+        self._lock = threading.RLock()
+        self._clients: dict[tuple[str, str], Any] = {}
+        self._http_client: httpx.Client | None = None
+        self._stats = _PoolStats()
+        # Per event loop: loop -> (http client, stats, {(kind, key): client})
+        self._async: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._clients_created = 0
+
+    # -------------------------------------------------------------------------
+    # Connection pools
+    # -------------------------------------------------------------------------
+
+    def http_client(self) -> httpx.Client:
+        """The shared sync HTTP client (keep-alive pool) behind every sync SDK client."""
+        with self._lock:
+            if self._http_client is None:
+                self._http_client = httpx.Client(
+                    transport=_CountingTransport(self._stats, limits=self.limits),
+                    timeout=self.timeout,
+                )
+            return self._http_client
+
+    def _loop_state(self) -> tuple[httpx.AsyncClient, _PoolStats, dict]:
+        """Async HTTP client, stats and client cache of the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._async.get(loop)
+            if state is None:
+                stats = _PoolStats()
+                http_client = httpx.AsyncClient(
+                    transport=_AsyncCountingTransport(stats, limits=self.limits),
+                    timeout=self.timeout,
+                )
+                state = (http_client, stats, {})
+                self._async[loop] = state
+            return state
+
+    def _get_or_create(self, cache: dict, kind: str, api_key: str, factory: Callable[[], Any]) -> Any:
+        with self._lock:
+            client = cache.get((kind, api_key))
+            if client is None:
+                client = factory()
+                cache[(kind, api_key)] = client
+                self._clients_created += 1
+                logger.debug("Created pooled %s client", kind)
+            return client
+
+    # -------------------------------------------------------------------------
+    # SDK clients
+    # -------------------------------------------------------------------------
+
+    def openai(self, api_key: str | None = None):
+        """
+        Get the shared sync OpenAI client.
+
+        Args:
+            api_key: API key (default: OPENAI_API_KEY)
+
+        Raises:
+            ValueError: If no API key is given or set
+        """
+        from openai import OpenAI
+
+        api_key = _require_key(api_key, "OPENAI_API_KEY")
+        return self._get_or_create(
+            self._clients, "openai", api_key,
+            lambda: OpenAI(
+                api_key=api_key, base_url=self.base_url,
+                http_client=self.http_client(), timeout=self.timeout,
+            ),
+        )
+
+    def instructor(self, api_key: str | None = None):
+        """Get the shared instructor wrapper around the sync OpenAI client."""
+        import instructor
+
+        client = self.openai(api_key)
+        return self._get_or_create(
+            self._clients, "instructor", _require_key(api_key, "OPENAI_API_KEY"),
+            lambda: instructor.from_openai(client),
+        )
+
+    def anthropic(self, api_key: str | None = None):
+        """
+        Get the shared sync Anthropic client.
+
+        Args:
+            api_key: API key (default: ANTHROPIC_API_KEY)
+
+        Raises:
+            ValueError: If no API key is given or set
+        """
+        import anthropic
+
+        api_key = _require_key(api_key, "ANTHROPIC_API_KEY")
+        return self._get_or_create(
+            self._clients, "anthropic", api_key,
+            lambda: anthropic.Anthropic(api_key=api_key, http_client=self.http_client(), timeout=self.timeout),
+        )
+
+    def async_openai(self, api_key: str | None = None):
+        """Get the async OpenAI client of the running event loop."""
+        from openai import AsyncOpenAI
+
+        api_key = _require_key(api_key, "OPENAI_API_KEY")
+        http_client, _stats, cache = self._loop_state()
+        return self._get_or_create(
+            cache, "async_openai", api_key,
+            lambda: AsyncOpenAI(
+                api_key=api_key, base_url=self.base_url,
+                http_client=http_client, timeout=self.timeout,
+            ),
+        )
+
+    def async_instructor(self, api_key: str | None = None):
+        """Get the instructor wrapper around the running loop's async OpenAI client."""
+        import instructor
+
+        client = self.async_openai(api_key)
+        _http_client, _stats, cache = self._loop_state()
+        return self._get_or_create(
+            cache, "async_instructor", _require_key(api_key, "OPENAI_API_KEY"),
+            lambda: instructor.from_openai(client),
+        )
+
+    def async_anthropic(self, api_key: str | None = None):
+        """Get the async Anthropic client of the running event loop."""
+        import anthropic
+
+        api_key = _require_key(api_key, "ANTHROPIC_API_KEY")
+        http_client, _stats, cache = self._loop_state()
+        return self._get_or_create(
+            cache, "async_anthropic", api_key,
+            lambda: anthropic.AsyncAnthropic(api_key=api_key, http_client=http_client, timeout=self.timeout),
+        )
+
+    # -------------------------------------------------------------------------
+    # Status
+    # -------------------------------------------------------------------------
+
+    def get_status(self) -> dict[str, Any]:
+        """Get pool limits and utilization of the sync and async pools."""
+        with self._lock:
+            pools = []
+            if self._http_client is not None:
+                pools.append(("sync", self._stats))
+            for _http_client, stats, _cache in list(self._async.values()):
+                pools.append(("async", stats))
+            clients = sorted({kind for kind, _key in self._clients})
+            clients_created = self._clients_created
+
+        return {
+            "limits": {
+                "max_connections": self.limits.max_connections,
+                "max_keepalive_connections": self.limits.max_keepalive_connections,
+                "keepalive_expiry": self.limits.keepalive_expiry,
+                "timeout": self.timeout.read,
+                "connect_timeout": self.timeout.connect,
+            },
+            "base_url": self.base_url,
+            "clients": clients,
+            "clients_created": clients_created,
+            "pools": [_pool_status(kind, stats) for kind, stats in pools],
+        }
+
+    def close(self) -> None:
+        """Close the sync pool and forget every client (e.g. on shutdown)."""
+        with self._lock:
+            if self._http_client is not None:
+                self._http_client.close()
+            self._http_client = None
+            self._clients.clear()
+            self._async = weakref.WeakKeyDictionary()
+            self._stats = _PoolStats()
+
+
+def _require_key(api_key: str | None, env_var: str) -> str:
+    api_key = api_key or os.getenv(env_var)
+    if not api_key:
+        raise ValueError(f"{env_var} not set")
+    return api_key
+
+
+def _pool_status(kind: str, stats: _PoolStats) -> dict[str, Any]:
+    connections = _pool_connections(stats.pool)
+    idle = sum(1 for connection in connections if connection.is_idle())
+    requests = stats.requests
+    return {
+        "kind": kind,
+        "requests": requests,
+        "in_flight": stats.in_flight,
+        "peak_in_flight": stats.peak_in_flight,
+        "connections_open": len(connections),
+        "connections_idle": idle,
+        "connections_opened": stats.connections_opened,
+        # Share of requests that went out on an already-open connection
+        "reuse_rate": round(1 - stats.connections_opened / requests, 3) if requests else None,
+    }
+
+
+# Global singleton instance
+llm_clients = LLMClientProvider()
@@ -0,0 +1,424 @@
+"""
+LLM Deadline - Per-Turn Latency Budget and Hedged LLM Requests.
+
+The LLM parsers set no timeout and the bot client uses one fixed
+LLM_TIMEOUT, so a single slow completion can hold a turn for a minute. On a
+voice call that is dead air. This module bounds the LLM time of a turn:
+
+- ``MessageProcessor`` starts a ``TurnDeadline`` for every message and makes
+  it active for the turn (voice turns get a tighter budget)
+- every LLM request gets the time left in the turn as its timeout
+- a request slower than the LLM_HEDGE_PERCENTILE of recent latencies for
+  the same call type gets a duplicate; the first response wins
+- when the budget runs out, ``LLMDeadlineExceeded`` is raised, and the state
+  machine answers with a clarifying question instead (see
+  ``OrderStateMachine._degraded_result``)
+
+A sync request that loses the race cannot be interrupted, and an async one
+is left to finish as well, so the stats can record how long waiting for it
+would have taken.
+
+The deadline is a ContextVar, like the parse budget (see
+tasks/parsers/parse_budget.py), so it follows the turn into
+``asyncio.to_thread`` workers. Without an active deadline, requests use
+their default timeout as before.
+
+Usage:
+    with use_turn_deadline(TurnDeadline(5.0)):
+        ...
+
+    result = call_with_hedge(
+        "OpenInputResponse",
+        lambda timeout: client.chat.completions.create(..., timeout=timeout),
+    )
+
+    get_llm_deadline_stats()
+    # {"calls": 240, "hedged": 9, "hedge_wins": 6, "saved_ms_total": 8420.0, ...}
+"""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Iterator, TypeVar
+
+from .config import (
+    LLM_HEDGE_MIN_SAMPLES,
+    LLM_HEDGE_PERCENTILE,
+    LLM_LATENCY_WINDOW,
+    LLM_MAX_CONNECTIONS,
+    LLM_TIMEOUT_SECONDS,
+    LLM_TURN_BUDGET_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class TurnDeadline:
+    """
+    Wall-clock time left for LLM calls in one turn.
+
+    Attributes:
+        seconds: The full budget (0 disables the deadline)
+        exceeded: Whether an LLM call ran out of budget
+    """
+
+    def __init__(self, seconds: float | None = None):
+        self.seconds = LLM_TURN_BUDGET_SECONDS if seconds is None else seconds
+        self._expires_at = time.monotonic() + self.seconds if self.seconds else None
+        self.exceeded = False
+
+    def __repr__(self) -> str:
+        remaining = self.remaining()
+        if remaining is None:
+            return "TurnDeadline(disabled)"
+        return f"TurnDeadline(remaining={remaining:.2f}s of {self.seconds:.1f}s)"
+
+    def remaining(self) -> float | None:
+        """Seconds left in the budget, or None when the deadline is disabled."""
+        if self._expires_at is None:
+            return None
+        return max(0.0, self._expires_at - time.monotonic())
+
+
+class LLMDeadlineExceeded(Exception):
+    """Raised when a turn's LLM budget runs out before a response arrives."""
+
+    def __init__(self, name: str, deadline: TurnDeadline):
+        super().__init__(f"LLM budget of {deadline.seconds:.1f}s exhausted waiting for {name}")
+        self.name = name
+
+
+_active_deadline: ContextVar[TurnDeadline | None] = ContextVar("llm_turn_deadline", default=None)
+
+
+@contextmanager
+def use_turn_deadline(deadline: TurnDeadline) -> Iterator[TurnDeadline]:
+    """Make a deadline the one LLM calls inside the block are bounded by."""
+    token = _active_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _active_deadline.reset(token)
+
+
+def get_turn_deadline() -> TurnDeadline | None:
+    """Get the active turn deadline, or None outside a turn."""
+    return _active_deadline.get()
+
+
+# =============================================================================
+# Stats
+# =============================================================================
+
+class _LatencyWindow:
+    """Most recent request latencies of one call type."""
+
+    def __init__(self, size: int):
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, percent: float) -> float | None:
+        samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, max(0, math.ceil(percent / 100 * len(samples)) - 1))
+        return samples[index]
+
+
+class _DeadlineStats:
+    """Hedging and deadline counts, and latency windows per call type."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        # Time between a hedge winning and the request it duplicated finishing
+        self.saved_seconds = 0.0
+        self.deadline_exceeded = 0
+        self.windows: dict[str, _LatencyWindow] = {}
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            window = self.windows.get(name)
+            if window is None:
+                window = self.windows[name] = _LatencyWindow(LLM_LATENCY_WINDOW)
+            window.add(seconds)
+
+    def add(self, counter: str, amount: float = 1) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+
+_stats = _DeadlineStats()
+
+
+def get_llm_deadline_stats() -> dict[str, Any]:
+    """
+    Get turn budget, hedging and latency stats for LLM calls.
+
+    Returns:
+        Dict with the configuration, "calls", "hedged" (duplicate requests
+        sent), "hedge_wins" (duplicates that answered first), "saved_ms_total"
+        and "saved_ms_avg" (how much sooner winning duplicates answered than
+        the requests they duplicated), "deadline_exceeded", and per call type
+        the recent p50/p95 latency and current hedge delay.
+    """
+    s = _stats
+    with s._lock:
+        windows = dict(s.windows)
+    latency = {}
+    for name, window in sorted(windows.items()):
+        p50, p95 = window.percentile(50), window.percentile(95)
+        delay = _hedge_delay(name)
+        latency[name] = {
+            "samples": len(window),
+            "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+            "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            "hedge_delay_ms": round(delay * 1000, 1) if delay is not None else None,
+        }
+    return {
+        "turn_budget_seconds": LLM_TURN_BUDGET_SECONDS,
+        "hedge_percentile": LLM_HEDGE_PERCENTILE,
+        "calls": s.calls,
+        "hedged": s.hedged,
+        "hedge_rate": round(s.hedged / s.calls, 4) if s.calls else 0.0,
+        "hedge_wins": s.hedge_wins,
+        "saved_ms_total": round(s.saved_seconds * 1000, 1),
+        "saved_ms_avg": round(s.saved_seconds * 1000 / s.hedge_wins, 1) if s.hedge_wins else 0.0,
+        "deadline_exceeded": s.deadline_exceeded,
+        "latency": latency,
+    }
+
+
+def reset_llm_deadline_stats() -> None:
+    """Reset all counts and latency windows."""
+    with _stats._lock:
+        _stats.reset()
+
+
+# =============================================================================
+# Calls
+# =============================================================================
+
+def _exceeded(name: str, deadline: TurnDeadline) -> None:
+    deadline.exceeded = True
+    _stats.add("deadline_exceeded")
+    logger.warning("LLM turn budget of %.1fs exhausted waiting for %s", deadline.seconds, name)
+    raise LLMDeadlineExceeded(name, deadline)
+
+
+def _raise_if_expired(name: str) -> None:
+    """Raise LLMDeadlineExceeded when a failed request used up the turn's budget."""
+    deadline = _active_deadline.get()
+    if deadline is not None and deadline.remaining() == 0:
+        _exceeded(name, deadline)
+
+
+def request_timeout(name: str, default: float = LLM_TIMEOUT_SECONDS) -> float:
+    """
+    Timeout for an LLM request: the turn's remaining budget, at most ``default``.
+
+    Args:
+        name: Call type, for the log message
+        default: Timeout outside a turn, and the upper bound within one
+
+    Raises:
+        LLMDeadlineExceeded: If the turn has no budget left
+    """
+    deadline = _active_deadline.get()
+    remaining = deadline.remaining() if deadline is not None else None
+    if remaining is None:
+        return default
+    if remaining <= 0:
+        _exceeded(name, deadline)
+    return min(default, remaining)
+
+
+def check_turn_budget(name: str) -> None:
+    """
+    Raise LLMDeadlineExceeded if the turn has no LLM budget left.
+
+    Checked before the circuit breaker (see llm_breaker.py), so a spent
+    budget is not taken for a request the provider got, or used as a probe.
+    """
+    request_timeout(name)
+
+
+def _hedge_delay(name: str) -> float | None:
+    """How long to wait before hedging a request, or None to not hedge it."""
+    if LLM_HEDGE_PERCENTILE <= 0:
+        return None
+    window = _stats.windows.get(name)
+    if window is None or len(window) < LLM_HEDGE_MIN_SAMPLES:
+        return None
+    return window.percentile(LLM_HEDGE_PERCENTILE)
+
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Threads that run hedged sync requests, created on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=LLM_MAX_CONNECTIONS, thread_name_prefix="llm-hedge",
+            )
+        return _executor
+
+
+def _timed(name: str, call: Callable[[float], T], timeout: float) -> T:
+    started = time.monotonic()
+    result = call(timeout)
+    _stats.observe(name, time.monotonic() - started)
+    return result
+
+
+def _wait_seconds() -> float | None:
+    deadline = _active_deadline.get()
+    return deadline.remaining() if deadline is not None else None
+
+
+def call_with_hedge(
+    name: str,
+    call: Callable[[float], T],
+    default_timeout: float = LLM_TIMEOUT_SECONDS,
+) -> T:
+    """
+    Make an LLM request within the turn's budget, hedging it when it is slow.
+
+    Args:
+        name: Call type; latencies and hedge delays are tracked per name
+        call: Makes the request with the given timeout in seconds
+        default_timeout: Timeout outside a turn, and the upper bound within one
+
+    Raises:
+        LLMDeadlineExceeded: If the turn's budget runs out first
+    """
+    timeout = request_timeout(name, default_timeout)
+    _stats.add("calls")
+    delay = _hedge_delay(name)
+    if delay is None or delay >= timeout:
+        try:
+            return _timed(name, call, timeout)
+        except Exception:
+            _raise_if_expired(name)
+            raise
+
+    executor = _get_executor()
+    primary: Future = executor.submit(_timed, name, call, timeout)
+    done, _ = wait([primary], timeout=delay)
+    if not done:
+        hedge = executor.submit(_timed, name, call, request_timeout(name, default_timeout))
+        _stats.add("hedged")
+        logger.info("Hedging %s request after %.0f ms", name, delay * 1000)
+        pending = {primary, hedge}
+        expires_in = _wait_seconds()
+        expires_at = time.monotonic() + expires_in if expires_in is not None else None
+        while pending:
+            timeout_left = max(0.0, expires_at - time.monotonic()) if expires_at is not None else None
+            done, pending = wait(pending, timeout=timeout_left, return_when=FIRST_COMPLETED)
+            if not done:
+                _exceeded(name, _active_deadline.get())
+            winner = next((f for f in done if f.exception() is None), None)
+            if winner is not None:
+                break
+        else:
+            winner = hedge
+        if winner is hedge and winner.exception() is None:
+            _stats.add("hedge_wins")
+            won_at = time.monotonic()
+            primary.add_done_callback(lambda _f: _stats.add("saved_seconds", time.monotonic() - won_at))
+        primary = winner
+
+    try:
+        return primary.result()
+    except Exception:
+        _raise_if_expired(name)
+        raise
+
+
+async def _timed_async(name: str, call: Callable[[float], Awaitable[T]], timeout: float) -> T:
+    started = time.monotonic()
+    result = await call(timeout)
+    _stats.observe(name, time.monotonic() - started)
+    return result
+
+
+def _retrieve(task: asyncio.Task) -> None:
+    """Retrieve a finished task's exception so it isn't logged as unhandled."""
+    if not task.cancelled():
+        task.exception()
+
+
+async def call_with_hedge_async(
+    name: str,
+    call: Callable[[float], Awaitable[T]],
+    default_timeout: float = LLM_TIMEOUT_SECONDS,
+) -> T:
+    """Async version of call_with_hedge."""
+    timeout = request_timeout(name, default_timeout)
+    _stats.add("calls")
+    delay = _hedge_delay(name)
+    if delay is None or delay >= timeout:
+        try:
+            return await _timed_async(name, call, timeout)
+        except Exception:
+            _raise_if_expired(name)
+            raise
+
+    primary = asyncio.ensure_future(_timed_async(name, call, timeout))
+    primary.add_done_callback(_retrieve)
+    done, _ = await asyncio.wait({primary}, timeout=delay)
+    if not done:
+        hedge = asyncio.ensure_future(_timed_async(name, call, request_timeout(name, default_timeout)))
+        hedge.add_done_callback(_retrieve)
+        _stats.add("hedged")
+        logger.info("Hedging %s request after %.0f ms", name, delay * 1000)
+        pending = {primary, hedge}
+        expires_in = _wait_seconds()
+        expires_at = time.monotonic() + expires_in if expires_in is not None else None
+        winner = hedge
+        while pending:
+            timeout_left = max(0.0, expires_at - time.monotonic()) if expires_at is not None else None
+            done, pending = await asyncio.wait(pending, timeout=timeout_left, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                for task in pending:
+                    task.cancel()
+                _exceeded(name, _active_deadline.get())
+            success = next((t for t in done if t.exception() is None), None)
+            if success is not None:
+                winner = success
+                break
+        if winner is hedge and winner.exception() is None:
+            _stats.add("hedge_wins")
+            won_at = time.monotonic()
+            primary.add_done_callback(
+                lambda t: t.cancelled() or _stats.add("saved_seconds", time.monotonic() - won_at)
+            )
+        primary = winner
+
+    try:
+        return primary.result()
+    except Exception:
+        _raise_if_expired(name)
+        raise
@@ -0,0 +1,390 @@
+"""
+LLM Response Cache - Persistent Cache of LLM Completions Across Restarts.
+
+The parse memo (parse_memo.py) lives in process memory, so every deploy and
+every new worker starts cold and pays for the same ambiguous utterances
+again. This cache keeps LLM completions in a SQLite file next to the app,
+so it needs no extra service.
+
+Keys are a SHA-256 of the caller's namespace, the model, the response
+model's JSON schema, the caller's prompt template version and the rendered
+prompt. Editing a prompt template or a response schema therefore never
+serves an answer to the old question. Each entry records the menu version
+it was produced under:
+
+- lookups only match entries of the current menu version
+- ``set_menu_version`` (called by ``MenuDataCache.load_from_db``) deletes
+  entries of other versions
+- entries older than the TTL are misses and are deleted when found
+- past the size limit, the least recently used entries are evicted
+
+Nothing is cached before a menu version is set. Database errors are logged
+and treated as misses, so a broken cache file never breaks a parse.
+
+Completions that carry customer details are never cached:
+
+- the name, email, phone, delivery choice and payment method parsers
+  (``cache=False`` in tasks/parsers/llm_parsers.py), whose responses hold
+  names, addresses, phone numbers and email addresses
+- sammy's replies on turns with a caller ID, a returning customer,
+  customer info in the order, an order in checkout, or a phone number or
+  email address in the message or history (see ``_response_cache_key`` in
+  sammy/llm_client.py)
+
+Modes:
+    readwrite   Look up and store (default)
+    readonly    Look up only, opening the file read-only. Use it to replay
+                a recorded cache without changing it (load tests, evals)
+    off         Disabled
+
+Usage:
+    from sandwich_bot.llm_response_cache import llm_response_cache
+
+    key = llm_response_cache.make_key("llm_parsers", model, SpreadChoiceResponse, "1", prompt)
+    cached = llm_response_cache.get(key, SpreadChoiceResponse)
+    if cached is None:
+        cached = client.chat.completions.create(...)
+        llm_response_cache.put(key, "llm_parsers", cached)
+
+Configuration (see config.py):
+    LLM_CACHE_PATH: SQLite file (empty disables the cache)
+    LLM_CACHE_MODE: readwrite, readonly or off
+    LLM_CACHE_TTL_SECONDS: How long a completion stays valid
+    LLM_CACHE_MAX_ENTRIES: Entries kept before LRU eviction
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+
+from .config import (
+    LLM_CACHE_MAX_ENTRIES,
+    LLM_CACHE_MODE,
+    LLM_CACHE_PATH,
+    LLM_CACHE_TTL_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+MODES = ("readwrite", "readonly", "off")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_responses (
+    key TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    menu_version TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS llm_responses_accessed_at ON llm_responses (accessed_at);
+"""
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed cache of LLM completions keyed by prompt and menu version.
+
+    Pydantic responses are stored as JSON and validated back into the
+    response model on a hit; plain-text completions are stored as is.
+
+    Args:
+        path: SQLite file (empty string disables the cache)
+        mode: "readwrite", "readonly" or "off"
+        ttl_seconds: How long a completion stays valid
+        max_entries: Entries kept before the least recently used are evicted
+    """
+
+    def __init__(
+        self,
+        path: str = LLM_CACHE_PATH,
+        mode: str = LLM_CACHE_MODE,
+        ttl_seconds: float = LLM_CACHE_TTL_SECONDS,
+        max_entries: int = LLM_CACHE_MAX_ENTRIES,
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Invalid LLM cache mode '{mode}'. Must be one of {', '.join(MODES)}.")
+        self.path = path
+        self.mode = mode if path else "off"
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._menu_version: str | None = None
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        # response model -> digest of its JSON schema
+        self._schema_digests: dict[type, str] = {}
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+        self._errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off" and self._menu_version is not None
+
+    @property
+    def read_only(self) -> bool:
+        return self.mode == "readonly"
+
+    @property
+    def menu_version(self) -> str | None:
+        """Menu version lookups and new entries are tied to."""
+        return self._menu_version
+
+    # -------------------------------------------------------------------------
+    # Connection
+    # -------------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache file on first use (caller holds the lock)."""
+        if self._connection is None:
+            if self.read_only:
+                connection = sqlite3.connect(
+                    f"file:{self.path}?mode=ro", uri=True, check_same_thread=False,
+                )
+            else:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                connection = sqlite3.connect(self.path, check_same_thread=False)
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _failed(self, action: str, error: sqlite3.Error) -> None:
+        self._errors += 1
+        logger.warning("LLM response cache %s failed (%s): %s", action, self.path, error)
+
+    def close(self) -> None:
+        """Close the cache file (it is reopened on next use)."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    # -------------------------------------------------------------------------
+    # Keys
+    # -------------------------------------------------------------------------
+
+    def _schema_digest(self, response_model: type[BaseModel] | None) -> str:
+        if response_model is None:
+            return "text"
+        digest = self._schema_digests.get(response_model)
+        if digest is None:
+            schema = json.dumps(response_model.model_json_schema(), sort_keys=True)
+            digest = hashlib.sha256(schema.encode()).hexdigest()
+            self._schema_digests[response_model] = digest
+        return digest
+
+    def make_key(
+        self,
+        namespace: str,
+        model: str,
+        response_model: type[BaseModel] | None,
+        template_version: str,
+        prompt: str | list[dict[str, Any]],
+    ) -> str:
+        """
+        Build the cache key for one completion.
+
+        Args:
+            namespace: Caller, e.g. "llm_parsers" or "sammy"
+            model: Model name
+            response_model: Pydantic response model, or None for text
+            template_version: Version of the caller's prompt templates
+            prompt: Rendered prompt, or the full chat messages
+        """
+        payload = json.dumps(
+            [namespace, model, self._schema_digest(response_model), template_version, prompt],
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    # -------------------------------------------------------------------------
+    # Lookups
+    # -------------------------------------------------------------------------
+
+    def get(self, key: str, response_model: type[BaseModel] | None = None) -> Any | None:
+        """
+        Get a cached completion, or None on a miss.
+
+        Args:
+            key: Key from make_key()
+            response_model: Model to validate the cached JSON into (None
+                returns the cached text)
+        """
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            try:
+                connection = self._connect()
+                row = connection.execute(
+                    "SELECT menu_version, created_at, payload FROM llm_responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None or row[0] != self._menu_version:
+                    self._misses += 1
+                    return None
+                menu_version, created_at, payload = row
+                if created_at + self.ttl_seconds <= now:
+                    self._expirations += 1
+                    self._misses += 1
+                    if not self.read_only:
+                        with connection:
+                            connection.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                    return None
+                if not self.read_only:
+                    with connection:
+                        connection.execute(
+                            "UPDATE llm_responses SET accessed_at = ? WHERE key = ?", (now, key),
+                        )
+            except sqlite3.Error as e:
+                self._failed("lookup", e)
+                return None
+
+        if response_model is None:
+            self._hits += 1
+            return payload
+        try:
+            result = response_model.model_validate_json(payload)
+        except ValidationError as e:
+            logger.warning("Discarding cached LLM response that no longer validates: %s", e)
+            self._misses += 1
+            return None
+        self._hits += 1
+        return result
+
+    def put(self, key: str, namespace: str, response: Any) -> None:
+        """
+        Store a completion, evicting the least recently used entries past the limit.
+
+        Only pydantic models and strings are stored; anything else (e.g.
+        test mocks) is ignored, as is every call in read-only mode.
+
+        Args:
+            key: Key from make_key()
+            namespace: Caller, e.g. "llm_parsers" or "sammy"
+            response: The completion
+        """
+        if not self.enabled or self.read_only:
+            return
+        if isinstance(response, BaseModel):
+            payload = response.model_dump_json()
+        elif isinstance(response, str):
+            payload = response
+        else:
+            return
+
+        now = time.time()
+        with self._lock:
+            try:
+                connection = self._connect()
+                with connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO llm_responses "
+                        "(key, namespace, menu_version, created_at, accessed_at, payload) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, namespace, self._menu_version, now, now, payload),
+                    )
+                    self._stores += 1
+                    (size,) = connection.execute("SELECT COUNT(*) FROM llm_responses").fetchone()
+                    if size > self.max_entries:
+                        evicted = connection.execute(
+                            "DELETE FROM llm_responses WHERE key IN "
+                            "(SELECT key FROM llm_responses ORDER BY accessed_at LIMIT ?)",
+                            (size - self.max_entries,),
+                        ).rowcount
+                        self._evictions += evicted
+            except sqlite3.Error as e:
+                self._failed("store", e)
+
+    # -------------------------------------------------------------------------
+    # Invalidation
+    # -------------------------------------------------------------------------
+
+    def set_menu_version(self, menu_version: str | None) -> None:
+        """
+        Tie lookups to a newly loaded menu and drop entries of other versions.
+
+        Entries are kept in read-only mode; they just stop matching.
+
+        Args:
+            menu_version: Version hash of the newly loaded menu data
+        """
+        self._menu_version = menu_version
+        if self.mode == "off" or self.read_only or menu_version is None:
+            return
+        with self._lock:
+            try:
+                connection = self._connect()
+                with connection:
+                    dropped = connection.execute(
+                        "DELETE FROM llm_responses WHERE menu_version != ?", (menu_version,),
+                    ).rowcount
+                self._invalidations += dropped
+            except sqlite3.Error as e:
+                self._failed("invalidation", e)
+                return
+        if dropped:
+            logger.info("LLM response cache dropped %d entries of other menu versions", dropped)
+
+    def clear(self) -> None:
+        """Delete every cached completion (no-op in read-only mode)."""
+        if self.mode == "off" or self.read_only:
+            return
+        with self._lock:
+            try:
+                connection = self._connect()
+                with connection:
+                    connection.execute("DELETE FROM llm_responses")
+            except sqlite3.Error as e:
+                self._failed("clear", e)
+
+    # -------------------------------------------------------------------------
+    # Status
+    # -------------------------------------------------------------------------
+
+    def get_status(self) -> dict[str, Any]:
+        """Get cache status and hit/miss/eviction counts."""
+        size = None
+        if self.mode != "off":
+            with self._lock:
+                try:
+                    (size,) = self._connect().execute("SELECT COUNT(*) FROM llm_responses").fetchone()
+                except sqlite3.Error as e:
+                    self._failed("status", e)
+        lookups = self._hits + self._misses
+        return {
+            "enabled": self.enabled,
+            "mode": self.mode,
+            "path": self.path or None,
+            "menu_version": self._menu_version,
+            "size": size,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            "stores": self._stores,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "invalidations": self._invalidations,
+            "errors": self._errors,
+        }
+
+
+# Global singleton instance
+llm_response_cache = LLMResponseCache()
@@ -0,0 +1,499 @@
+"""
+LLM Stand-In - Local OpenAI-Compatible Chat Completions Server.
+
+Benchmarking the full pipeline against OpenAI costs money, is rate limited,
+and measures OpenAI's latency as much as ours. This module serves
+``POST /v1/chat/completions`` locally in the shapes our callers use:
+
+- instructor structured output (llm_parsers.py): ``tools`` with a forced
+  ``tool_choice``, answered with a tool call
+- JSON mode (sammy/llm_client.py): ``response_format={"type": "json_object"}``,
+  answered with JSON message content
+- streaming (``stream=True``): server-sent chunk events ending in ``[DONE]``
+
+It runs in one of three modes:
+
+- record: proxy every request to the real API (``--upstream``) and append
+  the response and its latency to a JSONL recordings file
+- replay: answer from the recordings, keyed by a hash of the prompt (model,
+  messages, tools and response format), with the recorded latency
+- synthetic: answer with schema-valid placeholder output after a latency
+  drawn from a lognormal distribution (``--latency-median``,
+  ``--latency-p95``)
+
+Point the app at it with LLM_BASE_URL (see config.py). ``GET /stats``
+reports the request counts and the latency the stand-in added.
+
+Usage:
+    python -m sandwich_bot.llm_standin --mode record --recordings llm_recordings.jsonl
+    python -m sandwich_bot.llm_standin --mode replay --recordings llm_recordings.jsonl
+    python -m sandwich_bot.llm_standin --mode synthetic --latency-median 0.8 --latency-p95 2.5
+
+    LLM_BASE_URL=http://127.0.0.1:8100/v1 OPENAI_API_KEY=sk-local uvicorn sandwich_bot.main:app
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+logger = logging.getLogger(__name__)
+
+MODES = ("record", "replay", "synthetic")
+
+DEFAULT_UPSTREAM = "https://api.openai.com/v1"
+
+# Request fields that decide the response; the rest (timeouts, stream
+# options, user ids) are left out of the replay key
+_KEY_FIELDS = ("model", "messages", "tools", "tool_choice", "functions", "function_call", "response_format", "stream")
+
+# Characters per streamed chunk of synthetic content
+_CHUNK_CHARS = 8
+
+# Latencies kept for the /stats percentiles; older ones are dropped
+MAX_LATENCY_SAMPLES = 10_000
+
+# Reply of synthetic JSON mode completions, in the shape sammy expects
+_SYNTHETIC_JSON_REPLY = {"reply": "Sure, what else can I get for you?", "actions": []}
+
+
+def prompt_key(body: dict[str, Any]) -> str:
+    """Hash of the parts of a chat completions request that decide its response."""
+    payload = json.dumps({field: body.get(field) for field in _KEY_FIELDS}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+# =============================================================================
+# Latency
+# =============================================================================
+
+class LatencyModel:
+    """
+    Lognormal response latency with the given median and 95th percentile.
+
+    A p95 at or below the median gives a fixed latency.
+    """
+
+    def __init__(self, median: float = 0.0, p95: float | None = None, seed: int | None = None):
+        self.median = max(median, 0.0)
+        self.p95 = p95 if p95 is not None else median
+        # z-score of the 95th percentile of a standard normal
+        self.sigma = math.log(self.p95 / self.median) / 1.645 if 0 < self.median < self.p95 else 0.0
+        self._random = random.Random(seed)
+
+    def sample(self) -> float:
+        """Draw one latency in seconds."""
+        if self.median == 0 or self.sigma == 0:
+            return self.median
+        return self.median * math.exp(self._random.gauss(0.0, self.sigma))
+
+
+# =============================================================================
+# Recordings
+# =============================================================================
+
+class RecordingStore:
+    """
+    Recorded responses keyed by prompt hash, in a JSONL file.
+
+    Each line holds the key, the request, the latency in seconds and either
+    the completion or, for streamed requests, its chunks. A key recorded
+    more than once replays its latest response.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._records: dict[str, dict[str, Any]] = {}
+        if self.path.exists():
+            with self.path.open(encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        self._records[record["key"]] = record
+        logger.info("Loaded %d LLM recordings from %s", len(self._records), self.path)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        return self._records.get(key)
+
+    def add(self, record: dict[str, Any]) -> None:
+        with self._lock:
+            self._records[record["key"]] = record
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+
+
+# =============================================================================
+# Synthetic responses
+# =============================================================================
+
+def _schema_example(schema: dict[str, Any], defs: dict[str, Any]) -> Any:
+    """Smallest value valid against a JSON schema: required fields only, zero values."""
+    if "$ref" in schema:
+        return _schema_example(defs.get(schema["$ref"].rsplit("/", 1)[-1], {}), defs)
+    if "default" in schema:
+        return schema["default"]
+    if "const" in schema:
+        return schema["const"]
+    if schema.get("enum"):
+        return schema["enum"][0]
+    for combinator in ("anyOf", "oneOf", "allOf"):
+        if combinator in schema:
+            options = schema[combinator]
+            if any(option.get("type") == "null" for option in options):
+                return None
+            return _schema_example(options[0], defs)
+
+    kind = schema.get("type")
+    if isinstance(kind, list):
+        if "null" in kind:
+            return None
+        kind = kind[0]
+    if kind == "object":
+        properties = schema.get("properties", {})
+        return {
+            name: _schema_example(properties.get(name, {}), defs)
+            for name in schema.get("required", [])
+        }
+    return {"array": [], "string": "", "integer": 0, "number": 0, "boolean": False, "null": None}.get(kind)
+
+
+def _forced_tool(body: dict[str, Any]) -> dict[str, Any] | None:
+    """The function definition a request asks to be called, if any."""
+    tools = [tool["function"] for tool in body.get("tools") or [] if tool.get("type") == "function"]
+    if not tools:
+        return None
+    choice = body.get("tool_choice")
+    if isinstance(choice, dict):
+        name = choice.get("function", {}).get("name")
+        return next((tool for tool in tools if tool.get("name") == name), tools[0])
+    return tools[0]
+
+
+def synthetic_completion(body: dict[str, Any]) -> dict[str, Any]:
+    """
+    Build a placeholder completion in the shape the request asks for.
+
+    Tool requests get a call with arguments valid against the tool's schema,
+    JSON mode requests get a JSON object, and others a short text reply.
+    """
+    message: dict[str, Any] = {"role": "assistant", "content": None}
+    tool = _forced_tool(body)
+    response_format = body.get("response_format") or {}
+
+    if tool is not None:
+        parameters = tool.get("parameters", {})
+        arguments = _schema_example(parameters, parameters.get("$defs", {}))
+        message["tool_calls"] = [{
+            "id": f"call_{uuid.uuid4().hex[:24]}",
+            "type": "function",
+            "function": {"name": tool.get("name", ""), "arguments": json.dumps(arguments)},
+        }]
+    elif response_format.get("type") == "json_schema":
+        schema = response_format.get("json_schema", {}).get("schema", {})
+        message["content"] = json.dumps(_schema_example(schema, schema.get("$defs", {})))
+    elif response_format.get("type") == "json_object":
+        message["content"] = json.dumps(_SYNTHETIC_JSON_REPLY)
+    else:
+        message["content"] = _SYNTHETIC_JSON_REPLY["reply"]
+
+    prompt_tokens = _estimate_tokens(json.dumps(body.get("messages", [])) + json.dumps(body.get("tools") or []))
+    output = message["content"] or message["tool_calls"][0]["function"]["arguments"]
+    completion_tokens = _estimate_tokens(output)
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "stand-in"),
+        "choices": [{"index": 0, "message": message, "finish_reason": "stop", "logprobs": None}],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
+
+
+def completion_chunks(completion: dict[str, Any], include_usage: bool = False) -> list[dict[str, Any]]:
+    """
+    Split a completion into the chunk events of the same streamed response.
+
+    With ``include_usage`` (``stream_options.include_usage``) a last chunk
+    without choices carries the usage, as the API sends it.
+    """
+    choice = completion["choices"][0]
+    message = choice["message"]
+
+    def chunk(delta: dict[str, Any], finish_reason: str | None = None) -> dict[str, Any]:
+        return {
+            "id": completion["id"],
+            "object": "chat.completion.chunk",
+            "created": completion["created"],
+            "model": completion["model"],
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason, "logprobs": None}],
+        }
+
+    chunks = [chunk({"role": "assistant", "content": ""})]
+    content = message.get("content") or ""
+    chunks += [chunk({"content": content[i:i + _CHUNK_CHARS]}) for i in range(0, len(content), _CHUNK_CHARS)]
+    for index, call in enumerate(message.get("tool_calls") or []):
+        chunks.append(chunk({"tool_calls": [{
+            "index": index, "id": call["id"], "type": "function",
+            "function": {"name": call["function"]["name"], "arguments": call["function"]["arguments"]},
+        }]}))
+    chunks.append(chunk({}, choice.get("finish_reason") or "stop"))
+    if include_usage:
+        chunks.append({**chunk({}), "choices": [], "usage": completion.get("usage")})
+    return chunks
+
+
+# =============================================================================
+# Stats
+# =============================================================================
+
+class _StandInStats:
+    """Request counts and added latency of the stand-in."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.recorded = 0
+        self.replayed = 0
+        self.replay_misses = 0
+        self.synthetic = 0
+        self.upstream_errors = 0
+        self.latencies: deque[float] = deque(maxlen=MAX_LATENCY_SAMPLES)
+
+    def count(self, outcome: str, latency: float | None = None) -> None:
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+            if latency is not None:
+                self.latencies.append(latency)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            latencies = sorted(self.latencies)
+
+        def percentile(p: float) -> float | None:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000, 1)
+
+        return {
+            "requests": self.requests,
+            "recorded": self.recorded,
+            "replayed": self.replayed,
+            "replay_misses": self.replay_misses,
+            "synthetic": self.synthetic,
+            "upstream_errors": self.upstream_errors,
+            "latency_ms": {"p50": percentile(50), "p95": percentile(95), "p99": percentile(99)},
+        }
+
+
+# =============================================================================
+# App
+# =============================================================================
+
+def _sse(chunks: list[dict[str, Any]]) -> list[bytes]:
+    return [f"data: {json.dumps(chunk)}\n\n".encode() for chunk in chunks] + [b"data: [DONE]\n\n"]
+
+
+async def _paced(events: list[bytes], latency: float) -> AsyncIterator[bytes]:
+    """Send the first event after half the latency and spread the rest over the other half."""
+    await asyncio.sleep(latency / 2)
+    gap = latency / 2 / max(len(events) - 1, 1)
+    for i, event in enumerate(events):
+        if i:
+            await asyncio.sleep(gap)
+        yield event
+
+
+def _error(status: int, message: str) -> JSONResponse:
+    return JSONResponse(
+        status_code=status,
+        content={"error": {"message": message, "type": "stand_in_error", "code": None}},
+    )
+
+
+def create_app(
+    mode: str = "synthetic",
+    recordings: str | Path | None = None,
+    upstream: str = DEFAULT_UPSTREAM,
+    latency: LatencyModel | None = None,
+    replay_latency: bool = True,
+    replay_fallback: bool = False,
+    upstream_transport: httpx.AsyncBaseTransport | None = None,
+) -> FastAPI:
+    """
+    Create the stand-in app.
+
+    Args:
+        mode: "record", "replay" or "synthetic"
+        recordings: JSONL recordings file (required to record or replay)
+        upstream: Base URL of the real API, for record mode
+        latency: Latency of synthetic responses (default: none)
+        replay_latency: Wait the recorded latency before a replayed response
+        replay_fallback: Answer unrecorded prompts synthetically instead of
+            with a 404 in replay mode
+        upstream_transport: HTTP transport to the upstream API (for tests)
+
+    Raises:
+        ValueError: If the mode is unknown or needs a recordings file
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown stand-in mode {mode!r}, expected one of {', '.join(MODES)}")
+    if mode in ("record", "replay") and recordings is None:
+        raise ValueError(f"{mode} mode needs a recordings file")
+
+    store = RecordingStore(recordings) if recordings is not None else None
+    latency = latency or LatencyModel()
+    stats = _StandInStats()
+    app = FastAPI(title="LLM stand-in")
+    app.state.stats = stats
+    app.state.store = store
+
+    async def synthetic(body: dict[str, Any]):
+        seconds = latency.sample()
+        stats.count("synthetic", seconds)
+        completion = synthetic_completion(body)
+        if body.get("stream"):
+            include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+            events = _sse(completion_chunks(completion, include_usage))
+            return StreamingResponse(_paced(events, seconds), media_type="text/event-stream")
+        await asyncio.sleep(seconds)
+        return JSONResponse(completion)
+
+    async def replay(key: str, body: dict[str, Any]):
+        record = store.get(key)
+        if record is None:
+            stats.count("replay_misses")
+            if replay_fallback:
+                return await synthetic(body)
+            return _error(404, f"No recorded response for prompt {key[:12]}")
+
+        seconds = record["latency"] if replay_latency else 0.0
+        stats.count("replayed", seconds)
+        if "chunks" in record:
+            return StreamingResponse(_paced(_sse(record["chunks"]), seconds), media_type="text/event-stream")
+        await asyncio.sleep(seconds)
+        return JSONResponse(record["response"])
+
+    async def record(key: str, body: dict[str, Any], headers: dict[str, str]):
+        client = httpx.AsyncClient(base_url=upstream, transport=upstream_transport, timeout=None)
+        started = time.perf_counter()
+        request = client.build_request("POST", "/chat/completions", json=body, headers=headers)
+        response = await client.send(request, stream=True)
+
+        if response.status_code >= 400:
+            content = await response.aread()
+            await response.aclose()
+            await client.aclose()
+            stats.count("upstream_errors")
+            # Passed through as sent: error bodies from proxies and gateways aren't always JSON
+            return Response(
+                content=content,
+                status_code=response.status_code,
+                media_type=response.headers.get("content-type"),
+            )
+
+        if not body.get("stream"):
+            content = await response.aread()
+            await response.aclose()
+            await client.aclose()
+            seconds = time.perf_counter() - started
+            completion = json.loads(content)
+            store.add({"key": key, "request": body, "latency": seconds, "response": completion})
+            stats.count("recorded", seconds)
+            return JSONResponse(completion)
+
+        async def relay() -> AsyncIterator[bytes]:
+            chunks = []
+            try:
+                async for line in response.aiter_lines():
+                    if line.startswith("data: ") and line != "data: [DONE]":
+                        chunks.append(json.loads(line[len("data: "):]))
+                    if line:
+                        yield f"{line}\n\n".encode()
+            finally:
+                await response.aclose()
+                await client.aclose()
+            seconds = time.perf_counter() - started
+            store.add({"key": key, "request": body, "latency": seconds, "chunks": chunks})
+            stats.count("recorded", seconds)
+
+        return StreamingResponse(relay(), media_type="text/event-stream")
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        stats.count("requests")
+        key = prompt_key(body)
+        if mode == "synthetic":
+            return await synthetic(body)
+        if mode == "replay":
+            return await replay(key, body)
+        headers = {"Authorization": request.headers.get("authorization", "")}
+        return await record(key, body, headers)
+
+    @app.get("/stats")
+    async def get_stats():
+        return {
+            "mode": mode,
+            "recordings": len(store) if store is not None else None,
+            **stats.snapshot(),
+        }
+
+    return app
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the stand-in server."""
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible chat completions stand-in")
+    parser.add_argument("--mode", choices=MODES, default="synthetic")
+    parser.add_argument("--recordings", help="JSONL recordings file (record and replay modes)")
+    parser.add_argument("--upstream", default=DEFAULT_UPSTREAM, help="Real API base URL for record mode")
+    parser.add_argument("--latency-median", type=float, default=0.8, help="Synthetic median latency (seconds)")
+    parser.add_argument("--latency-p95", type=float, default=None, help="Synthetic p95 latency (seconds)")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for synthetic latencies")
+    parser.add_argument("--no-replay-latency", action="store_true", help="Replay without the recorded latency")
+    parser.add_argument("--replay-fallback", action="store_true", help="Answer unrecorded prompts synthetically")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    args = parser.parse_args(argv)
+
+    import uvicorn
+
+    app = create_app(
+        mode=args.mode,
+        recordings=args.recordings,
+        upstream=args.upstream,
+        latency=LatencyModel(args.latency_median, args.latency_p95, seed=args.seed),
+        replay_latency=not args.no_replay_latency,
+        replay_fallback=args.replay_fallback,
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,481 @@
+"""
+LLM Usage - Per-Call Token, Latency and Cost Accounting.
+
+Every LLM completion (the parsers in tasks/parsers/llm_parsers.py and
+tasks/parsing.py, and the sammy bot in sammy/llm_client.py) runs inside
+``track_llm_call``, which records:
+
+- the call name (the parser's response model, "parse_user_message",
+  "sammy" or "sammy_stream") and model
+- prompt, cached prompt and completion tokens, summed over instructor's
+  validation retries and hedged duplicates (see llm_deadline.py)
+- wall latency, retry count and whether the call failed
+- the session, store and tenant of the turn (set by MessageProcessor)
+- the cost in USD, from MODEL_PRICES
+
+Calls are aggregated per minute in memory over the last
+LLM_USAGE_WINDOW_MINUTES, with latency and prompt-size histograms, and
+the most recent LLM_USAGE_RECENT_CALLS calls are kept individually. The
+report at /admin/analytics/llm-usage ranks call names by the LLM time they
+use, which shows where a deterministic fast path would save the most.
+``flush_llm_usage`` writes finished minutes to the llm_usage_summaries
+table.
+
+Usage:
+    with track_llm_call("CoffeeSizeResponse", model) as call:
+        result = client.chat.completions.create(..., hooks=call.hooks())
+
+    with track_llm_call("sammy", model) as call:
+        completion = client.chat.completions.create(...)
+        call.add_usage(completion.usage)
+
+    get_llm_usage_stats(group_by=("name", "model"))
+"""
+
+import bisect
+import logging
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Iterator, NamedTuple
+
+from .config import LLM_USAGE_RECENT_CALLS, LLM_USAGE_WINDOW_MINUTES
+from .tenant import get_current_tenant
+
+logger = logging.getLogger(__name__)
+
+# USD per million tokens: (input, cached input, output). Dated snapshots
+# ("gpt-4o-mini-2024-07-18") are priced by their longest listed prefix.
+MODEL_PRICES: dict[str, tuple[float, float, float]] = {
+    "gpt-4o-mini": (0.15, 0.075, 0.60),
+    "gpt-4o": (2.50, 1.25, 10.00),
+    "gpt-4.1-nano": (0.10, 0.025, 0.40),
+    "gpt-4.1-mini": (0.40, 0.10, 1.60),
+    "gpt-4.1": (2.00, 0.50, 8.00),
+    "claude-3-5-haiku": (0.80, 0.08, 4.00),
+    "claude-sonnet-4": (3.00, 0.30, 15.00),
+}
+
+# Upper bounds of the latency histogram buckets (milliseconds)
+LATENCY_BUCKETS_MS = (100, 250, 500, 1000, 2000, 4000, 8000, 16000, 30000, math.inf)
+
+# Upper bounds of the prompt size histogram buckets (tokens)
+PROMPT_TOKEN_BUCKETS = (250, 500, 1000, 2000, 4000, 8000, 16000, math.inf)
+
+GROUP_FIELDS = ("name", "model", "tenant", "store_id")
+
+
+def model_cost(model: str, prompt_tokens: int, completion_tokens: int, cached_tokens: int = 0) -> float | None:
+    """
+    Cost of one call in USD.
+
+    Returns:
+        The cost, or None if the model is not in MODEL_PRICES.
+    """
+    prefix = max((p for p in MODEL_PRICES if model.startswith(p)), key=len, default=None)
+    if prefix is None:
+        return None
+    input_price, cached_price, output_price = MODEL_PRICES[prefix]
+    cached_tokens = min(cached_tokens, prompt_tokens)
+    return (
+        (prompt_tokens - cached_tokens) * input_price
+        + cached_tokens * cached_price
+        + completion_tokens * output_price
+    ) / 1_000_000
+
+
+# =============================================================================
+# Attribution
+# =============================================================================
+
+class _Scope(NamedTuple):
+    session_id: str | None
+    store_id: str | None
+
+
+_active_scope: ContextVar[_Scope | None] = ContextVar("llm_usage_scope", default=None)
+
+
+@contextmanager
+def use_llm_usage_scope(session_id: str | None, store_id: str | None = None) -> Iterator[None]:
+    """Attribute the LLM calls made inside the block to a session and store."""
+    token = _active_scope.set(_Scope(session_id, store_id))
+    try:
+        yield
+    finally:
+        _active_scope.reset(token)
+
+
+# =============================================================================
+# Calls
+# =============================================================================
+
+def _tokens(usage: Any, field: str) -> int:
+    """A token count of a usage object (0 when absent or not a count)."""
+    value = getattr(usage, field, None)
+    return value if isinstance(value, int) else 0
+
+
+class LLMCall:
+    """Usage of one tracked LLM call, filled in while it runs."""
+
+    def __init__(self, name: str, model: str):
+        self.name = name
+        self.model = model
+        scope = _active_scope.get()
+        self.session_id = scope.session_id if scope else None
+        self.store_id = scope.store_id if scope else None
+        self.tenant = get_current_tenant()
+        self.requests = 0
+        self.retries = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self.completion_tokens = 0
+        self.latency = 0.0
+        self.error: str | None = None
+        # Usage can arrive from hedge threads
+        self._lock = threading.Lock()
+
+    def add_usage(self, usage: Any) -> None:
+        """Add the usage of one completion (OpenAI or Anthropic usage object)."""
+        with self._lock:
+            self.requests += 1
+            if usage is None:
+                return
+            # OpenAI: prompt/completion tokens; Anthropic: input/output tokens
+            if hasattr(usage, "input_tokens") and not hasattr(usage, "prompt_tokens"):
+                cached = _tokens(usage, "cache_read_input_tokens")
+                prompt = _tokens(usage, "input_tokens") + cached
+                completion = _tokens(usage, "output_tokens")
+            else:
+                prompt = _tokens(usage, "prompt_tokens")
+                cached = _tokens(getattr(usage, "prompt_tokens_details", None), "cached_tokens")
+                completion = _tokens(usage, "completion_tokens")
+            self.prompt_tokens += prompt
+            self.cached_tokens += cached
+            self.completion_tokens += completion
+
+    def add_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def hooks(self):
+        """Instructor hooks that add each completion's usage and count validation retries."""
+        from instructor.core.hooks import Hooks
+
+        hooks = Hooks()
+        hooks.on("completion:response", lambda response: self.add_usage(getattr(response, "usage", None)))
+        hooks.on("parse:error", lambda error: self.add_retry())
+        return hooks
+
+    @property
+    def cost(self) -> float | None:
+        return model_cost(self.model, self.prompt_tokens, self.completion_tokens, self.cached_tokens)
+
+    def to_dict(self) -> dict[str, Any]:
+        cost = self.cost
+        return {
+            "name": self.name,
+            "model": self.model,
+            "session_id": self.session_id,
+            "store_id": self.store_id,
+            "tenant": self.tenant,
+            "requests": self.requests,
+            "retries": self.retries,
+            "prompt_tokens": self.prompt_tokens,
+            "cached_tokens": self.cached_tokens,
+            "completion_tokens": self.completion_tokens,
+            "latency_ms": round(self.latency * 1000, 1),
+            "cost_usd": round(cost, 6) if cost is not None else None,
+            "error": self.error,
+        }
+
+
+@contextmanager
+def track_llm_call(name: str, model: str) -> Iterator[LLMCall]:
+    """
+    Record the usage and wall latency of the LLM call made inside the block.
+
+    Args:
+        name: Call name to aggregate under (e.g. the response model name)
+        model: Model name, for pricing
+    """
+    call = LLMCall(name, model)
+    started = time.perf_counter()
+    try:
+        yield call
+    except BaseException as e:
+        call.error = type(e).__name__
+        raise
+    finally:
+        call.latency = time.perf_counter() - started
+        _usage.record(call)
+
+
+# =============================================================================
+# Aggregation
+# =============================================================================
+
+class _Bucket:
+    """Usage totals of one group in one minute."""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.requests = 0
+        self.retries = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self.completion_tokens = 0
+        self.cost = 0.0
+        self.unpriced = 0
+        self.latency = 0.0
+        self.max_latency = 0.0
+        self.latency_histogram = [0] * len(LATENCY_BUCKETS_MS)
+        self.prompt_histogram = [0] * len(PROMPT_TOKEN_BUCKETS)
+        self.sessions: set[str] = set()
+
+    def add(self, call: LLMCall) -> None:
+        self.calls += 1
+        self.errors += call.error is not None
+        self.requests += call.requests
+        self.retries += call.retries
+        self.prompt_tokens += call.prompt_tokens
+        self.cached_tokens += call.cached_tokens
+        self.completion_tokens += call.completion_tokens
+        cost = call.cost
+        if cost is None:
+            self.unpriced += 1
+        else:
+            self.cost += cost
+        self.latency += call.latency
+        self.max_latency = max(self.max_latency, call.latency)
+        self.latency_histogram[bisect.bisect_left(LATENCY_BUCKETS_MS, call.latency * 1000)] += 1
+        if call.requests:
+            per_request = call.prompt_tokens / call.requests
+            self.prompt_histogram[bisect.bisect_left(PROMPT_TOKEN_BUCKETS, per_request)] += 1
+        if call.session_id:
+            self.sessions.add(call.session_id)
+
+    def merge(self, other: "_Bucket") -> None:
+        for field in (
+            "calls", "errors", "requests", "retries", "prompt_tokens", "cached_tokens",
+            "completion_tokens", "cost", "unpriced", "latency",
+        ):
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+        self.max_latency = max(self.max_latency, other.max_latency)
+        self.latency_histogram = [a + b for a, b in zip(self.latency_histogram, other.latency_histogram)]
+        self.prompt_histogram = [a + b for a, b in zip(self.prompt_histogram, other.prompt_histogram)]
+        self.sessions |= other.sessions
+
+    def latency_percentile_ms(self, percentile: float) -> float | None:
+        """Upper bound of the histogram bucket holding the percentile (the max for the last bucket)."""
+        if not self.calls:
+            return None
+        rank = math.ceil(self.calls * percentile / 100)
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.latency_histogram):
+            seen += count
+            if seen >= rank:
+                return round(min(bound, self.max_latency * 1000), 1)
+        return round(self.max_latency * 1000, 1)
+
+    def to_dict(self) -> dict[str, Any]:
+        calls = self.calls or 1
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "retries": self.retries,
+            "retry_rate": round(self.retries / calls, 4),
+            "requests": self.requests,
+            "sessions": len(self.sessions),
+            "prompt_tokens": self.prompt_tokens,
+            "cached_tokens": self.cached_tokens,
+            "completion_tokens": self.completion_tokens,
+            "avg_prompt_tokens": round(self.prompt_tokens / calls, 1),
+            "avg_completion_tokens": round(self.completion_tokens / calls, 1),
+            "cost_usd": round(self.cost, 6),
+            "unpriced_calls": self.unpriced,
+            "latency_total_s": round(self.latency, 3),
+            "latency_avg_ms": round(self.latency * 1000 / calls, 1),
+            "latency_p50_ms": self.latency_percentile_ms(50),
+            "latency_p95_ms": self.latency_percentile_ms(95),
+            "latency_p99_ms": self.latency_percentile_ms(99),
+            "latency_histogram": _histogram(LATENCY_BUCKETS_MS, self.latency_histogram, "ms"),
+            "prompt_token_histogram": _histogram(PROMPT_TOKEN_BUCKETS, self.prompt_histogram, ""),
+        }
+
+
+def _histogram(bounds: tuple[float, ...], counts: list[int], unit: str) -> dict[str, int]:
+    labels = [f"<={bound:g}{unit}" for bound in bounds[:-1]] + [f">{bounds[-2]:g}{unit}"]
+    return dict(zip(labels, counts))
+
+
+_GroupKey = tuple[str, str, str | None, str | None]
+
+
+class _RollingUsage:
+    """Per-minute usage buckets for the last LLM_USAGE_WINDOW_MINUTES minutes."""
+
+    def __init__(self, window_minutes: int, recent_calls: int):
+        self._lock = threading.Lock()
+        self.window_minutes = window_minutes
+        self.recent_calls = recent_calls
+        self.reset()
+
+    def reset(self) -> None:
+        # (minute, {(name, model, tenant, store_id): bucket}), oldest first
+        self.minutes: deque[tuple[int, dict[_GroupKey, _Bucket]]] = deque()
+        self.recent: deque[dict[str, Any]] = deque(maxlen=self.recent_calls)
+        # Minutes up to this one are already written by flush_llm_usage
+        self.flushed_through = 0
+
+    def record(self, call: LLMCall, now: float | None = None) -> None:
+        minute = int((now if now is not None else time.time()) // 60)
+        key = (call.name, call.model, call.tenant, call.store_id)
+        with self._lock:
+            if not self.minutes or self.minutes[-1][0] != minute:
+                self.minutes.append((minute, {}))
+            self._expire(minute)
+            self.minutes[-1][1].setdefault(key, _Bucket()).add(call)
+            self.recent.append(call.to_dict())
+
+    def _expire(self, minute: int) -> None:
+        while self.minutes and self.minutes[0][0] <= minute - self.window_minutes:
+            self.minutes.popleft()
+
+    def buckets(self, since_minute: int) -> list[tuple[int, dict[_GroupKey, _Bucket]]]:
+        # Copied under the lock: record() adds groups and updates buckets in place
+        with self._lock:
+            return [
+                (minute, {key: _copy_bucket(bucket) for key, bucket in groups.items()})
+                for minute, groups in self.minutes
+                if minute >= since_minute
+            ]
+
+    def latest_calls(self, count: int) -> list[dict[str, Any]]:
+        with self._lock:
+            return list(self.recent)[-count:] if count else []
+
+
+def _copy_bucket(bucket: _Bucket) -> _Bucket:
+    copy = _Bucket()
+    copy.merge(bucket)
+    return copy
+
+
+_usage = _RollingUsage(LLM_USAGE_WINDOW_MINUTES, LLM_USAGE_RECENT_CALLS)
+
+
+def get_llm_usage_stats(
+    window_minutes: int | None = None,
+    group_by: tuple[str, ...] = ("name", "model"),
+    recent: int = 0,
+) -> dict[str, Any]:
+    """
+    Get LLM usage aggregated over the recent window.
+
+    Args:
+        window_minutes: Minutes to include (default and maximum:
+            LLM_USAGE_WINDOW_MINUTES)
+        group_by: Fields to group by, from "name", "model", "tenant" and
+            "store_id"
+        recent: Number of most recent individual calls to include
+
+    Returns:
+        Dict with the window, the totals, and the groups sorted by total
+        latency (most LLM time first). Each has call, error and retry
+        counts, token totals and averages, cost, latency percentiles
+        estimated from the histogram, and the latency and prompt size
+        histograms.
+
+    Raises:
+        ValueError: If group_by names an unknown field
+    """
+    unknown = set(group_by) - set(GROUP_FIELDS)
+    if unknown:
+        raise ValueError(f"Cannot group LLM usage by {', '.join(sorted(unknown))}")
+    window = min(window_minutes or _usage.window_minutes, _usage.window_minutes)
+    since = int(time.time() // 60) - window + 1
+
+    totals = _Bucket()
+    groups: dict[tuple, _Bucket] = {}
+    for _minute, minute_groups in _usage.buckets(since):
+        for key, bucket in minute_groups.items():
+            fields = dict(zip(GROUP_FIELDS, key))
+            group = tuple(fields[field] for field in group_by)
+            groups.setdefault(group, _Bucket()).merge(bucket)
+            totals.merge(bucket)
+
+    ranked = sorted(groups.items(), key=lambda item: item[1].latency, reverse=True)
+    return {
+        "window_minutes": window,
+        "group_by": list(group_by),
+        "totals": totals.to_dict(),
+        "groups": [
+            {**dict(zip(group_by, group)), **bucket.to_dict()}
+            for group, bucket in ranked
+        ],
+        "recent_calls": _usage.latest_calls(recent),
+    }
+
+
+def reset_llm_usage_stats() -> None:
+    """Drop all recorded LLM usage."""
+    with _usage._lock:
+        _usage.reset()
+
+
+def flush_llm_usage(db, now: float | None = None) -> int:
+    """
+    Write the finished minutes not yet flushed to the llm_usage_summaries table.
+
+    Each process keeps its own usage, so every worker flushes its own rows.
+    The current minute is left in memory until it is over.
+
+    Args:
+        db: Database session
+        now: Current time (for tests)
+
+    Returns:
+        Number of rows written.
+    """
+    from .models import LLMUsageSummary
+
+    current = int((now if now is not None else time.time()) // 60)
+    rows = []
+    flushed_through = _usage.flushed_through
+    for minute, groups in _usage.buckets(flushed_through + 1):
+        if minute >= current:
+            break
+        for (name, model, tenant, store_id), bucket in groups.items():
+            rows.append(LLMUsageSummary(
+                minute=datetime.fromtimestamp(minute * 60, tz=timezone.utc),
+                name=name,
+                model=model,
+                tenant=tenant,
+                store_id=store_id,
+                calls=bucket.calls,
+                errors=bucket.errors,
+                retries=bucket.retries,
+                sessions=len(bucket.sessions),
+                prompt_tokens=bucket.prompt_tokens,
+                cached_tokens=bucket.cached_tokens,
+                completion_tokens=bucket.completion_tokens,
+                cost_usd=bucket.cost,
+                latency_total_ms=bucket.latency * 1000,
+                latency_p95_ms=bucket.latency_percentile_ms(95),
+            ))
+        flushed_through = minute
+
+    if rows:
+        db.add_all(rows)
+        db.commit()
+    with _usage._lock:
+        _usage.flushed_through = max(_usage.flushed_through, flushed_through)
+    logger.info("Flushed %d LLM usage summaries", len(rows))
+    return len(rows)
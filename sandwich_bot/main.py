@@ -66,7 +66,7 @@ import logging
 import pathlib
 import uuid
 from contextlib import asynccontextmanager
-from typing import Dict
+from typing import Any, Dict
 
 from fastapi import FastAPI, Depends, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -84,6 +84,7 @@ from .config import (
     RATE_LIMIT_ENABLED,
     ADMIN_PAGES,
 )
+from .llm_breaker import llm_breaker
 from .logging_config import setup_logging
 
 # Import routers
@@ -286,9 +287,14 @@ def root(request: Request):
 
 
 @app.get("/health", tags=["Health"])
-def health() -> Dict[str, str]:
-    """Health check endpoint. Returns ok if the service is running."""
-    return {"status": "ok", "version": __version__}
+def health() -> Dict[str, Any]:
+    """
+    Health check endpoint. Returns ok if the service is running.
+
+    "llm" is the LLM circuit breaker's state; while it is "open", turns that
+    need the LLM get a clarifying question instead.
+    """
+    return {"status": "ok", "version": __version__, "llm": llm_breaker.get_health()}
 
 
 # =============================================================================
@@ -25,6 +25,7 @@ Usage:
 
 import asyncio
 import logging
+import re
 import threading
 from collections import defaultdict
 from datetime import datetime
@@ -32,8 +33,122 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
+from .llm_response_cache import llm_response_cache
+from .parse_memo import parse_memo
+from .pattern_registry import pattern_registry
+from .phrase_matcher import PhraseMatcher
+from .spell_corrector import ORDER_WORDS, SpellCorrector
+
 logger = logging.getLogger(__name__)
 
+# Generic phrases that contain "and" (or a comma) but name a single item.
+# The menu's own compound names and aliases are added at load time; these
+# cover the ways customers say items the menu lists under other names.
+DEFAULT_SINGLE_ITEM_PHRASES = frozenset({
+    "bacon egg and cheese", "ham egg and cheese", "sausage egg and cheese",
+    "bacon and egg and cheese", "ham and egg and cheese",
+    "bacon eggs and cheese", "ham eggs and cheese", "egg and cheese",
+    "egg cheese and bacon", "egg, cheese and bacon",
+    "ham and cheese", "ham and egg", "bacon and egg", "egg and bacon",
+    "lox and cream cheese", "salt and pepper", "cream cheese and lox",
+    "eggs and bacon", "black and white", "spinach and feta",
+    # Condiment pairs ("with mayo and mustard" is one instruction, not two items)
+    "mayo and mustard", "mustard and mayo", "ketchup and mustard",
+    "lettuce and tomato", "tomato and lettuce", "onions and peppers",
+    "pickles and onions",
+})
+
+# Generic words naming a coffee-bar drink, on top of the menu's coffee types
+DEFAULT_COFFEE_WORDS = frozenset({
+    "coffee", "iced coffee", "cold brew", "drip", "tea", "chai", "matcha",
+    "latte", "cappuccino", "espresso", "americano", "macchiato", "mocha",
+})
+
+# Generic words naming any other drink, on top of the menu's soda types
+DEFAULT_DRINK_WORDS = frozenset({
+    "soda", "juice", "milk", "chocolate milk", "water", "lemonade",
+    "coke", "diet coke", "coca-cola", "sprite",
+})
+
+# Generic words marking a special instruction as being about the bagel
+DEFAULT_BAGEL_MODIFIER_WORDS = frozenset({
+    "cream cheese", "cream", "butter", "spread", "meat", "cheese",
+    "cc", "veggie", "vegetable", "scallion", "peanut butter", "nutella",
+    "hummus", "jelly", "jam", "preserves", "strawberry", "grape", "raspberry",
+})
+
+# Generic words for milks, sweeteners and syrups added to a drink
+DEFAULT_COFFEE_MODIFIER_WORDS = frozenset({
+    "milk", "cream", "half and half", "sugar", "sweetener", "honey", "syrup",
+    "shot", "espresso shot", "foam", "whip", "whipped cream", "ice",
+})
+
+# Generic nouns that always start a new item, on top of the menu's item names
+DEFAULT_ITEM_HEAD_WORDS = frozenset({
+    "bagel", "sandwich", "croissant", "muffin", "pastry", "donut", "cookie",
+    "salad", "soup", "avocado toast", "omelette", "wrap",
+})
+
+
+def _with_plurals(phrases) -> set[str]:
+    """Add simple plurals ("lattes", "tomatoes") so word-boundary matches still find them."""
+    result = set(phrases)
+    for phrase in phrases:
+        result.add(phrase + "s")
+        if phrase.endswith("o"):
+            result.add(phrase + "es")
+    return result
+
+
+def _build_item_phrase_matcher(
+    compound_names=(),
+    coffee_types=(),
+    drink_types=(),
+    bagel_modifiers=(),
+    item_names=(),
+    coffee_modifiers=(),
+) -> PhraseMatcher:
+    """
+    Build the matcher for item-level phrases from menu vocabularies.
+
+    Categories:
+        single_item: Names containing "and" or a comma that are one item
+        coffee: Coffee-bar drinks
+        drink: Any drink (includes every coffee phrase)
+        bagel_modifier: Spreads, proteins, cheeses and toppings
+        item_head: Menu items, sides and generic food nouns
+        coffee_modifier: Milks, sweeteners and syrups ("oat milk" and "oat")
+    """
+    single_item = set(DEFAULT_SINGLE_ITEM_PHRASES)
+    for name in compound_names:
+        # Customers say "and" where the menu prints "&"
+        name = name.replace(" & ", " and ")
+        if " and " in name or ", " in name:
+            single_item.add(name)
+
+    coffee_modifier = set(DEFAULT_COFFEE_MODIFIER_WORDS)
+    for option in coffee_modifiers:
+        # Customers name options without the suffix ("oat", "vanilla")
+        option = option.lower().replace("&", "and")
+        coffee_modifier.add(option)
+        for suffix in (" milk", " syrup"):
+            if option.endswith(suffix):
+                coffee_modifier.add(option[:-len(suffix)])
+
+    coffee = _with_plurals(DEFAULT_COFFEE_WORDS | set(coffee_types))
+    return PhraseMatcher({
+        "single_item": _with_plurals(single_item),
+        "coffee": coffee,
+        "drink": coffee | _with_plurals(DEFAULT_DRINK_WORDS | set(drink_types)),
+        "bagel_modifier": _with_plurals(DEFAULT_BAGEL_MODIFIER_WORDS | set(bagel_modifiers)),
+        "item_head": _with_plurals(DEFAULT_ITEM_HEAD_WORDS | set(item_names)),
+        "coffee_modifier": _with_plurals(coffee_modifier),
+    })
+
+
+# Used before the first load, so item phrases are recognized without a database
+_DEFAULT_ITEM_PHRASE_MATCHER = _build_item_phrase_matcher()
+
 
 class MenuDataCache:
     """
@@ -88,6 +203,7 @@ class MenuDataCache:
         # Abbreviations for text expansion before parsing (e.g., "cc" -> "cream cheese")
         # Unlike aliases (used for matching), abbreviations replace text in the input
         self._abbreviations: dict[str, str] = {}  # abbreviation -> canonical name (lowercase)
+        self._abbreviation_pattern: re.Pattern | None = None  # Combined alternation, longest first
 
         # Category keyword mappings (replaces MENU_CATEGORY_KEYWORDS constant)
         # Maps user keywords (bagels, desserts, etc.) to category info
@@ -116,10 +232,19 @@ class MenuDataCache:
         self._bagel_keyword_index: dict[str, list[str]] = {}
         self._menu_item_keyword_index: dict[str, list[str]] = {}
 
+        # Single-pass phrase matcher for modifiers, qualifiers and bagel types
+        # (rebuilt on every load so it always reflects the current vocabulary)
+        self._modifier_matcher: PhraseMatcher | None = None
+        # Compound item names, drinks and bagel modifiers for multi-item detection
+        self._item_phrase_matcher: PhraseMatcher | None = None
+        # Near-miss word correction against the same vocabularies
+        self._spell_corrector: SpellCorrector | None = None
+
         # Cached menu index (expensive to build, loaded once at startup)
         self._menu_index: dict[str, Any] = {}
 
         # Metadata
+        self._menu_version: str | None = None  # Hash of all loaded menu data
         self._last_refresh: datetime | None = None
         self._is_loaded: bool = False
         self._refresh_lock = threading.Lock()
@@ -140,6 +265,11 @@ class MenuDataCache:
         """Get timestamp of last cache refresh."""
         return self._last_refresh
 
+    @property
+    def menu_version(self) -> str | None:
+        """Get the version hash of the loaded menu data (None if not loaded)."""
+        return self._menu_version if self._is_loaded else None
+
     def load_from_db(self, db: Session, fail_on_error: bool = True) -> None:
         """
         Load all menu data from the database.
@@ -182,9 +312,19 @@ class MenuDataCache:
                 # Build keyword indices for partial matching
                 self._build_keyword_indices()
 
+                # Build phrase matchers for single-pass modifier extraction
+                self._build_matchers()
+
+                self._menu_version = self._compute_menu_version()
                 self._last_refresh = datetime.now()
                 self._is_loaded = True
 
+                # Recompile every menu-driven regex against the new data
+                pattern_registry.rebuild(self._menu_version)
+                # Memoized parser results reflect the old menu
+                parse_memo.reset(self._menu_version)
+                llm_response_cache.set_menu_version(self._menu_version)
+
                 logger.info(
                     "Menu data cache loaded: %d spread_types, %d bagel_types, "
                     "%d proteins, %d toppings, %d cheeses, %d coffee_types, "
@@ -1052,6 +1192,7 @@ class MenuDataCache:
                 abbreviations[abbrev] = canonical
 
         self._abbreviations = abbreviations
+        self._abbreviation_pattern = self._build_abbreviation_pattern(abbreviations)
 
         logger.debug(
             "Loaded %d abbreviations from %d ingredients and %d menu items",
@@ -1060,6 +1201,20 @@ class MenuDataCache:
             len(menu_items),
         )
 
+    @staticmethod
+    def _build_abbreviation_pattern(abbreviations: dict[str, str]) -> re.Pattern | None:
+        """Compile all abbreviations into one word-bounded alternation.
+
+        Longer abbreviations come first so they win over their prefixes, and
+        a single scan expands every abbreviation in the input.
+        """
+        if not abbreviations:
+            return None
+        alternation = "|".join(
+            re.escape(abbrev) for abbrev in sorted(abbreviations, key=len, reverse=True)
+        )
+        return re.compile(rf"\b(?:{alternation})\b", re.IGNORECASE)
+
     def _load_item_type_fields(self, db: Session) -> None:
         """Load item type attribute configurations from the database.
 
@@ -1309,6 +1464,104 @@ class MenuDataCache:
             len(self._menu_item_keyword_index),
         )
 
+    def _build_matchers(self) -> None:
+        """Build the phrase matchers used for single-pass modifier extraction.
+
+        The modifier matcher covers every vocabulary that
+        extract_modifiers_from_input and extract_modifiers_with_qualifiers
+        scan for, so one pass over the user input finds all candidate spans.
+        The item phrase matcher marks compound item names, item heads,
+        drinks and their modifiers for multi-item detection and segmentation. The spell corrector is built from
+        the same vocabularies plus coffee, soda and menu item names.
+        """
+        self._modifier_matcher = PhraseMatcher({
+            "spread": self._bagel_spreads,
+            "protein": self._proteins,
+            "cheese": self._cheeses,
+            "topping": self._toppings,
+            "bagel_type": self._bagel_types,
+            "qualifier": self._modifier_qualifiers.keys(),
+        })
+
+        self._item_phrase_matcher = _build_item_phrase_matcher(
+            compound_names=[
+                *self._known_menu_items,
+                *self._signature_item_aliases,
+                *self._bagel_spreads,
+                *self._by_pound_aliases,
+                *self._side_items,
+                *self._coffee_types,
+                *self._soda_types,
+            ],
+            coffee_types=self._coffee_types,
+            drink_types=self._soda_types,
+            bagel_modifiers=[
+                *self._bagel_spreads,
+                *self._proteins,
+                *self._cheeses,
+                *self._toppings,
+            ],
+            item_names=[
+                *self._known_menu_items,
+                *self._signature_item_aliases,
+                *self._side_items,
+                *self._by_pound_aliases,
+            ],
+            coffee_modifiers=[
+                *self._beverage_milks,
+                *self._beverage_sweeteners,
+                *self._beverage_syrups,
+            ],
+        )
+
+        self._spell_corrector = SpellCorrector([
+            *self._bagel_types,
+            *self._bagel_spreads,
+            *self._spread_types,
+            *self._proteins,
+            *self._cheeses,
+            *self._toppings,
+            *self._coffee_types,
+            *self._soda_types,
+            *self._known_menu_items,
+            *self._signature_item_aliases,
+            *self._beverage_milks,
+            *self._beverage_sweeteners,
+            *self._beverage_syrups,
+            *ORDER_WORDS,
+        ])
+
+        logger.debug(
+            "Built modifier matcher with %d phrases, item phrase matcher with %d phrases, "
+            "spell corrector with %d words",
+            len(self._modifier_matcher),
+            len(self._item_phrase_matcher),
+            len(self._spell_corrector),
+        )
+
+    def _compute_menu_version(self) -> str:
+        """Hash all loaded menu data into a short version string.
+
+        Anything derived from the cache (compiled patterns, memoized parses)
+        can be keyed by this version and is invalidated when it changes.
+        """
+        import hashlib
+        import json
+
+        def _normalize(value: Any) -> Any:
+            if isinstance(value, (set, frozenset)):
+                return sorted(value)
+            return value
+
+        data = {
+            name: _normalize(value)
+            for name, value in vars(self).items()
+            if name.startswith("_") and isinstance(value, (set, frozenset, list, dict))
+            and not name.endswith("_keyword_index")
+        }
+        data_str = json.dumps(data, sort_keys=True, default=str)
+        return hashlib.md5(data_str.encode()).hexdigest()[:12]
+
     def _build_index(self, items: set[str], skip_words: set[str]) -> dict[str, list[str]]:
         """Build a keyword-to-items index for a set of items."""
         index: dict[str, list[str]] = defaultdict(list)
@@ -1397,6 +1650,33 @@ class MenuDataCache:
         """Get all known menu item names."""
         return self._known_menu_items.copy() if self._is_loaded else set()
 
+    def get_modifier_matcher(self) -> PhraseMatcher | None:
+        """Get the phrase matcher for modifiers, qualifiers and bagel types.
+
+        Categories: spread, protein, cheese, topping, bagel_type, qualifier.
+        The matcher is immutable, so it is shared rather than copied.
+
+        Returns:
+            The PhraseMatcher built at the last load, or None if not loaded.
+        """
+        return self._modifier_matcher if self._is_loaded else None
+
+    def get_item_phrase_matcher(self) -> PhraseMatcher:
+        """Get the phrase matcher for compound item names, drinks and bagel modifiers.
+
+        Categories: single_item (names like "bacon egg and cheese" whose
+        "and" does not separate items), coffee, drink, bagel_modifier,
+        item_head, coffee_modifier.
+
+        Returns:
+            The PhraseMatcher built at the last load, or one built from the
+            generic defaults if not loaded.
+        """
+        matcher = self._item_phrase_matcher
+        if not self._is_loaded or matcher is None:
+            return _DEFAULT_ITEM_PHRASE_MATCHER
+        return matcher
+
     def get_global_attribute_options(self, attr_slug: str) -> list[dict]:
         """Get options for a global attribute by slug.
 
@@ -1784,22 +2064,45 @@ class MenuDataCache:
             >>> cache.expand_abbreviations("I want a pb&j")  # no match for "pb&j"
             "I want a pb&j"
         """
-        import re
-
-        if not self._is_loaded or not self._abbreviations:
+        pattern = self._abbreviation_pattern
+        if not self._is_loaded or pattern is None:
             return text
 
-        result = text
-        # Sort by length descending to match longer abbreviations first
-        for abbrev, canonical in sorted(
-            self._abbreviations.items(), key=lambda x: len(x[0]), reverse=True
-        ):
-            # Use word boundary matching (case-insensitive)
-            # This ensures "cc" matches but "success" doesn't become "sucream cheesess"
-            pattern = rf'\b{re.escape(abbrev)}\b'
-            result = re.sub(pattern, canonical, result, flags=re.IGNORECASE)
+        # One scan over the input; each match is replaced via the lookup map.
+        # Word boundaries ensure "cc" matches but "success" doesn't become
+        # "sucream cheesess".
+        abbreviations = self._abbreviations
+        return pattern.sub(
+            lambda match: abbreviations.get(match.group(0).lower(), match.group(0)),
+            text,
+        )
+
+    def correct_spelling(self, text: str) -> str:
+        """
+        Snap misspelled words in the input to the menu vocabulary.
 
-        return result
+        Only near misses of menu words are changed; known words, common
+        English words and short words are left alone, and words of five
+        letters or fewer only change to complete a menu phrase (see
+        SpellCorrector).
+
+        Args:
+            text: User input text
+
+        Returns:
+            Text with near-miss words corrected.
+            Returns original text if cache not loaded.
+
+        Examples:
+            >>> cache.correct_spelling("everthing bagel with scallion cream chese")
+            "everything bagel with scallion cream cheese"
+            >>> cache.correct_spelling("a capuccino")
+            "a cappuccino"
+        """
+        corrector = self._spell_corrector
+        if not self._is_loaded or corrector is None:
+            return text
+        return corrector.correct(text)
 
     def get_category_keyword_mapping(self, keyword: str) -> dict | None:
         """
@@ -2282,6 +2585,7 @@ class MenuDataCache:
         """Get cache status information."""
         return {
             "is_loaded": self._is_loaded,
+            "menu_version": self._menu_version,
             "last_refresh": self._last_refresh.isoformat() if self._last_refresh else None,
             "counts": {
                 "spreads": len(self._spreads),
@@ -2305,6 +2609,14 @@ class MenuDataCache:
                 "bagel_keywords": len(self._bagel_keyword_index),
                 "menu_item_keywords": len(self._menu_item_keyword_index),
             },
+            "matchers": {
+                "modifier_phrases": len(self._modifier_matcher) if self._modifier_matcher else 0,
+                "item_phrases": len(self._item_phrase_matcher) if self._item_phrase_matcher else 0,
+                "spelling_words": len(self._spell_corrector) if self._spell_corrector else 0,
+            },
+            "patterns": pattern_registry.get_status(),
+            "parse_memo": parse_memo.get_status(),
+            "llm_response_cache": llm_response_cache.get_status(),
         }
 
     async def start_background_refresh(self, get_db_session) -> None:
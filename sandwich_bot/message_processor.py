@@ -22,8 +22,10 @@ from sqlalchemy.orm import Session
 
 from .models import SessionAnalytics, Company
 from .menu_data_cache import menu_cache
+from .llm_deadline import TurnDeadline, use_turn_deadline
+from .llm_usage import use_llm_usage_scope
 from .email_service import send_payment_link_email
-from .chains.integration import process_voice_message
+from .chains.integration import process_voice_message, process_voice_message_async
 from .services.helpers import get_customer_info, build_store_info
 
 logger = logging.getLogger(__name__)
@@ -46,6 +48,9 @@ class ProcessingContext:
     # Pre-loaded session (optional - if not provided, will be loaded)
     session: Optional[Dict[str, Any]] = None
 
+    # LLM time allowed for this turn in seconds (default: LLM_TURN_BUDGET_SECONDS)
+    llm_budget_seconds: Optional[float] = None
+
 
 @dataclass
 class ProcessingResult:
@@ -70,6 +75,17 @@ class ProcessingResult:
     session: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class _Turn:
+    """Context loaded for one message before the state machine runs."""
+    session: Dict[str, Any]
+    history: List[Dict[str, str]]
+    session_store_id: Optional[str]
+    session_caller_id: Optional[str]
+    # Keyword arguments for process_voice_message(_async)
+    state_machine_args: Dict[str, Any]
+
+
 # -----------------------------------------------------------------------------
 # MessageProcessor Class
 # -----------------------------------------------------------------------------
@@ -93,6 +109,9 @@ class MessageProcessor:
             session_id="abc123",
             caller_id="+15551234567",
         ))
+
+        # From an async endpoint
+        result = await processor.process_async(ctx)
     """
 
     def __init__(self, db: Session):
@@ -104,7 +123,44 @@ class MessageProcessor:
         Process a user message and return the result.
 
         This is the main entry point that orchestrates all processing steps.
+        LLM calls made for the message share one deadline (see
+        llm_deadline.py); if it runs out, the reply is a clarifying question.
+        Their usage is recorded against the session and store (see
+        llm_usage.py).
+        """
+        turn = self._begin_turn(ctx)
+
+        # 4. Process through state machine, within the turn's LLM budget
+        with use_turn_deadline(TurnDeadline(ctx.llm_budget_seconds)), self._usage_scope(ctx, turn):
+            reply, updated_order_state, actions = process_voice_message(**turn.state_machine_args)
+
+        return self._finish_turn(ctx, turn, reply, updated_order_state, actions)
+
+    async def process_async(self, ctx: ProcessingContext) -> ProcessingResult:
         """
+        Async version of process for async endpoints (e.g. the Vapi webhook).
+
+        The state machine step awaits LLM fallbacks on the event loop's
+        async client and runs handlers in a worker thread, so one slow
+        completion does not stall other calls.
+        """
+        turn = self._begin_turn(ctx)
+
+        # 4. Process through state machine, within the turn's LLM budget
+        with use_turn_deadline(TurnDeadline(ctx.llm_budget_seconds)), self._usage_scope(ctx, turn):
+            reply, updated_order_state, actions = await process_voice_message_async(
+                **turn.state_machine_args
+            )
+
+        return self._finish_turn(ctx, turn, reply, updated_order_state, actions)
+
+    @staticmethod
+    def _usage_scope(ctx: ProcessingContext, turn: "_Turn"):
+        """Attribute the turn's LLM calls to its session and store (see llm_usage.py)."""
+        return use_llm_usage_scope(ctx.session_id, turn.session_store_id)
+
+    def _begin_turn(self, ctx: ProcessingContext) -> "_Turn":
+        """Load the session, customer, menu and store context for a message."""
         # 1. Load or create session
         session = ctx.session or self._get_or_create_session(ctx.session_id)
         if session is None:
@@ -128,17 +184,36 @@ class MessageProcessor:
         menu_index = menu_cache.get_menu_index(session_store_id)
         store_info = self._build_store_info(session_store_id)
 
-        # 4. Process through state machine
-        reply, updated_order_state, actions = process_voice_message(
-            user_message=ctx.user_message,
-            order_state=order_state,
+        return _Turn(
+            session=session,
             history=history,
-            session_id=ctx.session_id,
-            menu_index=menu_index,
-            store_info=store_info,
-            returning_customer=returning_customer,
+            session_store_id=session_store_id,
+            session_caller_id=session_caller_id,
+            state_machine_args=dict(
+                user_message=ctx.user_message,
+                order_state=order_state,
+                history=history,
+                session_id=ctx.session_id,
+                menu_index=menu_index,
+                store_info=store_info,
+                returning_customer=returning_customer,
+            ),
         )
 
+    def _finish_turn(
+        self,
+        ctx: ProcessingContext,
+        turn: "_Turn",
+        reply: str,
+        updated_order_state: Dict[str, Any],
+        actions: List[Dict[str, Any]],
+    ) -> ProcessingResult:
+        """Record the reply, persist a confirmed order and save the session."""
+        session = turn.session
+        history = turn.history
+        session_store_id = turn.session_store_id
+        session_caller_id = turn.session_caller_id
+
         # 5. Update history
         history.append({"role": "user", "content": ctx.user_message})
         history.append({"role": "assistant", "content": reply})
@@ -962,6 +962,41 @@ class SessionAnalytics(Base):
 AbandonedSession = SessionAnalytics
 
 
+# --- LLM usage summaries (see llm_usage.py) ---
+
+class LLMUsageSummary(Base):
+    """
+    LLM usage of one call name and model in one minute, per tenant and store.
+    Written from the in-memory usage aggregates by llm_usage.flush_llm_usage.
+    """
+    __tablename__ = "llm_usage_summaries"
+
+    id = Column(Integer, primary_key=True, index=True)
+    minute = Column(DateTime(timezone=True), nullable=False, index=True)  # Start of the minute (UTC)
+
+    # What was called, and for whom
+    name = Column(String, nullable=False, index=True)  # Parser response model, "sammy", ...
+    model = Column(String, nullable=False)
+    tenant = Column(String, nullable=True)
+    store_id = Column(String, nullable=True, index=True)
+
+    # Counts
+    calls = Column(Integer, nullable=False, default=0)
+    errors = Column(Integer, nullable=False, default=0)
+    retries = Column(Integer, nullable=False, default=0)  # Instructor validation retries
+    sessions = Column(Integer, nullable=False, default=0)  # Distinct sessions
+
+    # Tokens and cost
+    prompt_tokens = Column(Integer, nullable=False, default=0)
+    cached_tokens = Column(Integer, nullable=False, default=0)
+    completion_tokens = Column(Integer, nullable=False, default=0)
+    cost_usd = Column(Float, nullable=False, default=0.0)
+
+    # Wall latency
+    latency_total_ms = Column(Float, nullable=False, default=0.0)
+    latency_p95_ms = Column(Float, nullable=True)  # Estimated from the latency histogram
+
+
 # --- Store model for multi-location support ---
 
 class Store(Base):
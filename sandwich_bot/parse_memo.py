@@ -0,0 +1,266 @@
+"""
+Parse Memo - Cross-Session Cache of Parser Results.
+
+Customers repeat the same utterances constantly ("that's it", "large iced
+latte", "plain bagel toasted with cream cheese"). Each of those runs the full
+deterministic parser chain and, when that fails, an LLM call, even though the
+answer only depends on the text, a few context arguments and the menu.
+
+This module memoizes parser results in a bounded LRU cache with a TTL. Keys
+combine the parser name, the whitespace-normalized input, the parser's other
+arguments and the menu version. ``MenuDataCache.load_from_db`` calls
+``reset()`` with the new menu version, which drops every entry.
+
+Results are stored as deep copies of the pydantic responses and every hit
+returns a fresh copy, so callers can keep mutating what they get back (the
+handlers routinely set fields on parser results).
+
+Usage:
+    from sandwich_bot.parse_memo import memoize_parser
+
+    @memoize_parser("spread_choice")
+    def parse_spread_choice(user_input: str, model: str = "gpt-4o-mini") -> SpreadChoiceResponse:
+        ...
+
+Configuration (see config.py):
+    PARSE_MEMO_MAX_SIZE: Maximum cached results (0 disables the memo)
+    PARSE_MEMO_TTL_SECONDS: How long a result stays valid
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from .config import PARSE_MEMO_MAX_SIZE, PARSE_MEMO_TTL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# Number of mapping fingerprints remembered by object identity
+_MAPPING_FINGERPRINT_SLOTS = 64
+
+
+def normalize_parser_input(user_input: str) -> str:
+    """Collapse runs of whitespace and trim the ends."""
+    return " ".join(user_input.split())
+
+
+class ParseMemo:
+    """
+    Bounded LRU/TTL cache of parser results keyed by menu version.
+
+    Entries are only stored while a menu version is set, so nothing is
+    cached before the menu cache has loaded.
+    """
+
+    def __init__(self, max_size: int = PARSE_MEMO_MAX_SIZE, ttl_seconds: float = PARSE_MEMO_TTL_SECONDS):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._menu_version: str | None = None
+        # key -> (expires_at, result)
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Context mappings (menu_data dicts) are large and long-lived, so their
+        # content digest is remembered per object: id -> (mapping, size, digest)
+        self._mapping_fingerprints: OrderedDict[int, tuple[dict, int, str]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._resets = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self._menu_version is not None
+
+    @property
+    def menu_version(self) -> str | None:
+        """Menu version the cached results were parsed against."""
+        return self._menu_version
+
+    def reset(self, menu_version: str | None) -> None:
+        """
+        Drop every cached result and start caching for a new menu version.
+
+        Args:
+            menu_version: Version hash of the newly loaded menu data
+        """
+        with self._lock:
+            dropped = len(self._entries)
+            self._entries.clear()
+            self._mapping_fingerprints.clear()
+            self._menu_version = menu_version
+            self._resets += 1
+        logger.debug("Parse memo reset for menu version %s (dropped %d entries)", menu_version, dropped)
+
+    def clear(self) -> None:
+        """Drop every cached result, keeping the current menu version."""
+        self.reset(self._menu_version)
+
+    def _fingerprint(self, value: Any) -> Hashable:
+        """Reduce a parser argument to a hashable key component."""
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return value
+        if isinstance(value, (list, tuple)):
+            return tuple(self._fingerprint(v) for v in value)
+        if isinstance(value, (set, frozenset)):
+            return frozenset(self._fingerprint(v) for v in value)
+        if isinstance(value, dict):
+            return ("mapping", self._mapping_fingerprint(value))
+        return repr(value)
+
+    def _mapping_fingerprint(self, mapping: dict) -> str:
+        """
+        Content digest of a context mapping, remembered by identity.
+
+        Holding a reference to the mapping keeps its id from being reused.
+        The size check catches mappings that were refilled in place.
+        """
+        key = id(mapping)
+        with self._lock:
+            cached = self._mapping_fingerprints.get(key)
+        if cached is not None and cached[0] is mapping and cached[1] == len(mapping):
+            return cached[2]
+
+        payload = json.dumps(mapping, sort_keys=True, default=repr)
+        digest = hashlib.md5(payload.encode()).hexdigest()
+        with self._lock:
+            self._mapping_fingerprints[key] = (mapping, len(mapping), digest)
+            while len(self._mapping_fingerprints) > _MAPPING_FINGERPRINT_SLOTS:
+                self._mapping_fingerprints.popitem(last=False)
+        return digest
+
+    def make_key(self, parser_name: str, user_input: str, context: dict[str, Any]) -> Hashable:
+        """
+        Build the cache key for one parser call.
+
+        Args:
+            parser_name: Name the parser was registered under
+            user_input: Normalized user input
+            context: The parser's remaining arguments by name
+        """
+        context_key = tuple(
+            (name, self._fingerprint(value)) for name, value in sorted(context.items())
+        )
+        return (self._menu_version, parser_name, user_input, context_key)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Get a copy of a cached result, or None on a miss."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, result = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return result.model_copy(deep=True)
+
+    def put(self, key: Hashable, result: Any) -> None:
+        """Store a copy of a parser result, evicting the least recently used entries."""
+        if key[0] != self._menu_version:
+            # Menu was refreshed while this result was being parsed
+            return
+        stored = result.model_copy(deep=True)
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, stored)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def get_status(self) -> dict[str, Any]:
+        """Get memo status and hit/miss/eviction counts."""
+        lookups = self._hits + self._misses
+        return {
+            "enabled": self.enabled,
+            "menu_version": self._menu_version,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "resets": self._resets,
+        }
+
+
+# Global singleton instance
+parse_memo = ParseMemo()
+
+
+def memoize_parser(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator that serves a parser's results from the parse memo.
+
+    The decorated parser must take the user input as its first argument and
+    return a pydantic model. Every other argument becomes part of the key.
+    On a miss the parser is called with the normalized input, so every input
+    that shares a key gets the same result. Other return values (e.g. mocks)
+    and exceptions are passed through uncached.
+
+    Async parsers get an async wrapper. Keys only depend on the name, so a
+    parser and its async variant registered under the same name share
+    results.
+
+    Args:
+        name: Parser name used in cache keys
+    """
+    def decorator(parser: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(parser)
+
+        def lookup(user_input: str, args, kwargs) -> tuple[Hashable, inspect.BoundArguments, Any]:
+            """Key, normalized call arguments and cached result (or None)."""
+            normalized = normalize_parser_input(user_input)
+            bound = signature.bind(normalized, *args, **kwargs)
+            bound.apply_defaults()
+            context = dict(bound.arguments)
+            context.pop(next(iter(signature.parameters)))
+
+            key = parse_memo.make_key(name, normalized, context)
+            return key, bound, parse_memo.get(key)
+
+        def store(key: Hashable, result: Any) -> Any:
+            if hasattr(result, "model_copy"):
+                parse_memo.put(key, result)
+            return result
+
+        if inspect.iscoroutinefunction(parser):
+            @functools.wraps(parser)
+            async def async_wrapper(user_input: str, *args, **kwargs):
+                if not parse_memo.enabled:
+                    return await parser(user_input, *args, **kwargs)
+
+                key, bound, cached = lookup(user_input, args, kwargs)
+                if cached is not None:
+                    return cached
+                return store(key, await parser(*bound.args, **bound.kwargs))
+
+            return async_wrapper
+
+        @functools.wraps(parser)
+        def wrapper(user_input: str, *args, **kwargs):
+            if not parse_memo.enabled:
+                return parser(user_input, *args, **kwargs)
+
+            key, bound, cached = lookup(user_input, args, kwargs)
+            if cached is not None:
+                return cached
+            return store(key, parser(*bound.args, **bound.kwargs))
+
+        return wrapper
+    return decorator
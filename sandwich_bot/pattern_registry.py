@@ -0,0 +1,142 @@
+"""
+Pattern Registry - Compiled Menu-Driven Regexes Keyed by Menu Version.
+
+Many parser regexes are built from database vocabularies (bagel types,
+signature item aliases, syrups, etc.). Compiling them inside request-time
+functions repeats the same work on every message, and ad-hoc module caches
+never notice a menu refresh.
+
+This registry holds a builder for each dynamic pattern. When
+``MenuDataCache.load_from_db`` finishes it calls ``rebuild()`` with the new
+menu version, which compiles every registered pattern once and swaps the
+whole set in a single assignment, so readers never see a mix of old and new
+patterns.
+
+Usage:
+    from sandwich_bot.pattern_registry import pattern_registry
+
+    @pattern_registry.register("bagel_type_answer")
+    def _build_bagel_type_answer_pattern() -> re.Pattern:
+        types = "|".join(re.escape(bt) for bt in get_bagel_types())
+        return re.compile(rf"^({types})(?:\\s+bagel)?s?$")
+
+    pattern = pattern_registry.get("bagel_type_answer")
+"""
+
+import logging
+import threading
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class PatternRegistry:
+    """
+    Registry of compiled patterns derived from menu data.
+
+    Builders take no arguments and read vocabularies through the usual
+    menu cache getters. A builder's result can be a compiled regex or any
+    other immutable precomputed structure (e.g. a tuple of patterns).
+    """
+
+    def __init__(self):
+        self._builders: dict[str, Callable[[], Any]] = {}
+        # (menu_version, compiled) - replaced as a whole on rebuild
+        self._snapshot: tuple[str | None, dict[str, Any]] = (None, {})
+        self._lock = threading.Lock()
+        self._rebuild_count = 0
+        self._lazy_build_count = 0
+
+    def register(self, name: str) -> Callable[[Callable[[], Any]], Callable[[], Any]]:
+        """
+        Decorator that registers a pattern builder under a name.
+
+        Args:
+            name: Unique pattern name used with get()
+
+        Returns:
+            Decorator returning the builder unchanged.
+        """
+        def decorator(builder: Callable[[], Any]) -> Callable[[], Any]:
+            with self._lock:
+                self._builders[name] = builder
+                # Drop any stale compiled value built by a previous builder
+                self._snapshot[1].pop(name, None)
+            return builder
+        return decorator
+
+    def get(self, name: str) -> Any:
+        """
+        Get the compiled pattern for the current menu version.
+
+        Patterns registered after the last rebuild (or requested before the
+        menu cache is loaded) are built on first use and kept until the next
+        rebuild.
+
+        Raises:
+            KeyError: If no builder is registered under the name
+        """
+        compiled = self._snapshot[1]
+        try:
+            return compiled[name]
+        except KeyError:
+            pass
+        value = self._builders[name]()
+        compiled[name] = value
+        self._lazy_build_count += 1
+        return value
+
+    def rebuild(self, menu_version: str | None) -> None:
+        """
+        Compile every registered pattern for a new menu version.
+
+        Builders that fail are logged and left out; they are retried lazily
+        on the next get() for that name.
+
+        Args:
+            menu_version: Version hash of the menu data the patterns reflect
+        """
+        with self._lock:
+            builders = list(self._builders.items())
+
+        compiled: dict[str, Any] = {}
+        for name, builder in builders:
+            try:
+                compiled[name] = builder()
+            except Exception as e:
+                logger.warning("Failed to compile pattern '%s': %s", name, e)
+
+        self._snapshot = (menu_version, compiled)
+        self._rebuild_count += 1
+
+        logger.debug(
+            "Compiled %d/%d menu patterns for menu version %s",
+            len(compiled),
+            len(builders),
+            menu_version,
+        )
+
+    def names(self) -> list[str]:
+        """Get the names of all registered patterns."""
+        with self._lock:
+            return list(self._builders)
+
+    @property
+    def menu_version(self) -> str | None:
+        """Menu version the current patterns were compiled for."""
+        return self._snapshot[0]
+
+    def get_status(self) -> dict[str, Any]:
+        """Get registry status information."""
+        version, compiled = self._snapshot
+        return {
+            "menu_version": version,
+            "registered": len(self._builders),
+            "compiled": len(compiled),
+            "rebuilds": self._rebuild_count,
+            "lazy_builds": self._lazy_build_count,
+        }
+
+
+# Global singleton instance
+pattern_registry = PatternRegistry()
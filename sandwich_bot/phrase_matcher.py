@@ -0,0 +1,232 @@
+"""
+Phrase Matcher - Single-Pass Multi-Phrase Search.
+
+This module provides an Aho-Corasick automaton for finding many known
+phrases (modifiers, qualifiers, bagel types, etc.) in user input with a
+single scan of the text. It replaces per-phrase ``str.find`` / ``re.search``
+loops whose cost grew with the size of the menu vocabulary.
+
+The matcher is built once per menu cache load (see
+``MenuDataCache._build_matchers``) and is immutable afterwards, so it can be
+shared freely between threads.
+
+Usage:
+    from sandwich_bot.phrase_matcher import PhraseMatcher
+
+    matcher = PhraseMatcher({
+        "protein": {"bacon", "turkey bacon"},
+        "qualifier": {"extra", "on the side"},
+    })
+
+    matcher.find_all("extra turkey bacon on the side")
+    # [PhraseMatch(0, 5, "extra", "qualifier"),
+    #  PhraseMatch(6, 18, "turkey bacon", "protein"),
+    #  PhraseMatch(13, 18, "bacon", "protein"),
+    #  PhraseMatch(19, 30, "on the side", "qualifier")]
+
+    matcher.find_longest("extra turkey bacon", categories=["protein"])
+    # [PhraseMatch(6, 18, "turkey bacon", "protein")]
+"""
+
+from collections import deque
+from typing import Iterable, NamedTuple
+
+
+class PhraseMatch(NamedTuple):
+    """A single phrase occurrence in the scanned text."""
+
+    start: int
+    end: int
+    phrase: str
+    category: str
+
+
+def _is_word_boundary(text: str, start: int, end: int) -> bool:
+    """Check that text[start:end] is not embedded inside a larger word."""
+    before_ok = start == 0 or not text[start - 1].isalnum()
+    after_ok = end >= len(text) or not text[end].isalnum()
+    return before_ok and after_ok
+
+
+class PhraseMatcher:
+    """
+    Aho-Corasick automaton over a categorized phrase vocabulary.
+
+    Phrases are stored lowercase; callers are expected to pass lowercased
+    text (all parsers already work on ``user_input.lower()``). Only
+    occurrences at word boundaries are reported, so "ham" never matches
+    inside "graham".
+
+    A phrase may belong to several categories (e.g. "egg" is both a bagel
+    type and a protein); each occurrence is then reported once per category.
+    """
+
+    def __init__(self, phrases_by_category: dict[str, Iterable[str]]):
+        # Trie transitions, failure links and output lists, indexed by state
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[int]] = [[]]
+
+        # Phrase table: index -> (phrase, categories)
+        self._phrases: list[str] = []
+        self._categories: list[tuple[str, ...]] = []
+        self._phrase_ids: dict[str, int] = {}
+        category_members: dict[str, set[str]] = {}
+
+        for category, phrases in phrases_by_category.items():
+            members = category_members.setdefault(category, set())
+            for phrase in phrases:
+                phrase = phrase.lower()
+                if not phrase:
+                    continue
+                members.add(phrase)
+                if phrase in self._phrase_ids:
+                    pid = self._phrase_ids[phrase]
+                    if category not in self._categories[pid]:
+                        self._categories[pid] += (category,)
+                    continue
+                pid = len(self._phrases)
+                self._phrase_ids[phrase] = pid
+                self._phrases.append(phrase)
+                self._categories.append((category,))
+                self._insert(phrase, pid)
+
+        self._category_members = {
+            category: frozenset(members) for category, members in category_members.items()
+        }
+        self._build_failure_links()
+
+    def _insert(self, phrase: str, pid: int) -> None:
+        """Add a phrase to the trie."""
+        state = 0
+        for ch in phrase:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = nxt
+        self._output[state].append(pid)
+
+    def _build_failure_links(self) -> None:
+        """Compute failure links breadth-first and merge suffix outputs."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+
+    def __len__(self) -> int:
+        return len(self._phrases)
+
+    def __contains__(self, phrase: str) -> bool:
+        return phrase in self._phrase_ids
+
+    def get_category(self, category: str) -> frozenset[str]:
+        """Get every phrase registered under a category."""
+        return self._category_members.get(category, frozenset())
+
+    def find_all(
+        self,
+        text: str,
+        categories: Iterable[str] | None = None,
+    ) -> list[PhraseMatch]:
+        """
+        Find every word-bounded phrase occurrence in one scan of the text.
+
+        Overlapping occurrences are all reported ("turkey bacon" and "bacon"
+        both match in "turkey bacon").
+
+        Args:
+            text: Lowercased text to scan
+            categories: Optional categories to report (default: all)
+
+        Returns:
+            Matches ordered by end position, then longest first.
+        """
+        wanted = set(categories) if categories is not None else None
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        phrases = self._phrases
+        phrase_categories = self._categories
+
+        matches: list[PhraseMatch] = []
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not output[state]:
+                continue
+            end = i + 1
+            for pid in output[state]:
+                phrase = phrases[pid]
+                start = end - len(phrase)
+                if not _is_word_boundary(text, start, end):
+                    continue
+                for category in phrase_categories[pid]:
+                    if wanted is None or category in wanted:
+                        matches.append(PhraseMatch(start, end, phrase, category))
+        return matches
+
+    def find_longest(
+        self,
+        text: str,
+        categories: Iterable[str] | None = None,
+        blocked: Iterable[tuple[int, int]] = (),
+        matches: list[PhraseMatch] | None = None,
+    ) -> list[PhraseMatch]:
+        """
+        Select non-overlapping matches, longest first.
+
+        Categories are claimed in the order given, so earlier categories win
+        spans over later ones (e.g. "cream cheese" as a spread blocks "cheese"
+        as a cheese). Within a category, longer phrases win, then earlier
+        positions.
+
+        Args:
+            text: Lowercased text to scan
+            categories: Categories in priority order (default: all, in
+                        registration order)
+            blocked: Spans that may not be claimed by any match
+            matches: Pre-computed ``find_all`` result to reuse, so several
+                     selections can share one scan
+
+        Returns:
+            Claimed matches in claim order (category priority, longest first).
+        """
+        if categories is None:
+            categories = list(self._category_members)
+        else:
+            categories = list(categories)
+        if matches is None:
+            matches = self.find_all(text, categories)
+
+        by_category: dict[str, list[PhraseMatch]] = {category: [] for category in categories}
+        for match in matches:
+            bucket = by_category.get(match.category)
+            if bucket is not None:
+                bucket.append(match)
+
+        # Character-level occupancy keeps the overlap check O(phrase length)
+        claimed = bytearray(len(text) + 1)
+        for start, end in blocked:
+            claimed[start:end] = b"\x01" * (end - start)
+
+        selected: list[PhraseMatch] = []
+        for category in categories:
+            for match in sorted(by_category[category], key=lambda m: (m.start - m.end, m.start)):
+                if any(claimed[match.start:match.end]):
+                    continue
+                claimed[match.start:match.end] = b"\x01" * (match.end - match.start)
+                selected.append(match)
+        return selected
@@ -462,7 +462,7 @@ def build_system_prompt_with_menu(
     base_prompt = build_system_prompt(db, bot_name, company_name)
 
     if menu_json:
-        menu_section = f"\n\nMENU:\n{json.dumps(menu_json, indent=2)}"
+        menu_section = f"\n\nMENU:\n{json.dumps(menu_json, separators=(',', ':'))}"
         return base_prompt + menu_section
 
     return base_prompt
@@ -10,6 +10,8 @@ Endpoints:
 ----------
 - GET /admin/analytics/sessions: List session records with pagination
 - GET /admin/analytics/summary: Get aggregated analytics summary
+- GET /admin/analytics/llm-usage: LLM tokens, latency, retries and cost per call
+- POST /admin/analytics/llm-usage/flush: Write finished minutes of LLM usage to the database
 
 Authentication:
 ---------------
@@ -53,18 +55,22 @@ Usage:
 
     # List abandoned sessions with items
     GET /admin/analytics/sessions?status=abandoned&page=1&page_size=50
+
+    # Which parsers use the most LLM time this hour, per store
+    GET /admin/analytics/llm-usage?group_by=name,store_id
 """
 
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from ..auth import verify_admin_credentials
 from ..db import get_db
+from ..llm_usage import flush_llm_usage, get_llm_usage_stats
 from ..models import SessionAnalytics
 from ..schemas.analytics import (
     SessionAnalyticsOut,
@@ -247,3 +253,42 @@ def get_summary(
         abandonment_by_reason=abandonment_by_reason,
         recent_trend=recent_trend,
     )
+
+
+# =============================================================================
+# LLM Usage Endpoints
+# =============================================================================
+
+@admin_analytics_router.get("/llm-usage", response_model=Dict[str, Any])
+def get_llm_usage(
+    _admin: str = Depends(verify_admin_credentials),
+    window_minutes: Optional[int] = Query(None, ge=1, description="Minutes to include (default: all kept)"),
+    group_by: str = Query("name,model", description="Comma-separated: name, model, tenant, store_id"),
+    recent: int = Query(0, ge=0, description="Most recent individual calls to list"),
+) -> Dict[str, Any]:
+    """
+    Get LLM usage of this process over the recent window.
+
+    Groups are sorted by total LLM latency, so the call names at the top
+    are where a deterministic fast path would save the most. Each group has
+    call, retry and error counts, prompt/cached/completion tokens, cost in
+    USD, latency percentiles and latency and prompt size histograms.
+    """
+    fields = tuple(field.strip() for field in group_by.split(",") if field.strip())
+    try:
+        return get_llm_usage_stats(window_minutes, fields, recent)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@admin_analytics_router.post("/llm-usage/flush", response_model=Dict[str, Any])
+def flush_llm_usage_summaries(
+    db: Session = Depends(get_db),
+    _admin: str = Depends(verify_admin_credentials),
+) -> Dict[str, Any]:
+    """
+    Write this process's finished minutes of LLM usage to llm_usage_summaries.
+
+    Minutes already flushed are skipped, so this can be called on a schedule.
+    """
+    return {"rows_written": flush_llm_usage(db)}
@@ -411,6 +411,43 @@ def get_cache_status(
     return menu_cache.get_status()
 
 
+@admin_menu_router.get("/cache/parser-stats", response_model=Dict[str, Any])
+def get_parser_stats(
+    _admin: str = Depends(verify_admin_credentials),
+) -> Dict[str, Any]:
+    """
+    Get parser dispatch statistics since startup.
+
+    Returns:
+    - fast_paths: Per-parser calls answered deterministically vs. sent to
+      the LLM, with the fallback rate
+    - dispatch: Per-sub-parser runs, skips and hits in the deterministic
+      open-input router
+    - llm_clients: Connection pool limits and utilization of the shared
+      LLM clients
+    - open_input_speculation: Open input LLM calls started early, the
+      latency they hid and the calls spent without need
+    - llm_deadline: Per-turn LLM budget, hedged requests and the time they
+      saved, budgets exhausted, and recent latency per call type
+    - llm_breaker: LLM circuit breaker state, the error rate and p95 latency
+      of recent calls, and requests failed fast while open
+
+    Requires admin authentication.
+    """
+    from ..llm_breaker import llm_breaker
+    from ..llm_clients import llm_clients
+    from ..llm_deadline import get_llm_deadline_stats
+    from ..tasks.parsers import get_dispatch_stats, get_fast_path_stats, get_speculation_stats
+    return {
+        "fast_paths": get_fast_path_stats(),
+        "dispatch": get_dispatch_stats(),
+        "llm_clients": llm_clients.get_status(),
+        "open_input_speculation": get_speculation_stats(),
+        "llm_deadline": get_llm_deadline_stats(),
+        "llm_breaker": llm_breaker.get_status(),
+    }
+
+
 @admin_menu_router.post("/cache/refresh", response_model=Dict[str, Any])
 def refresh_cache(
     db: Session = Depends(get_db),
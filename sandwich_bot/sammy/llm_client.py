@@ -7,6 +7,14 @@ from typing import List, Dict, Any, Optional, Generator
 from dotenv import load_dotenv
 from sqlalchemy.orm import Session
 
+from ..llm_breaker import llm_breaker
+from ..llm_clients import llm_clients
+from ..llm_deadline import call_with_hedge, check_turn_budget, request_timeout
+from ..llm_response_cache import llm_response_cache
+from ..llm_usage import track_llm_call
+from ..tasks.parsers.checkout_resolvers import mentions_contact_details
+from .menu_slice import dumps_compact, render_menu_slice
+
 logger = logging.getLogger(__name__)
 
 # Default timeout for LLM calls (in seconds)
@@ -42,6 +50,14 @@ else:
 logger.debug("LLM Provider: %s", LLM_PROVIDER)
 logger.debug("Using model: %s", DEFAULT_MODEL)
 
+# Part of every persistent response cache key (see llm_response_cache.py);
+# bump it to drop cached replies after changing how they are used
+PROMPT_TEMPLATE_VERSION = "1"
+
+# Order state fields set once checkout starts; replies from then on are
+# about the customer's details, so they are not cached
+_CHECKOUT_STATE_KEYS = ("order_type", "delivery_address", "payment_method")
+
 # Initialize clients based on provider
 openai_client = None
 anthropic_client = None
@@ -52,8 +68,9 @@ if LLM_PROVIDER == "openai":
             f"OPENAI_API_KEY not found in {env_path}. "
             "Create a .env file with OPENAI_API_KEY=sk-proj-... at the project root."
         )
-    from openai import OpenAI
-    openai_client = OpenAI(api_key=openai_api_key, timeout=DEFAULT_TIMEOUT)
+    # Shared, pooled client (see sandwich_bot/llm_clients.py); requests pass
+    # their own timeout
+    openai_client = llm_clients.openai(api_key=openai_api_key)
     logger.debug("OpenAI client initialized")
 
 elif LLM_PROVIDER == "claude":
@@ -62,8 +79,7 @@ elif LLM_PROVIDER == "claude":
             f"ANTHROPIC_API_KEY not found in {env_path}. "
             "Create a .env file with ANTHROPIC_API_KEY=sk-ant-... at the project root."
         )
-    import anthropic
-    anthropic_client = anthropic.Anthropic(api_key=anthropic_api_key)
+    anthropic_client = llm_clients.anthropic(api_key=anthropic_api_key)
     logger.debug("Anthropic/Claude client initialized")
 
 else:
@@ -537,7 +553,7 @@ def build_system_prompt_with_menu(
     # Fall back to legacy template-based prompt
     base_prompt = get_system_prompt_base(bot_name, company_name)
     if menu_json:
-        menu_section = f"\n\nMENU:\n{json.dumps(menu_json, indent=2)}"
+        menu_section = f"\n\nMENU:\n{dumps_compact(menu_json)}"
         return base_prompt + menu_section
     return base_prompt
 
@@ -750,6 +766,9 @@ RESPONSE_SCHEMA = {
     "required": ["reply", "actions"],
 }
 
+# The schema never changes, so it is serialized once
+RESPONSE_SCHEMA_TEXT = dumps_compact(RESPONSE_SCHEMA)
+
 
 def render_history(history: List[Dict[str, str]]) -> str:
     if not history:
@@ -757,60 +776,41 @@ def render_history(history: List[Dict[str, str]]) -> str:
     return "\n".join(f"{h['role']}: {h['content']}" for h in history[-6:])
 
 
-def call_sandwich_bot(
+def _build_messages(
     conversation_history,
     current_order_state,
     menu_json,
     user_message,
-    model: str = None,
-    include_menu_in_system: bool = True,
+    include_menu_in_system: bool,
     returning_customer: Dict[str, Any] = None,
     caller_id: str = None,
     bot_name: str = None,
     company_name: str = None,
     db: Optional[Session] = None,
     use_dynamic_prompt: bool = False,
-    timeout: float = None,
-) -> Dict[str, Any]:
+) -> tuple[str, List[Dict[str, str]]]:
     """
-    Call the OpenAI chat completion to get the bot's reply + structured intent/slots.
+    Build the system prompt and chat messages for one bot call.
 
-    Uses proper OpenAI conversation format with:
-    - System message containing menu (when include_menu_in_system=True)
-    - Conversation history as separate user/assistant messages
-    - Current user message with order state and schema
+    Only the part of the menu relevant to the message and the order is sent
+    (see menu_slice.py), and everything is serialized compactly.
 
-    Args:
-        conversation_history: List of previous messages (dicts with 'role' and 'content')
-        current_order_state: Current order state dict
-        menu_json: Menu data for LLM context
-        user_message: The user's message
-        model: OpenAI model to use (defaults to OPENAI_MODEL env var or gpt-4o)
-        include_menu_in_system: If True, include menu in system prompt (saves tokens
-            on subsequent messages). If False, include menu in user message.
-        returning_customer: Optional dict with returning customer info including last_order_items
-        caller_id: Optional phone number from incoming call (caller ID)
-        bot_name: The bot's persona name (e.g., "Sammy") - defaults to "Sammy"
-        company_name: The company name (e.g., "Sammy's Subs") - defaults to "a single sandwich shop"
-        db: Optional database session for dynamic prompt building
-        use_dynamic_prompt: If True and db provided, use dynamic prompt builder
-        timeout: Request timeout in seconds (defaults to DEFAULT_TIMEOUT)
+    Returns:
+        Tuple of (system_content, messages); messages start with the system
+        message, followed by the last 6 history messages and the user message.
     """
-    if model is None:
-        model = DEFAULT_MODEL
-
-    # Build messages array
     messages = []
+    if menu_json:
+        menu_text = render_menu_slice(menu_json, user_message, current_order_state)
+    else:
+        menu_text = dumps_compact(menu_json)
 
     # 1. System message - with or without menu
-    if include_menu_in_system:
-        system_content = build_system_prompt_with_menu(
-            menu_json, bot_name, company_name, db, use_dynamic_prompt
-        )
-    else:
-        system_content = build_system_prompt_with_menu(
-            None, bot_name, company_name, db, use_dynamic_prompt
-        )
+    system_content = build_system_prompt_with_menu(
+        None, bot_name, company_name, db, use_dynamic_prompt
+    )
+    if include_menu_in_system and menu_json:
+        system_content += f"\n\nMENU:\n{menu_text}"
 
     messages.append({"role": "system", "content": system_content})
 
@@ -829,20 +829,20 @@ def call_sandwich_bot(
     if include_menu_in_system:
         # Menu already in system prompt - use slim template
         user_content = USER_PROMPT_TEMPLATE_SLIM.format(
-            order_state=json.dumps(current_order_state, indent=2),
+            order_state=dumps_compact(current_order_state),
             caller_id_section=caller_id_section,
             previous_order_section=previous_order_section,
             user_message=user_message,
-            schema=json.dumps(RESPONSE_SCHEMA, indent=2),
+            schema=RESPONSE_SCHEMA_TEXT,
         )
     else:
         # Include menu in user message (fallback for when menu changed mid-conversation)
         user_content = USER_PROMPT_TEMPLATE_WITH_MENU.format(
             conversation_history=render_history(conversation_history),
-            order_state=json.dumps(current_order_state, indent=2),
-            menu_json=json.dumps(menu_json, indent=2),
+            order_state=dumps_compact(current_order_state),
+            menu_json=menu_text,
             user_message=user_message,
-            schema=json.dumps(RESPONSE_SCHEMA, indent=2),
+            schema=RESPONSE_SCHEMA_TEXT,
         )
         # Append caller ID and previous order sections if present
         extra_sections = caller_id_section + previous_order_section
@@ -853,41 +853,59 @@ def call_sandwich_bot(
             )
 
     messages.append({"role": "user", "content": user_content})
+    return system_content, messages
+
 
-    # Call LLM based on provider
-    request_timeout = timeout if timeout is not None else DEFAULT_TIMEOUT
+def _response_cache_key(
+    model: str,
+    messages: List[Dict[str, str]],
+    current_order_state: Dict[str, Any],
+    conversation_history: List[Dict[str, str]],
+    user_message: str,
+    returning_customer: Dict[str, Any] = None,
+    caller_id: str = None,
+) -> Optional[str]:
+    """
+    Persistent response cache key for a bot call.
+
+    Returns None for calls whose prompt carries customer details, so those
+    replies are never written to disk: a caller ID, a returning customer,
+    customer info in the order, an order in checkout (order type, address
+    or payment chosen, or confirmed), or a phone number or email address in
+    the message or the history sent with it.
+    """
+    state = current_order_state or {}
+    customer = state.get("customer") or {}
+    if caller_id or returning_customer or any(customer.values()):
+        return None
+    if state.get("status") == "confirmed" or any(state.get(key) for key in _CHECKOUT_STATE_KEYS):
+        return None
+    texts = [user_message, *(msg["content"] for msg in conversation_history[-6:])]
+    if any(mentions_contact_details(text) for text in texts if text):
+        return None
+    return llm_response_cache.make_key("sammy", model, None, PROMPT_TEMPLATE_VERSION, messages)
+
+
+def _cache_response(cache_key: Optional[str], content: str) -> None:
+    """Store a reply in the persistent response cache if it is valid JSON."""
+    if cache_key is None or not content:
+        return
     try:
-        if LLM_PROVIDER == "claude":
-            # Claude API: system message is passed separately
-            response = anthropic_client.messages.create(
-                model=model,
-                max_tokens=2048,
-                system=system_content,
-                messages=[msg for msg in messages if msg["role"] != "system"],
-                temperature=0.0,
-            )
-            content = response.content[0].text
-        else:
-            # OpenAI API
-            completion = openai_client.chat.completions.create(
-                model=model,
-                messages=messages,
-                response_format={"type": "json_object"},
-                temperature=0.0,
-                timeout=request_timeout,
-            )
-            content = completion.choices[0].message.content
+        json.loads(content)
+    except json.JSONDecodeError:
+        return
+    llm_response_cache.put(cache_key, "sammy", content)
+
+
+def _timeout_response() -> Dict[str, Any]:
+    return {
+        "reply": "I'm sorry, the request is taking longer than expected. Please try again.",
+        "actions": [],
+    }
 
-        # Log the raw LLM response for debugging
-        logger.info("LLM raw response: %s", content[:1000] if content else "(empty)")
-    except Exception as e:
-        error_name = type(e).__name__
-        logger.error("LLM request failed (%s): %s", error_name, str(e))
-        return {
-            "reply": "I'm sorry, the request is taking longer than expected. Please try again.",
-            "actions": [],
-        }
 
+def _parse_bot_response(content: str) -> Dict[str, Any]:
+    """Parse the bot's JSON reply, falling back to a rephrase request."""
     try:
         return json.loads(content)
     except json.JSONDecodeError as e:
@@ -922,6 +940,112 @@ def call_sandwich_bot(
         }
 
 
+def call_sandwich_bot(
+    conversation_history,
+    current_order_state,
+    menu_json,
+    user_message,
+    model: str = None,
+    include_menu_in_system: bool = True,
+    returning_customer: Dict[str, Any] = None,
+    caller_id: str = None,
+    bot_name: str = None,
+    company_name: str = None,
+    db: Optional[Session] = None,
+    use_dynamic_prompt: bool = False,
+    timeout: float = None,
+) -> Dict[str, Any]:
+    """
+    Call the OpenAI chat completion to get the bot's reply + structured intent/slots.
+
+    Uses proper OpenAI conversation format with:
+    - System message containing menu (when include_menu_in_system=True)
+    - Conversation history as separate user/assistant messages
+    - Current user message with order state and schema
+
+    Args:
+        conversation_history: List of previous messages (dicts with 'role' and 'content')
+        current_order_state: Current order state dict
+        menu_json: Menu data for LLM context
+        user_message: The user's message
+        model: OpenAI model to use (defaults to OPENAI_MODEL env var or gpt-4o)
+        include_menu_in_system: If True, include menu in system prompt (saves tokens
+            on subsequent messages). If False, include menu in user message.
+        returning_customer: Optional dict with returning customer info including last_order_items
+        caller_id: Optional phone number from incoming call (caller ID)
+        bot_name: The bot's persona name (e.g., "Sammy") - defaults to "Sammy"
+        company_name: The company name (e.g., "Sammy's Subs") - defaults to "a single sandwich shop"
+        db: Optional database session for dynamic prompt building
+        use_dynamic_prompt: If True and db provided, use dynamic prompt builder
+        timeout: Request timeout in seconds (defaults to DEFAULT_TIMEOUT); within
+            a turn, requests get at most the turn's remaining LLM budget
+    """
+    if model is None:
+        model = DEFAULT_MODEL
+
+    system_content, messages = _build_messages(
+        conversation_history, current_order_state, menu_json, user_message,
+        include_menu_in_system, returning_customer, caller_id, bot_name,
+        company_name, db, use_dynamic_prompt,
+    )
+
+    cache_key = _response_cache_key(
+        model, messages, current_order_state, conversation_history, user_message,
+        returning_customer, caller_id,
+    )
+    cached = llm_response_cache.get(cache_key) if cache_key else None
+    if cached is not None:
+        return _parse_bot_response(cached)
+
+    # Call LLM based on provider, within the turn's LLM budget (see llm_deadline.py).
+    # While the circuit breaker is open (see llm_breaker.py) this fails at once
+    default_timeout = timeout if timeout is not None else DEFAULT_TIMEOUT
+    try:
+        check_turn_budget("sammy")
+        with llm_breaker.guard("sammy"), track_llm_call("sammy", model) as call:
+            if LLM_PROVIDER == "claude":
+                # Claude API: system message is passed separately
+                response = call_with_hedge(
+                    "sammy",
+                    lambda seconds: anthropic_client.messages.create(
+                        model=model,
+                        max_tokens=2048,
+                        system=system_content,
+                        messages=[msg for msg in messages if msg["role"] != "system"],
+                        temperature=0.0,
+                        timeout=seconds,
+                    ),
+                    default_timeout,
+                )
+                content = response.content[0].text
+                call.add_usage(response.usage)
+            else:
+                # OpenAI API
+                completion = call_with_hedge(
+                    "sammy",
+                    lambda seconds: openai_client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        response_format={"type": "json_object"},
+                        temperature=0.0,
+                        timeout=seconds,
+                    ),
+                    default_timeout,
+                )
+                content = completion.choices[0].message.content
+                call.add_usage(completion.usage)
+
+        # Log the raw LLM response for debugging
+        logger.info("LLM raw response: %s", content[:1000] if content else "(empty)")
+    except Exception as e:
+        error_name = type(e).__name__
+        logger.error("LLM request failed (%s): %s", error_name, str(e))
+        return _timeout_response()
+
+    _cache_response(cache_key, content)
+    return _parse_bot_response(content)
+
+
 def call_sandwich_bot_stream(
     conversation_history,
     current_order_state,
@@ -955,90 +1079,57 @@ def call_sandwich_bot_stream(
     if model is None:
         model = DEFAULT_MODEL
 
-    # Build messages array (same as non-streaming version)
-    messages = []
-
-    # 1. System message - with or without menu
-    if include_menu_in_system:
-        system_content = build_system_prompt_with_menu(
-            menu_json, bot_name, company_name, db, use_dynamic_prompt
-        )
-    else:
-        system_content = build_system_prompt_with_menu(
-            None, bot_name, company_name, db, use_dynamic_prompt
-        )
-
-    messages.append({"role": "system", "content": system_content})
-
-    # 2. Add conversation history as proper message objects (last 6 messages)
-    for msg in conversation_history[-6:]:
-        messages.append({
-            "role": msg["role"],
-            "content": msg["content"]
-        })
-
-    # 3. Build current user message
-    previous_order_section = format_previous_order_section(returning_customer)
-    caller_id_section = format_caller_id_section(caller_id)
-
-    if include_menu_in_system:
-        user_content = USER_PROMPT_TEMPLATE_SLIM.format(
-            order_state=json.dumps(current_order_state, indent=2),
-            caller_id_section=caller_id_section,
-            previous_order_section=previous_order_section,
-            user_message=user_message,
-            schema=json.dumps(RESPONSE_SCHEMA, indent=2),
-        )
-    else:
-        user_content = USER_PROMPT_TEMPLATE_WITH_MENU.format(
-            conversation_history=render_history(conversation_history),
-            order_state=json.dumps(current_order_state, indent=2),
-            menu_json=json.dumps(menu_json, indent=2),
-            user_message=user_message,
-            schema=json.dumps(RESPONSE_SCHEMA, indent=2),
-        )
-        extra_sections = caller_id_section + previous_order_section
-        if extra_sections:
-            user_content = user_content.replace(
-                "USER MESSAGE:",
-                f"{extra_sections}\nUSER MESSAGE:"
-            )
-
-    messages.append({"role": "user", "content": user_content})
+    system_content, messages = _build_messages(
+        conversation_history, current_order_state, menu_json, user_message,
+        include_menu_in_system, returning_customer, caller_id, bot_name,
+        company_name, db, use_dynamic_prompt,
+    )
 
-    # Call LLM with streaming based on provider
-    request_timeout = timeout if timeout is not None else DEFAULT_TIMEOUT
+    # Call LLM with streaming based on provider. A stream is not hedged, but
+    # it is bounded by the turn's LLM budget
     full_content = ""
 
     try:
-        if LLM_PROVIDER == "claude":
-            # Claude streaming API
-            with anthropic_client.messages.stream(
-                model=model,
-                max_tokens=2048,
-                system=system_content,
-                messages=[msg for msg in messages if msg["role"] != "system"],
-                temperature=0.0,
-            ) as stream:
-                for text in stream.text_stream:
-                    full_content += text
-                    yield text
-        else:
-            # OpenAI streaming API
-            stream = openai_client.chat.completions.create(
-                model=model,
-                messages=messages,
-                response_format={"type": "json_object"},
-                temperature=0.0,
-                timeout=request_timeout,
-                stream=True,
-            )
-
-            for chunk in stream:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    token = chunk.choices[0].delta.content
-                    full_content += token
-                    yield token
+        stream_timeout = request_timeout(
+            "sammy_stream", timeout if timeout is not None else DEFAULT_TIMEOUT,
+        )
+        # A stream's duration depends on the reply's length, so only its
+        # failures count toward the circuit breaker
+        with llm_breaker.guard("sammy_stream", timed=False), track_llm_call("sammy_stream", model) as call:
+            if LLM_PROVIDER == "claude":
+                # Claude streaming API
+                with anthropic_client.messages.stream(
+                    model=model,
+                    max_tokens=2048,
+                    system=system_content,
+                    messages=[msg for msg in messages if msg["role"] != "system"],
+                    temperature=0.0,
+                    timeout=stream_timeout,
+                ) as stream:
+                    for text in stream.text_stream:
+                        full_content += text
+                        yield text
+                    call.add_usage(stream.get_final_message().usage)
+            else:
+                # OpenAI streaming API
+                stream = openai_client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    response_format={"type": "json_object"},
+                    temperature=0.0,
+                    timeout=stream_timeout,
+                    stream=True,
+                    # The last chunk then carries the usage, with no choices
+                    stream_options={"include_usage": True},
+                )
+
+                for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        token = chunk.choices[0].delta.content
+                        full_content += token
+                        yield token
+                    if chunk.usage is not None:
+                        call.add_usage(chunk.usage)
 
     except Exception as e:
         error_name = type(e).__name__
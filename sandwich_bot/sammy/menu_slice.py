@@ -0,0 +1,211 @@
+"""
+Menu Slice - The Part of the Menu a Sammy Prompt Needs.
+
+Sammy's prompts used to embed the whole menu index, pretty-printed, on every
+call. That includes every item's recipe and default configuration (twice,
+since ``items_by_type`` repeats the category lists) and lookup tables that
+only the parsers use. On a large menu, that is most of the prompt's tokens
+and a large share of the time to first token.
+
+The slicer keeps the full entries only for items relevant to the turn:
+
+- items named in the message, found with the menu cache's menu item keyword
+  index (``menu_cache.find_menu_item_matches``) or by their full name
+- items of the item types the message mentions, found through the category
+  keywords (``menu_cache.get_category_keyword_mapping``) and the menu's
+  ``item_keywords``; naming a category list ("sides", "drinks") includes all
+  of it
+- items and item types already in the order
+
+Every other item is listed by name only, under "other_menu_items", so the
+bot still knows what exists. Ingredient lists and other non-item entries
+are always sent.
+
+Each item and each non-item entry is serialized compactly once per menu
+(and menu version); a slice is assembled from those fragments.
+
+Usage:
+    from sandwich_bot.sammy.menu_slice import render_menu_slice
+
+    menu_text = render_menu_slice(menu_json, "a large latte and the leo", order_state)
+"""
+
+import json
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable
+
+from ..menu_data_cache import menu_cache
+
+# Entries of the menu index that repeat the category lists (items_by_type)
+# or are lookup tables for the deterministic parsers
+_PARSER_ONLY_KEYS = frozenset({"items_by_type", "item_keywords", "ingredient_to_items", "item_descriptions"})
+
+# Menus whose fragments are kept (one per store menu in use)
+_MAX_MENUS = 8
+
+_WORD_RE = re.compile(r"[a-z0-9']+")
+
+
+def dumps_compact(value: Any) -> str:
+    """Serialize to JSON without indentation or spaces after separators."""
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _singular(word: str) -> str:
+    return word[:-1] if len(word) > 3 and word.endswith("s") else word
+
+
+def _words(text: str) -> list[str]:
+    """The words of a message, with plurals also in singular form."""
+    words = _WORD_RE.findall(text.lower())
+    return words + [_singular(word) for word in words if _singular(word) != word]
+
+
+def _normalize_name(name: str) -> str:
+    name = name.lower().strip()
+    return name[4:] if name.startswith("the ") else name
+
+
+def _is_item_list(value: Any) -> bool:
+    return isinstance(value, list) and bool(value) and all(
+        isinstance(item, dict) and "name" in item for item in value
+    )
+
+
+class _MenuFragments:
+    """A menu's entries, each serialized once."""
+
+    def __init__(self, menu_json: dict[str, Any]):
+        self.menu_json = menu_json
+        # (key, serialized value) for entries always sent, and
+        # (key, [(item, serialized item)]) for category lists, in menu order
+        self.entries: list[tuple[str, str | list[tuple[dict, str]]]] = []
+        for key, value in menu_json.items():
+            if key in _PARSER_ONLY_KEYS:
+                continue
+            if _is_item_list(value):
+                self.entries.append((key, [(item, dumps_compact(item)) for item in value]))
+            else:
+                self.entries.append((key, dumps_compact(value)))
+
+
+_fragments: "OrderedDict[tuple[str | None, int], _MenuFragments]" = OrderedDict()
+_fragments_lock = threading.Lock()
+
+
+def _get_fragments(menu_json: dict[str, Any]) -> _MenuFragments:
+    """Get a menu's serialized fragments, building them on first use."""
+    key = (menu_cache.menu_version, id(menu_json))
+    with _fragments_lock:
+        fragments = _fragments.get(key)
+        # The id of a discarded menu can be reused by a new one
+        if fragments is not None and fragments.menu_json is menu_json:
+            _fragments.move_to_end(key)
+            return fragments
+
+    fragments = _MenuFragments(menu_json)
+    with _fragments_lock:
+        _fragments[key] = fragments
+        while len(_fragments) > _MAX_MENUS:
+            _fragments.popitem(last=False)
+    return fragments
+
+
+def _order_items(order_state: dict[str, Any] | None) -> Iterable[dict[str, Any]]:
+    items = (order_state or {}).get("items") or []
+    return (item for item in items if isinstance(item, dict))
+
+
+def relevant_menu_terms(
+    user_message: str,
+    order_state: dict[str, Any] | None = None,
+    item_keywords: dict[str, str] | None = None,
+) -> tuple[set[str], set[str]]:
+    """
+    Find the item types and item names a turn is about.
+
+    Args:
+        user_message: The customer's message
+        order_state: The current order, whose items stay relevant
+        item_keywords: The menu's keyword to item type slug mapping
+
+    Returns:
+        Tuple of (item type slugs, normalized item names)
+    """
+    text = user_message.lower()
+    words = _WORD_RE.findall(text)
+    phrases = _words(text) + [f"{first} {second}" for first, second in zip(words, words[1:])]
+
+    item_types: set[str] = set()
+    for phrase in phrases:
+        mapping = menu_cache.get_category_keyword_mapping(phrase)
+        if mapping is not None:
+            item_types.add(mapping["slug"])
+            item_types.update(mapping.get("expands_to") or [])
+        if item_keywords and phrase in item_keywords:
+            item_types.add(item_keywords[phrase])
+
+    names = {_normalize_name(name) for name in menu_cache.find_menu_item_matches(text)}
+    for item in _order_items(order_state):
+        if item.get("item_type"):
+            item_types.add(item["item_type"])
+        if item.get("menu_item_name"):
+            names.add(_normalize_name(item["menu_item_name"]))
+    return item_types, names
+
+
+def render_menu_slice(
+    menu_json: dict[str, Any],
+    user_message: str,
+    order_state: dict[str, Any] | None = None,
+) -> str:
+    """
+    Serialize the part of the menu relevant to a turn as compact JSON.
+
+    Args:
+        menu_json: The menu index (see menu_index_builder.py)
+        user_message: The customer's message
+        order_state: The current order
+
+    Returns:
+        JSON object text with the menu's non-item entries, full entries for
+        relevant items, and "other_menu_items" naming the rest by category
+    """
+    fragments = _get_fragments(menu_json)
+    item_types, names = relevant_menu_terms(user_message, order_state, menu_json.get("item_keywords"))
+    words = set(_words(user_message))
+    message_words = _WORD_RE.findall(user_message.lower())
+    # Padded with spaces so a name only matches whole words
+    texts = (f" {' '.join(message_words)} ", f" {' '.join(map(_singular, message_words))} ")
+
+    parts = []
+    other_items: dict[str, list[str]] = {}
+    for key, value in fragments.entries:
+        if isinstance(value, str):
+            parts.append(f"{json.dumps(key)}:{value}")
+            continue
+
+        whole_category = key in words or _singular(key) in words
+        shown, omitted = [], []
+        for item, item_json in value:
+            name = _normalize_name(item["name"])
+            if (
+                whole_category
+                or name in names
+                or any(f" {name} " in text for text in texts)
+                or item.get("item_type") in item_types
+                or ("signature_items" in item_types and item.get("is_signature"))
+            ):
+                shown.append(item_json)
+            else:
+                omitted.append(item["name"])
+        if shown:
+            parts.append(f"{json.dumps(key)}:[{','.join(shown)}]")
+        if omitted:
+            other_items[key] = omitted
+
+    if other_items:
+        parts.append(f'"other_menu_items":{dumps_compact(other_items)}')
+    return "{" + ",".join(parts) + "}"
@@ -0,0 +1,243 @@
+"""
+Spell Corrector - Snap Near-Miss Words to the Menu Vocabulary.
+
+Typos and speech-to-text errors ("everthing bagel", "capuccino", "scallion
+cream chese") miss every deterministic parser and end up in the LLM. This
+module corrects single words against the menu vocabulary before
+deterministic parsing.
+
+Lookups use a SymSpell-style deletion index. Every vocabulary word is
+indexed under all strings obtained by deleting up to ``max_distance``
+characters. A typed word is then corrected by generating its own deletions
+and verifying the few candidates they point at. This costs a handful of dict
+lookups per word, independent of the vocabulary size.
+
+Corrections are deliberately conservative:
+- words the vocabulary already knows, and common English words, are never changed
+- short words (under ``min_word_length`` letters) are never changed
+- words under ``min_standalone_length`` letters are only changed when the
+  correction completes a multi-word menu phrase ("cream chese"), since
+  everyday words sit one edit away from short menu words ("live" / "lime",
+  "bill" / "bell")
+- words under eight letters allow only one edit
+- the first letter must match (typos and transcripts rarely get it wrong)
+- ties between different candidates leave the word as typed
+
+The corrector is built once per menu cache load (see
+``MenuDataCache._build_matchers``) and is immutable afterwards.
+
+Usage:
+    from sandwich_bot.spell_corrector import SpellCorrector
+
+    corrector = SpellCorrector({"everything", "cappuccino", "scallion cream cheese"})
+    corrector.correct("everthing bagel and a capuccino")
+    # "everything bagel and a cappuccino"
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable
+
+_WORD_PATTERN = re.compile(r"[A-Za-z]+")
+
+# Words the deterministic parsers rely on that are not menu item names.
+# They are correction targets alongside the menu vocabulary.
+ORDER_WORDS = frozenset({
+    "bagel", "bagels", "toasted", "toast", "coffee", "coffees", "sandwich",
+    "sandwiches", "omelette", "omelet", "small", "medium", "large", "iced",
+    "please", "without", "extra", "light", "scooped", "sugar", "sugars",
+    "cream", "cheese", "butter", "milk", "decaf", "everything",
+})
+
+# Everyday words that sit one edit away from menu words ("what" / "wheat",
+# "like" / "lime", "make" / "cake") and must never be corrected
+COMMON_WORDS = frozenset({
+    "about", "actually", "add", "added", "adding", "again", "also", "another",
+    "anything", "around", "back", "bake", "baked", "bring", "call", "came",
+    "cancel", "change", "check", "cold", "come", "could", "cost", "done",
+    "does", "each", "else", "even", "ever", "every", "fine", "first",
+    "fixed", "forget", "from", "full", "give", "going", "gone", "good",
+    "great", "half", "have", "hello", "help", "here", "hold", "home", "hope",
+    "instead", "just", "keep", "kind", "know", "last", "later", "less",
+    "like", "likes", "little", "long", "look", "lots", "made", "make",
+    "many", "mean", "meant", "mind", "mine", "more", "most", "much", "must",
+    "name", "need", "never", "next", "nice", "none", "nothing", "okay",
+    "once", "only", "order", "orders", "other", "over", "pick", "pickup",
+    "place", "plan", "plus", "price", "quite", "rather", "ready", "real",
+    "really", "remove", "same", "says", "scratch", "second", "should", "side",
+    "some", "something", "sorry", "start", "still", "such", "sure", "take",
+    "than", "thank", "thanks", "that", "their", "them", "then", "there",
+    "these", "they", "thing", "things", "think", "third", "this", "those",
+    "three", "time", "total", "twice", "under", "upon", "very", "wait",
+    "want", "wanted", "wants", "well", "went", "were", "what", "when",
+    "where", "which", "while", "will", "wish", "with", "would", "yeah",
+    "your", "yours",
+})
+
+
+def _deletes(word: str, max_distance: int) -> set[str]:
+    """All strings obtained by deleting up to max_distance characters."""
+    results = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {
+            candidate[:i] + candidate[i + 1:]
+            for candidate in frontier
+            for i in range(len(candidate))
+        }
+        results |= frontier
+    return results
+
+
+def _edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance (edits plus adjacent transpositions).
+
+    Returns max_distance + 1 as soon as the distance is known to exceed it.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous_previous: list[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return previous[-1]
+
+
+class SpellCorrector:
+    """
+    Word-level spell corrector over a fixed vocabulary.
+
+    Vocabulary entries may be phrases; each of their words becomes a
+    correction target, so fixing the words fixes the phrase.
+    """
+
+    def __init__(
+        self,
+        vocabulary: Iterable[str],
+        protected_words: Iterable[str] = COMMON_WORDS,
+        max_distance: int = 2,
+        min_word_length: int = 4,
+        min_standalone_length: int = 6,
+    ):
+        self._max_distance = max_distance
+        self._min_word_length = min_word_length
+        self._min_standalone_length = min_standalone_length
+
+        words = {
+            word
+            for phrase in vocabulary
+            for word in _WORD_PATTERN.findall(phrase.lower())
+            if len(word) >= min_word_length
+        }
+        self._words = frozenset(words)
+        self._protected = self._words | frozenset(w.lower() for w in protected_words)
+
+        # Multi-word phrases by each of their words, to check that a
+        # correction of a short word completes one
+        phrases: dict[str, set[tuple[str, ...]]] = {}
+        for phrase in vocabulary:
+            phrase_words = tuple(_WORD_PATTERN.findall(phrase.lower()))
+            if len(phrase_words) > 1:
+                for word in phrase_words:
+                    phrases.setdefault(word, set()).add(phrase_words)
+        self._phrases = phrases
+
+        index: dict[str, list[str]] = {}
+        for word in sorted(words):
+            for deletion in _deletes(word, max_distance):
+                index.setdefault(deletion, []).append(word)
+        self._index = index
+
+        # Vocabulary is fixed, so lookups can be remembered for the instance's life
+        self.correct_word = lru_cache(maxsize=4096)(self._correct_word)
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def _is_known(self, word: str) -> bool:
+        """Check a word, or the singular of a plural, against the protected words."""
+        if word in self._protected:
+            return True
+        if word.endswith("ies") and word[:-3] + "y" in self._protected:
+            return True
+        if word.endswith("es") and word[:-2] in self._protected:
+            return True
+        return word.endswith("s") and word[:-1] in self._protected
+
+    def _correct_word(self, word: str) -> str | None:
+        """
+        Find the vocabulary word a lowercase word is a near miss of.
+
+        Returns:
+            The correction, or None if the word is known, too short,
+            too far from the vocabulary, or ambiguous.
+        """
+        if len(word) < self._min_word_length or self._is_known(word):
+            return None
+
+        allowed = 1 if len(word) < 8 else self._max_distance
+        best_distance = allowed + 1
+        best: set[str] = set()
+        for deletion in _deletes(word, allowed):
+            for candidate in self._index.get(deletion, ()):
+                if candidate[0] != word[0]:
+                    continue
+                distance = _edit_distance(word, candidate, allowed)
+                if distance < best_distance:
+                    best_distance, best = distance, {candidate}
+                elif distance == best_distance:
+                    best.add(candidate)
+
+        if len(best) != 1:
+            return None
+        return best.pop()
+
+    def _completes_phrase(self, words: list[str], position: int) -> bool:
+        """Check the word at a position is part of a multi-word vocabulary phrase."""
+        for phrase in self._phrases.get(words[position], ()):
+            size = len(phrase)
+            for start in range(max(0, position - size + 1), min(position, len(words) - size) + 1):
+                if tuple(words[start:start + size]) == phrase:
+                    return True
+        return False
+
+    def correct(self, text: str) -> str:
+        """
+        Replace near-miss words in text with their vocabulary spelling.
+
+        Unchanged words keep their original form; a corrected word keeps
+        a leading capital. Short words are only corrected when that
+        completes a multi-word vocabulary phrase.
+        """
+        matches = list(_WORD_PATTERN.finditer(text))
+        words = [match.group(0).lower() for match in matches]
+        corrections = [self.correct_word(word) for word in words]
+        if not any(corrections):
+            return text
+        corrected_words = [
+            correction or word for word, correction in zip(words, corrections)
+        ]
+
+        parts = []
+        end = 0
+        for position, (match, correction) in enumerate(zip(matches, corrections)):
+            word = match.group(0)
+            if correction is not None and (
+                len(word) >= self._min_standalone_length
+                or self._completes_phrase(corrected_words, position)
+            ):
+                word = correction.capitalize() if word[0].isupper() else correction
+            parts.append(text[end:match.start()])
+            parts.append(word)
+            end = match.end()
+        parts.append(text[end:])
+        return "".join(parts)
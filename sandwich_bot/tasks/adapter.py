@@ -113,6 +113,8 @@ def dict_to_order_task(order_dict: Dict[str, Any], session_id: str = None) -> Or
         order.pending_duplicate_selection = sm_state.get("pending_duplicate_selection")
         order.pending_same_thing_clarification = sm_state.get("pending_same_thing_clarification")
         order.pending_suggested_item = sm_state.get("pending_suggested_item")
+        order.is_repeat_order = sm_state.get("is_repeat_order", False)
+        order.last_order_type = sm_state.get("last_order_type")
 
     # Convert checkout state
     checkout_data = order_dict.get("checkout_state", {})
@@ -271,6 +273,8 @@ def order_task_to_dict(
         "pending_duplicate_selection": order.pending_duplicate_selection,
         "pending_same_thing_clarification": order.pending_same_thing_clarification,
         "pending_suggested_item": order.pending_suggested_item,
+        "is_repeat_order": order.is_repeat_order,
+        "last_order_type": order.last_order_type,
     }
 
     return order_dict
@@ -34,6 +34,7 @@ from .models import (
 from .schemas import OrderPhase, StateMachineResult, ExtractedModifiers
 from .parsers import (
     parse_toasted_deterministic,
+    get_parsed_text,
 )
 from .parsers.llm_parsers import (
     parse_bagel_choice,
@@ -283,7 +284,7 @@ class BagelConfigHandler(BaseHandler):
         Returns:
             Selected spread type if matched, None if no match found.
         """
-        input_lower = user_input.lower().strip()
+        input_lower = get_parsed_text(user_input).lower
 
         # Remove common filler words
         input_lower = input_lower.replace("cream cheese", "").strip()
@@ -345,7 +346,7 @@ class BagelConfigHandler(BaseHandler):
             stacklevel=2,
         )
         logger.debug("DEPRECATED: handle_bagel_choice called for item %s", getattr(item, 'id', 'unknown'))
-        input_lower = user_input.lower().strip()
+        input_lower = get_parsed_text(user_input).lower
 
         # Check for pagination request ("what else", "more", etc.)
         if _is_pagination_request(user_input):
@@ -405,7 +406,7 @@ class BagelConfigHandler(BaseHandler):
         # e.g., "add american cheese" or "and cheese" should acknowledge and stay on track
         modifiers_for_acknowledgment = None
         if not bagel_type and getattr(item, 'is_bagel', False):
-            modifiers_for_acknowledgment = extract_modifiers_from_input(user_input)
+            modifiers_for_acknowledgment = self.parse_context.run(extract_modifiers_from_input, user_input)
 
         # If no bagel type found AND no modifiers detected, check if user is trying to order a new item
         has_modifiers = modifiers_for_acknowledgment and modifiers_for_acknowledgment.has_modifiers()
@@ -454,7 +455,7 @@ class BagelConfigHandler(BaseHandler):
         logger.info("Parsed bagel type '%s' for item %s", bagel_type, type(item).__name__)
 
         # Extract any additional modifiers from the input (e.g., "plain with salt pepper and ketchup")
-        extracted_modifiers = extract_modifiers_from_input(user_input)
+        extracted_modifiers = self.parse_context.run(extract_modifiers_from_input, user_input)
 
         # IMPORTANT: Remove the bagel type from extracted modifiers to avoid ambiguity
         # e.g., "blueberry" is both a bagel type AND a cream cheese flavor
@@ -541,7 +542,7 @@ class BagelConfigHandler(BaseHandler):
             stacklevel=2,
         )
         logger.debug("DEPRECATED: handle_spread_choice called for item %s", getattr(item, 'id', 'unknown'))
-        input_lower = user_input.lower().strip()
+        input_lower = get_parsed_text(user_input).lower
 
         # Check if user is asking for cream cheese options
         # e.g., "what kind of cream cheese do you have?", "what flavors?"
@@ -727,7 +728,7 @@ class BagelConfigHandler(BaseHandler):
         # For MenuItemTask bagels - full handling with modifiers
         # First check if the user is requesting modifiers instead of a spread
         # e.g., "make it bacon egg and cheese" when asked about spread
-        modifiers = extract_modifiers_from_input(user_input)
+        modifiers = self.parse_context.run(extract_modifiers_from_input, user_input)
 
         # Filter out cream cheese variants from cheeses - these are spreads, not sliced cheeses
         # This prevents "Honey Walnut Cream Cheese" from being treated as a cheese (like American)
@@ -869,7 +870,7 @@ class BagelConfigHandler(BaseHandler):
         # e.g., "add blueberry cream cheese" should acknowledge and stay on track
         modifiers_for_acknowledgment = None
         if getattr(item, 'is_bagel', False):
-            modifiers_for_acknowledgment = extract_modifiers_from_input(user_input)
+            modifiers_for_acknowledgment = self.parse_context.run(extract_modifiers_from_input, user_input)
 
         # If no modifiers detected, check if user is trying to order a new item
         has_modifiers = modifiers_for_acknowledgment and modifiers_for_acknowledgment.has_modifiers()
@@ -906,7 +907,7 @@ class BagelConfigHandler(BaseHandler):
 
         # Extract any additional modifiers from the input (e.g., "yes with extra cheese")
         if getattr(item, 'is_bagel', False):
-            extracted_modifiers = extract_modifiers_from_input(user_input)
+            extracted_modifiers = self.parse_context.run(extract_modifiers_from_input, user_input)
             if extracted_modifiers.has_modifiers() or extracted_modifiers.has_special_instructions():
                 logger.info("Extracted additional modifiers from toasted choice: %s", extracted_modifiers)
                 apply_modifiers_to_bagel(item, extracted_modifiers)
@@ -1032,7 +1033,7 @@ class BagelConfigHandler(BaseHandler):
         )
         logger.debug("DEPRECATED: handle_cheese_choice called for item %s", getattr(item, 'id', 'unknown'))
         # Before redirect check, see if user is adding modifiers to the current item
-        modifiers_for_acknowledgment = extract_modifiers_from_input(user_input)
+        modifiers_for_acknowledgment = self.parse_context.run(extract_modifiers_from_input, user_input)
 
         # If no modifiers detected, check if user is trying to order a new item
         has_modifiers = modifiers_for_acknowledgment and modifiers_for_acknowledgment.has_modifiers()
@@ -1043,7 +1044,7 @@ class BagelConfigHandler(BaseHandler):
             if redirect:
                 return redirect
 
-        input_lower = user_input.lower().strip()
+        input_lower = get_parsed_text(user_input).lower
 
         # Try to extract cheese type from input
         cheese_types = {
@@ -1096,7 +1097,7 @@ class BagelConfigHandler(BaseHandler):
         item.needs_cheese_clarification = False
 
         # Extract any additional modifiers from the input (e.g., "cheddar with extra bacon")
-        extracted_modifiers = extract_modifiers_from_input(user_input)
+        extracted_modifiers = self.parse_context.run(extract_modifiers_from_input, user_input)
         if extracted_modifiers.has_modifiers() or extracted_modifiers.has_special_instructions():
             logger.info("Extracted additional modifiers from cheese choice: %s", extracted_modifiers)
             # Apply modifiers (skip cheeses since we already handled cheese above)
@@ -90,10 +90,7 @@ class CheckoutHandler(BaseHandler):
         self._transition_to_next_slot = transition_callback or kwargs.get("transition_callback")
         self._handle_taking_items_with_parsed = handle_taking_items_with_parsed or kwargs.get("handle_taking_items_with_parsed")
 
-        # Context set per-request
-        self._returning_customer: dict | None = None
-        self._is_repeat_order: bool = False
-        self._last_order_type: str | None = None
+        # Set from the menu by the state machine
         self._spread_types: list[str] = []
 
     @property
@@ -107,22 +104,9 @@ class CheckoutHandler(BaseHandler):
         """Get item keyword to item type slug mapping from menu data."""
         return self._menu_data.get("item_keywords", {})
 
-    def set_context(
-        self,
-        store_info: dict | None = None,
-        returning_customer: dict | None = None,
-        is_repeat_order: bool = False,
-        last_order_type: str | None = None,
-        spread_types: list[str] | None = None,
-        menu_data: dict | None = None,
-    ) -> None:
-        """Set per-request context for checkout handling."""
-        self._store_info = store_info
-        self._returning_customer = returning_customer
-        self._is_repeat_order = is_repeat_order
-        self._last_order_type = last_order_type
+    def set_spread_types(self, spread_types: list[str] | None) -> None:
+        """Set the spread types from the menu's cheese types."""
         self._spread_types = spread_types or []
-        self._menu_data = menu_data or {}
 
     def handle_delivery(
         self,
@@ -180,8 +164,8 @@ class CheckoutHandler(BaseHandler):
                 )
             return StateMachineResult(
                 message=self.message_builder.get_delivery_question(
-                    self._is_repeat_order,
-                    self._last_order_type,
+                    order.is_repeat_order,
+                    order.last_order_type,
                 ),
                 order=order,
             )
@@ -205,8 +189,8 @@ class CheckoutHandler(BaseHandler):
 
         if next_slot and next_slot.category == SlotCategory.DELIVERY_ADDRESS:
             # Check for previous delivery address from repeat order
-            if self._is_repeat_order and self._returning_customer:
-                last_address = self._returning_customer.get("last_order_address")
+            if order.is_repeat_order and self.returning_customer:
+                last_address = self.returning_customer.get("last_order_address")
                 if last_address:
                     # Pre-fill the address and ask for confirmation
                     order.delivery_method.address.street = last_address
@@ -236,7 +220,7 @@ class CheckoutHandler(BaseHandler):
             StateMachineResult if there's an error or need clarification,
             None if address was successfully set on the order.
         """
-        allowed_zips = (self._store_info or {}).get('delivery_zip_codes', [])
+        allowed_zips = (self.store_info or {}).get('delivery_zip_codes', [])
 
         # Use address completion service
         result = complete_address(partial_address, allowed_zips)
@@ -605,7 +589,8 @@ class CheckoutHandler(BaseHandler):
         order.checkout.order_reviewed = False
 
         # Try to parse the input for new items
-        item_parsed = parse_open_input(
+        item_parsed = self.parse_context.run(
+            parse_open_input,
             user_input,
             model=self.model,
             spread_types=self._spread_types,
@@ -618,7 +603,7 @@ class CheckoutHandler(BaseHandler):
         # If they mentioned a new item, process it
         if item_parsed.parsed_items:
             logger.info("CONFIRMATION: Detected new item! Processing via _handle_taking_items_with_parsed")
-            extracted_modifiers = extract_modifiers_from_input(user_input)
+            extracted_modifiers = self.parse_context.run(extract_modifiers_from_input, user_input)
 
             # Use orchestrator to determine phase before processing
             if self._transition_to_next_slot:
@@ -672,10 +657,11 @@ class CheckoutHandler(BaseHandler):
         order.checkout.order_reviewed = True
 
         # For returning customers, auto-send to their last used contact method
-        if self._returning_customer:
+        returning_customer = self.returning_customer
+        if returning_customer:
             # Prefer email if available, otherwise use phone
-            email = self._returning_customer.get("email") or order.customer_info.email
-            phone = self._returning_customer.get("phone") or order.customer_info.phone
+            email = returning_customer.get("email") or order.customer_info.email
+            phone = returning_customer.get("phone") or order.customer_info.phone
 
             if email:
                 # Auto-send to email
@@ -722,14 +708,13 @@ class CheckoutHandler(BaseHandler):
         self,
         order: OrderTask,
         returning_customer: dict | None = None,
-        set_repeat_info_callback: Callable[[bool, str | None], None] | None = None,
     ) -> StateMachineResult:
         """
         Handle a request to repeat the customer's previous order.
 
         Copies items from returning_customer.last_order_items to the current order.
         """
-        customer = returning_customer or self._returning_customer
+        customer = returning_customer or self.returning_customer
 
         if not customer:
             logger.info("Repeat order requested but no returning customer data")
@@ -771,8 +756,9 @@ class CheckoutHandler(BaseHandler):
             order.customer_info.email = customer["email"]
 
         # Store last order type for "pickup again?" / "delivery again?" prompt
-        if customer.get("last_order_type") and set_repeat_info_callback:
-            set_repeat_info_callback(True, customer["last_order_type"])
+        if customer.get("last_order_type"):
+            order.is_repeat_order = True
+            order.last_order_type = customer["last_order_type"]
 
         logger.info("Repeat order: added %d item types from previous order", len(items_added))
 
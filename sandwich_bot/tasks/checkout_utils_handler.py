@@ -61,14 +61,6 @@ class CheckoutUtilsHandler:
         self._configure_next_incomplete_bagel = configure_next_incomplete_bagel or kwargs.get("configure_next_incomplete_bagel")
         self._configure_next_incomplete_menu_item = configure_next_incomplete_menu_item or kwargs.get("configure_next_incomplete_menu_item")
 
-        self._is_repeat_order: bool = False
-        self._last_order_type: str | None = None
-
-    def set_repeat_order_info(self, is_repeat: bool, last_order_type: str | None) -> None:
-        """Set repeat order info for personalized delivery question."""
-        self._is_repeat_order = is_repeat
-        self._last_order_type = last_order_type
-
     def get_next_question(
         self,
         order: OrderTask,
@@ -309,21 +301,21 @@ class CheckoutUtilsHandler:
                 # Order type not set yet, ask pickup/delivery
                 logger.info("CHECKOUT: Asking for pickup/delivery")
                 return StateMachineResult(
-                    message=self.get_delivery_question(),
+                    message=self.get_delivery_question(order),
                     order=order,
                 )
         else:
             # Default: ask for delivery method
             return StateMachineResult(
-                message=self.get_delivery_question(),
+                message=self.get_delivery_question(order),
                 order=order,
             )
 
-    def get_delivery_question(self) -> str:
+    def get_delivery_question(self, order: OrderTask) -> str:
         """Get the delivery/pickup question, personalized for repeat orders."""
-        if self._is_repeat_order and self._last_order_type == "pickup":
+        if order.is_repeat_order and order.last_order_type == "pickup":
             return "Is this for pickup again, or delivery?"
-        elif self._is_repeat_order and self._last_order_type == "delivery":
+        elif order.is_repeat_order and order.last_order_type == "delivery":
             return "Is this for delivery again, or pickup?"
         else:
             return "Is this for pickup or delivery?"
@@ -31,6 +31,7 @@ from .parsers import (
     parse_coffee_style,
     parse_hot_iced_deterministic,
     extract_coffee_modifiers_from_input,
+    get_parsed_text,
 )
 from .parsers.constants import DEFAULT_PAGINATION_SIZE, get_coffee_types, is_soda_drink, extract_quantity
 from .message_builder import MessageBuilder
@@ -906,7 +907,7 @@ class CoffeeConfigHandler(BaseHandler):
 
         # Also extract any milk/sweetener/syrup mentioned with the size response
         # e.g., "small with two sugars" or "large with oat milk"
-        coffee_mods = extract_coffee_modifiers_from_input(user_input)
+        coffee_mods = self.parse_context.run(extract_coffee_modifiers_from_input, user_input)
         if coffee_mods.milk and not item.milk:
             item.milk = coffee_mods.milk
             logger.info(f"Extracted milk from size response: {coffee_mods.milk}")
@@ -1001,7 +1002,7 @@ class CoffeeConfigHandler(BaseHandler):
 
         # Also extract any milk/sweetener/syrup mentioned with the hot/iced response
         # e.g., "hot with 2 splenda" or "iced with oat milk"
-        coffee_mods = extract_coffee_modifiers_from_input(user_input)
+        coffee_mods = self.parse_context.run(extract_coffee_modifiers_from_input, user_input)
         if coffee_mods.milk and not item.milk:
             item.milk = coffee_mods.milk
             logger.info(f"Extracted milk from style response: {coffee_mods.milk}")
@@ -1051,7 +1052,7 @@ class CoffeeConfigHandler(BaseHandler):
             if redirect:
                 return redirect
 
-        user_lower = user_input.lower().strip()
+        user_lower = get_parsed_text(user_input).lower
 
         # Check if user is asking about available options (e.g., "what kind of milk do you have?")
         option_question_patterns = [
@@ -1109,7 +1110,7 @@ class CoffeeConfigHandler(BaseHandler):
         db_sweeteners = [m for m in db_matched_modifiers if m.get("category") == "sweetener" or "sweetener" in m.get("slug", "").lower() or "sugar" in m.get("slug", "").lower() or "splenda" in m.get("slug", "").lower()]
 
         # Fall back to parser-based extraction for anything not matched by DB
-        coffee_mods = extract_coffee_modifiers_from_input(user_input)
+        coffee_mods = self.parse_context.run(extract_coffee_modifiers_from_input, user_input)
 
         # Check if user said "syrup" without specifying a flavor
         # This handles responses like "syrup", "yes syrup", "with syrup" etc.
@@ -1231,7 +1232,7 @@ class CoffeeConfigHandler(BaseHandler):
             if redirect:
                 return redirect
 
-        user_lower = user_input.lower().strip()
+        user_lower = get_parsed_text(user_input).lower
 
         # Check for negative/cancellation responses
         negative_patterns = [
@@ -1274,7 +1275,7 @@ class CoffeeConfigHandler(BaseHandler):
             return self.configure_next_incomplete_coffee(order)
 
         # Fall back to parser-based extraction
-        coffee_mods = extract_coffee_modifiers_from_input(user_input)
+        coffee_mods = self.parse_context.run(extract_coffee_modifiers_from_input, user_input)
 
         if coffee_mods.flavor_syrup:
             # Use the maximum of: pending quantity (from "2 syrups") and flavor response quantity (from "3 caramel")
@@ -1323,7 +1324,7 @@ class CoffeeConfigHandler(BaseHandler):
                 order=order,
             )
 
-        user_lower = user_input.lower().strip()
+        user_lower = get_parsed_text(user_input).lower
         options = order.pending_drink_options
 
         # Reject negative numbers or other invalid input early
@@ -1540,7 +1541,7 @@ class CoffeeConfigHandler(BaseHandler):
             stacklevel=2,
         )
         logger.debug("DEPRECATED: handle_drink_type_selection called")
-        user_lower = user_input.lower().strip()
+        user_lower = get_parsed_text(user_input).lower
 
         # Check for "what else" / "more options" pagination requests
         show_more_phrases = [
@@ -8,6 +8,9 @@ across all handler classes, reducing boilerplate in handler initialization.
 from dataclasses import dataclass
 from typing import Callable, Any, TYPE_CHECKING
 
+from .parse_context import TurnParseContext, get_parse_context
+from .turn_context import get_turn_context
+
 if TYPE_CHECKING:
     from .models import OrderTask, ItemTask
     from .schemas import StateMachineResult
@@ -79,10 +82,12 @@ class BaseHandler:
         pricing: PricingEngine instance
         menu_lookup: MenuLookup instance
         menu_data: Raw menu data dictionary
-        store_info: Store information dictionary
+        store_info: Store information dictionary (the current turn's)
+        returning_customer: Returning customer data (the current turn's)
         message_builder: MessageBuilder instance
         _get_next_question: Callback for next question
         _check_redirect: Callback for redirect checks
+        parse_context: Parser results for the current turn
     """
 
     def __init__(self, config: "HandlerConfig | None" = None, **kwargs):
@@ -112,6 +117,8 @@ class BaseHandler:
             self.message_builder = kwargs.get("message_builder")
             self._get_next_question = kwargs.get("get_next_question")
             self._check_redirect = kwargs.get("check_redirect")
+        # Used outside a turn; a turn's come from its TurnContext
+        self._returning_customer: dict | None = None
 
     @property
     def menu_data(self) -> dict:
@@ -123,16 +130,28 @@ class BaseHandler:
         """Set menu data dictionary."""
         self._menu_data = value or {}
 
+    @property
+    def parse_context(self) -> TurnParseContext:
+        """Get the current turn's parse context (a fresh one outside a turn)."""
+        return get_parse_context()
+
     @property
     def store_info(self) -> dict | None:
-        """Get store info dictionary."""
-        return self._store_info
+        """Get the current turn's store info (the handler's own outside a turn)."""
+        context = get_turn_context()
+        return context.store_info if context is not None else self._store_info
 
     @store_info.setter
     def store_info(self, value: dict | None) -> None:
-        """Set store info dictionary."""
+        """Set the store info used outside a turn."""
         self._store_info = value
 
+    @property
+    def returning_customer(self) -> dict | None:
+        """Get the current turn's returning customer (the handler's own outside a turn)."""
+        context = get_turn_context()
+        return context.returning_customer if context is not None else self._returning_customer
+
 
 @dataclass
 class HandlerCallbacks:
@@ -1004,12 +1004,12 @@ class MenuItemConfigHandler(BaseHandler):
         extraction_type = self.MODIFIER_EXTRACTION_TYPE.get(item_type)
 
         if extraction_type == "food":
-            modifiers = extract_modifiers_from_input(user_input)
+            modifiers = self.parse_context.run(extract_modifiers_from_input, user_input)
             if modifiers.has_modifiers() or modifiers.has_special_instructions():
                 logger.debug("Extracted food modifiers from input: %s", modifiers)
                 return modifiers
         elif extraction_type == "beverage":
-            modifiers = extract_coffee_modifiers_from_input(user_input)
+            modifiers = self.parse_context.run(extract_coffee_modifiers_from_input, user_input)
             if modifiers.milk or modifiers.sweetener or modifiers.flavor_syrup or modifiers.has_special_instructions():
                 logger.debug("Extracted beverage modifiers from input: %s", modifiers)
                 return modifiers
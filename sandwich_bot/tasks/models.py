@@ -886,6 +886,11 @@ class OrderTask(BaseTask):
     # Stores the menu item name (e.g., "The Lexington") for confirmation
     pending_suggested_item: str | None = None
 
+    # Repeat order state, set when the customer asks for their previous order
+    # Used to ask "Is this for pickup again, or delivery?" at checkout
+    is_repeat_order: bool = False
+    last_order_type: str | None = None  # "pickup" or "delivery" from the previous order
+
     # Menu query pagination state for "show more" functionality
     # Dict with: category (str), offset (int), total_items (int)
     # Used when user asks "what other X do you have?" or "more X"
@@ -16,6 +16,7 @@ from .models import (
     MenuItemTask,
 )
 from .schemas import StateMachineResult
+from .turn_context import get_turn_context
 from ..services.tax_utils import calculate_taxes, round_money
 
 if TYPE_CHECKING:
@@ -57,8 +58,14 @@ class OrderUtilsHandler:
         # Handler-specific callback
         self._build_order_summary = build_order_summary or kwargs.get("build_order_summary")
 
+    @property
+    def store_info(self) -> dict:
+        """Get the current turn's store info (the one set here outside a turn)."""
+        context = get_turn_context()
+        return context.store_info if context is not None else self._store_info
+
     def set_store_info(self, store_info: dict | None) -> None:
-        """Set the store info for tax calculations (legacy method)."""
+        """Set the store info for tax calculations outside a turn."""
         self._store_info = store_info or {}
 
     def set_message_builder(self, message_builder: "MessageBuilder | None") -> None:
@@ -221,7 +228,7 @@ class OrderUtilsHandler:
         subtotal = order.items.get_subtotal()
 
         # Calculate taxes using centralized utility
-        taxes = calculate_taxes(subtotal, self._store_info)
+        taxes = calculate_taxes(subtotal, self.store_info)
         total_with_tax = round_money(subtotal + taxes.total)
 
         # Format response
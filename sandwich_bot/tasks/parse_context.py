@@ -0,0 +1,181 @@
+"""
+Per-Turn Parse Context.
+
+One user message is often parsed several times in a single turn: the
+redirect check runs ``_looks_like_new_order_attempt``, greeting and taking
+items both call ``parse_open_input``, and the config handlers call
+``extract_modifiers_from_input`` / ``extract_coffee_modifiers_from_input``
+again on text another handler already looked at.
+
+``OrderStateMachine.process`` creates a ``TurnParseContext`` for every
+message and makes it current with ``use_parse_context`` for the rest of the
+turn. It is held in a ContextVar, not on the shared state machine, so turns
+running in parallel threads each see their own. Handlers run parsers
+through it (``get_parse_context``), so each parser runs at most once per
+input and arguments during the turn.
+
+Callers pass the parser function itself (the name imported into their own
+module), so tests that patch a handler module's parser still take effect.
+Every call returns a deep copy of the first result, because handlers
+routinely set fields on what a parser returns.
+
+The context also holds the turn's ParseBudget and makes it active while a
+parser runs, so deterministic parsing across the whole turn shares one
+deadline (see parsers/parse_budget.py), and the turn's ParsedText of each
+text the parsers are handed (see ``get_parsed_text``), so tokenization is
+done once per turn and dropped with it.
+
+``run_async`` awaits a parser's async variant and stores the result under
+the sync parser, so ``OrderStateMachine.process_async`` can await a turn's
+LLM fallback on the event loop before the handlers run.
+
+Usage:
+    parsed = self.parse_context.run(parse_open_input, user_input, model=self.model)
+    modifiers = self.parse_context.run(extract_modifiers_from_input, user_input)
+"""
+
+import copy
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Hashable, Iterator, TypeVar
+
+from .parsers.parse_budget import ParseBudget, use_parse_budget
+from .parsers.parsed_text import ParsedText
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _argument_key(value: Any) -> Hashable:
+    """Key an argument by value, or by identity for unhashable context mappings."""
+    try:
+        hash(value)
+    except TypeError:
+        return ("id", id(value))
+    return value
+
+
+def _call_key(parser: Callable, text: str, args: tuple, kwargs: dict) -> Hashable:
+    return (
+        parser,
+        text,
+        tuple(_argument_key(arg) for arg in args),
+        tuple(sorted((name, _argument_key(value)) for name, value in kwargs.items())),
+    )
+
+
+class TurnParseContext:
+    """
+    Memoized parser results for one turn of the conversation.
+
+    Attributes:
+        user_input: The message this turn is processing
+        parse_budget: Deterministic parsing time left this turn
+    """
+
+    def __init__(self, user_input: str = "", parse_budget: ParseBudget | None = None):
+        self.user_input = user_input
+        self.parse_budget = parse_budget or ParseBudget()
+        # key -> (arguments kept alive so their ids stay unique, result)
+        self._results: dict[Hashable, tuple[tuple, Any]] = {}
+        self._parsed_texts: dict[str, ParsedText] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self) -> str:
+        return f"TurnParseContext({self.user_input[:30]!r}, results={len(self._results)})"
+
+    def run(self, parser: Callable[..., T], text: str, *args, **kwargs) -> T:
+        """
+        Run a parser on text, or return a copy of its result from earlier this turn.
+
+        Args:
+            parser: The parser function
+            text: The input to parse
+            *args, **kwargs: Further parser arguments (part of the key)
+
+        Returns:
+            A deep copy of the parser's result for these arguments.
+        """
+        key = _call_key(parser, text, args, kwargs)
+        entry = self._results.get(key)
+        if entry is None:
+            self._misses += 1
+            with use_parse_budget(self.parse_budget):
+                result = parser(text, *args, **kwargs)
+            self._results[key] = ((args, kwargs), result)
+        else:
+            self._hits += 1
+            result = entry[1]
+            logger.debug("Parse context hit: %s(%r)", getattr(parser, "__name__", parser), text[:50])
+        return copy.deepcopy(result)
+
+    async def run_async(
+        self,
+        parser: Callable[..., T],
+        async_parser: Callable[..., Awaitable[T]],
+        text: str,
+        *args,
+        **kwargs,
+    ) -> T:
+        """
+        Await a parser's async variant, or reuse its result from earlier this turn.
+
+        The result is stored under the sync parser, so handlers that later
+        call ``run(parser, text, ...)`` with the same arguments get it
+        without parsing again.
+
+        Args:
+            parser: The sync parser function (the key)
+            async_parser: Its async variant
+            text: The input to parse
+            *args, **kwargs: Further parser arguments (part of the key)
+        """
+        key = _call_key(parser, text, args, kwargs)
+        entry = self._results.get(key)
+        if entry is None:
+            self._misses += 1
+            with use_parse_budget(self.parse_budget):
+                result = await async_parser(text, *args, **kwargs)
+            self._results[key] = ((args, kwargs), result)
+        else:
+            self._hits += 1
+            result = entry[1]
+        return copy.deepcopy(result)
+
+    def parsed_text(self, text: str) -> ParsedText:
+        """Get this turn's ParsedText of a text, built on first use."""
+        parsed = self._parsed_texts.get(text)
+        if parsed is None:
+            parsed = self._parsed_texts[text] = ParsedText(text)
+        return parsed
+
+    def get_stats(self) -> dict[str, int]:
+        """Get how many parser calls this turn ran versus reused."""
+        return {"runs": self._misses, "reuses": self._hits}
+
+
+_current_context: ContextVar[TurnParseContext | None] = ContextVar("turn_parse_context", default=None)
+
+
+@contextmanager
+def use_parse_context(context: TurnParseContext) -> Iterator[TurnParseContext]:
+    """Make a context the current turn's inside the block."""
+    token = _current_context.set(context)
+    try:
+        yield context
+    finally:
+        _current_context.reset(token)
+
+
+def get_parse_context() -> TurnParseContext:
+    """
+    Get the parse context of the turn being processed.
+
+    Handlers used outside OrderStateMachine.process (e.g. directly in tests)
+    get a fresh context, so parsers simply run every time.
+    """
+    context = _current_context.get()
+    return context if context is not None else TurnParseContext()
@@ -8,7 +8,10 @@ Exports:
 - Validators: Email, phone, ZIP code validation functions
 - Constants: Menu items, regex patterns, price data, modifier lists
 - Deterministic Parsers: Regex-based parsing functions
+- ParsedText: Shared tokenized view of a user message
 - LLM Parsers: OpenAI/instructor-based parsing functions
+- Fast Paths: Deterministic resolvers in front of the LLM parsers
+- Speculation: Early LLM fallback for open input likely to need it
 """
 
 from .validators import (
@@ -53,6 +56,27 @@ from .deterministic import (
     _parse_item_description_inquiry,
     _parse_multi_item_order,
     parse_open_input_deterministic,
+    # Sub-parser dispatch gates
+    PARSER_GATES,
+    get_dispatch_stats,
+    reset_dispatch_stats,
+)
+
+from .fast_paths import (
+    get_fast_path_stats,
+    reset_fast_path_stats,
+)
+
+from .speculation import (
+    predict_llm_fallback,
+    get_speculation_stats,
+    reset_speculation_stats,
+)
+
+from .parsed_text import (
+    ParsedText,
+    get_parsed_text,
+    strip_filler_words,
 )
 
 from .llm_parsers import (
@@ -74,6 +98,25 @@ from .llm_parsers import (
     parse_payment_method,
     parse_email,
     parse_phone,
+    # Async variants for async endpoints
+    get_async_instructor_client,
+    parse_side_choice_async,
+    parse_bagel_choice_async,
+    parse_multi_bagel_choice_async,
+    parse_multi_toasted_async,
+    parse_multi_spread_async,
+    parse_spread_choice_async,
+    parse_toasted_choice_async,
+    parse_coffee_size_async,
+    parse_coffee_style_async,
+    parse_by_pound_category_async,
+    parse_open_input_async,
+    parse_delivery_choice_async,
+    parse_name_async,
+    parse_confirmation_async,
+    parse_payment_method_async,
+    parse_email_async,
+    parse_phone_async,
 )
 
 from .constants import (
@@ -88,6 +131,10 @@ from .constants import (
     get_spreads,
     get_spread_types,
     get_bagel_spreads,
+    # Single-pass modifier/qualifier matcher (built once per menu cache load)
+    get_modifier_matcher,
+    # Compound item names, drinks and bagel modifiers (multi-item detection)
+    get_item_phrase_matcher,
     # Modifier classification (computed from bagel/spread types)
     get_bagel_only_types,
     get_spread_only_types,
@@ -172,6 +219,20 @@ __all__ = [
     "_parse_item_description_inquiry",
     "_parse_multi_item_order",
     "parse_open_input_deterministic",
+    "PARSER_GATES",
+    "get_dispatch_stats",
+    "reset_dispatch_stats",
+    # LLM parser fast paths
+    "get_fast_path_stats",
+    "reset_fast_path_stats",
+    # Speculative open input LLM fallback
+    "predict_llm_fallback",
+    "get_speculation_stats",
+    "reset_speculation_stats",
+    # Shared tokenized message
+    "ParsedText",
+    "get_parsed_text",
+    "strip_filler_words",
     # LLM parsers
     "get_instructor_client",
     "parse_side_choice",
@@ -191,6 +252,25 @@ __all__ = [
     "parse_payment_method",
     "parse_email",
     "parse_phone",
+    # LLM parsers - async variants
+    "get_async_instructor_client",
+    "parse_side_choice_async",
+    "parse_bagel_choice_async",
+    "parse_multi_bagel_choice_async",
+    "parse_multi_toasted_async",
+    "parse_multi_spread_async",
+    "parse_spread_choice_async",
+    "parse_toasted_choice_async",
+    "parse_coffee_size_async",
+    "parse_coffee_style_async",
+    "parse_by_pound_category_async",
+    "parse_open_input_async",
+    "parse_delivery_choice_async",
+    "parse_name_async",
+    "parse_confirmation_async",
+    "parse_payment_method_async",
+    "parse_email_async",
+    "parse_phone_async",
     # Constants - Drink categories
     "get_coffee_types",
     "is_soda_drink",
@@ -202,6 +282,10 @@ __all__ = [
     "get_spreads",
     "get_spread_types",
     "get_bagel_spreads",
+    # Single-pass modifier/qualifier matcher (built once per menu cache load)
+    "get_modifier_matcher",
+    # Compound item names, drinks and bagel modifiers (multi-item detection)
+    "get_item_phrase_matcher",
     # Modifier classification (computed from bagel/spread types)
     "get_bagel_only_types",
     "get_spread_only_types",
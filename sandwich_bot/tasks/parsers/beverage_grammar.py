@@ -0,0 +1,316 @@
+"""
+Beverage Order Grammar.
+
+Coffee orders used to be read with one regex search per slot and per menu
+option: a loop over every coffee type for the drink, a quantity regex
+rebuilt from the drink list on each call, and a milk, a quantity and a
+mention pattern for each milk, sweetener and syrup option. "Large iced oat
+latte with two splendas" scanned the message several dozen times.
+
+``BeverageGrammar`` is compiled once per menu version (the
+"beverage_grammar" builder in ``deterministic.py``) from the beverage
+types, the beverage milk/sweetener/syrup modifiers and the global size,
+temperature and shots options. ``parse`` tags the message with a single
+phrase matcher scan, longest phrase first, and fills every coffee slot from
+the tags and the message's tokens:
+
+    drink        the longest drink name ("chai tea" over "tea")
+    quantity     a number before the drink, past size, temperature and milk
+                 words ("two large iced oat lattes")
+    size         the first size phrase
+    iced         True for "iced", False for "hot"
+    decaf        True for "decaf"
+    extra_shots  1 for "double espresso", 2 for "triple shot espresso"
+    milk         the first milk phrase, else "none" for "black", else
+                 "whole" for a bare "milk"
+    cream_level  dark, light (not "light roast") or regular
+    sweetener    the first sweetener, counted by the word before it
+    flavor_syrup the first syrup, counted by the word before it; a bare
+                 "syrup" sets wants_syrup instead
+
+A phrase in several vocabularies fills every slot it belongs to, so
+"mocha" is both the drink and its syrup.
+
+Usage:
+    grammar = BeverageGrammar(
+        drinks={"latte", "coffee"},
+        milks=["oat", "whole"],
+        sweeteners=["splenda", "sugar"],
+        syrups=["vanilla"],
+    )
+    grammar.parse(get_parsed_text("two large iced oat lattes with 2 splendas"))
+    # BeverageSlots(drink="latte", quantity=2, size="large", iced=True,
+    #               milk="oat", sweetener="splenda", sweetener_quantity=2, ...)
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Iterable
+
+from sandwich_bot.phrase_matcher import PhraseMatcher
+
+from .constants import WORD_TO_NUM
+from .parsed_text import ParsedText
+from .segmenter import Tag, tag_message
+
+
+# Pastries named after a drink; a message with one is not a coffee order
+NOT_DRINK_PHRASES = ("coffee cake", "coffee cakes")
+
+DEFAULT_SIZES = {"small": "small", "medium": "medium", "large": "large"}
+DEFAULT_TEMPERATURES = {"iced": "iced", "hot": "hot"}
+DEFAULT_SHOTS = {"double": 2, "triple": 3}
+
+# Counts that may come before a drink ("a couple of lattes"); "double" and
+# "triple" are left out since they name espresso shots
+_DRINK_QUANTITIES = {
+    phrase: value for phrase, value in WORD_TO_NUM.items()
+    if phrase not in ("a", "an", "few", "double", "triple", "quad", "quadruple")
+}
+_SWEETENER_COUNTS = {
+    word: WORD_TO_NUM[word]
+    for word in ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten")
+}
+_SYRUP_COUNTS = {
+    word: WORD_TO_NUM[word]
+    for word in ("one", "two", "three", "four", "five", "six", "double", "triple")
+}
+
+
+@dataclass
+class BeverageSlots:
+    """Coffee order slots read from one message."""
+
+    drink: str | None = None
+    quantity: int = 1
+    size: str | None = None
+    iced: bool | None = None
+    decaf: bool | None = None
+    extra_shots: int = 0
+    milk: str | None = None
+    cream_level: str | None = None
+    sweetener: str | None = None
+    sweetener_quantity: int = 1
+    flavor_syrup: str | None = None
+    syrup_quantity: int = 1
+    wants_syrup: bool = False
+    not_drink: bool = False  # "coffee cake" - a pastry, not a coffee order
+
+
+def _normalize_milk(milk: str) -> str:
+    """Map spelling variants of a milk option to one value."""
+    if milk in ("2%", "two percent"):
+        return "2%"
+    if milk in ("half and half", "half & half"):
+        return "half and half"
+    return milk
+
+
+class BeverageGrammar:
+    """
+    Coffee order vocabulary for one menu version, matched in one scan.
+
+    Args:
+        drinks: Coffee/tea types and aliases (get_coffee_types())
+        milks: Milk options without the word "milk" ("oat", "2%")
+        sweeteners: Sweetener options ("splenda", "sugar")
+        syrups: Flavor syrup options without the word "syrup" ("vanilla").
+                A syrup that is also a milk ("almond") only matches
+                followed by "syrup".
+        sizes: Extra size phrases -> size slug (global size options)
+        temperatures: Extra single words -> "iced" or "hot"
+        shots: Extra single words -> shot count ("quad" -> 4)
+    """
+
+    def __init__(
+        self,
+        drinks: Iterable[str],
+        milks: Iterable[str],
+        sweeteners: Iterable[str],
+        syrups: Iterable[str],
+        sizes: dict[str, str] | None = None,
+        temperatures: dict[str, str] | None = None,
+        shots: dict[str, int] | None = None,
+    ):
+        drink_values: dict[str, str] = {}
+        for drink in drinks:
+            drink = drink.lower()
+            drink_values.setdefault(f"{drink}s", drink)
+            drink_values[drink] = drink
+
+        milk_values: dict[str, str] = {}
+        for milk in milks:
+            milk = milk.lower()
+            milk_values[milk] = milk_values[f"{milk} milk"] = _normalize_milk(milk)
+
+        sweetener_values: dict[str, str] = {}
+        for sweetener in sweeteners:
+            sweetener = sweetener.lower()
+            sweetener_values.setdefault(f"{sweetener}s", sweetener)
+            sweetener_values[sweetener] = sweetener
+
+        syrup_values: dict[str, str] = {}
+        for syrup in syrups:
+            syrup = syrup.lower()
+            if syrup not in milk_values:
+                syrup_values[syrup] = syrup
+            syrup_values[f"{syrup} syrup"] = syrup_values[f"{syrup} syrups"] = syrup
+
+        size_values = {**DEFAULT_SIZES, **{k.lower(): v for k, v in (sizes or {}).items()}}
+
+        self._values: dict[str, dict[str, str]] = {
+            "drink": drink_values,
+            "milk": milk_values,
+            "sweetener": sweetener_values,
+            "syrup": syrup_values,
+            "size": size_values,
+        }
+        self._quantities = _DRINK_QUANTITIES
+        self.matcher = PhraseMatcher({
+            **{category: list(values) for category, values in self._values.items()},
+            "quantity": list(self._quantities),
+            "syrup_word": ["syrup", "syrups"],
+            "not_drink": NOT_DRINK_PHRASES,
+        })
+
+        self._temperatures = {**DEFAULT_TEMPERATURES, **(temperatures or {})}
+        self._shots = {**DEFAULT_SHOTS, **(shots or {})}
+        # Words allowed between a drink's quantity and its name, besides
+        # size and milk phrases
+        self._drink_adjectives = frozenset({*self._temperatures, "decaf"})
+
+    def parse(self, parsed: ParsedText) -> BeverageSlots:
+        """
+        Fill every coffee slot from one message.
+
+        Where a slot is mentioned more than once, the first mention in the
+        message is used.
+
+        Args:
+            parsed: The message
+
+        Returns:
+            The slots; ``drink`` is None when no drink is named.
+        """
+        slots = BeverageSlots()
+        starts = [token.start for token in parsed.tokens]
+        values = self._values
+
+        drink_tag: Tag | None = None
+        syrup_word_tag: Tag | None = None
+        quantity_ends: dict[int, Tag] = {}
+        modifier_ends: dict[int, Tag] = {}
+        for tag in tag_message(parsed, self.matcher):
+            categories = tag.categories
+            if "not_drink" in categories:
+                slots.not_drink = True
+            if "quantity" in categories:
+                quantity_ends[tag.end] = tag
+            if "size" in categories or "milk" in categories:
+                modifier_ends[tag.end] = tag
+            if "drink" in categories:
+                drink = values["drink"][tag.phrase]
+                if slots.drink is None or len(drink) > len(slots.drink):
+                    slots.drink, drink_tag = drink, tag
+            if "size" in categories and slots.size is None:
+                slots.size = values["size"][tag.phrase]
+            if "milk" in categories and slots.milk is None:
+                slots.milk = values["milk"][tag.phrase]
+            if "sweetener" in categories and slots.sweetener is None:
+                slots.sweetener = values["sweetener"][tag.phrase]
+                slots.sweetener_quantity = _count_before(parsed, starts, tag.start, _SWEETENER_COUNTS)
+            if "syrup" in categories and slots.flavor_syrup is None:
+                slots.flavor_syrup = values["syrup"][tag.phrase]
+                slots.syrup_quantity = _count_before(parsed, starts, tag.start, _SYRUP_COUNTS)
+            if "syrup_word" in categories and syrup_word_tag is None:
+                syrup_word_tag = tag
+
+        if drink_tag is not None:
+            slots.quantity = self._drink_quantity(parsed, starts, drink_tag, quantity_ends, modifier_ends)
+        if slots.flavor_syrup is None and syrup_word_tag is not None:
+            slots.wants_syrup = True
+            slots.syrup_quantity = _count_before(parsed, starts, syrup_word_tag.start, _SYRUP_COUNTS)
+
+        self._fill_word_slots(parsed, slots)
+        return slots
+
+    def _drink_quantity(
+        self,
+        parsed: ParsedText,
+        starts: list[int],
+        drink_tag: Tag,
+        quantity_ends: dict[int, Tag],
+        modifier_ends: dict[int, Tag],
+    ) -> int:
+        """Count given before the drink, e.g. 3 for "three medium oat lattes"."""
+        tokens = parsed.tokens
+        position = drink_tag.start
+        i = bisect_left(starts, position) - 1
+        while i >= 0 and parsed.lower[tokens[i].end:position].isspace():
+            token = tokens[i]
+            quantity_tag = quantity_ends.get(token.end)
+            if quantity_tag is not None:
+                return self._quantities[quantity_tag.phrase]
+            if token.text.isdigit():
+                return int(token.text)
+            # Step over size and milk phrases and temperature/decaf words
+            modifier_tag = modifier_ends.get(token.end)
+            if modifier_tag is not None:
+                position = modifier_tag.start
+            elif token.text in self._drink_adjectives:
+                position = token.start
+            else:
+                break
+            i = bisect_left(starts, position) - 1
+        return 1
+
+    def _fill_word_slots(self, parsed: ParsedText, slots: BeverageSlots) -> None:
+        """Fill the slots given by single words (temperature, decaf, shots, cream)."""
+        words = parsed.words
+        temperatures = {self._temperatures[word] for word in words if word in self._temperatures}
+        if "iced" in temperatures:
+            slots.iced = True
+        elif "hot" in temperatures:
+            slots.iced = False
+        if "decaf" in words:
+            slots.decaf = True
+
+        tokens = parsed.tokens
+        light_roast = False
+        for i, token in enumerate(tokens):
+            following = tokens[i + 1].text if i + 1 < len(tokens) else None
+            if token.text == "light" and following == "roast":
+                light_roast = True
+            count = self._shots.get(token.text)
+            if count:
+                # "double espresso", "triple shot espresso"
+                j = i + 2 if following == "shot" else i + 1
+                if j < len(tokens) and tokens[j].text == "espresso":
+                    slots.extra_shots = max(slots.extra_shots, count - 1)
+
+        if slots.milk is None and "black" in words:
+            slots.milk = "none"
+        elif slots.milk is None and "milk" in words:
+            slots.milk = "whole"
+
+        # "dark" = less cream/milk, "light" = more; "light roast" is a roast
+        if "dark" in words:
+            slots.cream_level = "dark"
+        elif "light" in words:
+            if not light_roast:
+                slots.cream_level = "light"
+        elif "regular" in words:
+            slots.cream_level = "regular"
+
+
+def _count_before(parsed: ParsedText, starts: list[int], position: int, counts: dict[str, int]) -> int:
+    """Count given by the word right before a position ("2 splendas"), else 1."""
+    i = bisect_left(starts, position) - 1
+    if i < 0:
+        return 1
+    token = parsed.tokens[i]
+    if not parsed.lower[token.end:position].isspace():
+        return 1
+    if token.text.isdigit():
+        return int(token.text)
+    return counts.get(token.text, 1)
@@ -0,0 +1,330 @@
+"""
+Deterministic Resolvers for the Checkout-Phase LLM Parsers.
+
+Checkout answers are mostly structured: a phone number, an email address,
+"pickup", "text me", "yes", a first name. These resolvers recognize them
+locally, on top of the validators and the menu cache response patterns,
+so the LLM parsers in llm_parsers.py only see free-form replies.
+
+They plug into the same ``fast_path`` decorator as the configuration-phase
+resolvers (see fast_paths.py), so stats and the confidence threshold are
+shared. Voice transcripts are handled too: spoken digits ("five five five
+...") and spoken email addresses ("john at gmail dot com").
+
+Resolvers only recognize; the handlers still validate phone numbers and
+email addresses exactly as they do for LLM results.
+"""
+
+import re
+
+from sandwich_bot.menu_data_cache import menu_cache
+
+from ..schemas import (
+    DeliveryChoiceResponse,
+    NameResponse,
+    ConfirmationResponse,
+    PaymentMethodResponse,
+    EmailResponse,
+    PhoneResponse,
+)
+from .fast_paths import LOW_CONFIDENCE, Resolution
+from .parsed_text import ParsedText
+
+
+# =============================================================================
+# Vocabulary
+# =============================================================================
+
+# Words around a phone number or email address that carry no information
+_CONTACT_FILLER_WORDS = frozenset({
+    "my", "number", "phone", "cell", "mobile", "is", "it", "s", "its", "the",
+    "you", "can", "reach", "me", "at", "use", "email", "e", "mail", "address",
+    "send", "to", "text", "call", "please", "sure", "yes", "yeah", "ok",
+    "okay", "that", "thanks", "i", "d", "like", "want", "an", "a",
+})
+
+_SPOKEN_DIGITS = {
+    "zero": "0", "oh": "0", "o": "0", "one": "1", "two": "2", "three": "3",
+    "four": "4", "five": "5", "six": "6", "seven": "7", "eight": "8", "nine": "9",
+}
+
+_EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+
+_TEXT_WORDS = frozenset({"text", "texted", "texting", "txt", "sms", "message", "phone", "cell"})
+_EMAIL_WORDS = frozenset({"email", "emailed", "mail", "e"})
+
+_PICKUP_PATTERN = re.compile(
+    r"\b(?:pick\s*(?:it\s+|them\s+)?up|picking\s+(?:it\s+)?up|pickup|carry\s*out|take\s*out|to\s+go|come\s+get\s+it)\b"
+)
+_DELIVERY_PATTERN = re.compile(r"\b(?:delivery|deliver(?:ed)?(?:\s+it)?)\b")
+_DELIVERY_ADDRESS_PATTERN = re.compile(
+    r"^(?:delivery|deliver(?:ed)?(?:\s+it)?)\s+(?:to|at)\s+(\d+.*)$", re.IGNORECASE
+)
+_DELIVERY_FILLER_WORDS = frozenset({
+    "i", "ll", "will", "it", "for", "please", "we", "can", "you", "want",
+    "d", "like", "do", "let", "s", "go", "with", "make", "that", "a", "an",
+    "the", "order", "this", "is", "yes", "thanks",
+})
+
+# A street address: house number, then a street name ending in a street
+# type, or anything ending in a ZIP code
+_STREET_ADDRESS_PATTERN = re.compile(
+    r"^\d+[a-z]?\s+[a-z0-9].*\b(?:st|street|ave|avenue|rd|road|blvd|boulevard|pl|place|"
+    r"ln|lane|dr|drive|way|ct|court|ter|terrace|pkwy|parkway|hwy|highway|broadway)\b"
+    r"|^\d+[a-z]?\s+[a-z].*\b\d{5}(?:-\d{4})?$",
+    re.IGNORECASE,
+)
+
+_NAME_PREFIX_PATTERN = re.compile(
+    r"^(?:(?:my\s+)?name(?:'s|\s+is)|this\s+is|put\s+(?:it\s+)?under|under)\s+",
+    re.IGNORECASE,
+)
+# "for Sarah" is also how orders start ("for here"), and "I'm hungry", "it is
+# correct" or "call me back" aren't names either, so these are no better than a bare word
+_WEAK_NAME_PREFIX_PATTERN = re.compile(r"^(?:for|it(?:'s|\s+is)|i'm|i\s+am|call\s+me)\s+", re.IGNORECASE)
+_NAME_SUFFIX_PATTERN = re.compile(r"[\s,.!]*(?:please|thanks|thank\s+you)?[\s.!]*$", re.IGNORECASE)
+_NAME_PATTERN = re.compile(r"^[A-Za-z][A-Za-z'-]*(?:\s+[A-Za-z][A-Za-z'-]*){0,2}$")
+
+# Words that show a reply is not a name
+_NOT_NAME_WORDS = frozenset({
+    "a", "an", "the", "and", "or", "but", "to", "of", "in", "on", "at", "for",
+    "with", "is", "are", "was", "it", "its", "this", "that", "what", "why",
+    "how", "when", "where", "who", "which", "can", "could", "do", "does",
+    "did", "i", "me", "my", "you", "your", "we", "our", "no", "not", "yes",
+    "yeah", "nope", "sure", "ok", "okay", "please", "thanks", "wait", "hold",
+    "on", "actually", "cancel", "order", "pickup", "delivery", "total",
+    "tax", "change", "add", "remove", "want", "like", "have", "get", "need",
+    "sorry", "hi", "hello", "hey", "um", "uh", "just", "more", "else",
+    "nothing", "done", "good", "fine", "great", "bagel", "coffee",
+})
+
+# Sizes and bagel types, which the menu matchers miss before the menu loads
+_NOT_NAME_MENU_WORDS = frozenset({
+    "small", "medium", "large", "regular", "plain", "everything", "sesame",
+    "poppy", "onion", "garlic", "cinnamon", "raisin", "pumpernickel",
+})
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+def _coverage(parsed: ParsedText, explained_words: frozenset[str], spans: list[tuple[int, int]]) -> float:
+    """Share of tokens that are filler words or inside the matched spans."""
+    tokens = parsed.tokens
+    if not tokens:
+        return 0.0
+    explained = sum(
+        1 for token in tokens
+        if token.text in explained_words
+        or any(start <= token.start and token.end <= end for start, end in spans)
+    )
+    return explained / len(tokens)
+
+
+def _find_phone_digits(parsed: ParsedText) -> tuple[str | None, list[tuple[int, int]]]:
+    """
+    Collect the digits of a phone number, written or spoken.
+
+    Returns:
+        Tuple of (10-digit number or None, spans of the tokens used).
+    """
+    digits = []
+    spans = []
+    for token in parsed.tokens:
+        if token.text.isdigit():
+            digits.append(token.text)
+        elif token.text in _SPOKEN_DIGITS:
+            digits.append(_SPOKEN_DIGITS[token.text])
+        else:
+            continue
+        spans.append((token.start, token.end))
+
+    number = "".join(digits)
+    if len(number) == 11 and number.startswith("1"):
+        number = number[1:]
+    if len(number) != 10:
+        return None, []
+    return number, spans
+
+
+def _find_email(parsed: ParsedText) -> tuple[str | None, ParsedText]:
+    """
+    Find one email address, written or spoken ("john at gmail dot com").
+
+    Returns:
+        Tuple of (address or None, the ParsedText the address was found in).
+    """
+    matches = _EMAIL_PATTERN.findall(parsed.lower)
+    if not matches and " at " in parsed.lower and " dot " in parsed.lower:
+        spoken = re.sub(r"\s+at\s+(?=\S+\s+dot\s+)", "@", parsed.lower)
+        spoken = re.sub(r"\s+dot\s+", ".", spoken)
+        parsed = ParsedText(spoken)
+        matches = _EMAIL_PATTERN.findall(parsed.lower)
+    if len(set(matches)) != 1:
+        return None, parsed
+    return matches[0].rstrip("."), parsed
+
+
+def mentions_contact_details(text: str) -> bool:
+    """
+    Whether text holds a phone number or email address, written or spoken.
+
+    Unlike the resolvers this looks anywhere in a longer message, so any run
+    of seven or more digits counts as a phone number.
+    """
+    parsed = ParsedText(text)
+    if _EMAIL_PATTERN.search(parsed.lower) or _find_email(parsed)[0] is not None:
+        return True
+    run = 0
+    for token in parsed.tokens:
+        if token.text.isdigit():
+            run += len(token.text)
+        elif token.text in _SPOKEN_DIGITS:
+            run += 1
+        else:
+            run = 0
+        if run >= 7:
+            return True
+    return False
+
+
+def _normalize_reply(parsed: ParsedText) -> str:
+    """Lowercase reply without punctuation, for exact response-pattern lookups."""
+    return " ".join(re.sub(r"[^\w\s']", " ", parsed.lower).split())
+
+
+def _mentions_menu(text: str) -> bool:
+    """Whether text names a menu item, drink, modifier, bagel type or size."""
+    lower = text.lower()
+    if any(word in _NOT_NAME_MENU_WORDS for word in lower.split()):
+        return True
+    matchers = (menu_cache.get_item_phrase_matcher(), menu_cache.get_modifier_matcher())
+    return any(matcher is not None and matcher.find_all(lower) for matcher in matchers)
+
+
+# =============================================================================
+# Resolvers
+# =============================================================================
+
+def resolve_phone(user_input: str) -> Resolution | None:
+    """Resolve "555-123-4567", "it's (908) 555-9999", "five five five ..."."""
+    parsed = ParsedText(user_input)
+    phone, spans = _find_phone_digits(parsed)
+    if phone is None:
+        return None
+    return Resolution(PhoneResponse(phone=phone), _coverage(parsed, _CONTACT_FILLER_WORDS, spans))
+
+
+def resolve_email(user_input: str) -> Resolution | None:
+    """Resolve "john@example.com", "my email is john at gmail dot com"."""
+    email, parsed = _find_email(ParsedText(user_input))
+    if email is None:
+        return None
+    start = parsed.lower.find(email)
+    return Resolution(
+        EmailResponse(email=email),
+        _coverage(parsed, _CONTACT_FILLER_WORDS, [(start, start + len(email))]),
+    )
+
+
+def resolve_payment_method(user_input: str) -> Resolution | None:
+    """Resolve "text me", "email", "555-123-4567", "email it to john@example.com"."""
+    parsed = ParsedText(user_input)
+    email, email_parsed = _find_email(parsed)
+    phone, phone_spans = _find_phone_digits(parsed)
+    if email and phone:
+        return None
+
+    if email:
+        start = email_parsed.lower.find(email)
+        return Resolution(
+            PaymentMethodResponse(choice="email", email_address=email),
+            _coverage(email_parsed, _CONTACT_FILLER_WORDS, [(start, start + len(email))]),
+        )
+    if phone:
+        if parsed.words & _EMAIL_WORDS:
+            return None
+        return Resolution(
+            PaymentMethodResponse(choice="text", phone_number=phone),
+            _coverage(parsed, _CONTACT_FILLER_WORDS | _TEXT_WORDS, phone_spans),
+        )
+
+    wants_text = bool(parsed.words & _TEXT_WORDS)
+    wants_email = bool(parsed.words & _EMAIL_WORDS)
+    if wants_text == wants_email:
+        return None
+    choice = "text" if wants_text else "email"
+    return Resolution(
+        PaymentMethodResponse(choice=choice),
+        _coverage(parsed, _CONTACT_FILLER_WORDS | _TEXT_WORDS | _EMAIL_WORDS | {"me", "by", "via", "over"}, []),
+    )
+
+
+def resolve_delivery_choice(user_input: str) -> Resolution | None:
+    """Resolve "pickup", "I'll pick it up", "delivery to 123 Main St", a bare street address."""
+    parsed = ParsedText(user_input)
+
+    address_match = _DELIVERY_ADDRESS_PATTERN.match(parsed.text)
+    if address_match:
+        return Resolution(
+            DeliveryChoiceResponse(choice="delivery", address=address_match.group(1).strip()),
+            1.0,
+        )
+    if _STREET_ADDRESS_PATTERN.match(parsed.text) and not _PICKUP_PATTERN.search(parsed.lower):
+        # A bare address only makes sense for delivery
+        return Resolution(DeliveryChoiceResponse(choice="delivery", address=parsed.text), 1.0)
+
+    pickup_spans = [m.span() for m in _PICKUP_PATTERN.finditer(parsed.lower)]
+    delivery_spans = [m.span() for m in _DELIVERY_PATTERN.finditer(parsed.lower)]
+    if bool(pickup_spans) == bool(delivery_spans):
+        return None
+    choice = "pickup" if pickup_spans else "delivery"
+    return Resolution(
+        DeliveryChoiceResponse(choice=choice),
+        _coverage(parsed, _DELIVERY_FILLER_WORDS, pickup_spans + delivery_spans),
+    )
+
+
+def resolve_confirmation(user_input: str) -> Resolution | None:
+    """Resolve replies that match the affirmative/negative response patterns."""
+    reply = _normalize_reply(ParsedText(user_input))
+    if menu_cache.is_affirmative(reply):
+        return Resolution(ConfirmationResponse(confirmed=True), 1.0)
+    if menu_cache.is_negative(reply):
+        return Resolution(ConfirmationResponse(wants_changes=True), 1.0)
+    return None
+
+
+def resolve_name(user_input: str) -> Resolution | None:
+    """
+    Resolve "my name is Mike Smith", "It's Sarah", "John".
+
+    Only "my name is", "name's", "this is" and "under" introduce a name for
+    sure. A bare word, or one after "it's", "I'm" or "call me", could be
+    anything ("I'm hungry", "call me back later"), so it only gets
+    LOW_CONFIDENCE and the LLM still decides. Replies naming menu
+    vocabulary are never names.
+    """
+    parsed = ParsedText(user_input)
+    reply = _normalize_reply(parsed)
+    if any(
+        menu_cache.is_response_type(reply, pattern_type)
+        for pattern_type in ("affirmative", "negative", "cancel", "done")
+    ):
+        return None
+
+    candidate, prefixed = _NAME_PREFIX_PATTERN.subn("", parsed.text, count=1)
+    if not prefixed:
+        candidate = _WEAK_NAME_PREFIX_PATTERN.sub("", candidate, count=1)
+    candidate = _NAME_SUFFIX_PATTERN.sub("", candidate).strip()
+    if not _NAME_PATTERN.match(candidate):
+        return None
+    if any(word.lower() in _NOT_NAME_WORDS for word in candidate.split()):
+        return None
+    if _mentions_menu(candidate):
+        return None
+
+    # Voice transcripts and quick typing are often all lowercase
+    name = candidate.title() if candidate.islower() else candidate
+    return Resolution(NameResponse(name=name), 1.0 if prefixed else LOW_CONFIDENCE)
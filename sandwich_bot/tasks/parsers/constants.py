@@ -397,7 +397,7 @@ DELIVERY_ZONE_PATTERNS = [
     # "do you deliver to X" / "can you deliver to X"
     re.compile(r"(?:do|can|will)\s+you\s+deliver\s+to\s+(.+?)(?:\?|$)", re.IGNORECASE),
     # "is X in your delivery area/zone"
-    re.compile(r"is\s+(.+?)\s+in\s+(?:your|the)\s+delivery\s+(?:area|zone|range)", re.IGNORECASE),
+    re.compile(r"is\s+(\S.*?)\s+in\s+(?:your|the)\s+delivery\s+(?:area|zone|range)", re.IGNORECASE),
     # "can I get delivery to X"
     re.compile(r"can\s+i\s+get\s+delivery\s+to\s+(.+?)(?:\?|$)", re.IGNORECASE),
     # "do you deliver in X"
@@ -638,7 +638,7 @@ MORE_MENU_ITEMS_PATTERNS = [
     # "keep going" / "continue"
     re.compile(r"^(?:keep going|continue|go on)\s*\??$", re.IGNORECASE),
     # "and?" / "and what else?"
-    re.compile(r"^and\s*\??\s*$", re.IGNORECASE),
+    re.compile(r"^and\s*(?:\?\s*)?$", re.IGNORECASE),
 ]
 
 
@@ -713,6 +713,37 @@ def get_bagel_spreads() -> set[str]:
     )
 
 
+def get_modifier_matcher():
+    """
+    Get the single-pass phrase matcher for modifiers, qualifiers and bagel types.
+
+    The matcher is built once per menu cache load, so per-turn extraction cost
+    does not grow with the size of the ingredient catalog.
+
+    Returns data from cache. Raises RuntimeError if cache not loaded.
+    """
+    cache = _get_menu_cache()
+    if cache:
+        matcher = cache.get_modifier_matcher()
+        if matcher is not None:
+            return matcher
+    raise RuntimeError(
+        "Modifier matcher not available. Ensure menu_data_cache is loaded from the database."
+    )
+
+
+def get_item_phrase_matcher():
+    """
+    Get the phrase matcher for compound item names, drinks and bagel modifiers.
+
+    Used to protect spans like "bacon egg and cheese" from being split as
+    separate items. Falls back to the generic vocabulary before the menu
+    cache is loaded, so multi-item detection never needs the database.
+    """
+    from sandwich_bot.menu_data_cache import menu_cache
+    return menu_cache.get_item_phrase_matcher()
+
+
 def get_bagel_only_types() -> set[str]:
     """
     Get bagel types that are NOT also spread types (unambiguous bagel types).
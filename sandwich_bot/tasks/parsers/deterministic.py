@@ -8,8 +8,14 @@ input patterns like greetings, simple bagel orders, coffee orders, etc.
 
 import re
 import logging
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Callable, NamedTuple
 
+from sandwich_bot.config import DETERMINISTIC_PARSE_MAX_CHARS
 from sandwich_bot.menu_data_cache import menu_cache
+from sandwich_bot.pattern_registry import pattern_registry
+from sandwich_bot.phrase_matcher import PhraseMatch, PhraseMatcher
 
 from ..schemas import (
     OpenInputResponse,
@@ -44,7 +50,8 @@ from .constants import (
     # Dynamic spread functions (loaded from database)
     get_spreads,
     get_spread_types,
-    get_bagel_spreads,
+    get_modifier_matcher,
+    get_item_phrase_matcher,
     QUALIFIER_PATTERNS,
     STANDALONE_INSTRUCTION_PATTERNS,
     GREETING_PATTERNS,
@@ -71,6 +78,10 @@ from .constants import (
     get_by_pound_items,
     find_by_pound_item,
 )
+from .beverage_grammar import BeverageGrammar
+from .parse_budget import ParseDeadlineExceeded, check_parse_deadline, parse_deadline
+from .parsed_text import ParsedText, get_parsed_text
+from .segmenter import segment_order
 
 logger = logging.getLogger(__name__)
 
@@ -265,37 +276,39 @@ def _build_side_parsed_item(
 # =============================================================================
 
 # Replace item patterns: "make it a X instead", "change it to X", "actually X instead", etc.
+# The item starts and ends on a non-space so the whitespace around it can't be
+# split between the item and the trailers in many ways (see pattern_bench.py)
 REPLACE_ITEM_PATTERN = re.compile(
     r"^(?:"
     # "make it X", "make that X", "make this X" - requires "make it/that/this"
-    r"make\s+(?:it|that|this)\s+(?:a\s+)?(.+?)(?:\s+instead)?[\s!.,?]*$"
+    r"make\s+(?:it|that|this)\s+(?:a\s+)?(\S(?:.*?\S)??)(?:\s+instead)?[\s!.,?]*$"
     r"|"
     # "can you make it X?", "could you make it X?" - requires "can/could you make it/that/this"
-    r"(?:can|could)\s+you\s+make\s+(?:it|that|this)\s+(?:a\s+)?(.+?)(?:\s+instead)?[\s!.,?]*$"
+    r"(?:can|could)\s+you\s+make\s+(?:it|that|this)\s+(?:a\s+)?(\S(?:.*?\S)??)(?:\s+instead)?[\s!.,?]*$"
     r"|"
     # "change it to X", "change to X" - requires "change"
-    r"change\s+(?:it\s+)?(?:to\s+)?(?:a\s+)?(.+?)(?:\s+instead)?[\s!.,?]*$"
+    r"change\s+(?:it\s+)?(?:to\s+)?(?:a\s+)?(\S(?:.*?\S)??)(?:\s+instead)?[\s!.,?]*$"
     r"|"
     # "switch to X", "switch it to X" - requires "switch"
-    r"switch\s+(?:it\s+)?(?:to\s+)?(?:a\s+)?(.+?)(?:\s+instead)?[\s!.,?]*$"
+    r"switch\s+(?:it\s+)?(?:to\s+)?(?:a\s+)?(\S(?:.*?\S)??)(?:\s+instead)?[\s!.,?]*$"
     r"|"
     # "swap for X", "swap it for X" - requires "swap"
-    r"swap\s+(?:it\s+)?(?:for\s+)?(?:a\s+)?(.+?)(?:\s+instead)?[\s!.,?]*$"
+    r"swap\s+(?:it\s+)?(?:for\s+)?(?:a\s+)?(\S(?:.*?\S)??)(?:\s+instead)?[\s!.,?]*$"
     r"|"
     # "replace with X", "replace it with X" - requires "replace"
-    r"replace\s+(?:it\s+)?(?:with\s+)?(?:a\s+)?(.+?)(?:\s+instead)?[\s!.,?]*$"
+    r"replace\s+(?:it\s+)?(?:with\s+)?(?:a\s+)?(\S(?:.*?\S)??)(?:\s+instead)?[\s!.,?]*$"
     r"|"
     # "actually X", "no X", "nope X", "wait X" - requires one of these words
-    r"(?:actually|nope|wait)[,]?\s+(?:make\s+(?:it\s+)?)?(?:a\s+)?(.+?)(?:\s+instead)?[\s!.,?]*$"
+    r"(?:actually|nope|wait)[,]?\s+(?:make\s+(?:it\s+)?)?(?:a\s+)?(\S(?:.*?\S)??)(?:\s+instead)?[\s!.,?]*$"
     r"|"
     # "no X" but NOT "no more X" (which is cancellation)
-    r"no[,]?\s+(?!more\s)(?:make\s+(?:it\s+)?)?(?:a\s+)?(.+?)(?:\s+instead)?[\s!.,?]*$"
+    r"no[,]?\s+(?!more\s)(?:make\s+(?:it\s+)?)?(?:a\s+)?(\S(?:.*?\S)??)(?:\s+instead)?[\s!.,?]*$"
     r"|"
     # "i meant X" - requires "i meant"
-    r"i\s+meant\s+(?:a\s+)?(.+?)(?:\s+instead)?[\s!.,?]*$"
+    r"i\s+meant\s+(?:a\s+)?(\S(?:.*?\S)??)(?:\s+instead)?[\s!.,?]*$"
     r"|"
     # "X instead" - requires "instead" at end
-    r"(?:a\s+)?(.+?)\s+instead[\s!.,?]*$"
+    r"(?:a\s+)?(\S(?:.*?\S)??)\s+instead[\s!.,?]*$"
     r")",
     re.IGNORECASE
 )
@@ -326,48 +339,6 @@ CANCEL_ITEM_PATTERN = re.compile(
     re.IGNORECASE
 )
 
-# Filler words pattern - words that add no meaning and should be stripped before parsing
-# e.g., "actually, make it two" -> "make it two"
-# Note: "actually" is only stripped when followed by comma (filler), not when followed directly
-# by an item name (e.g., "actually coke" means replacement, not filler + new order)
-FILLER_WORDS_PATTERN = re.compile(
-    r"^(?:"
-    r"actually,\s*"  # "actually," with comma is filler
-    r"|actually\s+(?=cancel|remove|forget|nevermind|never\s+mind|scratch|take\s+off)"  # "actually cancel/remove" etc.
-    r"|oh[,\s]+"     # "oh" is always filler
-    r"|wait,\s*"     # "wait," with comma is filler
-    r"|um+[,\s]+"    # "um" is always filler
-    r"|uh+[,\s]+"    # "uh" is always filler
-    r"|hmm+[,\s]+"   # "hmm" is always filler
-    r"|well[,\s]+"   # "well" is always filler
-    r"|so[,\s]+"     # "so" is always filler
-    r"|ok(?:ay)?[,\s]+"  # "ok/okay" is always filler
-    r"|hey[,\s]+"    # "hey" is always filler
-    r"|like[,\s]+"   # "like" is always filler
-    r"|sorry[,\s]+"  # "sorry" is filler (e.g., "sorry, I meant plain bagel")
-    r")",
-    re.IGNORECASE
-)
-
-
-def strip_filler_words(text: str) -> str:
-    """
-    Remove common filler words from the start of user input.
-
-    These words add no semantic meaning and can confuse parsing.
-    e.g., "actually, make it two" -> "make it two"
-    """
-    result = text
-    # Keep stripping filler words until none remain at the start
-    while True:
-        match = FILLER_WORDS_PATTERN.match(result)
-        if match:
-            result = result[match.end():].strip()
-        else:
-            break
-    return result
-
-
 # "Make it 2" pattern - user wants to change quantity of last item to N
 # e.g., "make it 2", "I'll take 2", "actually 2", "give me 2", "let's do 2", "can I get 2?"
 MAKE_IT_N_PATTERN = re.compile(
@@ -571,13 +542,15 @@ ADD_MORE_PATTERN = re.compile(
 )
 
 # Bagel quantity pattern - note: compound expressions like "half dozen" must come before single words
+# Whitespace and digit runs are only taken from their start, so a search
+# doesn't rescan a run from every position in it (see pattern_bench.py)
 BAGEL_QUANTITY_PATTERN = re.compile(
     r"(?:i(?:'?d|\s*would)?\s*(?:like|want|need|take|have|get)|"
     r"(?:can|could|may)\s+i\s+(?:get|have)|"
     r"give\s+me|"
     r"let\s*(?:me|'s)\s*(?:get|have)|"
-    r")?\s*"
-    r"(\d+|(?:a\s+)?half(?:\s+a)?\s+dozen|a\s+dozen|a\s+couple(?:\s+of)?|couple(?:\s+of)?|a\s+few|a|an|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve|dozen)\s+"
+    r")?(?:(?<!\s)\s+)?"
+    r"((?<!\d)\d+|(?:a\s+)?half(?:\s+a)?\s+dozen|a\s+dozen|a\s+couple(?:\s+of)?|couple(?:\s+of)?|a\s+few|a|an|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve|dozen)\s+"
     r"(?:\w+\s+)*"
     r"bagels?",
     re.IGNORECASE
@@ -589,43 +562,44 @@ SIMPLE_BAGEL_PATTERN = re.compile(
     r"(?:can|could|may)\s+i\s+(?:get|have)|"
     r"give\s+me|"
     r"let\s*(?:me|'s)\s*(?:get|have)|"
-    r")?\s*"
+    r")?(?:(?<!\s)\s+)?"
     r"(?:a\s+)?bagel(?:\s|$|[.,!?])",
     re.IGNORECASE
 )
 
-# Coffee order pattern - lazily built to use database-driven coffee types
-_COFFEE_ORDER_PATTERN_CACHE: re.Pattern | None = None
+# Coffee order pattern - built from database-driven coffee types and
+# recompiled by the pattern registry whenever the menu cache is refreshed
+@pattern_registry.register("coffee_order")
+def _build_coffee_order_pattern() -> re.Pattern:
+    """Build the coffee order regex from the current coffee/tea types."""
+    coffee_types = get_coffee_types()
+    # Sort by length (longest first) to match longer names first
+    sorted_types = sorted(coffee_types, key=len, reverse=True)
+    types_pattern = "|".join(re.escape(t) for t in sorted_types)
+    return re.compile(
+        r"(?:i(?:'?d|\s*would)?\s*(?:like|want|need|take|have|get)|"
+        r"(?:can|could|may)\s+i\s+(?:get|have)|"
+        r"give\s+me|"
+        r"let\s*(?:me|'s)\s*(?:get|have)|"
+        r")?(?:(?<!\s)\s+)?"
+        r"(?:an?\s+)?"
+        r"(?:((?<!\d)\d+|two|three|four|five)\s+)?"
+        r"(?:(small|medium|large)\s+)?"
+        r"(?:(iced|hot)\s+)?"
+        r"(?:(decaf)\s+)?"
+        rf"({types_pattern})"
+        r"(?:\s|$|[.,!?])",
+        re.IGNORECASE
+    )
 
 
 def _get_coffee_order_pattern() -> re.Pattern:
-    """Get the coffee order regex pattern, building it lazily on first use.
+    """Get the coffee order regex pattern for the current menu version.
 
-    Uses get_coffee_types() to get coffee/tea types from the database cache,
-    falling back to hardcoded defaults if cache isn't loaded.
+    Uses get_coffee_types() to get coffee/tea types from the database cache.
+    The pattern is compiled once per menu cache load by the pattern registry.
     """
-    global _COFFEE_ORDER_PATTERN_CACHE
-    if _COFFEE_ORDER_PATTERN_CACHE is None:
-        coffee_types = get_coffee_types()
-        # Sort by length (longest first) to match longer names first
-        sorted_types = sorted(coffee_types, key=len, reverse=True)
-        types_pattern = "|".join(re.escape(t) for t in sorted_types)
-        _COFFEE_ORDER_PATTERN_CACHE = re.compile(
-            r"(?:i(?:'?d|\s*would)?\s*(?:like|want|need|take|have|get)|"
-            r"(?:can|could|may)\s+i\s+(?:get|have)|"
-            r"give\s+me|"
-            r"let\s*(?:me|'s)\s*(?:get|have)|"
-            r")?\s*"
-            r"(?:an?\s+)?"
-            r"(?:(\d+|two|three|four|five)\s+)?"
-            r"(?:(small|medium|large)\s+)?"
-            r"(?:(iced|hot)\s+)?"
-            r"(?:(decaf)\s+)?"
-            rf"({types_pattern})"
-            r"(?:\s|$|[.,!?])",
-            re.IGNORECASE
-        )
-    return _COFFEE_ORDER_PATTERN_CACHE
+    return pattern_registry.get("coffee_order")
 
 
 # Keep COFFEE_ORDER_PATTERN as a property-like accessor for backwards compatibility
@@ -637,6 +611,16 @@ COFFEE_ORDER_PATTERN = None  # Will be set lazily; use _get_coffee_order_pattern
 # Modifier Qualifier Extraction Functions
 # =============================================================================
 
+# Maximum gap (in characters) between a qualifier and the modifier it applies to
+QUALIFIER_ADJACENCY_WINDOW = 15
+
+
+@lru_cache(maxsize=32)
+def _extra_modifier_matcher(phrases: frozenset[str]) -> PhraseMatcher:
+    """Matcher for modifiers outside the menu vocabulary, built once per phrase set."""
+    return PhraseMatcher({"modifier": phrases})
+
+
 def extract_modifiers_with_qualifiers(
     text: str,
     known_modifiers: set[str]
@@ -644,8 +628,10 @@ def extract_modifiers_with_qualifiers(
     """
     Extract modifiers and their associated qualifiers from text.
 
-    Scans the text for qualifier patterns (extra, light, on the side, etc.)
-    from the database and associates them with adjacent modifiers.
+    Scans the text once with the menu cache's phrase matcher to find every
+    qualifier pattern (extra, light, on the side, etc.) and known modifier
+    (plus once for any known modifiers outside the menu vocabulary), then
+    associates each modifier with its adjacent qualifiers.
 
     Args:
         text: The text to parse (e.g., "extra mayo and bacon on the side")
@@ -666,90 +652,97 @@ def extract_modifiers_with_qualifiers(
         >>> extract_modifiers_with_qualifiers("light extra mayo", {"mayo"})
         ([], [("mayo", "light", "extra")])  # Conflict detected
     """
-    text_lower = text.lower().strip()
-
-    # Get qualifier patterns from database (sorted by length for longest match first)
-    qualifier_patterns = menu_cache.get_qualifier_patterns()
+    text_lower = get_parsed_text(text).lower
+    known_modifiers = {modifier.lower() for modifier in known_modifiers}
+
+    matcher = get_modifier_matcher()
+    qualifier_patterns = matcher.get_category("qualifier")
+
+    # One scan finds every qualifier and modifier candidate
+    matches = matcher.find_all(text_lower)
+    extras = frozenset(modifier for modifier in known_modifiers if modifier not in matcher)
+    if extras:
+        # Caller passed modifiers outside the menu vocabulary - scan for those too
+        matches += _extra_modifier_matcher(extras).find_all(text_lower)
+
+    qualifier_matches: list[PhraseMatch] = []
+    modifier_matches: list[PhraseMatch] = []
+    seen_modifier_spans: set[tuple[int, int]] = set()
+    for match in matches:
+        if match.category == "qualifier":
+            qualifier_matches.append(match)
+        elif match.phrase in known_modifiers and (match.start, match.end) not in seen_modifier_spans:
+            # A phrase can be in several categories (e.g. protein and topping)
+            seen_modifier_spans.add((match.start, match.end))
+            modifier_matches.append(match._replace(category="modifier"))
 
     if not qualifier_patterns:
         # No qualifiers in database, fall back to simple modifier extraction
         formatted = []
-        for modifier in sorted(known_modifiers, key=len, reverse=True):
-            if re.search(rf'\b{re.escape(modifier)}\b', text_lower):
-                normalized = menu_cache.normalize_modifier(modifier)
-                if normalized not in formatted:
-                    formatted.append(normalized)
+        for match in sorted(modifier_matches, key=lambda m: (m.start - m.end, m.start)):
+            normalized = menu_cache.normalize_modifier(match.phrase)
+            if normalized not in formatted:
+                formatted.append(normalized)
         return (formatted, None)
 
-    # Track found qualifiers with their positions
-    # Format: [(start, end, pattern, normalized_form, category), ...]
-    found_qualifiers: list[tuple[int, int, str, str, str]] = []
-
-    for pattern in qualifier_patterns:
-        # Find all occurrences of this qualifier pattern
-        pattern_re = re.compile(rf'\b{re.escape(pattern)}\b', re.IGNORECASE)
-        for match in pattern_re.finditer(text_lower):
-            info = menu_cache.get_qualifier_info(pattern)
-            if info:
-                found_qualifiers.append((
-                    match.start(),
-                    match.end(),
-                    pattern,
-                    info["normalized_form"],
-                    info["category"],
-                ))
-
-    # Track found modifiers with their positions
-    # Format: [(start, end, modifier, normalized), ...]
-    found_modifiers: list[tuple[int, int, str, str]] = []
-    matched_spans: list[tuple[int, int]] = []
-
-    # Mark qualifier spans to avoid matching modifiers inside them
-    for start, end, _, _, _ in found_qualifiers:
-        matched_spans.append((start, end))
-
-    for modifier in sorted(known_modifiers, key=len, reverse=True):
-        pattern_re = re.compile(rf'\b{re.escape(modifier)}\b', re.IGNORECASE)
-        for match in pattern_re.finditer(text_lower):
-            start, end = match.start(), match.end()
-            # Check for overlap with existing spans
-            overlaps = any(not (end <= s or start >= e) for s, e in matched_spans)
-            if not overlaps:
-                normalized = menu_cache.normalize_modifier(modifier)
-                found_modifiers.append((start, end, modifier, normalized))
-                matched_spans.append((start, end))
+    # Longest qualifiers win ("a little bit of" over "a little"), and modifiers
+    # may not be matched inside a qualifier span
+    found_qualifiers = matcher.find_longest(
+        text_lower, ["qualifier"], matches=qualifier_matches
+    )
+    found_qualifiers.sort(key=lambda m: m.start)
+    found_modifiers = matcher.find_longest(
+        text_lower,
+        ["modifier"],
+        blocked=[(q.start, q.end) for q in found_qualifiers],
+        matches=modifier_matches,
+    )
 
     # Associate qualifiers with modifiers
-    # A qualifier applies to a modifier if it's adjacent (before or after)
+    # A qualifier applies to a modifier if it's adjacent (before or after).
+    # Qualifiers don't overlap, so their starts and ends are both sorted and
+    # the adjacency windows can be located by bisection.
+    qual_starts = [q.start for q in found_qualifiers]
+    qual_ends = [q.end for q in found_qualifiers]
     modifier_qualifiers: dict[str, list[tuple[str, str]]] = {}  # normalized_modifier -> [(normalized_qual, category), ...]
     conflicts: list[tuple[str, str, str]] = []
+    normalized_modifiers: list[str] = []
 
-    for mod_start, mod_end, _, normalized_mod in found_modifiers:
+    for mod in found_modifiers:
+        normalized_mod = menu_cache.normalize_modifier(mod.phrase)
+        normalized_modifiers.append(normalized_mod)
         if normalized_mod not in modifier_qualifiers:
             modifier_qualifiers[normalized_mod] = []
 
-        # Find qualifiers adjacent to this modifier
-        for qual_start, qual_end, _, qual_normalized, qual_category in found_qualifiers:
-            # Check if qualifier is adjacent (within 20 chars, accounting for spaces)
-            # Qualifier before modifier: "extra mayo" -> qual_end near mod_start
-            # Qualifier after modifier: "mayo on the side" -> mod_end near qual_start
-            is_before = qual_end <= mod_start and mod_start - qual_end <= 15
-            is_after = qual_start >= mod_end and qual_start - mod_end <= 15
-
-            if is_before or is_after:
-                # Check for conflicts in same category
-                existing_categories = [cat for _, cat in modifier_qualifiers[normalized_mod]]
-                if qual_category == "amount" and "amount" in existing_categories:
-                    # Conflict: multiple amount qualifiers for same modifier
-                    existing_amount = next(q for q, c in modifier_qualifiers[normalized_mod] if c == "amount")
-                    conflicts.append((normalized_mod, existing_amount, qual_normalized))
-                else:
-                    modifier_qualifiers[normalized_mod].append((qual_normalized, qual_category))
+        # Qualifier before modifier: "extra mayo" -> qual_end near mod_start
+        before = range(
+            bisect_left(qual_ends, mod.start - QUALIFIER_ADJACENCY_WINDOW),
+            bisect_right(qual_ends, mod.start),
+        )
+        # Qualifier after modifier: "mayo on the side" -> mod_end near qual_start
+        after = range(
+            bisect_left(qual_starts, mod.end),
+            bisect_right(qual_starts, mod.end + QUALIFIER_ADJACENCY_WINDOW),
+        )
+
+        for index in (*before, *after):
+            info = menu_cache.get_qualifier_info(found_qualifiers[index].phrase)
+            if not info:
+                continue
+            qual_normalized, qual_category = info["normalized_form"], info["category"]
+            # Check for conflicts in same category
+            existing_categories = [cat for _, cat in modifier_qualifiers[normalized_mod]]
+            if qual_category == "amount" and "amount" in existing_categories:
+                # Conflict: multiple amount qualifiers for same modifier
+                existing_amount = next(q for q, c in modifier_qualifiers[normalized_mod] if c == "amount")
+                conflicts.append((normalized_mod, existing_amount, qual_normalized))
+            else:
+                modifier_qualifiers[normalized_mod].append((qual_normalized, qual_category))
 
     # Build formatted output
     formatted: list[str] = []
 
-    for mod_start, mod_end, _, normalized_mod in found_modifiers:
+    for normalized_mod in normalized_modifiers:
         qualifiers = modifier_qualifiers.get(normalized_mod, [])
         if qualifiers:
             # Sort qualifiers for consistent output
@@ -765,12 +758,23 @@ def extract_modifiers_with_qualifiers(
 # Modifier Extraction Functions
 # =============================================================================
 
+# "side of X" spans are side orders, not bagel modifiers
+SIDE_OF_PATTERN = re.compile(r'\bside\s+of\s+\w+(?:\s+\w+)?', re.IGNORECASE)
+
+# Matched right after a bagel type to recognize "<type> bagel(s)" spans
+BAGEL_SUFFIX_PATTERN = re.compile(r'\s+bagels?\b', re.IGNORECASE)
+
+GENERIC_CHEESE_PATTERN = re.compile(r'\bcheese\b', re.IGNORECASE)
+CREAM_CHEESE_PATTERN = re.compile(r'\bcream\s+cheese\b', re.IGNORECASE)
+
+
 def extract_modifiers_from_input(user_input: str) -> ExtractedModifiers:
     """
     Extract bagel modifiers from user input using keyword matching.
 
-    This is a deterministic, non-LLM approach that scans the input for
-    known modifier keywords and extracts them by category.
+    This is a deterministic, non-LLM approach that scans the input once
+    with the menu cache's phrase matcher and assigns the longest
+    non-overlapping matches to each modifier category.
 
     Args:
         user_input: The raw user input string
@@ -781,68 +785,42 @@ def extract_modifiers_from_input(user_input: str) -> ExtractedModifiers:
     result = ExtractedModifiers()
     input_lower = user_input.lower()
 
+    matcher = get_modifier_matcher()
+    matches = matcher.find_all(input_lower)
+
     # Pre-mark "side of X" patterns to exclude them from modifier extraction
-    side_of_spans: list[tuple[int, int]] = []
-    side_of_pattern = re.compile(r'\bside\s+of\s+\w+(?:\s+\w+)?', re.IGNORECASE)
-    for match in side_of_pattern.finditer(input_lower):
-        side_of_spans.append((match.start(), match.end()))
+    excluded_spans: list[tuple[int, int]] = []
+    for match in SIDE_OF_PATTERN.finditer(input_lower):
+        excluded_spans.append((match.start(), match.end()))
         logger.debug(f"Excluding 'side of' pattern from modifiers: '{match.group()}'")
 
     # Pre-mark bagel type patterns to exclude them from topping extraction
-    bagel_type_spans: list[tuple[int, int]] = []
-    for bagel_type in sorted(get_bagel_types(), key=len, reverse=True):
-        pattern = re.compile(rf'\b{re.escape(bagel_type)}\s+bagels?\b', re.IGNORECASE)
-        for match in pattern.finditer(input_lower):
-            type_end = match.start() + len(bagel_type)
-            bagel_type_spans.append((match.start(), type_end))
-            logger.debug(f"Excluding bagel type from modifiers: '{bagel_type}'")
-
-    def is_word_boundary(text: str, start: int, end: int) -> bool:
-        """Check if the match is at word boundaries."""
-        before_ok = start == 0 or not text[start - 1].isalnum()
-        after_ok = end >= len(text) or not text[end].isalnum()
-        return before_ok and after_ok
-
-    matched_spans: list[tuple[int, int]] = side_of_spans.copy() + bagel_type_spans.copy()
-
-    def find_and_add(modifier_set: set[str], target_list: list[str], category: str):
-        """Find modifiers from a set and add to target list."""
-        sorted_modifiers = sorted(modifier_set, key=len, reverse=True)
-
-        for modifier in sorted_modifiers:
-            start = 0
-            while True:
-                pos = input_lower.find(modifier, start)
-                if pos == -1:
-                    break
-
-                end = pos + len(modifier)
-
-                if is_word_boundary(input_lower, pos, end):
-                    overlaps = any(
-                        not (end <= s or pos >= e) for s, e in matched_spans
-                    )
-                    if not overlaps:
-                        matched_spans.append((pos, end))
-                        normalized = menu_cache.normalize_modifier(modifier)
-                        if normalized not in target_list:
-                            target_list.append(normalized)
-                            logger.debug(f"Extracted {category}: '{modifier}' -> '{normalized}'")
-
-                start = pos + 1
+    for match in matches:
+        if match.category == "bagel_type" and BAGEL_SUFFIX_PATTERN.match(input_lower, match.end):
+            excluded_spans.append((match.start, match.end))
+            logger.debug(f"Excluding bagel type from modifiers: '{match.phrase}'")
+
+    targets = {
+        "spread": result.spreads,
+        "protein": result.proteins,
+        "cheese": result.cheeses,
+        "topping": result.toppings,
+    }
 
-    # Extract in order of specificity
-    find_and_add(get_bagel_spreads(), result.spreads, "spread")
-    find_and_add(get_proteins(), result.proteins, "protein")
-    find_and_add(get_cheeses(), result.cheeses, "cheese")
-    find_and_add(get_toppings(), result.toppings, "topping")
+    # Extract in order of specificity (earlier categories claim spans first)
+    for match in matcher.find_longest(
+        input_lower, list(targets), blocked=excluded_spans, matches=matches
+    ):
+        target_list = targets[match.category]
+        normalized = menu_cache.normalize_modifier(match.phrase)
+        if normalized not in target_list:
+            target_list.append(normalized)
+            logger.debug(f"Extracted {match.category}: '{match.phrase}' -> '{normalized}'")
 
     # Special case: detect generic "cheese" even if not in database cheeses list
     # This handles "add cheese" where user wants sliced cheese but didn't specify type
     # Exclude "cream cheese" which is a spread, not a sliced cheese
-    generic_cheese_pattern = re.compile(r'\bcheese\b', re.IGNORECASE)
-    cream_cheese_pattern = re.compile(r'\bcream\s+cheese\b', re.IGNORECASE)
-    has_generic_cheese = generic_cheese_pattern.search(input_lower) and not cream_cheese_pattern.search(input_lower)
+    has_generic_cheese = GENERIC_CHEESE_PATTERN.search(input_lower) and not CREAM_CHEESE_PATTERN.search(input_lower)
 
     if has_generic_cheese:
         # Check if we found any specific cheese types
@@ -858,21 +836,64 @@ def extract_modifiers_from_input(user_input: str) -> ExtractedModifiers:
 
     # Extract special instructions (filter to only bagel-related ones)
     instructions_list = extract_special_instructions_from_input(user_input)
-    bagel_keywords = {
-        'cream cheese', 'butter', 'cream', 'lox', 'spread',
-        'bacon', 'ham', 'turkey', 'egg', 'sausage', 'meat',
-        'cheese', 'american', 'cheddar', 'swiss', 'muenster',
-        'tomato', 'onion', 'lettuce', 'cucumber', 'capers', 'avocado',
-    }
-    bagel_instructions = [n for n in instructions_list if any(kw in n.lower() for kw in bagel_keywords)]
+    item_matcher = get_item_phrase_matcher()
+    bagel_instructions = [
+        n for n in instructions_list
+        if item_matcher.find_all(n.lower(), ["bagel_modifier"])
+    ]
     result.special_instructions = bagel_instructions
 
     return result
 
 
+# Coffee order grammar - compiled from the beverage options and global
+# attribute options, rebuilt by the pattern registry on every menu refresh
+
+# Shot counts of the global "shots" option slugs
+_SHOT_COUNTS = {"single": 1, "double": 2, "triple": 3, "quad": 4}
+
+
+def _global_option_phrases(attr_slug: str, include_aliases: bool = True) -> dict[str, str]:
+    """Map a global attribute's option slugs, display names and aliases to the slug."""
+    phrases: dict[str, str] = {}
+    for option in menu_cache.get_global_attribute_options(attr_slug):
+        slug = option["slug"].lower()
+        aliases = (option.get("aliases") or []) if include_aliases else []
+        for phrase in (slug, option.get("display_name") or "", *aliases):
+            if phrase.strip():
+                phrases[phrase.strip().lower()] = slug
+    return phrases
+
+
+@pattern_registry.register("beverage_grammar")
+def _build_beverage_grammar() -> BeverageGrammar:
+    """Compile the coffee order grammar from the current beverage options."""
+    # Temperature and shot words are matched as single tokens; aliases are
+    # left out since they include bare numbers ("2" shots, "two" coffees)
+    temperatures = {
+        word: slug
+        for word, slug in _global_option_phrases("temperature", include_aliases=False).items()
+        if slug in ("iced", "hot") and " " not in word
+    }
+    shots = {
+        word: _SHOT_COUNTS[slug]
+        for word, slug in _global_option_phrases("shots", include_aliases=False).items()
+        if slug in _SHOT_COUNTS and " " not in word
+    }
+    return BeverageGrammar(
+        drinks=get_coffee_types(),
+        milks=_get_parser_milk_options(),
+        sweeteners=_get_parser_sweetener_options(),
+        syrups=_get_parser_syrup_options(),
+        sizes=_global_option_phrases("size"),
+        temperatures=temperatures,
+        shots=shots,
+    )
+
+
 def extract_coffee_modifiers_from_input(user_input: str) -> ExtractedCoffeeModifiers:
     """
-    Extract coffee modifiers from user input using keyword matching.
+    Extract coffee modifiers from user input with the beverage grammar.
 
     Args:
         user_input: The raw user input string
@@ -880,156 +901,21 @@ def extract_coffee_modifiers_from_input(user_input: str) -> ExtractedCoffeeModif
     Returns:
         ExtractedCoffeeModifiers with sweetener, flavor_syrup, and milk if found
     """
-    result = ExtractedCoffeeModifiers()
-    input_lower = user_input.lower()
-
-    # Get options from database (with fallbacks)
-    sweeteners = _get_parser_sweetener_options()
-    syrups = _get_parser_syrup_options()
-    milk_types = _get_parser_milk_options()
-
-    # Extract milk type
-    for milk in milk_types:
-        # Match patterns like "oat milk", "with oat", "almond milk"
-        # For "almond", skip if it's followed by "syrup" (almond syrup is a flavor, not milk)
-        if milk == "almond":
-            if re.search(r'\balmond\s+syrup\b', input_lower):
-                continue  # Skip, this is almond syrup not almond milk
-        if re.search(rf'\b{re.escape(milk)}(?:\s+milk)?\b', input_lower):
-            # Normalize milk type
-            if milk in ("2%", "two percent"):
-                result.milk = "2%"
-            elif milk in ("half and half", "half & half"):
-                result.milk = "half and half"
-            else:
-                result.milk = milk
-            logger.debug(f"Extracted coffee milk: {result.milk}")
-            break
-
-    # Check for "black" (no milk)
-    if not result.milk and re.search(r'\bblack\b', input_lower):
-        result.milk = "none"
-        logger.debug("Extracted coffee milk: none (black)")
-
-    # Check for cream level (dark, light, regular)
-    # "dark" = less cream/milk, "light" = more cream/milk
-    # Note: "light" for cream level is different from "light roast" - context is cream preference
-    if re.search(r'\bdark\b', input_lower):
-        result.cream_level = "dark"
-        logger.debug("Extracted coffee cream_level: dark")
-    elif re.search(r'\blight\b', input_lower):
-        # Only match "light" if it's not followed by "roast" (to avoid "light roast" confusion)
-        if not re.search(r'\blight\s+roast\b', input_lower):
-            result.cream_level = "light"
-            logger.debug("Extracted coffee cream_level: light")
-    elif re.search(r'\bregular\b', input_lower):
-        result.cream_level = "regular"
-        logger.debug("Extracted coffee cream_level: regular")
-
-    # Check for just "milk" without a type - default to whole milk
-    if not result.milk and re.search(r'\bmilk\b', input_lower):
-        result.milk = "whole"
-        logger.debug("Extracted coffee milk: whole (default from 'milk')")
-
-    # Extract sweetener with quantity
-    for sweetener in sweeteners:
-        qty_pattern = re.compile(
-            rf'(\d+|one|two|three|four|five|six|seven|eight|nine|ten)\s+{sweetener}s?',
-            re.IGNORECASE
-        )
-        qty_match = qty_pattern.search(input_lower)
-        if qty_match:
-            qty_str = qty_match.group(1)
-            if qty_str.isdigit():
-                result.sweetener_quantity = int(qty_str)
-            else:
-                result.sweetener_quantity = WORD_TO_NUM.get(qty_str.lower(), 1)
-            result.sweetener = sweetener
-            logger.debug(f"Extracted coffee sweetener: {result.sweetener_quantity} {sweetener}")
-            break
-        elif re.search(rf'\b{sweetener}s?\b', input_lower):
-            result.sweetener = sweetener
-            result.sweetener_quantity = 1
-            logger.debug(f"Extracted coffee sweetener: {sweetener}")
-            break
-
-    # Extract flavor syrup with quantity
-    for syrup in syrups:
-        # For "almond", require "almond syrup" to avoid matching "almond milk"
-        if syrup == "almond":
-            # Check for quantity + almond syrup (e.g., "2 almond syrups")
-            qty_pattern = re.compile(
-                r'(\d+|one|two|three|four|five|six|double|triple)\s+almond\s+syrups?',
-                re.IGNORECASE
-            )
-            qty_match = qty_pattern.search(input_lower)
-            if qty_match:
-                qty_str = qty_match.group(1).lower()
-                if qty_str.isdigit():
-                    result.syrup_quantity = int(qty_str)
-                elif qty_str == "double":
-                    result.syrup_quantity = 2
-                elif qty_str == "triple":
-                    result.syrup_quantity = 3
-                else:
-                    result.syrup_quantity = WORD_TO_NUM.get(qty_str, 1)
-                result.flavor_syrup = syrup
-                logger.debug(f"Extracted coffee flavor syrup: {result.syrup_quantity} {syrup}")
-                break
-            elif re.search(r'\balmond\s+syrup\b', input_lower):
-                result.flavor_syrup = syrup
-                result.syrup_quantity = 1
-                logger.debug(f"Extracted coffee flavor syrup: {syrup}")
-                break
-        else:
-            # Check for quantity + syrup (e.g., "2 hazelnut syrups", "double vanilla")
-            qty_pattern = re.compile(
-                rf'(\d+|one|two|three|four|five|six|double|triple)\s+{re.escape(syrup)}(?:\s+syrups?)?',
-                re.IGNORECASE
-            )
-            qty_match = qty_pattern.search(input_lower)
-            if qty_match:
-                qty_str = qty_match.group(1).lower()
-                if qty_str.isdigit():
-                    result.syrup_quantity = int(qty_str)
-                elif qty_str == "double":
-                    result.syrup_quantity = 2
-                elif qty_str == "triple":
-                    result.syrup_quantity = 3
-                else:
-                    result.syrup_quantity = WORD_TO_NUM.get(qty_str, 1)
-                result.flavor_syrup = syrup
-                logger.debug(f"Extracted coffee flavor syrup: {result.syrup_quantity} {syrup}")
-                break
-            elif re.search(rf'\b{syrup}\b', input_lower):
-                result.flavor_syrup = syrup
-                result.syrup_quantity = 1
-                logger.debug(f"Extracted coffee flavor syrup: {syrup}")
-                break
-
-    # Check for generic "syrup" request without a specific flavor
-    # e.g., "with syrup", "add syrup", "2 syrups"
-    if not result.flavor_syrup and re.search(r'\bsyrups?\b', input_lower):
-        result.wants_syrup = True
-        # Extract quantity from "2 syrups", "two syrups", "double syrup", etc.
-        qty_pattern = re.compile(
-            r'(\d+|one|two|three|four|five|six|double|triple)\s+syrups?\b',
-            re.IGNORECASE
-        )
-        qty_match = qty_pattern.search(input_lower)
-        if qty_match:
-            qty_str = qty_match.group(1).lower()
-            if qty_str.isdigit():
-                result.syrup_quantity = int(qty_str)
-            elif qty_str == "double":
-                result.syrup_quantity = 2
-            elif qty_str == "triple":
-                result.syrup_quantity = 3
-            else:
-                result.syrup_quantity = WORD_TO_NUM.get(qty_str, 1)
-            logger.debug("User requested %d syrups without specifying flavor", result.syrup_quantity)
-        else:
-            logger.debug("User requested syrup without specifying flavor")
+    slots = pattern_registry.get("beverage_grammar").parse(get_parsed_text(user_input))
+    result = ExtractedCoffeeModifiers(
+        sweetener=slots.sweetener,
+        sweetener_quantity=slots.sweetener_quantity,
+        flavor_syrup=slots.flavor_syrup,
+        syrup_quantity=slots.syrup_quantity,
+        milk=slots.milk,
+        cream_level=slots.cream_level,
+        wants_syrup=slots.wants_syrup,
+    )
+    logger.debug(
+        "Extracted coffee modifiers: milk=%s, cream_level=%s, sweetener=%s(%d), syrup=%s(%d), wants_syrup=%s",
+        result.milk, result.cream_level, result.sweetener, result.sweetener_quantity,
+        result.flavor_syrup, result.syrup_quantity, result.wants_syrup,
+    )
 
     result.special_instructions = extract_special_instructions_from_input(user_input)
 
@@ -1400,7 +1286,7 @@ def _parse_modify_existing_item(text: str, spread_types: set[str]) -> OpenInputR
 
     Returns OpenInputResponse with modify_existing_item=True if detected, None otherwise.
     """
-    text_lower = text.lower().strip()
+    text_lower = get_parsed_text(text).lower
 
     spread_part = None
     target_bagel = None
@@ -1523,7 +1409,7 @@ def _parse_add_modifier_to_item(text: str) -> OpenInputResponse | None:
 
     Returns OpenInputResponse with modify_existing_item=True if detected, None otherwise.
     """
-    text_lower = text.lower().strip()
+    text_lower = get_parsed_text(text).lower
 
     # Skip patterns that look like breakfast sandwiches ("add bacon egg and cheese")
     # These should be handled by _parse_egg_cheese_sandwich_abbrev instead
@@ -1636,7 +1522,7 @@ def _parse_add_modifier_to_item(text: str) -> OpenInputResponse | None:
 
 def _extract_menu_item_from_text(text: str) -> tuple[str | None, int]:
     """Try to extract a known menu item from text."""
-    text_lower = text.lower().strip()
+    text_lower = get_parsed_text(text).lower
 
     text_lower = re.sub(r'^(i\s+want\s+|i\'?d\s+like\s+|can\s+i\s+(get|have)\s+|give\s+me\s+|let\s+me\s+(get|have)\s+)', '', text_lower)
     text_lower = re.sub(r'^(a|an|the)\s+', '', text_lower)
@@ -1682,10 +1568,11 @@ def _parse_bagel_with_modifiers(text: str) -> OpenInputResponse | None:
         - "plain bagel with egg and cheese"
         - "sesame bagel with lox and cream cheese"
     """
-    text_lower = text.lower().strip()
+    parsed = get_parsed_text(text)
+    text_lower = parsed.lower
 
     # Must have "bagel" in the text
-    if not re.search(r"\bbagels?\b", text_lower):
+    if not parsed.has_bagel:
         return None
 
     # Must have "with" followed by modifiers - this indicates a customized bagel
@@ -1798,6 +1685,26 @@ def _parse_bagel_with_modifiers(text: str) -> OpenInputResponse | None:
 # Split-Quantity Bagel Parsing
 # =============================================================================
 
+# Split-quantity part patterns ("one with X, the other with Y")
+# Captures: (quantity_word, specification)
+SPLIT_QUANTITY_BAGELS_PATTERN = re.compile(
+    r"(?:,?(?:(?<!\s)\s+)?(?:and\s+)?)"  # Optional comma/and separator
+    r"(one|two|three|1|2|3|first|second|third|the\s+other|another)\s+"  # Quantity/ordinal (group 1)
+    r"(with\s+.+?|(?:not\s+)?toasted(?:\s+with\s+.+?)?|plain(?:\s+with\s+.+?)?|"  # Specification (group 2)
+    r"(?:plain|everything|sesame|poppy|onion|salt|garlic|pumpernickel|whole\s+wheat|cinnamon\s+raisin|bialy)(?:\s+with\s+.+?)?)"  # Or bagel type
+    r"(?=(?:,?(?:(?<!\s)\s+)?(?:and\s+)?(?:one|two|three|1|2|3|first|second|third|the\s+other|another)\s)|$)",
+    re.IGNORECASE
+)
+
+SPLIT_QUANTITY_DRINKS_PATTERN = re.compile(
+    r"(?:,?(?:(?<!\s)\s+)?(?:and\s+)?)"  # Optional comma/and separator
+    r"(one|two|three|1|2|3|first|second|third|the\s+other|another)\s+"  # Quantity/ordinal (group 1)
+    r"(with\s+.+?|iced(?:\s+with\s+.+?)?|hot(?:\s+with\s+.+?)?|black|decaf(?:\s+with\s+.+?)?|plain)"  # Specification (group 2)
+    r"(?=(?:,?(?:(?<!\s)\s+)?(?:and\s+)?(?:one|two|three|1|2|3|first|second|third|the\s+other|another)\s)|$)",
+    re.IGNORECASE
+)
+
+
 def _parse_split_quantity_bagels(text: str) -> OpenInputResponse | None:
     """
     Parse orders with multiple bagels that have different configurations.
@@ -1809,10 +1716,11 @@ def _parse_split_quantity_bagels(text: str) -> OpenInputResponse | None:
 
     Returns OpenInputResponse with parsed_items populated with ParsedBagelEntry objects.
     """
-    text_lower = text.lower().strip()
+    parsed = get_parsed_text(text)
+    text_lower = parsed.lower
 
     # Must have "bagel" in the text
-    if not re.search(r"\bbagels?\b", text_lower):
+    if not parsed.has_bagel:
         return None
 
     # Detect split-quantity patterns: "one with X" or "one X" repeated
@@ -1871,18 +1779,7 @@ def _parse_split_quantity_bagels(text: str) -> OpenInputResponse | None:
 
     # Split the text into parts for each bagel
     # Look for patterns like "one with X", "two Y", "the other with Z"
-    # Captures: (quantity_word, specification)
-    split_pattern = re.compile(
-        r"(?:,?\s*(?:and\s+)?)"  # Optional comma/and separator
-        r"(one|two|three|1|2|3|first|second|third|the\s+other|another)\s+"  # Quantity/ordinal (group 1)
-        r"(with\s+.+?|(?:not\s+)?toasted(?:\s+with\s+.+?)?|plain(?:\s+with\s+.+?)?|"  # Specification (group 2)
-        r"(?:plain|everything|sesame|poppy|onion|salt|garlic|pumpernickel|whole\s+wheat|cinnamon\s+raisin|bialy)(?:\s+with\s+.+?)?)"  # Or bagel type
-        r"(?=(?:,?\s*(?:and\s+)?(?:one|two|three|1|2|3|first|second|third|the\s+other|another)\s+)|$)",
-        re.IGNORECASE
-    )
-
-    # Find all split parts with quantities
-    raw_parts = split_pattern.findall(text_lower)
+    raw_parts = SPLIT_QUANTITY_BAGELS_PATTERN.findall(text_lower)
     logger.info("SPLIT-QUANTITY: found %d raw parts: %s", len(raw_parts), raw_parts)
 
     # Convert to (quantity, specification) tuples
@@ -2031,7 +1928,7 @@ def _parse_split_quantity_drinks(text: str) -> OpenInputResponse | None:
 
     Returns OpenInputResponse with parsed_items populated with ParsedCoffeeEntry objects.
     """
-    text_lower = text.lower().strip()
+    text_lower = get_parsed_text(text).lower
 
     # Build pattern for drink types (coffee, tea, latte, etc.)
     # get_coffee_types() includes both item names and aliases from database
@@ -2112,17 +2009,7 @@ def _parse_split_quantity_drinks(text: str) -> OpenInputResponse | None:
         base_decaf = True
 
     # Split the text into parts for each drink
-    # Captures: (quantity_word, specification)
-    split_pattern = re.compile(
-        r"(?:,?\s*(?:and\s+)?)"  # Optional comma/and separator
-        r"(one|two|three|1|2|3|first|second|third|the\s+other|another)\s+"  # Quantity/ordinal (group 1)
-        r"(with\s+.+?|iced(?:\s+with\s+.+?)?|hot(?:\s+with\s+.+?)?|black|decaf(?:\s+with\s+.+?)?|plain)"  # Specification (group 2)
-        r"(?=(?:,?\s*(?:and\s+)?(?:one|two|three|1|2|3|first|second|third|the\s+other|another)\s+)|$)",
-        re.IGNORECASE
-    )
-
-    # Find all split parts with quantities
-    raw_parts = split_pattern.findall(text_lower)
+    raw_parts = SPLIT_QUANTITY_DRINKS_PATTERN.findall(text_lower)
     logger.info("SPLIT-QUANTITY DRINKS: found %d raw parts: %s", len(raw_parts), raw_parts)
 
     # Convert to (quantity, specification) tuples
@@ -2339,20 +2226,66 @@ def _parse_egg_cheese_sandwich_abbrev(text: str) -> OpenInputResponse | None:
     )
 
 
+@pattern_registry.register("signature_item_aliases")
+def _build_signature_item_alias_patterns() -> tuple[tuple[str, str, re.Pattern], ...]:
+    """Compile (alias, item name, quantity pattern) per signature item alias.
+
+    Aliases are ordered longest first so "bacon egg and cheese" wins over "bec".
+    """
+    signature_items = get_signature_item_aliases()
+    return tuple(
+        (
+            key,
+            signature_items[key],
+            re.compile(
+                r"(\d+|a|an|one|two|three|four|five|six|seven|eight|nine|ten)\s+" + re.escape(key),
+                re.IGNORECASE
+            ),
+        )
+        for key in sorted(signature_items.keys(), key=len, reverse=True)
+    )
+
+
+@pattern_registry.register("signature_bagel_choice")
+def _build_signature_bagel_choice_patterns() -> tuple[re.Pattern, re.Pattern]:
+    """Compile the bagel type alternations used to find a signature item's bagel.
+
+    Returns:
+        Tuple of (pattern for "on/with [a] TYPE", pattern for "TYPE bagel(s)"),
+        each capturing the bagel type in group 1.
+    """
+    types_pattern = "|".join(
+        re.escape(bagel_type) for bagel_type in sorted(get_bagel_types(), key=len, reverse=True)
+    ) or r"(?!)"
+    return (
+        re.compile(
+            rf"\b(?:on|with)\s+(?:(?:a|an)\s+)?({types_pattern})(?:\s|$|[,.])",
+            re.IGNORECASE
+        ),
+        re.compile(rf"\b({types_pattern})\s+bagels?\b", re.IGNORECASE),
+    )
+
+
+def _find_longest_bagel_type(pattern: re.Pattern, text: str) -> str | None:
+    """Return the longest bagel type captured by any match of the pattern."""
+    found = [match.group(1).lower() for match in pattern.finditer(text)]
+    return max(found, key=len) if found else None
+
+
 def _parse_signature_item_deterministic(text: str) -> OpenInputResponse | None:
     """Parse signature item orders like 'The Classic BEC on a wheat bagel'."""
     text_lower = text.lower()
 
-    # Get signature items mapping from database
-    signature_items = get_signature_item_aliases()
-
     matched_item = None
     matched_key = None
+    qty_pattern = None
 
-    for key in sorted(signature_items.keys(), key=len, reverse=True):
+    # Signature item aliases from database, longest first
+    for key, item_name, key_qty_pattern in pattern_registry.get("signature_item_aliases"):
         if key in text_lower:
-            matched_item = signature_items[key]
+            matched_item = item_name
             matched_key = key
+            qty_pattern = key_qty_pattern
             break
 
     if not matched_item:
@@ -2368,10 +2301,6 @@ def _parse_signature_item_deterministic(text: str) -> OpenInputResponse | None:
 
     # Extract quantity
     quantity = 1
-    qty_pattern = re.compile(
-        r"(\d+|a|an|one|two|three|four|five|six|seven|eight|nine|ten)\s+" + re.escape(matched_key),
-        re.IGNORECASE
-    )
     qty_match = qty_pattern.search(text_lower)
     if qty_match:
         qty_str = qty_match.group(1).lower()
@@ -2402,27 +2331,14 @@ def _parse_signature_item_deterministic(text: str) -> OpenInputResponse | None:
                     bagel_choice = bagel_type
                     break
 
+    on_type_pattern, type_bagel_pattern = pattern_registry.get("signature_bagel_choice")
     if not bagel_choice:
-        for bagel_type in sorted(get_bagel_types(), key=len, reverse=True):
-            pattern = re.compile(
-                r"\b(?:on|with)\s+(?:(?:a|an)\s+)?" + re.escape(bagel_type) + r"(?:\s|$|[,.])",
-                re.IGNORECASE
-            )
-            if pattern.search(text_lower):
-                bagel_choice = bagel_type
-                break
+        bagel_choice = _find_longest_bagel_type(on_type_pattern, text_lower)
 
     # Fallback: look for "[bagel_type] bagel" without "on/with" prefix
     # e.g., "bec everything bagel toasted" -> everything
     if not bagel_choice:
-        for bagel_type in sorted(get_bagel_types(), key=len, reverse=True):
-            pattern = re.compile(
-                r"\b" + re.escape(bagel_type) + r"\s+bagels?\b",
-                re.IGNORECASE
-            )
-            if pattern.search(text_lower):
-                bagel_choice = bagel_type
-                break
+        bagel_choice = _find_longest_bagel_type(type_bagel_pattern, text_lower)
 
     # Extract modifications (e.g., "with mayo and mustard", "no onions")
     modifications = _extract_menu_item_modifications(text)
@@ -2531,94 +2447,23 @@ def _parse_coffee_deterministic(text: str) -> OpenInputResponse | None:
     """Try to parse coffee/beverage orders deterministically."""
     text_lower = text.lower()
 
-    # Exclude "coffee cake" - it's a pastry, not a coffee order
-    # This must be checked early before we match "coffee" as a beverage
-    if re.search(r'\bcoffee\s+cake\b', text_lower):
-        return None
-
-    coffee_type = None
+    # One grammar pass fills the drink and every modifier slot
+    slots = pattern_registry.get("beverage_grammar").parse(get_parsed_text(text))
 
-    # Check for beverage keywords from database (sorted by length for specificity)
-    # This matches compound names like "chai tea" before simpler ones like "tea"
-    for bev in sorted(get_coffee_types(), key=len, reverse=True):
-        if re.search(rf'\b{re.escape(bev)}s?\b', text_lower):
-            coffee_type = bev
-            break
-
-    if not coffee_type:
+    # Exclude "coffee cake" - it's a pastry, not a coffee order
+    if slots.not_drink or not slots.drink:
         return None
 
     # Resolve alias to canonical menu item name (e.g., "matcha" -> "Seasonal Latte Matcha")
-    canonical_coffee_type = resolve_coffee_alias(coffee_type)
-    logger.debug("Deterministic parse: detected coffee type '%s' -> canonical '%s'", coffee_type, canonical_coffee_type)
-    coffee_type = canonical_coffee_type
-
-    # Extract quantity - allow optional size/temperature words between qty and coffee type
-    # e.g., "three medium coffees", "2 large iced lattes", "dozen hot coffees"
-    quantity = 1
-    # Compound expressions first, then single words
-    qty_words = r'\d+|(?:a\s+)?couple(?:\s+of)?|(?:a\s+)?half(?:\s+a)?\s+dozen|a\s+dozen|a\s+few|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve|dozen'
-    size_words = r'(?:(?:small|medium|large|iced|hot)\s+)*'
-
-    # Build pattern that matches beverage types from database
-    all_drink_types = list(get_coffee_types())
-    # Escape special regex chars and sort by length (longest first)
-    drink_pattern = "|".join(re.escape(d) for d in sorted(all_drink_types, key=len, reverse=True))
+    coffee_type = resolve_coffee_alias(slots.drink)
+    logger.debug("Deterministic parse: detected coffee type '%s' -> canonical '%s'", slots.drink, coffee_type)
 
-    qty_match = re.search(rf'({qty_words})\s+{size_words}(?:{drink_pattern})s?\b', text_lower)
-    if qty_match:
-        qty_str = qty_match.group(1)
-        if qty_str.isdigit():
-            quantity = int(qty_str)
-        else:
-            quantity = WORD_TO_NUM.get(qty_str, 1)
-
-    # Extract size
-    size = None
-    size_match = re.search(r'\b(small|medium|large)\b', text_lower)
-    if size_match:
-        size = size_match.group(1)
-
-    # Extract iced/hot
-    iced = None
-    if re.search(r'\biced\b', text_lower):
-        iced = True
-    elif re.search(r'\bhot\b', text_lower):
-        iced = False
-
-    # Extract decaf
-    decaf = None
-    if re.search(r'\bdecaf\b', text_lower):
-        decaf = True
-
-    # Extract extra shots for espresso drinks (double = 1 extra, triple = 2 extra)
-    extra_shots = 0
-    if re.search(r'\btriple\s+(?:shot\s+)?espresso\b', text_lower):
-        extra_shots = 2
-    elif re.search(r'\bdouble\s+(?:shot\s+)?espresso\b', text_lower):
-        extra_shots = 1
-
-    # Extract milk preference
-    milk = None
-    milk_patterns = [
-        (r'\bwith\s+(oat|almond|soy|skim|whole|coconut)\s*milk\b', 1),
-        (r'\b(oat|almond|soy|skim|whole|coconut)\s*milk\b', 1),
-        (r'\bblack\b', 'none'),
-        (r'\bwith\s+milk\b', 'whole'),
-        (r'\bwith\s+(?:a\s+)?(?:splash|little|bit)\s+(?:of\s+)?milk\b', 'whole'),
-        (r'\bmilk\b(?!\s*(?:oat|almond|soy|skim|whole|coconut|chocolate))', 'whole'),
-    ]
-    for pattern, group in milk_patterns:
-        milk_match = re.search(pattern, text_lower)
-        if milk_match:
-            milk = milk_match.group(group) if isinstance(group, int) else group
-            break
-
-    coffee_mods = extract_coffee_modifiers_from_input(text)
-
-    # Fall back to coffee_mods.milk if local patterns didn't match (e.g., "cream")
-    if milk is None and coffee_mods.milk:
-        milk = coffee_mods.milk
+    quantity = slots.quantity
+    size = slots.size
+    iced = slots.iced
+    decaf = slots.decaf
+    extra_shots = slots.extra_shots
+    milk = slots.milk
 
     instructions_list = extract_special_instructions_from_input(text)
     coffee_keywords = {'milk', 'cream', 'ice', 'hot', 'shot', 'espresso', 'foam', 'whip', 'sugar', 'syrup'}
@@ -2628,18 +2473,18 @@ def _parse_coffee_deterministic(text: str) -> OpenInputResponse | None:
     logger.debug(
         "Deterministic parse: coffee order - type=%s, qty=%d, size=%s, iced=%s, decaf=%s, milk=%s, sweetener=%s(%d), syrup=%s(%d), extra_shots=%d, special_instructions=%s",
         coffee_type, quantity, size, iced, decaf, milk,
-        coffee_mods.sweetener, coffee_mods.sweetener_quantity, coffee_mods.flavor_syrup, coffee_mods.syrup_quantity, extra_shots, special_instructions
+        slots.sweetener, slots.sweetener_quantity, slots.flavor_syrup, slots.syrup_quantity, extra_shots, special_instructions
     )
 
     # Build parsed_items for unified handler (Phase 8 dual-write)
-    # Build sweeteners list from coffee_mods
+    # Build sweeteners list from the grammar slots
     sweeteners = []
-    if coffee_mods.sweetener:
-        sweeteners.append(SweetenerItem(type=coffee_mods.sweetener, quantity=coffee_mods.sweetener_quantity))
-    # Build syrups list from coffee_mods
+    if slots.sweetener:
+        sweeteners.append(SweetenerItem(type=slots.sweetener, quantity=slots.sweetener_quantity))
+    # Build syrups list from the grammar slots
     syrups = []
-    if coffee_mods.flavor_syrup:
-        syrups.append(SyrupItem(type=coffee_mods.flavor_syrup, quantity=coffee_mods.syrup_quantity))
+    if slots.flavor_syrup:
+        syrups.append(SyrupItem(type=slots.flavor_syrup, quantity=slots.syrup_quantity))
 
     parsed_items = [
         _build_coffee_parsed_item(
@@ -2649,7 +2494,7 @@ def _parse_coffee_deterministic(text: str) -> OpenInputResponse | None:
             quantity=1,
             milk=milk,
             decaf=decaf,
-            cream_level=coffee_mods.cream_level,
+            cream_level=slots.cream_level,
             special_instructions=special_instructions,
             sweeteners=sweeteners,
             syrups=syrups,
@@ -2667,11 +2512,11 @@ def _parse_coffee_deterministic(text: str) -> OpenInputResponse | None:
         new_coffee_iced=iced,
         new_coffee_decaf=decaf,
         new_coffee_milk=milk,
-        new_coffee_cream_level=coffee_mods.cream_level,
-        new_coffee_sweetener=coffee_mods.sweetener,
-        new_coffee_sweetener_quantity=coffee_mods.sweetener_quantity,
-        new_coffee_flavor_syrup=coffee_mods.flavor_syrup,
-        new_coffee_syrup_quantity=coffee_mods.syrup_quantity,
+        new_coffee_cream_level=slots.cream_level,
+        new_coffee_sweetener=slots.sweetener,
+        new_coffee_sweetener_quantity=slots.sweetener_quantity,
+        new_coffee_flavor_syrup=slots.flavor_syrup,
+        new_coffee_syrup_quantity=slots.syrup_quantity,
         new_coffee_special_instructions=special_instructions,
         parsed_items=parsed_items,  # Dual-write for Phase 8
     )
@@ -2791,7 +2636,7 @@ BY_POUND_PATTERN = re.compile(
     r"""
     (?:
         ((?:a\s+)?half\s+(?:a\s+)?(?:pound|lb))    # a half pound / half a pound / half pound / half lb
-        |(\d+(?:\s*/\s*\d+)?)\s*(?:pound|lb)s?     # 1/4 pound, 2 pounds, 1 lb
+        |((?<!\d)\d+(?:\s*/\s*\d+)?)\s*(?:pound|lb)s?  # 1/4 pound, 2 pounds, 1 lb
         |(a\s+(?:pound|lb))                        # a pound / a lb
         |((?:a\s+)?quarter\s+(?:pound|lb))         # a quarter pound / quarter pound / quarter lb
     )
@@ -2830,7 +2675,7 @@ def _parse_by_pound_order(text: str) -> OpenInputResponse | None:
     Returns:
         OpenInputResponse with by_pound_items if matched, None otherwise.
     """
-    text_lower = text.lower().strip()
+    text_lower = get_parsed_text(text).lower
 
     # Strip common action verb prefixes - these indicate intent, not item type
     # The quantity phrase ("quarter pound", "half pound") identifies by-the-pound orders
@@ -2905,7 +2750,7 @@ def _parse_by_pound_order(text: str) -> OpenInputResponse | None:
 
 def _parse_price_inquiry_deterministic(text: str) -> OpenInputResponse | None:
     """Parse price inquiry questions."""
-    text_lower = text.lower().strip()
+    text_lower = get_parsed_text(text).lower
 
     for pattern in PRICE_INQUIRY_PATTERNS:
         match = pattern.search(text_lower)
@@ -2948,9 +2793,39 @@ def _parse_price_inquiry_deterministic(text: str) -> OpenInputResponse | None:
     return None
 
 
+# Patterns for GENERAL menu inquiries (should list all categories)
+GENERAL_MENU_QUERY_PATTERNS = (
+    # "what's on your/the menu?" / "whats on your menu?" / "what is on your/the menu?"
+    re.compile(r"what(?:'?s|\s+is)\s+on\s+(?:your|the)\s+menu", re.IGNORECASE),
+    # "what do you have?" / "what do you have on the menu?"
+    re.compile(r"what\s+do\s+you\s+have(?:\s+on\s+(?:the|your)\s+menu)?(?:\?|$)", re.IGNORECASE),
+    # "what do you serve?" / "what do you sell?"
+    re.compile(r"what\s+do\s+you\s+(?:serve|sell|offer|make)", re.IGNORECASE),
+    # "what can I order?" / "what can I get?"
+    re.compile(r"what\s+can\s+i\s+(?:order|get|have)", re.IGNORECASE),
+    # "show me the menu" / "let me see the menu"
+    re.compile(r"(?:show|let\s+me\s+see|can\s+i\s+see)\s+(?:me\s+)?(?:the|your)\s+menu", re.IGNORECASE),
+    # "menu please" / "the menu"
+    re.compile(r"^(?:the\s+)?menu(?:\s+please)?(?:\?|!|\.)?$", re.IGNORECASE),
+)
+
+# Patterns for menu category queries
+# "what desserts do you have?", "what sweets do you have?", "what pastries do you have?"
+# "what kind of muffins do you have?"
+MENU_QUERY_PATTERNS = (
+    # "what kind of X do you have" - capture X
+    re.compile(r"what\s+(?:kind|type|types|kinds)\s+of\s+(\S.*?)\s+do\s+you\s+have", re.IGNORECASE),
+    # "what X do you have" - capture X
+    re.compile(r"what\s+(\S.*?)\s+do\s+you\s+have", re.IGNORECASE),
+    re.compile(r"what\s+(?:kind\s+of\s+)?(\S.*?)\s+(?:do\s+you|have\s+you)\s+got", re.IGNORECASE),
+    re.compile(r"what\s+(?:are\s+)?(?:your|the)\s+(\S.*?)(?:\s+options)?(?:\?|$)", re.IGNORECASE),
+    re.compile(r"do\s+you\s+have\s+(?:any\s+)?(\S.*?)(?:\?|$)", re.IGNORECASE),
+)
+
+
 def _parse_menu_query_deterministic(text: str) -> OpenInputResponse | None:
     """Parse 'what X do you have?' type menu queries."""
-    text_lower = text.lower().strip()
+    text_lower = get_parsed_text(text).lower
 
     # Generic terms that should trigger a GENERAL menu listing (all categories)
     # These are not specific category queries - they're asking about the whole menu
@@ -2959,24 +2834,8 @@ def _parse_menu_query_deterministic(text: str) -> OpenInputResponse | None:
         "menu", "options", "choices", "eats", "grub",
     }
 
-    # Patterns for GENERAL menu inquiries (should list all categories)
-    general_menu_patterns = [
-        # "what's on your/the menu?" / "whats on your menu?" / "what is on your/the menu?"
-        re.compile(r"what(?:'?s|\s+is)\s+on\s+(?:your|the)\s+menu", re.IGNORECASE),
-        # "what do you have?" / "what do you have on the menu?"
-        re.compile(r"what\s+do\s+you\s+have(?:\s+on\s+(?:the|your)\s+menu)?(?:\?|$)", re.IGNORECASE),
-        # "what do you serve?" / "what do you sell?"
-        re.compile(r"what\s+do\s+you\s+(?:serve|sell|offer|make)", re.IGNORECASE),
-        # "what can I order?" / "what can I get?"
-        re.compile(r"what\s+can\s+i\s+(?:order|get|have)", re.IGNORECASE),
-        # "show me the menu" / "let me see the menu"
-        re.compile(r"(?:show|let\s+me\s+see|can\s+i\s+see)\s+(?:me\s+)?(?:the|your)\s+menu", re.IGNORECASE),
-        # "menu please" / "the menu"
-        re.compile(r"^(?:the\s+)?menu(?:\s+please)?(?:\?|!|\.)?$", re.IGNORECASE),
-    ]
-
     # Check for general menu inquiry patterns first
-    for pattern in general_menu_patterns:
+    for pattern in GENERAL_MENU_QUERY_PATTERNS:
         if pattern.search(text_lower):
             logger.info("GENERAL MENU QUERY: '%s'", text[:50])
             return OpenInputResponse(
@@ -2984,20 +2843,7 @@ def _parse_menu_query_deterministic(text: str) -> OpenInputResponse | None:
                 menu_query_type=None,  # None means list all categories
             )
 
-    # Patterns for menu category queries
-    # "what desserts do you have?", "what sweets do you have?", "what pastries do you have?"
-    # "what kind of muffins do you have?"
-    menu_query_patterns = [
-        # "what kind of X do you have" - capture X
-        re.compile(r"what\s+(?:kind|type|types|kinds)\s+of\s+(.+?)\s+do\s+you\s+have", re.IGNORECASE),
-        # "what X do you have" - capture X
-        re.compile(r"what\s+(.+?)\s+do\s+you\s+have", re.IGNORECASE),
-        re.compile(r"what\s+(?:kind\s+of\s+)?(.+?)\s+(?:do\s+you|have\s+you)\s+got", re.IGNORECASE),
-        re.compile(r"what\s+(?:are\s+)?(?:your|the)\s+(.+?)(?:\s+options)?(?:\?|$)", re.IGNORECASE),
-        re.compile(r"do\s+you\s+have\s+(?:any\s+)?(.+?)(?:\?|$)", re.IGNORECASE),
-    ]
-
-    for pattern in menu_query_patterns:
+    for pattern in MENU_QUERY_PATTERNS:
         match = pattern.search(text_lower)
         if match:
             category_text = match.group(1).strip()
@@ -3027,7 +2873,7 @@ def _parse_menu_query_deterministic(text: str) -> OpenInputResponse | None:
 
 def _parse_recommendation_inquiry(text: str) -> OpenInputResponse | None:
     """Parse recommendation questions."""
-    text_lower = text.lower().strip()
+    text_lower = get_parsed_text(text).lower
 
     for pattern, category in RECOMMENDATION_PATTERNS:
         if pattern.search(text_lower):
@@ -3042,7 +2888,7 @@ def _parse_recommendation_inquiry(text: str) -> OpenInputResponse | None:
 
 def _parse_store_info_inquiry(text: str) -> OpenInputResponse | None:
     """Parse store info inquiries."""
-    text_lower = text.lower().strip()
+    text_lower = get_parsed_text(text).lower
 
     for pattern in STORE_HOURS_PATTERNS:
         if pattern.search(text_lower):
@@ -3074,7 +2920,7 @@ def _parse_customer_service_inquiry(text: str) -> OpenInputResponse | None:
     Detects when user wants to speak to a manager, report an issue,
     request a refund, or escalate a complaint.
     """
-    text_lower = text.lower().strip()
+    text_lower = get_parsed_text(text).lower
 
     for pattern in CUSTOMER_SERVICE_PATTERNS:
         if pattern.search(text_lower):
@@ -3086,7 +2932,7 @@ def _parse_customer_service_inquiry(text: str) -> OpenInputResponse | None:
 
 def _parse_item_description_inquiry(text: str) -> OpenInputResponse | None:
     """Parse item description questions."""
-    text_lower = text.lower().strip()
+    text_lower = get_parsed_text(text).lower
 
     if any(word in text_lower for word in ["my cart", "my order", "the cart", "the order"]):
         return None
@@ -3123,7 +2969,7 @@ def _parse_modifier_inquiry(
             (e.g., {"latte": "coffee", "cappuccino": "coffee"})
             If None, item detection is skipped.
     """
-    text_lower = text.lower().strip()
+    text_lower = get_parsed_text(text).lower
     keywords = modifier_category_keywords or {}
     item_keywords = modifier_item_keywords or {}
 
@@ -3184,7 +3030,7 @@ def _parse_more_menu_items(text: str) -> OpenInputResponse | None:
     Also extracts the category from "what other X" patterns so the handler can
     start a fresh query if no pagination context exists.
     """
-    text_lower = text.lower().strip()
+    text_lower = get_parsed_text(text).lower
 
     for pattern in MORE_MENU_ITEMS_PATTERNS:
         if pattern.search(text_lower):
@@ -3236,7 +3082,7 @@ def _parse_ingredient_search(
     if not ingredient_to_items:
         return None
 
-    text_lower = text.lower().strip()
+    text_lower = get_parsed_text(text).lower
 
     # Patterns that indicate ingredient search:
     # - "chicken" (standalone ingredient)
@@ -3435,147 +3281,70 @@ def _parse_add_more_request(text: str) -> OpenInputResponse | None:
 # Multi-Item Order Parsing
 # =============================================================================
 
-def _parse_multi_item_order(user_input: str) -> OpenInputResponse | None:
-    """Parse multi-item orders like 'The Lexington and an orange juice'."""
-    text = user_input.strip()
-    text_lower = text.lower()
+class UnresolvedSegment(NamedTuple):
+    """A segment of a multi-item order that no deterministic parser understood."""
 
-    # Early exit: Don't split coffee orders where " and " connects modifiers
-    # e.g., "large iced coffee with sugar and 2 vanilla syrups" should NOT be split
-    # e.g., "large latte with oat milk and 2 sugars" should NOT be split
-    # This allows the coffee parser to handle the complete input with all modifiers
-    if " with " in text_lower and " and " in text_lower:
-        # Check if this looks like a single coffee order with multiple modifiers
-        coffee_keywords = ["coffee", "latte", "cappuccino", "espresso", "americano",
-                          "macchiato", "mocha", "tea", "chai", "matcha", "cold brew"]
-        # Get modifier options from database (with fallbacks)
-        sweeteners = _get_parser_sweetener_options()
-        syrups = _get_parser_syrup_options() + ["syrup"]  # Add generic "syrup" keyword
-        milks = _get_parser_milk_options() + ["milk"]  # Add generic "milk" keyword
-        # Note: "cream" is intentionally omitted from milks to avoid matching "cream cheese"
-
-        # Item keywords that indicate a separate item, not just modifiers
-        item_keywords = ["bagel", "sandwich", "classic", "leo", "traditional",
-                        "croissant", "muffin", "pastry", "donut", "cookie",
-                        "salad", "soup", "avocado toast"]
-
-        has_coffee = any(kw in text_lower for kw in coffee_keywords)
-        if has_coffee:
-            # Get the part after "with"
-            after_with = text_lower.split(" with ", 1)[1] if " with " in text_lower else ""
-            # Check if " and " connects sweetener/syrup/milk modifiers
-            # Pattern: "[modifier] and [modifier]" where modifiers are sweetener, syrup, or milk
-            if " and " in after_with:
-                before_and = after_with.split(" and ")[0].strip()
-                after_and = after_with.split(" and ", 1)[1].strip()
-
-                # If after_and contains an item keyword, it's a multi-item order, not modifiers
-                after_has_item = any(item in after_and for item in item_keywords)
-                if after_has_item:
-                    # Don't skip - this is a multi-item order like "coffee with milk and a bagel"
-                    pass
-                else:
-                    # Check modifier types for before_and
-                    before_is_sweetener = any(sw in before_and for sw in sweeteners)
-                    before_has_syrup = any(sy in before_and for sy in syrups)
-                    before_has_milk = any(m in before_and for m in milks)
-
-                    # Check modifier types for after_and
-                    after_is_sweetener = any(sw in after_and for sw in sweeteners)
-                    after_has_syrup = any(sy in after_and for sy in syrups)
-                    after_has_milk = any(m in after_and for m in milks)
-
-                    # Skip split if both parts are coffee modifiers (any combination)
-                    before_is_coffee_modifier = before_is_sweetener or before_has_syrup or before_has_milk
-                    after_is_coffee_modifier = after_is_sweetener or after_has_syrup or after_has_milk
-
-                    if before_is_coffee_modifier and after_is_coffee_modifier:
-                        logger.debug("Multi-item: skipping split - detected coffee with modifier pattern: '%s'", text[:60])
-                        return None  # Let coffee parser handle the complete input
-
-    compound_phrases = [
-        # Egg sandwich phrases (longer phrases first to match properly)
-        ("bacon egg and cheese", "BACON_EGG_CHEESE_PLACEHOLDER"),
-        ("ham egg and cheese", "HAM_EGG_CHEESE_PLACEHOLDER"),
-        ("sausage egg and cheese", "SAUSAGE_EGG_CHEESE_PLACEHOLDER"),
-        ("egg and cheese", "EGG_CHEESE_PLACEHOLDER"),
-        ("bacon and egg and cheese", "BACON_AND_EGG_CHEESE_PLACEHOLDER"),
-        ("ham and egg and cheese", "HAM_AND_EGG_CHEESE_PLACEHOLDER"),
-        ("bacon eggs and cheese", "BACON_EGGS_CHEESE_PLACEHOLDER"),
-        ("ham eggs and cheese", "HAM_EGGS_CHEESE_PLACEHOLDER"),
-        # Other compound phrases
-        ("ham and cheese", "HAM_CHEESE_PLACEHOLDER"),
-        ("ham and egg", "HAM_EGG_PLACEHOLDER"),
-        ("bacon and egg", "BACON_EGG_PLACEHOLDER"),
-        ("lox and cream cheese", "LOX_CC_PLACEHOLDER"),
-        ("cream cheese and lox", "CC_LOX_PLACEHOLDER"),
-        ("salt and pepper", "SALT_PEPPER_PLACEHOLDER"),
-        ("eggs and bacon", "EGGS_BACON_PLACEHOLDER"),
-        ("black and white", "BLACK_WHITE_PLACEHOLDER"),
-        ("spinach and feta", "SPINACH_FETA_PLACEHOLDER"),
-        # Condiment pairs (prevent splitting "with mayo and mustard")
-        ("mayo and mustard", "MAYO_MUSTARD_PLACEHOLDER"),
-        ("mustard and mayo", "MUSTARD_MAYO_PLACEHOLDER"),
-        ("ketchup and mustard", "KETCHUP_MUSTARD_PLACEHOLDER"),
-        ("lettuce and tomato", "LETTUCE_TOMATO_PLACEHOLDER"),
-        ("tomato and lettuce", "TOMATO_LETTUCE_PLACEHOLDER"),
-        ("onions and peppers", "ONIONS_PEPPERS_PLACEHOLDER"),
-        ("pickles and onions", "PICKLES_ONIONS_PLACEHOLDER"),
-    ]
+    text: str
+    start: int
+    end: int
+    # The (spelling-corrected) message the span refers to
+    utterance: str
+    # Index in the result's parsed_items where the segment's items belong
+    position: int
 
-    preserved_text = text_lower
-    for phrase, placeholder in compound_phrases:
-        preserved_text = preserved_text.replace(phrase, placeholder)
+    def context(self, width: int = 40) -> str:
+        """The segment in its surrounding text, marked with [[ ]]."""
+        before = self.utterance[max(0, self.start - width):self.start]
+        after = self.utterance[self.end:self.end + width]
+        return f"{before}[[{self.text}]]{after}".strip()
 
-    if " and " not in preserved_text and ", " not in preserved_text:
-        return None
 
-    preserved_text = preserved_text.replace(", and ", ", ")
-    preserved_text = preserved_text.replace(" and ", ", ")
+def _parse_multi_item_order(
+    user_input: str,
+    unresolved: list[UnresolvedSegment] | None = None,
+) -> OpenInputResponse | None:
+    """
+    Parse multi-item orders like 'The Lexington and an orange juice'.
+
+    Args:
+        user_input: The user's input string
+        unresolved: When given, a segment none of the parsers understand no
+            longer makes the order fall back as a whole: the items of the
+            other segments are returned, and the missed segments are added
+            to this list so one LLM request can extract just those (see
+            ``parse_open_input``)
+
+    Returns:
+        The parsed items, or None when the input isn't a multi-item order
+        the parsers understand
+    """
+    parsed = get_parsed_text(user_input)
+    text = parsed.text
+    item_matcher = get_item_phrase_matcher()
 
-    parts = [p.strip() for p in preserved_text.split(",") if p.strip()]
-    if len(parts) < 2:
+    # Compound names ("bacon egg and cheese") and condiment pairs ("mayo and
+    # mustard") are protected so their "and" does not split them
+    if not parsed.has_list_separator_outside(parsed.single_item_spans(item_matcher)):
         return None
 
-    restored_parts = []
-    for part in parts:
-        restored = part.strip()
-        for phrase, placeholder in compound_phrases:
-            restored = restored.replace(placeholder, phrase)
-        if restored:
-            restored_parts.append(restored)
-
-    logger.info("Multi-item order split into %d parts: %s", len(restored_parts), restored_parts)
-
-    # Early exit: Don't split bagel orders where commas separate modifiers from the bagel
-    # e.g., "pumpernickel bagel, butter, not toasted please" should NOT be split
-    # The commas are just punctuation, not item separators
-    if len(restored_parts) >= 2:
-        first_part_lower = restored_parts[0].lower()
-        # Check if first part is a bagel
-        if "bagel" in first_part_lower:
-            # Define what counts as bagel modifiers (not separate items)
-            bagel_modifier_keywords = [
-                # Spreads
-                "butter", "cream cheese", "cc", "scallion", "veggie", "vegetable",
-                "plain", "lox", "peanut butter", "nutella", "hummus", "jelly",
-                "strawberry", "grape", "raspberry", "jam", "preserves",
-                # Toasted state
-                "toasted", "not toasted", "untoasted",
-                # Scooped state
-                "scooped", "not scooped",
-                # Polite words that might end up as separate parts
-                "please", "thanks", "thank you",
-            ]
-            other_parts = restored_parts[1:]
-            # Check if ALL other parts are just modifiers, not separate items
-            all_are_modifiers = all(
-                any(mod in part.lower() for mod in bagel_modifier_keywords)
-                for part in other_parts
-            )
-            if all_are_modifiers:
-                logger.debug("Multi-item: skipping split - detected bagel with comma-separated modifiers: '%s'", text[:60])
-                return None  # Let bagel parser handle the complete input
+    # One segment per item: modifiers after a separator stay with their item,
+    # e.g. "large latte with oat milk and 2 sugars" or "plain bagel, butter,
+    # not toasted please" are one segment and are left to the single-item parsers
+    segments = segment_order(parsed, item_matcher, menu_cache.get_modifier_matcher())
+    if len(segments) < 2:
+        logger.debug("Multi-item: single item with modifiers, not splitting: '%s'", text[:60])
+        return None
+
+    parts = [segment.text for segment in segments]
+    logger.info("Multi-item order split into %d parts: %s", len(parts), parts)
+    # The coffee parser needs a word-bounded coffee type, which the item
+    # matcher scan already located
+    coffee_ends = [
+        match.end for match in parsed.item_phrases(item_matcher) if match.category == "coffee"
+    ]
+    part_has_coffee = [
+        any(segment.start < end <= segment.end for end in coffee_ends) for segment in segments
+    ]
 
     # Use a list to collect ALL menu items instead of overwriting
     menu_item_list: list[MenuItemOrderDetails] = []
@@ -3601,25 +3370,24 @@ def _parse_multi_item_order(user_input: str) -> OpenInputResponse | None:
     # By-the-pound items collection
     by_pound_items: list[ByPoundOrderItem] = []
 
-    # First pass: count how many parts have menu items
+    # First pass: find the menu item in each part (reused by the second pass)
     # If only ONE part has a menu item, we should extract modifications from the ORIGINAL text
-    # (to handle cases like "the Lexington with mayo, mustard and ketchup" which gets split incorrectly)
-    parts_with_menu_items = 0
-    for part in restored_parts:
-        item_name, _ = _extract_menu_item_from_text(part.strip())
-        if item_name:
-            parts_with_menu_items += 1
+    # (to handle cases like "the Lexington with mayo, sriracha" where a modifier
+    # the menu does not know ends up in its own part)
+    part_menu_items = [_extract_menu_item_from_text(part) for part in parts]
+    parts_with_menu_items = sum(1 for item_name, _ in part_menu_items if item_name)
 
     # Extract modifications from original text if only one menu item detected
     # This captures "with mayo, mustard and ketchup" that gets split into separate parts
     use_original_text_for_mods = parts_with_menu_items == 1
     original_modifications = _extract_menu_item_modifications(text) if use_original_text_for_mods else []
 
-    for part in restored_parts:
-        part = part.strip()
-        if not part:
-            continue
+    missed: list[UnresolvedSegment] = []
 
+    for segment, part, has_coffee, (item_name, item_qty) in zip(segments, parts, part_has_coffee, part_menu_items):
+        # Each part runs several sub-parsers; stop between parts once the
+        # turn's parse budget is spent
+        check_parse_deadline("multi_item")
         # Try signature item FIRST - important because "bacon egg and cheese"
         # would otherwise be matched as a menu item "Bacon"
         speed_result = _parse_signature_item_deterministic(part)
@@ -3645,7 +3413,9 @@ def _parse_multi_item_order(user_input: str) -> OpenInputResponse | None:
 
         # Try by-pound order BEFORE menu item extraction
         # This prevents "quarter pound of plain cream cheese" from matching "Plain Cream Cheese Sandwich"
-        by_pound_result = _parse_by_pound_order(part)
+        by_pound_result = None
+        if PARSER_GATES["by_pound"].is_candidate(get_parsed_text(part)):
+            by_pound_result = _parse_by_pound_order(part)
         if by_pound_result and by_pound_result.by_pound_items:
             for bp_item in by_pound_result.by_pound_items:
                 by_pound_items.append(bp_item)
@@ -3659,7 +3429,9 @@ def _parse_multi_item_order(user_input: str) -> OpenInputResponse | None:
 
         # Try coffee detection BEFORE menu item extraction
         # This prevents "latte" from being matched as a menu item instead of coffee
-        coffee_result = _parse_coffee_deterministic(part)
+        coffee_result = None
+        if has_coffee:
+            coffee_result = _parse_coffee_deterministic(part)
         if coffee_result and coffee_result.new_coffee:
             # Track coffee for new_coffee_* fields in return (backwards compat)
             if not coffee_list:
@@ -3739,7 +3511,6 @@ def _parse_multi_item_order(user_input: str) -> OpenInputResponse | None:
                             bagel_type, bagel_qty, bagel_toasted, bagel_scooped, bagel_spread, parsed.new_bagel_spread_type)
                 continue
 
-        item_name, item_qty = _extract_menu_item_from_text(part)
         if item_name:
             bagel_choice = _extract_bagel_type(part)
             toasted = _extract_toasted(part)
@@ -3767,6 +3538,7 @@ def _parse_multi_item_order(user_input: str) -> OpenInputResponse | None:
         parsed = parse_open_input_deterministic(part)
         if not parsed:
             logger.debug("Multi-item: could not parse part '%s' deterministically", part)
+            missed.append(UnresolvedSegment(part, segment.start, segment.end, text, len(parsed_items)))
             continue
 
         if parsed.new_menu_item:
@@ -3918,7 +3690,11 @@ def _parse_multi_item_order(user_input: str) -> OpenInputResponse | None:
 
     # Use parsed_items count as source of truth - it correctly tracks all items including
     # multiple bagels of different types (e.g., "plain bagel and sesame bagel")
-    if items_found >= 2 or total_items >= 2 or len(parsed_items) >= 2:
+    partial = unresolved is not None and bool(missed) and bool(parsed_items)
+    if items_found >= 2 or total_items >= 2 or len(parsed_items) >= 2 or partial:
+        if partial:
+            logger.info("Multi-item: %d of %d parts left for batched extraction", len(missed), len(parts))
+            unresolved.extend(missed)
         first_coffee = coffee_list[0] if coffee_list else None
         logger.info("Multi-item order parsed: menu_items=%d, coffees=%d, bagel=%s, side=%s, signature_item=%s, parsed_items=%d",
                     len(menu_item_list), len(coffee_list), bagel, side_item, signature_item_name, len(parsed_items))
@@ -4025,6 +3801,163 @@ def _parse_multi_item_order(user_input: str) -> OpenInputResponse | None:
     return None
 
 
+# =============================================================================
+# Sub-Parser Dispatch Gates
+# =============================================================================
+#
+# parse_open_input_deterministic tries ~20 sub-parsers in a fixed priority
+# order, and most inputs only have a chance of matching a few of them. Each
+# gate below declares the trigger substrings or words that every pattern of
+# its parser requires (or a cheap precheck), so the router can skip parsers
+# that cannot match without changing which parser wins.
+#
+# Gates must stay conservative: a gate may let through inputs its parser
+# rejects, but must never reject an input its parser would accept. When
+# adding a pattern to a gated parser, make sure its trigger is listed here.
+
+class ParserGate(NamedTuple):
+    """
+    Trigger declaration for one deterministic sub-parser.
+
+    A parser is a candidate when any trigger substring occurs in the text,
+    any trigger word is one of its tokens, or its precheck returns True.
+    Parsers that declare nothing run on every input.
+    """
+
+    substrings: tuple[str, ...] = ()
+    words: frozenset[str] = frozenset()
+    precheck: Callable[..., bool] | None = None
+
+    def is_candidate(self, parsed: ParsedText, *args) -> bool:
+        if self.precheck is not None:
+            return self.precheck(parsed, *args)
+        if not self.substrings and not self.words:
+            return True
+        if self.words & parsed.words:
+            return True
+        return any(s in parsed.lower for s in self.substrings)
+
+
+PARSER_GATES: dict[str, ParserGate] = {
+    "price_inquiry": ParserGate(substrings=("much", "price", "cost")),
+    "add_modifier": ParserGate(
+        precheck=lambda g: g.lower.startswith(("add", "put", "extra", "more")),
+    ),
+    "more_menu_items": ParserGate(
+        precheck=lambda g: bool(
+            g.words & {"other", "more", "else", "keep", "continue", "go"}
+        ) or g.lower.startswith("and"),
+    ),
+    "menu_query": ParserGate(substrings=("what", "menu", "have")),
+    "recommendation": ParserGate(
+        substrings=("recommend", "popular", "best", "good", "suggest", "sells", "favorite"),
+    ),
+    "store_info": ParserGate(
+        substrings=("hours", "open", "close", "located", "address", "location", "where", "how", "deliver"),
+    ),
+    "customer_service": ParserGate(
+        substrings=(
+            "manager", "supervisor", "person", "human", "someone", "order",
+            "problem", "issue", "complain", "wrong", "food", "item", "missing",
+            "unhappy", "dissatisfied", "disappointed", "upset", "refund", "money",
+        ),
+    ),
+    "item_description": ParserGate(substrings=("what", "tell", "describe", "ingredients")),
+    # Without keyword maps the parser can never resolve an item or category
+    "modifier_inquiry": ParserGate(
+        precheck=lambda g, category_keywords, item_keywords: bool(
+            category_keywords or item_keywords
+        ) and any(
+            s in g.lower
+            for s in ("what", "have", "offer", "carry", "option", "choice", "add", "extra")
+        ),
+    ),
+    # Standalone ingredients are limited to three words; longer inputs need
+    # "something with X" or "what has X"
+    "ingredient_search": ParserGate(
+        precheck=lambda g, ingredient_to_items: bool(ingredient_to_items) and (
+            len(g.lower.split()) <= 3
+            or any(s in g.lower for s in ("with", "that", "what"))
+        ),
+    ),
+    "by_pound": ParserGate(substrings=("pound", "lb")),
+    "signature_item": ParserGate(),
+    # Every EGG_CHEESE_SANDWICH_ABBREVS key contains one of these
+    "egg_cheese_abbrev": ParserGate(substrings=("egg", "ec", "e.c")),
+    "modify_existing": ParserGate(substrings=("bagel",), words=frozenset({"it"})),
+    "add_more": ParserGate(
+        words=frozenset({
+            "another", "more", "additional", "third", "fourth", "fifth",
+            "sixth", "seventh", "eighth", "ninth", "tenth",
+        }),
+    ),
+    "split_quantity_bagels": ParserGate(words=frozenset({"bagel", "bagels"})),
+    "bagel_with_modifiers": ParserGate(
+        precheck=lambda g: g.has_bagel and "with" in g.words,
+    ),
+    "multi_item": ParserGate(
+        precheck=lambda g: g.has_list_separator,
+    ),
+    "split_quantity_drinks": ParserGate(
+        words=frozenset({
+            "one", "two", "three", "1", "2", "3",
+            "first", "second", "other", "another",
+        }),
+    ),
+    "soda": ParserGate(),
+    "coffee": ParserGate(),
+}
+
+_dispatch_stats: dict[str, dict[str, int]] = {
+    name: {"runs": 0, "skips": 0, "hits": 0} for name in PARSER_GATES
+}
+
+
+def _dispatch(
+    name: str,
+    parsed: ParsedText,
+    parser: Callable[..., OpenInputResponse | None],
+    text: str,
+    *args,
+) -> OpenInputResponse | None:
+    """
+    Run a sub-parser if its gate admits the input, recording skip/hit counts.
+
+    Extra args are passed to both the gate precheck and the parser.
+
+    Raises:
+        ParseDeadlineExceeded: If the turn's parse budget is used up
+    """
+    check_parse_deadline(name)
+    stats = _dispatch_stats[name]
+    if not PARSER_GATES[name].is_candidate(parsed, *args):
+        stats["skips"] += 1
+        return None
+    stats["runs"] += 1
+    result = parser(text, *args)
+    if result:
+        stats["hits"] += 1
+    return result
+
+
+def get_dispatch_stats() -> dict[str, dict[str, int]]:
+    """
+    Get per-parser dispatch counts for parse_open_input_deterministic.
+
+    Returns:
+        Dict mapping sub-parser name to {"runs", "skips", "hits"} counts,
+        in dispatch priority order.
+    """
+    return {name: dict(counts) for name, counts in _dispatch_stats.items()}
+
+
+def reset_dispatch_stats() -> None:
+    """Reset all dispatch counts to zero."""
+    for counts in _dispatch_stats.values():
+        for key in counts:
+            counts[key] = 0
+
+
 # =============================================================================
 # Main Deterministic Parser
 # =============================================================================
@@ -4049,8 +3982,43 @@ def parse_open_input_deterministic(
         ingredient_to_items: Mapping of ingredient names to menu items containing them
             (e.g., {"chicken": [{"name": "Chicken Salad Sandwich", ...}]})
 
+    Sub-parsers are tried in priority order; those whose PARSER_GATES entry
+    rules out the input are skipped (see get_dispatch_stats()). Inputs longer
+    than DETERMINISTIC_PARSE_MAX_CHARS, and parses that run out of the turn's
+    parse budget (see parse_budget.py), fall back to the LLM.
+
     Returns OpenInputResponse if parsing succeeds, None if should fall back to LLM.
     """
+    if len(user_input) > DETERMINISTIC_PARSE_MAX_CHARS:
+        logger.info(
+            "Deterministic parse: %d-character input exceeds %d, falling back to LLM",
+            len(user_input), DETERMINISTIC_PARSE_MAX_CHARS,
+        )
+        return None
+
+    try:
+        with parse_deadline():
+            check_parse_deadline("parse_open_input")
+            return _parse_open_input_deterministic(
+                user_input,
+                spread_types,
+                modifier_category_keywords,
+                modifier_item_keywords,
+                ingredient_to_items,
+            )
+    except ParseDeadlineExceeded as e:
+        logger.warning("Deterministic parse: %s, falling back to LLM for '%s'", e, user_input[:50])
+        return None
+
+
+def _parse_open_input_deterministic(
+    user_input: str,
+    spread_types: set[str] | None,
+    modifier_category_keywords: dict[str, str] | None,
+    modifier_item_keywords: dict[str, str] | None,
+    ingredient_to_items: dict[str, list[dict]] | None,
+) -> OpenInputResponse | None:
+    """Body of parse_open_input_deterministic, run under the parse deadline."""
     text = user_input.strip()
 
     # Expand abbreviations before any parsing (e.g., "cc" -> "cream cheese")
@@ -4084,78 +4052,82 @@ def parse_open_input_deterministic(
 
     # Strip filler words (after greeting/done checks, before order parsing)
     # e.g., "actually, make it two" -> "make it two"
-    text = strip_filler_words(text)
+    parsed = get_parsed_text(text).filler_stripped
+    text = parsed.text
 
     # Check for price inquiries
-    price_result = _parse_price_inquiry_deterministic(text)
+    price_result = _dispatch("price_inquiry", parsed, _parse_price_inquiry_deterministic, text)
     if price_result:
         return price_result
 
     # Check for add-modifier patterns ("add bacon", "extra cheese", "more cheese")
     # This MUST run BEFORE _parse_more_menu_items() because "more cheese" would otherwise
     # be caught by the "^more\b" pattern in MORE_MENU_ITEMS_PATTERNS
-    add_modifier_result = _parse_add_modifier_to_item(text)
+    add_modifier_result = _dispatch("add_modifier", parsed, _parse_add_modifier_to_item, text)
     if add_modifier_result:
         return add_modifier_result
 
     # Check for "show more" menu requests BEFORE menu queries
     # "what other pastries do you have?" should be pagination, not a new query
-    more_items_result = _parse_more_menu_items(text)
+    more_items_result = _dispatch("more_menu_items", parsed, _parse_more_menu_items, text)
     if more_items_result:
         return more_items_result
 
     # Check for menu category queries ("what sweets do you have?", "what desserts do you have?")
-    menu_query_result = _parse_menu_query_deterministic(text)
+    menu_query_result = _dispatch("menu_query", parsed, _parse_menu_query_deterministic, text)
     if menu_query_result:
         return menu_query_result
 
     # Check for recommendation questions
-    recommendation_result = _parse_recommendation_inquiry(text)
+    recommendation_result = _dispatch("recommendation", parsed, _parse_recommendation_inquiry, text)
     if recommendation_result:
         return recommendation_result
 
     # Check for store info inquiries
-    store_info_result = _parse_store_info_inquiry(text)
+    store_info_result = _dispatch("store_info", parsed, _parse_store_info_inquiry, text)
     if store_info_result:
         return store_info_result
 
     # Check for customer service escalation requests
-    customer_service_result = _parse_customer_service_inquiry(text)
+    customer_service_result = _dispatch("customer_service", parsed, _parse_customer_service_inquiry, text)
     if customer_service_result:
         return customer_service_result
 
     # Check for item description inquiries
-    item_desc_result = _parse_item_description_inquiry(text)
+    item_desc_result = _dispatch("item_description", parsed, _parse_item_description_inquiry, text)
     if item_desc_result:
         return item_desc_result
 
     # Check for modifier/add-on inquiries
-    modifier_inquiry_result = _parse_modifier_inquiry(text, modifier_category_keywords, modifier_item_keywords)
+    modifier_inquiry_result = _dispatch(
+        "modifier_inquiry", parsed, _parse_modifier_inquiry,
+        text, modifier_category_keywords, modifier_item_keywords,
+    )
     if modifier_inquiry_result:
         return modifier_inquiry_result
 
     # Check for ingredient-based menu search
     # When user says "chicken" or "something with bacon", show matching items
-    ingredient_search_result = _parse_ingredient_search(text, ingredient_to_items)
+    ingredient_search_result = _dispatch("ingredient_search", parsed, _parse_ingredient_search, text, ingredient_to_items)
     if ingredient_search_result:
         return ingredient_search_result
 
     # Check for by-the-pound orders EARLY
     # Must be checked BEFORE spread/salad sandwich matching to prevent
     # "half a pound of whitefish salad" from matching "Whitefish Salad Sandwich"
-    by_pound_result = _parse_by_pound_order(text)
+    by_pound_result = _dispatch("by_pound", parsed, _parse_by_pound_order, text)
     if by_pound_result:
         return by_pound_result
 
     # Check for signature items
-    signature_item_result = _parse_signature_item_deterministic(text)
+    signature_item_result = _dispatch("signature_item", parsed, _parse_signature_item_deterministic, text)
     if signature_item_result:
         return signature_item_result
 
     # Check for egg+cheese sandwich abbreviations (SEC, HEC, BEC, "ham egg and cheese", etc.)
     # This MUST run BEFORE menu item lookup to prevent "ham egg and cheese" from matching
     # "Ham (1 lb)" as a deli item instead of being parsed as a breakfast sandwich
-    egg_cheese_result = _parse_egg_cheese_sandwich_abbrev(text)
+    egg_cheese_result = _dispatch("egg_cheese_abbrev", parsed, _parse_egg_cheese_sandwich_abbrev, text)
     if egg_cheese_result:
         return egg_cheese_result
 
@@ -4227,7 +4199,7 @@ def parse_open_input_deterministic(
     # Check for modification to existing item BEFORE replacement patterns
     # This catches patterns like "make the bagel with scallion cream cheese"
     # which should modify an existing bagel, not trigger replace_last_item
-    modify_existing_result = _parse_modify_existing_item(text, spread_types)
+    modify_existing_result = _dispatch("modify_existing", parsed, _parse_modify_existing_item, text, spread_types)
     if modify_existing_result:
         return modify_existing_result
 
@@ -4285,32 +4257,32 @@ def parse_open_input_deterministic(
             return OpenInputResponse(cancel_item=cancel_item)
 
     # Check for "add more" requests (add a third, add another, etc.)
-    add_more_result = _parse_add_more_request(text)
+    add_more_result = _dispatch("add_more", parsed, _parse_add_more_request, text)
     if add_more_result:
         return add_more_result
 
     # Check for split-quantity bagels FIRST (e.g., "two bagels one with lox one with cream cheese")
     # This MUST run BEFORE bagel_with_modifiers to handle multi-bagel orders with different configs
-    split_qty_result = _parse_split_quantity_bagels(text)
+    split_qty_result = _dispatch("split_quantity_bagels", parsed, _parse_split_quantity_bagels, text)
     if split_qty_result:
         return split_qty_result
 
     # Check for bagel with modifiers FIRST (e.g., "everything bagel with bacon and egg")
     # This MUST run BEFORE multi-item parsing to prevent "with bacon and egg" from being
     # interpreted as multiple items. Also prevents "bacon" from matching as a side item.
-    bagel_with_mods_result = _parse_bagel_with_modifiers(text)
+    bagel_with_mods_result = _dispatch("bagel_with_modifiers", parsed, _parse_bagel_with_modifiers, text)
     if bagel_with_mods_result:
         return bagel_with_mods_result
 
     # Check for multi-item orders (e.g., "one coffee and one latte", "bagel and a coffee")
     # Must be checked before single-item parsers to handle "X and Y" patterns
-    multi_item_result = _parse_multi_item_order(text)
+    multi_item_result = _dispatch("multi_item", parsed, _parse_multi_item_order, text)
     if multi_item_result:
         return multi_item_result
 
     # Early check for spread/salad sandwiches
-    text_lower = text.lower()
-    has_bagel_mention = re.search(r"\bbagels?\b", text_lower)
+    text_lower = parsed.lower
+    has_bagel_mention = parsed.has_bagel
     has_sandwich_mention = "sandwich" in text_lower
 
     if (has_sandwich_mention or not has_bagel_mention) and any(term in text_lower for term in [
@@ -4498,7 +4470,7 @@ def parse_open_input_deterministic(
         )
 
     # Check if text contains "bagel" anywhere (but only if no menu item was matched earlier)
-    if re.search(r"\bbagels?\b", text, re.IGNORECASE):
+    if parsed.has_bagel:
         bagel_type = _extract_bagel_type(text)
         toasted = _extract_toasted(text)
         scooped = _extract_scooped(text)
@@ -4530,7 +4502,7 @@ def parse_open_input_deterministic(
 
     # Check for split-quantity drinks FIRST (e.g., "two coffees one with milk one black")
     # This MUST run BEFORE regular coffee parsing to handle multi-drink orders with different configs
-    split_qty_drinks_result = _parse_split_quantity_drinks(text)
+    split_qty_drinks_result = _dispatch("split_quantity_drinks", parsed, _parse_split_quantity_drinks, text)
     if split_qty_drinks_result:
         logger.info(
             "DETERMINISTIC SPLIT-QTY DRINKS: matched '%s' -> %d drinks",
@@ -4539,13 +4511,13 @@ def parse_open_input_deterministic(
         return split_qty_drinks_result
 
     # Check for soda/bottled drink order FIRST (more specific names like "Snapple Iced Tea")
-    soda_result = _parse_soda_deterministic(text)
+    soda_result = _dispatch("soda", parsed, _parse_soda_deterministic, text)
     if soda_result:
         logger.info("DETERMINISTIC SODA: matched '%s'", text[:50])
         return soda_result
 
     # Check for coffee/sized beverage order (more generic names like "iced tea")
-    coffee_result = _parse_coffee_deterministic(text)
+    coffee_result = _dispatch("coffee", parsed, _parse_coffee_deterministic, text)
     if coffee_result:
         logger.info("DETERMINISTIC COFFEE: matched '%s' -> type=%s", text[:50], coffee_result.new_coffee_type)
         return coffee_result
@@ -0,0 +1,629 @@
+"""
+Deterministic Fast Paths for the Configuration-Phase LLM Parsers.
+
+Most answers to "What kind of bagel?", "Toasted?", "What size?" or "Hot or
+iced?" are a word or two from a small, known vocabulary ("plain", "both
+sesame", "large", "iced please"). The LLM parsers in llm_parsers.py each
+make a model round trip for them anyway.
+
+Each resolver here matches the answer against the option vocabulary from
+the menu cache and returns the parser's response along with a confidence.
+The ``fast_path`` decorator returns the resolved response when the
+confidence reaches PARSER_FAST_PATH_MIN_CONFIDENCE and calls the LLM parser
+otherwise. Confidence is mostly coverage: the share of the answer's words
+that are option vocabulary, quantifiers ("both", "all of them") or
+politeness filler. Words the resolver cannot account for might carry
+meaning it would drop, so those answers go to the LLM.
+
+Usage:
+    from sandwich_bot.tasks.parsers.fast_paths import fast_path, resolve_coffee_size
+
+    @fast_path("coffee_size", resolve_coffee_size)
+    def parse_coffee_size(user_input: str, model: str = "gpt-4o-mini") -> CoffeeSizeResponse:
+        ...
+
+    get_fast_path_stats()["coffee_size"]
+    # {"calls": 40, "resolved": 37, "fallbacks": 3, "fallback_rate": 0.075}
+"""
+
+import functools
+import inspect
+import logging
+import re
+from typing import Any, Callable, NamedTuple
+
+from sandwich_bot.config import PARSER_FAST_PATH_MIN_CONFIDENCE
+from sandwich_bot.menu_data_cache import menu_cache
+from sandwich_bot.pattern_registry import pattern_registry
+from sandwich_bot.phrase_matcher import PhraseMatch, PhraseMatcher
+
+from ..schemas import (
+    SideChoiceResponse,
+    BagelChoiceResponse,
+    MultiBagelChoiceResponse,
+    MultiToastedResponse,
+    MultiSpreadResponse,
+    SpreadChoiceResponse,
+    ToastedChoiceResponse,
+    CoffeeSizeResponse,
+    CoffeeStyleResponse,
+    ByPoundCategoryResponse,
+)
+from .constants import get_bagel_types, get_spreads, get_spread_types
+from .parsed_text import ParsedText, Token, get_parsed_text
+from .validators import parse_toasted_deterministic
+
+logger = logging.getLogger(__name__)
+
+
+class Resolution(NamedTuple):
+    """A deterministically resolved parser response and how sure we are of it."""
+
+    response: Any
+    confidence: float
+
+
+# Confidence for answers that resolve to something plausible but could mean
+# more than the resolver understands (e.g. one bagel type for three bagels)
+LOW_CONFIDENCE = 0.5
+
+
+# =============================================================================
+# Vocabulary
+# =============================================================================
+
+# Words that never change the answer to a configuration question
+_FILLER_WORDS = frozenset({
+    "a", "an", "the", "i", "ll", "d", "m", "s", "id", "im", "ill", "me",
+    "please", "thanks", "thank", "you", "ok", "okay", "sure", "yes", "yeah",
+    "um", "uh", "so", "well", "actually", "oh", "hmm",
+    "like", "want", "would", "will", "have", "take", "get", "go", "do", "let",
+    "lets", "just", "can", "could", "for", "make", "it", "that", "those",
+    "them", "of", "on", "with", "to", "be", "is", "and", "sounds", "good",
+    "great", "bagel", "bagels", "one", "ones", "gimme", "give",
+})
+
+# Words that can turn a matched option into its opposite
+_NEGATION_WORDS = frozenset({
+    "no", "not", "don", "dont", "without", "never", "instead", "nothing",
+    "none", "neither", "nope", "nah",
+})
+
+# Words that apply an answer to every pending item
+_ALL_WORDS = frozenset({"all", "every", "each", "both"})
+
+_QUESTION_STARTS = frozenset({
+    "what", "which", "how", "do", "does", "is", "are", "why", "where", "when",
+})
+
+# Declining a spread ("nothing", "no thanks", "just plain")
+_DECLINE_WORDS = frozenset({"no", "none", "nothing", "nope", "nah", "plain", "dry", "skip"})
+_DECLINE_SUPPORT_WORDS = frozenset({"spread", "thanks", "thank", "you", "any", "need", "as", "is"})
+
+_TOASTED_WORDS = frozenset({
+    "toasted", "toast", "toasty", "untoasted", "yes", "yeah", "yep", "yup",
+    "sure", "please", "no", "nope", "nah", "not", "don", "dont", "t",
+})
+_TOASTED_SIDE_PATTERN = re.compile(r"\b(?:(not|un|no|don'?t)\s*)?toast(?:ed|y)?\b")
+
+_ICED_WORDS = frozenset({"iced", "ice", "cold"})
+_HOT_WORDS = frozenset({"hot", "warm", "regular"})
+
+_CANCEL_WORDS = frozenset({"cancel", "remove", "nevermind", "forget", "scratch"})
+
+# Category keywords for by-the-pound questions; items come from the menu
+_BY_POUND_CATEGORY_KEYWORDS = {
+    "cheese": ("cheese", "cheeses"),
+    "spread": ("spread", "spreads", "cream cheese", "cream cheeses"),
+    "cold_cut": ("cold cut", "cold cuts", "deli meat", "deli meats", "meat", "meats"),
+    "fish": ("fish", "smoked fish", "lox", "salmon"),
+    "salad": ("salad", "salads"),
+}
+_BY_POUND_QUERY_WORDS = frozenset({
+    "what", "which", "kind", "kinds", "type", "types", "you", "sell", "carry",
+    "got", "by", "pound", "lb", "lbs", "interested", "in", "some", "your",
+    "half", "quarter", "about", "hear", "are", "there",
+})
+_BY_POUND_DECLINE_WORDS = frozenset({"nothing", "nevermind", "never", "mind", "no", "nope", "nah", "none"})
+
+
+class _Vocabulary(NamedTuple):
+    """Option phrases for one menu version."""
+
+    matcher: PhraseMatcher
+    size_slugs: dict[str, str]
+    by_pound_categories: dict[str, str]
+
+
+@pattern_registry.register("fast_path_vocabulary")
+def _build_vocabulary() -> _Vocabulary:
+    size_slugs: dict[str, str] = {}
+    for option in menu_cache.get_global_attribute_options("size"):
+        slug = option["slug"].lower()
+        for phrase in (slug, option.get("display_name") or "", *(option.get("aliases") or [])):
+            if phrase.strip():
+                size_slugs[phrase.strip().lower()] = slug
+
+    by_pound_categories = {
+        alias: category for alias, (_name, category) in menu_cache.get_by_pound_aliases().items()
+    }
+    keyword_categories = {
+        keyword: category
+        for category, keywords in _BY_POUND_CATEGORY_KEYWORDS.items()
+        for keyword in keywords
+    }
+
+    matcher = PhraseMatcher({
+        "qualifier": menu_cache.get_qualifier_patterns(),
+        "bagel_type": get_bagel_types(),
+        "spread": get_spreads(),
+        "spread_type": get_spread_types(),
+        "size": size_slugs,
+        "by_pound_item": by_pound_categories,
+        "by_pound_keyword": keyword_categories,
+    })
+    return _Vocabulary(matcher, size_slugs, {**keyword_categories, **by_pound_categories})
+
+
+def _get_vocabulary() -> _Vocabulary | None:
+    """Get the option vocabulary, or None before the menu cache is loaded."""
+    try:
+        return pattern_registry.get("fast_path_vocabulary")
+    except RuntimeError:
+        return None
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+def _find(vocabulary: _Vocabulary, parsed: ParsedText, categories: tuple[str, ...]) -> list[PhraseMatch]:
+    """Claim non-overlapping option phrases, returned in reading order."""
+    matches = vocabulary.matcher.find_longest(parsed.lower, categories)
+    return sorted(matches, key=lambda m: m.start)
+
+
+def _in_spans(token: Token, spans: list[tuple[int, int]]) -> bool:
+    return any(start <= token.start and token.end <= end for start, end in spans)
+
+
+def _spans(matches: list[PhraseMatch]) -> list[tuple[int, int]]:
+    return [(m.start, m.end) for m in matches]
+
+
+def _coverage(
+    parsed: ParsedText,
+    spans: list[tuple[int, int]],
+    explained_words: frozenset[str] = frozenset(),
+) -> float:
+    """Share of tokens that are claimed options, filler or explained words."""
+    tokens = parsed.tokens
+    if not tokens:
+        return 0.0
+    explained = sum(
+        1 for token in tokens
+        if token.text in _FILLER_WORDS
+        or token.text in explained_words
+        or _in_spans(token, spans)
+    )
+    return explained / len(tokens)
+
+
+def _has_free_word(parsed: ParsedText, words: frozenset[str], spans: list[tuple[int, int]]) -> bool:
+    """Check whether any of the words occurs outside the claimed spans."""
+    return any(token.text in words and not _in_spans(token, spans) for token in parsed.tokens)
+
+
+def _is_question(parsed: ParsedText) -> bool:
+    return "?" in parsed.lower or (bool(parsed.tokens) and parsed.tokens[0].text in _QUESTION_STARTS)
+
+
+def _is_decline(parsed: ParsedText) -> bool:
+    """Check for a plain refusal like "nothing", "no thanks" or "just plain"."""
+    words = parsed.words
+    return bool(words & _DECLINE_WORDS) and all(
+        word in _DECLINE_WORDS or word in _DECLINE_SUPPORT_WORDS or word in _FILLER_WORDS
+        for word in words
+    )
+
+
+def _quantity_before(parsed: ParsedText, start: int, end: int, spans: list[tuple[int, int]]) -> int | None:
+    """Value of the last unclaimed number between two offsets."""
+    value = None
+    for number in parsed.numbers:
+        if start <= number.token.start and number.token.end <= end and not _in_spans(number.token, spans):
+            value = number.value
+    return value
+
+
+def _number_spans(parsed: ParsedText) -> list[tuple[int, int]]:
+    return [(n.token.start, n.token.end) for n in parsed.numbers]
+
+
+def _spread_entries(parsed: ParsedText, matches: list[PhraseMatch]) -> list[tuple[str, str | None]]:
+    """
+    Pair spread varieties with the spread directly after them.
+
+    "scallion cream cheese and butter" -> [("cream cheese", "scallion"), ("butter", None)]
+    A variety on its own is a cream cheese variety.
+    """
+    entries: list[tuple[str, str | None]] = []
+    pending: PhraseMatch | None = None
+    for match in matches:
+        if match.category == "spread_type":
+            if pending is not None:
+                entries.append(("cream cheese", pending.phrase))
+            pending = match
+        elif match.category == "spread":
+            if pending is not None and not parsed.lower[pending.end:match.start].strip():
+                entries.append((match.phrase, pending.phrase))
+            else:
+                if pending is not None:
+                    entries.append(("cream cheese", pending.phrase))
+                entries.append((match.phrase, None))
+            pending = None
+    if pending is not None:
+        entries.append(("cream cheese", pending.phrase))
+    return entries
+
+
+def _toasted_preference(parsed: ParsedText) -> tuple[bool | None, list[tuple[int, int]]]:
+    """Find "toasted" / "not toasted" in a longer answer, with the spans used."""
+    matches = list(_TOASTED_SIDE_PATTERN.finditer(parsed.lower))
+    values = {match.group(1) is None for match in matches}
+    if len(values) != 1:
+        return None, []
+    return values.pop(), [match.span() for match in matches]
+
+
+# =============================================================================
+# Resolvers
+# =============================================================================
+
+def resolve_bagel_choice(user_input: str, num_pending_bagels: int = 1) -> Resolution | None:
+    """Resolve "plain", "both sesame", "2 of them everything"."""
+    vocabulary = _get_vocabulary()
+    parsed = get_parsed_text(user_input)
+    if vocabulary is None or _is_question(parsed):
+        return None
+
+    matches = _find(vocabulary, parsed, ("bagel_type",))
+    types = {m.phrase for m in matches}
+    spans = _spans(matches)
+    if len(types) != 1 or _has_free_word(parsed, _NEGATION_WORDS, spans):
+        return None
+
+    if parsed.words & {"all", "every", "each"}:
+        quantity = num_pending_bagels
+    elif "both" in parsed.words:
+        quantity = 2
+    else:
+        quantity = _quantity_before(parsed, 0, len(parsed.lower), spans) or 1
+
+    spans += _number_spans(parsed)
+    return Resolution(
+        BagelChoiceResponse(bagel_type=types.pop(), quantity=quantity),
+        _coverage(parsed, spans, _ALL_WORDS),
+    )
+
+
+def resolve_multi_bagel_choice(
+    user_input: str,
+    num_bagels: int,
+    bagel_descriptions: list[str] | None = None,
+) -> Resolution | None:
+    """Resolve "both plain", "one plain, one sesame", "two everything and a salt"."""
+    vocabulary = _get_vocabulary()
+    parsed = get_parsed_text(user_input)
+    if vocabulary is None or _is_question(parsed):
+        return None
+
+    matches = _find(vocabulary, parsed, ("bagel_type",))
+    spans = _spans(matches)
+    if not matches or _has_free_word(parsed, _NEGATION_WORDS, spans):
+        return None
+
+    bagel_types: list[str] = []
+    previous_end = 0
+    for match in matches:
+        count = _quantity_before(parsed, previous_end, match.start, spans) or 1
+        bagel_types.extend([match.phrase] * count)
+        previous_end = match.end
+
+    applies_to_all = bool(parsed.words & _ALL_WORDS)
+    confidence = _coverage(parsed, spans + _number_spans(parsed), _ALL_WORDS | {"first", "second", "third", "other"})
+    if len(set(bagel_types)) == 1 and (applies_to_all or len(bagel_types) == num_bagels):
+        return Resolution(MultiBagelChoiceResponse(all_same_type=bagel_types[0]), confidence)
+    if len(bagel_types) != num_bagels:
+        confidence = min(confidence, LOW_CONFIDENCE)
+    return Resolution(MultiBagelChoiceResponse(bagel_types=bagel_types), confidence)
+
+
+def resolve_spread_choice(user_input: str) -> Resolution | None:
+    """Resolve "cream cheese", "scallion", "extra butter", "nothing"."""
+    parsed = get_parsed_text(user_input)
+    if _is_decline(parsed):
+        return Resolution(SpreadChoiceResponse(no_spread=True), 1.0)
+
+    vocabulary = _get_vocabulary()
+    if vocabulary is None or _is_question(parsed):
+        return None
+
+    matches = _find(vocabulary, parsed, ("qualifier", "spread", "spread_type"))
+    spans = _spans(matches)
+    entries = set(_spread_entries(parsed, matches))
+    if len(entries) != 1 or _has_free_word(parsed, _NEGATION_WORDS, spans):
+        return None
+
+    spread, spread_type = entries.pop()
+    qualifiers = [m.phrase for m in matches if m.category == "qualifier"]
+    special_instructions = None
+    if qualifiers:
+        special_instructions = re.sub(r"\s+of$", "", qualifiers[0])
+
+    confidence = _coverage(parsed, spans, frozenset({"plain", "spread"}))
+    if len(qualifiers) > 1:
+        confidence = min(confidence, LOW_CONFIDENCE)
+    return Resolution(
+        SpreadChoiceResponse(
+            spread=spread,
+            spread_type=spread_type,
+            special_instructions=special_instructions,
+        ),
+        confidence,
+    )
+
+
+def resolve_multi_spread(
+    user_input: str,
+    num_bagels: int,
+    bagel_descriptions: list[str] | None = None,
+) -> Resolution | None:
+    """Resolve "cream cheese on both", "butter", "scallion and butter"."""
+    parsed = get_parsed_text(user_input)
+    if _is_decline(parsed):
+        return Resolution(MultiSpreadResponse(all_same_spread="none"), 1.0)
+
+    vocabulary = _get_vocabulary()
+    if vocabulary is None or _is_question(parsed):
+        return None
+
+    matches = _find(vocabulary, parsed, ("spread", "spread_type"))
+    spans = _spans(matches)
+    entries = _spread_entries(parsed, matches)
+    if not entries or _has_free_word(parsed, _NEGATION_WORDS, spans):
+        return None
+
+    confidence = _coverage(parsed, spans, _ALL_WORDS | {"plain", "spread", "other", "first", "second"})
+    if len(set(entries)) == 1:
+        spread, spread_type = entries[0]
+        return Resolution(
+            MultiSpreadResponse(all_same_spread=spread, all_same_spread_type=spread_type),
+            confidence,
+        )
+    if len(entries) != num_bagels:
+        confidence = min(confidence, LOW_CONFIDENCE)
+    spreads = [
+        {"spread": spread, "spread_type": spread_type} if spread_type else {"spread": spread}
+        for spread, spread_type in entries
+    ]
+    return Resolution(MultiSpreadResponse(spreads=spreads), confidence)
+
+
+def resolve_toasted_choice(user_input: str) -> Resolution | None:
+    """Resolve "yes", "toasted", "not toasted", "no thanks"."""
+    toasted = parse_toasted_deterministic(user_input)
+    if toasted is None:
+        return None
+    parsed = get_parsed_text(user_input)
+    return Resolution(ToastedChoiceResponse(toasted=toasted), _coverage(parsed, [], _TOASTED_WORDS))
+
+
+def resolve_multi_toasted(
+    user_input: str,
+    num_bagels: int,
+    bagel_descriptions: list[str] | None = None,
+) -> Resolution | None:
+    """
+    Resolve answers that apply to every bagel ("yes", "both toasted", "no").
+
+    Answers naming particular bagels ("just the first one") are left to the LLM.
+    """
+    toasted = parse_toasted_deterministic(user_input)
+    if toasted is None:
+        return None
+    parsed = get_parsed_text(user_input)
+    return Resolution(
+        MultiToastedResponse(all_toasted=toasted),
+        _coverage(parsed, [], _TOASTED_WORDS | _ALL_WORDS),
+    )
+
+
+def resolve_coffee_size(user_input: str) -> Resolution | None:
+    """
+    Resolve "small", "a large one", "large with oat milk".
+
+    The response only carries the size, so other words don't lower the
+    confidence; the handler extracts milk and sweeteners separately.
+    """
+    vocabulary = _get_vocabulary()
+    parsed = get_parsed_text(user_input)
+    if vocabulary is None or _is_question(parsed):
+        return None
+
+    matches = _find(vocabulary, parsed, ("size",))
+    sizes = {vocabulary.size_slugs[m.phrase] for m in matches}
+    if len(sizes) != 1 or _has_free_word(parsed, _NEGATION_WORDS, _spans(matches)):
+        return None
+    return Resolution(CoffeeSizeResponse(size=sizes.pop()), 1.0)
+
+
+def resolve_coffee_style(user_input: str) -> Resolution | None:
+    """Resolve "iced", "hot please", "cold"."""
+    parsed = get_parsed_text(user_input)
+    if _is_question(parsed) or parsed.words & _NEGATION_WORDS:
+        return None
+    iced = bool(parsed.words & _ICED_WORDS)
+    hot = bool(parsed.words & _HOT_WORDS)
+    if iced == hot:
+        return None
+    return Resolution(CoffeeStyleResponse(iced=iced), 1.0)
+
+
+def resolve_side_choice(user_input: str, item_name: str = "") -> Resolution | None:
+    """Resolve "bagel", "fruit salad", "plain bagel toasted with cream cheese"."""
+    parsed = get_parsed_text(user_input)
+    wants_bagel = parsed.has_bagel
+    wants_fruit = "fruit" in parsed.words
+    if wants_bagel == wants_fruit or parsed.words & _CANCEL_WORDS or _is_question(parsed):
+        return None
+
+    if wants_fruit:
+        return Resolution(
+            SideChoiceResponse(choice="fruit_salad"),
+            _coverage(parsed, [], frozenset({"fruit", "salad", "cup", "side"})),
+        )
+
+    vocabulary = _get_vocabulary()
+    if vocabulary is None:
+        return None
+    toasted, toasted_spans = _toasted_preference(parsed)
+    matches = _find(vocabulary, parsed, ("spread", "spread_type", "bagel_type"))
+    bagel_types = {m.phrase for m in matches if m.category == "bagel_type"}
+    spreads = set(_spread_entries(parsed, matches))
+    spans = _spans(matches) + toasted_spans
+    if len(bagel_types) > 1 or len(spreads) > 1 or _has_free_word(parsed, _NEGATION_WORDS, spans):
+        return None
+
+    spread = None
+    if spreads:
+        spread_name, spread_type = spreads.pop()
+        spread = f"{spread_type} {spread_name}" if spread_type else spread_name
+    return Resolution(
+        SideChoiceResponse(
+            choice="bagel",
+            bagel_type=bagel_types.pop() if bagel_types else None,
+            toasted=toasted,
+            spread=spread,
+        ),
+        _coverage(parsed, spans, frozenset({"side"})),
+    )
+
+
+def resolve_by_pound_category(user_input: str) -> Resolution | None:
+    """Resolve "cheeses", "what fish do you have", "half a pound of nova", "never mind"."""
+    parsed = get_parsed_text(user_input)
+    words = parsed.words
+    if words & _BY_POUND_DECLINE_WORDS and all(
+        word in _BY_POUND_DECLINE_WORDS or word in _FILLER_WORDS for word in words
+    ):
+        return Resolution(ByPoundCategoryResponse(category=None, unclear=False), 1.0)
+
+    vocabulary = _get_vocabulary()
+    if vocabulary is None:
+        return None
+    matches = _find(vocabulary, parsed, ("by_pound_item", "by_pound_keyword"))
+    categories = {vocabulary.by_pound_categories[m.phrase] for m in matches}
+    spans = _spans(matches)
+    if len(categories) != 1 or _has_free_word(parsed, _NEGATION_WORDS, spans):
+        return None
+
+    items = [m.phrase for m in matches if m.category == "by_pound_item"]
+    return Resolution(
+        ByPoundCategoryResponse(
+            category=categories.pop(),
+            wants_to_order=items[0] if len(items) == 1 else None,
+        ),
+        _coverage(parsed, spans, _BY_POUND_QUERY_WORDS),
+    )
+
+
+# =============================================================================
+# Dispatch and Stats
+# =============================================================================
+
+_fast_path_stats: dict[str, dict[str, int]] = {}
+
+
+def fast_path(
+    name: str,
+    resolver: Callable[..., Resolution | None],
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator that answers an LLM parser deterministically when it can.
+
+    The resolver is called with the parser's arguments (except ``model``) by
+    name. Its response is returned when the confidence reaches
+    PARSER_FAST_PATH_MIN_CONFIDENCE; otherwise the parser runs as before.
+    Async parsers are wrapped with an async wrapper; a parser and its async
+    variant registered under the same name share their stats.
+
+    Args:
+        name: Parser name used in the fast path stats
+        resolver: Function returning a Resolution or None
+    """
+    def decorator(parser: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(parser)
+        stats = _fast_path_stats.setdefault(name, {"calls": 0, "resolved": 0, "fallbacks": 0})
+
+        def resolve(args, kwargs) -> Resolution | None:
+            """The confident resolution for a call, or None to call the parser."""
+            stats["calls"] += 1
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = {k: v for k, v in bound.arguments.items() if k != "model"}
+
+            resolution = resolver(**arguments)
+            if resolution is not None and resolution.confidence >= PARSER_FAST_PATH_MIN_CONFIDENCE:
+                stats["resolved"] += 1
+                return resolution
+
+            stats["fallbacks"] += 1
+            if resolution is not None:
+                logger.debug("Fast path %s not confident enough (%.2f)", name, resolution.confidence)
+            return None
+
+        if inspect.iscoroutinefunction(parser):
+            @functools.wraps(parser)
+            async def async_wrapper(*args, **kwargs):
+                resolution = resolve(args, kwargs)
+                if resolution is not None:
+                    return resolution.response
+                return await parser(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(parser)
+        def wrapper(*args, **kwargs):
+            resolution = resolve(args, kwargs)
+            if resolution is not None:
+                return resolution.response
+            return parser(*args, **kwargs)
+
+        return wrapper
+    return decorator
+
+
+def get_fast_path_stats() -> dict[str, dict[str, Any]]:
+    """
+    Get per-parser fast path counts.
+
+    Returns:
+        Dict mapping parser name to {"calls", "resolved", "fallbacks",
+        "fallback_rate"}, where fallbacks are the calls that reached the LLM
+        parser (or its memo).
+    """
+    return {
+        name: {
+            **counts,
+            "fallback_rate": round(counts["fallbacks"] / counts["calls"], 4) if counts["calls"] else 0.0,
+        }
+        for name, counts in _fast_path_stats.items()
+    }
+
+
+def reset_fast_path_stats() -> None:
+    """Reset all fast path counts to zero."""
+    for counts in _fast_path_stats.values():
+        for key in counts:
+            counts[key] = 0
@@ -4,14 +4,49 @@ LLM-Powered Parsers.
 This module contains all parsing functions that use instructor/OpenAI
 to parse user input in context-specific ways. Each function is designed
 for a specific state in the order flow.
+
+Parsers whose answer depends only on the input, their arguments and the menu
+are memoized across sessions (see sandwich_bot/parse_memo.py), and their
+LLM completions are kept in the persistent response cache when one is
+configured (see sandwich_bot/llm_response_cache.py). The name, email,
+phone, delivery choice and payment method parsers use neither, since their
+responses carry names, addresses, phone numbers and email addresses.
+
+The open input prompt is split into system instructions rendered once per
+menu version (signature items, sides and item types come from the menu
+cache) and a short per-turn user message, so the provider can cache the
+unchanging prefix.
+
+When only some segments of a multi-item order defeat the deterministic
+parsers, just those segments, with their surrounding text, are sent in one
+SegmentExtractionResponse request and the extracted items are merged with
+the parsed ones, instead of sending the whole order.
+
+The configuration-phase parsers (bagel type, spread, toasted, size, hot/iced,
+side, by-the-pound category) first try a deterministic resolver against the
+menu vocabulary and only call the LLM when it isn't confident (see
+fast_paths.py). The checkout parsers do the same for phone numbers, email
+addresses, pickup/delivery, text/email and yes/no replies (see
+checkout_resolvers.py).
+
+Every parser has an async variant (``parse_open_input_async``,
+``parse_bagel_choice_async``, ...) for async endpoints. It builds the same
+prompt, shares the fast path and memo of the sync parser, and awaits the
+event loop's async client instead of blocking a thread on the completion.
 """
 
-import os
 import logging
-
-import instructor
-from openai import OpenAI
-
+from typing import Any, Awaitable, Callable, TypeVar
+
+from sandwich_bot.config import OPEN_INPUT_BATCH_EXTRACTION
+from sandwich_bot.llm_breaker import llm_breaker
+from sandwich_bot.llm_clients import llm_clients
+from sandwich_bot.llm_deadline import call_with_hedge, call_with_hedge_async, check_turn_budget
+from sandwich_bot.llm_response_cache import llm_response_cache
+from sandwich_bot.llm_usage import track_llm_call
+from sandwich_bot.menu_data_cache import menu_cache
+from sandwich_bot.parse_memo import memoize_parser
+from sandwich_bot.pattern_registry import pattern_registry
 from ..schemas import (
     SideChoiceResponse,
     BagelChoiceResponse,
@@ -30,29 +65,151 @@ from ..schemas import (
     EmailResponse,
     PhoneResponse,
     OpenInputResponse,
+    ParsedCoffeeEntry,
+    SegmentExtractionResponse,
 )
 from .deterministic import (
+    UnresolvedSegment,
     parse_open_input_deterministic,
     _parse_multi_item_order,
     _parse_bagel_with_modifiers,
 )
+from .checkout_resolvers import (
+    resolve_delivery_choice,
+    resolve_name,
+    resolve_confirmation,
+    resolve_payment_method,
+    resolve_email,
+    resolve_phone,
+)
+from .fast_paths import (
+    fast_path,
+    resolve_side_choice,
+    resolve_bagel_choice,
+    resolve_multi_bagel_choice,
+    resolve_multi_toasted,
+    resolve_multi_spread,
+    resolve_spread_choice,
+    resolve_toasted_choice,
+    resolve_coffee_size,
+    resolve_coffee_style,
+    resolve_by_pound_category,
+)
+from .speculation import PartialResult, run_speculative, run_speculative_async
+from .constants import get_item_phrase_matcher
+from .parsed_text import get_parsed_text
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Part of every persistent cache key (see llm_response_cache.py). Bump it when
+# a change to how completions are used should drop every cached completion,
+# even though the rendered prompts stay the same.
+PROMPT_TEMPLATE_VERSION = "1"
+
 
 def get_instructor_client():
-    """Get instructor-wrapped OpenAI client."""
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY not set")
-    return instructor.from_openai(OpenAI(api_key=api_key))
+    """Get the shared, pooled instructor-wrapped OpenAI client."""
+    return llm_clients.instructor()
 
 
-def parse_side_choice(user_input: str, item_name: str, model: str = "gpt-4o-mini") -> SideChoiceResponse:
-    """Parse user input when waiting for omelette side choice."""
-    client = get_instructor_client()
+def get_async_instructor_client():
+    """Get the pooled instructor-wrapped async OpenAI client of the running event loop."""
+    return llm_clients.async_instructor()
+
+
+def _messages(prompt: str, system: str | None) -> list[dict[str, str]]:
+    messages = [{"role": "user", "content": prompt}]
+    if system is not None:
+        messages.insert(0, {"role": "system", "content": system})
+    return messages
+
+
+def _cache_key(prompt: str, response_model: type[T], model: str, system: str | None = None) -> str:
+    return llm_response_cache.make_key(
+        "llm_parsers", model, response_model, PROMPT_TEMPLATE_VERSION,
+        prompt if system is None else _messages(prompt, system),
+    )
+
 
-    prompt = f"""The user ordered "{item_name}" which comes with a choice of bagel or fruit salad.
+def _complete(
+    prompt: str,
+    response_model: type[T],
+    model: str,
+    cache: bool = True,
+    system: str | None = None,
+) -> T:
+    """
+    Run one structured completion for a parser prompt.
+
+    A ``system`` prompt is sent ahead of the prompt as a system message; keep
+    it identical across calls so the provider can cache it. With ``cache``,
+    the completion is served from and stored in the persistent LLM response
+    cache. The request is bounded by the turn's LLM deadline and hedged when
+    slow (see llm_deadline.py), and its tokens, latency and retries are
+    recorded under the response model's name (see llm_usage.py). While the
+    LLM circuit breaker is open, ``LLMCircuitOpen`` is raised without a
+    request (see llm_breaker.py).
+    """
+    key = _cache_key(prompt, response_model, model, system) if cache else None
+    if key is not None:
+        cached = llm_response_cache.get(key, response_model)
+        if cached is not None:
+            return cached
+
+    client = get_instructor_client()
+    check_turn_budget(response_model.__name__)
+    with llm_breaker.guard(response_model.__name__), track_llm_call(response_model.__name__, model) as call:
+        result = call_with_hedge(
+            response_model.__name__,
+            lambda timeout: client.chat.completions.create(
+                model=model,
+                response_model=response_model,
+                messages=_messages(prompt, system),
+                timeout=timeout,
+                hooks=call.hooks(),
+            ),
+        )
+    if key is not None:
+        llm_response_cache.put(key, "llm_parsers", result)
+    return result
+
+
+async def _complete_async(
+    prompt: str,
+    response_model: type[T],
+    model: str,
+    cache: bool = True,
+    system: str | None = None,
+) -> T:
+    """Run one structured completion for a parser prompt without blocking the event loop."""
+    key = _cache_key(prompt, response_model, model, system) if cache else None
+    if key is not None:
+        cached = llm_response_cache.get(key, response_model)
+        if cached is not None:
+            return cached
+
+    client = get_async_instructor_client()
+    check_turn_budget(response_model.__name__)
+    with llm_breaker.guard(response_model.__name__), track_llm_call(response_model.__name__, model) as call:
+        result = await call_with_hedge_async(
+            response_model.__name__,
+            lambda timeout: client.chat.completions.create(
+                model=model,
+                response_model=response_model,
+                messages=_messages(prompt, system),
+                timeout=timeout,
+                hooks=call.hooks(),
+            ),
+        )
+    if key is not None:
+        llm_response_cache.put(key, "llm_parsers", result)
+    return result
+
+
+def _side_choice_prompt(user_input: str, item_name: str) -> str:
+    return f"""The user ordered "{item_name}" which comes with a choice of bagel or fruit salad.
 We asked: "Would you like a bagel or fruit salad with your {item_name}?"
 
 The user said: "{user_input}"
@@ -73,18 +230,23 @@ Examples:
 - "the fruit" -> choice: "fruit_salad"
 """
 
-    return client.chat.completions.create(
-        model=model,
-        response_model=SideChoiceResponse,
-        messages=[{"role": "user", "content": prompt}],
-    )
 
+@fast_path("side_choice", resolve_side_choice)
+@memoize_parser("side_choice")
+def parse_side_choice(user_input: str, item_name: str, model: str = "gpt-4o-mini") -> SideChoiceResponse:
+    """Parse user input when waiting for omelette side choice."""
+    return _complete(_side_choice_prompt(user_input, item_name), SideChoiceResponse, model)
+
+
+@fast_path("side_choice", resolve_side_choice)
+@memoize_parser("side_choice")
+async def parse_side_choice_async(user_input: str, item_name: str, model: str = "gpt-4o-mini") -> SideChoiceResponse:
+    """Async version of parse_side_choice."""
+    return await _complete_async(_side_choice_prompt(user_input, item_name), SideChoiceResponse, model)
 
-def parse_bagel_choice(user_input: str, num_pending_bagels: int = 1, model: str = "gpt-4o-mini") -> BagelChoiceResponse:
-    """Parse user input when waiting for bagel type."""
-    client = get_instructor_client()
 
-    prompt = f"""We asked the user "What kind of bagel?" for ONE specific bagel.
+def _bagel_choice_prompt(user_input: str, num_pending_bagels: int = 1) -> str:
+    return f"""We asked the user "What kind of bagel?" for ONE specific bagel.
 The user said: "{user_input}"
 
 Extract the bagel type. Common types: plain, everything, sesame, poppy, onion, cinnamon raisin, pumpernickel, whole wheat, salt, garlic, bialy.
@@ -108,20 +270,23 @@ Examples:
 - "make them all everything" -> bagel_type: "everything", quantity: {num_pending_bagels}
 """
 
-    return client.chat.completions.create(
-        model=model,
-        response_model=BagelChoiceResponse,
-        messages=[{"role": "user", "content": prompt}],
-    )
+
+@fast_path("bagel_choice", resolve_bagel_choice)
+@memoize_parser("bagel_choice")
+def parse_bagel_choice(user_input: str, num_pending_bagels: int = 1, model: str = "gpt-4o-mini") -> BagelChoiceResponse:
+    """Parse user input when waiting for bagel type."""
+    return _complete(_bagel_choice_prompt(user_input, num_pending_bagels), BagelChoiceResponse, model)
 
 
-def parse_multi_bagel_choice(user_input: str, num_bagels: int, bagel_descriptions: list[str], model: str = "gpt-4o-mini") -> MultiBagelChoiceResponse:
-    """Parse user input when waiting for multiple bagel types."""
-    client = get_instructor_client()
+@fast_path("bagel_choice", resolve_bagel_choice)
+@memoize_parser("bagel_choice")
+async def parse_bagel_choice_async(user_input: str, num_pending_bagels: int = 1, model: str = "gpt-4o-mini") -> BagelChoiceResponse:
+    """Async version of parse_bagel_choice."""
+    return await _complete_async(_bagel_choice_prompt(user_input, num_pending_bagels), BagelChoiceResponse, model)
 
-    bagel_list = ", ".join(bagel_descriptions) if bagel_descriptions else f"{num_bagels} bagels"
 
-    prompt = f"""We asked the user what kind of bagels they want for their {num_bagels} bagels.
+def _multi_bagel_choice_prompt(user_input: str, num_bagels: int) -> str:
+    return f"""We asked the user what kind of bagels they want for their {num_bagels} bagels.
 The user said: "{user_input}"
 
 Extract the bagel types. Common types: plain, everything, sesame, poppy, onion,
@@ -138,20 +303,25 @@ Examples:
 - "the first one plain, second one sesame" -> bagel_types: ["plain", "sesame"]
 """
 
-    return client.chat.completions.create(
-        model=model,
-        response_model=MultiBagelChoiceResponse,
-        messages=[{"role": "user", "content": prompt}],
-    )
+
+@fast_path("multi_bagel_choice", resolve_multi_bagel_choice)
+@memoize_parser("multi_bagel_choice")
+def parse_multi_bagel_choice(user_input: str, num_bagels: int, bagel_descriptions: list[str], model: str = "gpt-4o-mini") -> MultiBagelChoiceResponse:
+    """Parse user input when waiting for multiple bagel types."""
+    return _complete(_multi_bagel_choice_prompt(user_input, num_bagels), MultiBagelChoiceResponse, model)
 
 
-def parse_multi_toasted(user_input: str, num_bagels: int, bagel_descriptions: list[str], model: str = "gpt-4o-mini") -> MultiToastedResponse:
-    """Parse user input about toasting multiple bagels."""
-    client = get_instructor_client()
+@fast_path("multi_bagel_choice", resolve_multi_bagel_choice)
+@memoize_parser("multi_bagel_choice")
+async def parse_multi_bagel_choice_async(user_input: str, num_bagels: int, bagel_descriptions: list[str], model: str = "gpt-4o-mini") -> MultiBagelChoiceResponse:
+    """Async version of parse_multi_bagel_choice."""
+    return await _complete_async(_multi_bagel_choice_prompt(user_input, num_bagels), MultiBagelChoiceResponse, model)
 
+
+def _multi_toasted_prompt(user_input: str, num_bagels: int, bagel_descriptions: list[str]) -> str:
     bagel_list = ", ".join(bagel_descriptions) if bagel_descriptions else f"{num_bagels} bagels"
 
-    prompt = f"""We asked if the user wants their bagels toasted. They have: {bagel_list}
+    return f"""We asked if the user wants their bagels toasted. They have: {bagel_list}
 The user said: "{user_input}"
 
 - If ALL bagels should be toasted (e.g., "yes", "both toasted"), set all_toasted=true
@@ -166,20 +336,25 @@ Examples:
 - "just the first one" -> toasted_list: [true, false]
 """
 
-    return client.chat.completions.create(
-        model=model,
-        response_model=MultiToastedResponse,
-        messages=[{"role": "user", "content": prompt}],
-    )
 
+@fast_path("multi_toasted", resolve_multi_toasted)
+@memoize_parser("multi_toasted")
+def parse_multi_toasted(user_input: str, num_bagels: int, bagel_descriptions: list[str], model: str = "gpt-4o-mini") -> MultiToastedResponse:
+    """Parse user input about toasting multiple bagels."""
+    return _complete(_multi_toasted_prompt(user_input, num_bagels, bagel_descriptions), MultiToastedResponse, model)
 
-def parse_multi_spread(user_input: str, num_bagels: int, bagel_descriptions: list[str], model: str = "gpt-4o-mini") -> MultiSpreadResponse:
-    """Parse user input about spreads for multiple bagels."""
-    client = get_instructor_client()
 
+@fast_path("multi_toasted", resolve_multi_toasted)
+@memoize_parser("multi_toasted")
+async def parse_multi_toasted_async(user_input: str, num_bagels: int, bagel_descriptions: list[str], model: str = "gpt-4o-mini") -> MultiToastedResponse:
+    """Async version of parse_multi_toasted."""
+    return await _complete_async(_multi_toasted_prompt(user_input, num_bagels, bagel_descriptions), MultiToastedResponse, model)
+
+
+def _multi_spread_prompt(user_input: str, num_bagels: int, bagel_descriptions: list[str]) -> str:
     bagel_list = ", ".join(bagel_descriptions) if bagel_descriptions else f"{num_bagels} bagels"
 
-    prompt = f"""We asked what spread the user wants on their bagels. They have: {bagel_list}
+    return f"""We asked what spread the user wants on their bagels. They have: {bagel_list}
 The user said: "{user_input}"
 
 Spread options: cream cheese, butter, none/nothing.
@@ -195,18 +370,23 @@ Examples:
 - "scallion cream cheese on the first, strawberry on the second" -> spreads: [{{"spread": "cream cheese", "spread_type": "scallion"}}, {{"spread": "cream cheese", "spread_type": "strawberry"}}]
 """
 
-    return client.chat.completions.create(
-        model=model,
-        response_model=MultiSpreadResponse,
-        messages=[{"role": "user", "content": prompt}],
-    )
 
+@fast_path("multi_spread", resolve_multi_spread)
+@memoize_parser("multi_spread")
+def parse_multi_spread(user_input: str, num_bagels: int, bagel_descriptions: list[str], model: str = "gpt-4o-mini") -> MultiSpreadResponse:
+    """Parse user input about spreads for multiple bagels."""
+    return _complete(_multi_spread_prompt(user_input, num_bagels, bagel_descriptions), MultiSpreadResponse, model)
 
-def parse_spread_choice(user_input: str, model: str = "gpt-4o-mini") -> SpreadChoiceResponse:
-    """Parse user input when waiting for spread choice."""
-    client = get_instructor_client()
 
-    prompt = f"""We asked the user what spread they want on their bagel.
+@fast_path("multi_spread", resolve_multi_spread)
+@memoize_parser("multi_spread")
+async def parse_multi_spread_async(user_input: str, num_bagels: int, bagel_descriptions: list[str], model: str = "gpt-4o-mini") -> MultiSpreadResponse:
+    """Async version of parse_multi_spread."""
+    return await _complete_async(_multi_spread_prompt(user_input, num_bagels, bagel_descriptions), MultiSpreadResponse, model)
+
+
+def _spread_choice_prompt(user_input: str) -> str:
+    return f"""We asked the user what spread they want on their bagel.
 The user said: "{user_input}"
 
 Extract their spread choice. Options: cream cheese, butter, none/nothing.
@@ -226,18 +406,23 @@ Examples:
 - "cream cheese on the side" -> spread: "cream cheese", special_instructions: "on the side"
 """
 
-    return client.chat.completions.create(
-        model=model,
-        response_model=SpreadChoiceResponse,
-        messages=[{"role": "user", "content": prompt}],
-    )
+
+@fast_path("spread_choice", resolve_spread_choice)
+@memoize_parser("spread_choice")
+def parse_spread_choice(user_input: str, model: str = "gpt-4o-mini") -> SpreadChoiceResponse:
+    """Parse user input when waiting for spread choice."""
+    return _complete(_spread_choice_prompt(user_input), SpreadChoiceResponse, model)
 
 
-def parse_toasted_choice(user_input: str, model: str = "gpt-4o-mini") -> ToastedChoiceResponse:
-    """Parse user input when waiting for toasted preference."""
-    client = get_instructor_client()
+@fast_path("spread_choice", resolve_spread_choice)
+@memoize_parser("spread_choice")
+async def parse_spread_choice_async(user_input: str, model: str = "gpt-4o-mini") -> SpreadChoiceResponse:
+    """Async version of parse_spread_choice."""
+    return await _complete_async(_spread_choice_prompt(user_input), SpreadChoiceResponse, model)
+
 
-    prompt = f"""We asked the user if they want their bagel toasted.
+def _toasted_choice_prompt(user_input: str) -> str:
+    return f"""We asked the user if they want their bagel toasted.
 The user said: "{user_input}"
 
 Examples:
@@ -245,18 +430,23 @@ Examples:
 - "no" / "not toasted" / "no thanks" -> toasted: false
 """
 
-    return client.chat.completions.create(
-        model=model,
-        response_model=ToastedChoiceResponse,
-        messages=[{"role": "user", "content": prompt}],
-    )
+
+@fast_path("toasted_choice", resolve_toasted_choice)
+@memoize_parser("toasted_choice")
+def parse_toasted_choice(user_input: str, model: str = "gpt-4o-mini") -> ToastedChoiceResponse:
+    """Parse user input when waiting for toasted preference."""
+    return _complete(_toasted_choice_prompt(user_input), ToastedChoiceResponse, model)
 
 
-def parse_coffee_size(user_input: str, model: str = "gpt-4o-mini") -> CoffeeSizeResponse:
-    """Parse user input when waiting for coffee size."""
-    client = get_instructor_client()
+@fast_path("toasted_choice", resolve_toasted_choice)
+@memoize_parser("toasted_choice")
+async def parse_toasted_choice_async(user_input: str, model: str = "gpt-4o-mini") -> ToastedChoiceResponse:
+    """Async version of parse_toasted_choice."""
+    return await _complete_async(_toasted_choice_prompt(user_input), ToastedChoiceResponse, model)
+
 
-    prompt = f"""We asked the user what size coffee they want.
+def _coffee_size_prompt(user_input: str) -> str:
+    return f"""We asked the user what size coffee they want.
 The user said: "{user_input}"
 
 Examples:
@@ -266,18 +456,23 @@ Examples:
 - Any unclear response -> size: null
 """
 
-    return client.chat.completions.create(
-        model=model,
-        response_model=CoffeeSizeResponse,
-        messages=[{"role": "user", "content": prompt}],
-    )
 
+@fast_path("coffee_size", resolve_coffee_size)
+@memoize_parser("coffee_size")
+def parse_coffee_size(user_input: str, model: str = "gpt-4o-mini") -> CoffeeSizeResponse:
+    """Parse user input when waiting for coffee size."""
+    return _complete(_coffee_size_prompt(user_input), CoffeeSizeResponse, model)
 
-def parse_coffee_style(user_input: str, model: str = "gpt-4o-mini") -> CoffeeStyleResponse:
-    """Parse user input when waiting for hot/iced preference."""
-    client = get_instructor_client()
 
-    prompt = f"""We asked the user if they want their coffee hot or iced.
+@fast_path("coffee_size", resolve_coffee_size)
+@memoize_parser("coffee_size")
+async def parse_coffee_size_async(user_input: str, model: str = "gpt-4o-mini") -> CoffeeSizeResponse:
+    """Async version of parse_coffee_size."""
+    return await _complete_async(_coffee_size_prompt(user_input), CoffeeSizeResponse, model)
+
+
+def _coffee_style_prompt(user_input: str) -> str:
+    return f"""We asked the user if they want their coffee hot or iced.
 The user said: "{user_input}"
 
 Examples:
@@ -286,18 +481,23 @@ Examples:
 - Any unclear response -> iced: null
 """
 
-    return client.chat.completions.create(
-        model=model,
-        response_model=CoffeeStyleResponse,
-        messages=[{"role": "user", "content": prompt}],
-    )
 
+@fast_path("coffee_style", resolve_coffee_style)
+@memoize_parser("coffee_style")
+def parse_coffee_style(user_input: str, model: str = "gpt-4o-mini") -> CoffeeStyleResponse:
+    """Parse user input when waiting for hot/iced preference."""
+    return _complete(_coffee_style_prompt(user_input), CoffeeStyleResponse, model)
 
-def parse_by_pound_category(user_input: str, model: str = "gpt-4o-mini") -> ByPoundCategoryResponse:
-    """Parse user input when they're selecting a by-the-pound category or item."""
-    client = get_instructor_client()
 
-    prompt = f"""We asked the user which by-the-pound category they're interested in.
+@fast_path("coffee_style", resolve_coffee_style)
+@memoize_parser("coffee_style")
+async def parse_coffee_style_async(user_input: str, model: str = "gpt-4o-mini") -> CoffeeStyleResponse:
+    """Async version of parse_coffee_style."""
+    return await _complete_async(_coffee_style_prompt(user_input), CoffeeStyleResponse, model)
+
+
+def _by_pound_category_prompt(user_input: str) -> str:
+    return f"""We asked the user which by-the-pound category they're interested in.
 We sell cheeses, spreads, cold cuts, fish, and salads by the pound.
 
 The user said: "{user_input}"
@@ -327,90 +527,78 @@ Examples:
 - Any unclear response -> unclear: true
 """
 
-    return client.chat.completions.create(
-        model=model,
-        response_model=ByPoundCategoryResponse,
-        messages=[{"role": "user", "content": prompt}],
-    )
 
+@fast_path("by_pound_category", resolve_by_pound_category)
+@memoize_parser("by_pound_category")
+def parse_by_pound_category(user_input: str, model: str = "gpt-4o-mini") -> ByPoundCategoryResponse:
+    """Parse user input when they're selecting a by-the-pound category or item."""
+    return _complete(_by_pound_category_prompt(user_input), ByPoundCategoryResponse, model)
 
-def parse_open_input(
+
+@fast_path("by_pound_category", resolve_by_pound_category)
+@memoize_parser("by_pound_category")
+async def parse_by_pound_category_async(user_input: str, model: str = "gpt-4o-mini") -> ByPoundCategoryResponse:
+    """Async version of parse_by_pound_category."""
+    return await _complete_async(_by_pound_category_prompt(user_input), ByPoundCategoryResponse, model)
+
+
+def _try_open_input_deterministic(
     user_input: str,
-    context: str = "",
-    model: str = "gpt-4o-mini",
     spread_types: set[str] | None = None,
     modifier_category_keywords: dict[str, str] | None = None,
     modifier_item_keywords: dict[str, str] | None = None,
     ingredient_to_items: dict[str, list[dict]] | None = None,
-) -> OpenInputResponse:
-    """Parse user input when open for new orders.
+    unresolved: list[UnresolvedSegment] | None = None,
+) -> OpenInputResponse | None:
+    """
+    Deterministic stage of parse_open_input.
 
-    Tries deterministic parsing first for speed and consistency.
-    Falls back to LLM for complex orders (menu items, multi-config bagels, coffee).
+    With ``unresolved``, a multi-item order with segments none of the parsers
+    understand is returned partially parsed, and the missed segments are
+    added to the list (see ``_parse_multi_item_order``).
 
-    Args:
-        user_input: The user's input string
-        context: Optional context string for LLM fallback
-        model: Model to use for LLM fallback
-        spread_types: Optional set of spread type keywords from database
-        modifier_category_keywords: Mapping of keywords to category slugs
-            (e.g., {"sweetener": "sweeteners", "sugar": "sweeteners"})
-        modifier_item_keywords: Mapping of item keywords to item type slugs
-            (e.g., {"latte": "coffee", "cappuccino": "coffee"})
-        ingredient_to_items: Mapping of ingredient names to menu items containing them
-            (e.g., {"chicken": [{"name": "Chicken Salad Sandwich", ...}]})
+    Returns:
+        The parsed order, or None when the input needs the LLM.
     """
+    # Typos and transcription errors would otherwise miss every deterministic parser
+    original_input = user_input
+    user_input = menu_cache.correct_spelling(user_input)
+    if user_input != original_input:
+        logger.info("Spelling corrected: %s -> %s", original_input[:50], user_input[:50])
+
     # Check if input likely contains multiple items
-    input_lower = user_input.lower()
-    # Clean up common phrases that contain "and" but aren't multi-item orders
-    # Order matters: longer phrases first to match properly
-    cleaned = input_lower
-    for phrase in [
-        # Egg sandwich phrases (must come first - longer phrases)
-        "bacon egg and cheese", "ham egg and cheese", "sausage egg and cheese",
-        "bacon and egg and cheese", "ham and egg and cheese",
-        "bacon eggs and cheese", "ham eggs and cheese", "egg and cheese",
-        "egg cheese and bacon", "egg, cheese and bacon",
-        # Other compound phrases
-        "ham and cheese", "ham and egg", "bacon and egg", "egg and bacon",
-        "lox and cream cheese", "salt and pepper", "cream cheese and lox",
-        "eggs and bacon", "black and white", "spinach and feta",
-    ]:
-        cleaned = cleaned.replace(phrase, "")
+    parsed = get_parsed_text(user_input)
+    input_lower = parsed.lower
+    # Compound names like "bacon egg and cheese" contain "and" but name a
+    # single item; their spans are ignored when looking for separators
+    item_matcher = get_item_phrase_matcher()
+    single_item_spans = parsed.single_item_spans(item_matcher)
 
     # If "and" or comma still appears, it might be multi-item OR a single bagel with multiple modifiers
     # Pattern: "bagel with X, Y, and Z" is a single bagel with modifiers, NOT multi-item
-    if " and " in cleaned or ", " in cleaned:
+    if parsed.has_list_separator_outside(single_item_spans):
         # Check if this looks like a multi-item order with a coffee/drink BEFORE the bagel
         # e.g., "large iced oat milk latte with vanilla and a gluten free everything bagel"
         # In this case, the " with " comes from "latte with vanilla", not "bagel with modifiers"
-        coffee_keywords = [
-            "latte", "cappuccino", "espresso", "americano", "macchiato", "mocha",
-            "coffee", "cold brew", "iced coffee", "drip", "tea", "chai",
-            "coke", "coca-cola", "diet coke", "sprite", "soda", "juice",
-            "chocolate milk", "milk", "water", "lemonade",
-        ]
-
-        # Check if there's a coffee keyword before " and a " or " and an " that precedes "bagel"
         is_multi_item_with_drink_first = False
         bagel_pos = input_lower.find("bagel")
         if bagel_pos > 0:
             # Look for " and a " or " and an " before the bagel
             text_before_bagel = input_lower[:bagel_pos]
-            for separator in [" and a ", " and an ", " plus a ", " plus an ", ", a ", ", an "]:
-                sep_pos = text_before_bagel.find(separator)
-                if sep_pos > 0:
-                    # Check if there's a coffee keyword before this separator
-                    text_before_sep = text_before_bagel[:sep_pos]
-                    for keyword in coffee_keywords:
-                        if keyword in text_before_sep:
-                            is_multi_item_with_drink_first = True
-                            logger.info(
-                                "Detected multi-item with drink ('%s') before bagel: %s",
-                                keyword, user_input[:50]
-                            )
-                            break
-                    if is_multi_item_with_drink_first:
+            sep_positions = [
+                text_before_bagel.find(separator)
+                for separator in (" and a ", " and an ", " plus a ", " plus an ", ", a ", ", an ")
+            ]
+            last_sep_pos = max(sep_positions)
+            if last_sep_pos > 0:
+                # Check if there's a drink before one of these separators
+                for match in parsed.item_phrases(item_matcher):
+                    if match.category == "drink" and match.end <= last_sep_pos:
+                        is_multi_item_with_drink_first = True
+                        logger.info(
+                            "Detected multi-item with drink ('%s') before bagel: %s",
+                            match.phrase, user_input[:50]
+                        )
                         break
 
         # Check for single bagel with modifiers pattern first
@@ -425,7 +613,7 @@ def parse_open_input(
 
         # Otherwise try multi-item deterministic parsing
         logger.info("Multi-item order detected, trying deterministic parse: %s", user_input[:50])
-        result = _parse_multi_item_order(user_input)
+        result = _parse_multi_item_order(user_input, unresolved)
         if result is not None:
             logger.info("Parsed multi-item order deterministically: %s", user_input[:50])
             return result
@@ -442,19 +630,16 @@ def parse_open_input(
         logger.info("Parsed deterministically: %s", user_input[:50])
         return result
 
-    # Fall back to LLM for complex cases
-    logger.info("Falling back to LLM for: %s", user_input[:50])
-    client = get_instructor_client()
+    return None
 
-    prompt = f"""Parse this customer message at a bagel shop.
-{f"Context: {context}" if context else ""}
 
-The user said: "{user_input}"
+# Instructions for parse_open_input. They go in a system message that is
+# the same on every turn of a menu version, so the provider can cache the
+# prefix; only the context and the user's message change per turn.
+_OPEN_INPUT_INSTRUCTIONS = """Parse customer messages at a bagel shop. Each message comes with optional order context.
 
 Determine what they want:
-- If ordering a SIGNATURE ITEM (The Classic, The Leo, The Traditional, The Max Zucker,
-  The Classic BEC, The Avocado Toast, The Chelsea Club, The Flatiron Traditional,
-  The Old School Tuna Sandwich), use new_signature_item fields (see examples below)
+- If ordering a SIGNATURE ITEM (see "Signature item orders" below), use new_signature_item fields
 - If ordering a different menu item by name (e.g., "the chipotle egg omelette", omelettes, sandwiches),
   set new_menu_item to the item name and new_menu_item_quantity to the number ordered
 - If ordering bagels:
@@ -496,11 +681,7 @@ Examples:
 - "ham egg and cheese on wheat toasted" -> new_menu_item: "Ham Egg & Cheese on Wheat", new_menu_item_quantity: 1, new_menu_item_toasted: true
 - "I'd like a plain bagel" -> new_bagel: true, new_bagel_quantity: 1, new_bagel_type: "plain"
 - "two bagels please" -> new_bagel: true, new_bagel_quantity: 2
-- "three bagels" -> new_bagel: true, new_bagel_quantity: 3
-- "I want three bagels" -> new_bagel: true, new_bagel_quantity: 3
 - "3 bagels please" -> new_bagel: true, new_bagel_quantity: 3
-- "four bagels" -> new_bagel: true, new_bagel_quantity: 4
-- "I'd like 5 bagels" -> new_bagel: true, new_bagel_quantity: 5
 - "two plain bagels toasted" -> new_bagel: true, new_bagel_quantity: 2, new_bagel_type: "plain", new_bagel_toasted: true
 - "one plain bagel and one everything bagel" -> new_bagel: true, new_bagel_quantity: 2, parsed_items: [{{"type": "bagel", "bagel_type": "plain"}}, {{"type": "bagel", "bagel_type": "everything"}}]
 - "plain bagel with butter and cinnamon raisin with cream cheese" -> new_bagel: true, new_bagel_quantity: 2, parsed_items: [{{"type": "bagel", "bagel_type": "plain", "spread": "butter"}}, {{"type": "bagel", "bagel_type": "cinnamon raisin", "spread": "cream cheese"}}]
@@ -530,7 +711,7 @@ Examples:
 
 Side orders (IMPORTANT - these are SEPARATE items, not toppings on bagels!):
 - When user says "side of X", "with a side of X", or orders a side item -> set new_side_item
-- Available sides: Side of Sausage, Side of Bacon, Side of Turkey Bacon, Side of Ham, Side of Chicken Sausage, Side of Breakfast Latke, Hard Boiled Egg
+- Available sides: {side_items}
 - CRITICAL: If user says "side of" anything, it is a SIDE ITEM, NOT a bagel topping. Do NOT add it to bagel modifiers!
 - "side of sausage" -> new_side_item: "Side of Sausage"
 - "side of turkey sausage" -> new_side_item: "Side of Sausage" (map to closest available item)
@@ -550,34 +731,26 @@ Side orders (IMPORTANT - these are SEPARATE items, not toppings on bagels!):
 - "my usual" -> wants_repeat_order: true
 
 Signature item orders (pre-configured sandwiches):
-- These are specific named menu items that come pre-configured: "The Classic", "The Classic BEC",
-  "The Traditional", "The Leo", "The Max Zucker", "The Avocado Toast", "The Chelsea Club",
-  "The Flatiron Traditional", "The Old School Tuna Sandwich"
-- "bacon egg and cheese" / "BEC" / "bacon egg cheese" are ALL "The Classic BEC"
-- "ham egg and cheese" / "HEC" are The Classic with ham instead of bacon
+- These are specific named menu items that come pre-configured: {signature_items}
+- Customers often order them by a short name or by what is on them:
+{signature_examples}
 - When user orders these by name, set new_signature_item=true and new_signature_item_name to the item name
-- "3 Classics" -> new_signature_item: true, new_signature_item_name: "The Classic", new_signature_item_quantity: 3
-- "The Leo please" -> new_signature_item: true, new_signature_item_name: "The Leo"
-- "two Traditionals toasted" -> new_signature_item: true, new_signature_item_name: "The Traditional", new_signature_item_quantity: 2, new_signature_item_toasted: true
-- "a Max Zucker" -> new_signature_item: true, new_signature_item_name: "The Max Zucker"
-- "Classic BEC" -> new_signature_item: true, new_signature_item_name: "The Classic BEC"
-- "bacon egg and cheese bagel" -> new_signature_item: true, new_signature_item_name: "The Classic BEC" (DO NOT set bagel_choice to "egg" - the "egg" is part of the item name, not the bagel type!)
-- "bacon egg and cheese on everything" -> new_signature_item: true, new_signature_item_name: "The Classic BEC", new_signature_item_bagel_choice: "everything"
-- "ham egg and cheese bagel" -> new_signature_item: true, new_signature_item_name: "The Classic BEC" (ham variant, but map to BEC)
-- "the avocado toast" -> new_signature_item: true, new_signature_item_name: "The Avocado Toast"
-- "Chelsea Club toasted" -> new_signature_item: true, new_signature_item_name: "The Chelsea Club", new_signature_item_toasted: true
+- "3 <item>s" -> new_signature_item: true, new_signature_item_name: "<item>", new_signature_item_quantity: 3
+- "two <item>s toasted" -> new_signature_item: true, new_signature_item_name: "<item>", new_signature_item_quantity: 2, new_signature_item_toasted: true
+- "<item> on everything" -> new_signature_item: true, new_signature_item_name: "<item>", new_signature_item_bagel_choice: "everything"
+- When an item is named after its fillings (e.g. "bacon egg and cheese bagel"), the fillings are part of the item name: DO NOT set bagel_choice to "egg" or another filling
 
 MULTI-ITEM ORDERS (IMPORTANT - extract ALL items!):
 - When user orders MULTIPLE different items in one message, you MUST extract ALL of them
 - If ordering a sandwich/menu item AND a drink together, set BOTH new_menu_item AND new_coffee fields
-- "The Lexington and an orange juice" -> new_menu_item: "The Lexington", new_coffee: true, new_coffee_type: "orange juice"
-- "Classic BEC with a coffee" -> new_signature_item: true, new_signature_item_name: "The Classic BEC", new_coffee: true, new_coffee_type: "coffee"
-- "Delancey and a latte" -> new_menu_item: "The Delancey", new_coffee: true, new_coffee_type: "latte"
+- "<menu item> and an orange juice" -> new_menu_item: "<menu item>", new_coffee: true, new_coffee_type: "orange juice"
+- "<signature item> with a coffee" -> new_signature_item: true, new_signature_item_name: "<signature item>", new_coffee: true, new_coffee_type: "coffee"
 - "two bagels and a coffee" -> new_bagel: true, new_bagel_quantity: 2, new_coffee: true, new_coffee_type: "coffee"
 - "plain bagel and orange juice" -> new_bagel: true, new_bagel_type: "plain", new_coffee: true, new_coffee_type: "orange juice"
 
 Menu queries (asking what items are available):
 - If user asks "what X do you have?" where X is a type of menu item -> menu_query: true, menu_query_type: "<type>"
+  - Menu item types: {item_types}
   - "what sodas do you have" -> menu_query: true, menu_query_type: "soda"
   - "what juices do you have" -> menu_query: true, menu_query_type: "juice"
   - "what drinks do you have" -> menu_query: true, menu_query_type: "drink"
@@ -629,18 +802,242 @@ By-the-pound ORDERS (user is ordering, not asking):
   - "a quarter pound of lox" -> by_pound_items: [{{"item_name": "Lox", "quantity": "quarter lb", "category": "fish"}}]
 """
 
-    return client.chat.completions.create(
-        model=model,
-        response_model=OpenInputResponse,
-        messages=[{"role": "user", "content": prompt}],
+
+def _quoted_list(names) -> str:
+    return ", ".join(f'"{name}"' for name in sorted(set(names)))
+
+
+# Alias examples shown for the signature items; the prompt is sent every turn
+MAX_SIGNATURE_ITEM_EXAMPLES = 8
+
+
+def _signature_item_examples(aliases: dict[str, str]) -> str:
+    """Example lines mapping the menu's signature item aliases to their item names."""
+    examples = [
+        f'  - "{alias}" -> new_signature_item: true, new_signature_item_name: "{name}"'
+        for alias, name in sorted(aliases.items())
+        if alias != name.lower()
+    ]
+    return "\n".join(examples[:MAX_SIGNATURE_ITEM_EXAMPLES]) or "  - (no signature items on the menu)"
+
+
+def _menu_prompt_fields() -> dict[str, str]:
+    """The menu's signature items, sides and item types for system prompts."""
+    menu_index = menu_cache.get_menu_index()
+    item_types = [slug for slug in menu_index.get("items_by_type", {}) if slug != "signature_items"]
+    signature_aliases = menu_cache.get_signature_item_aliases()
+    return {
+        "signature_items": _quoted_list(signature_aliases.values()) or "none",
+        "signature_examples": _signature_item_examples(signature_aliases),
+        "side_items": ", ".join(sorted({item["name"] for item in menu_index.get("sides", [])})) or "none",
+        "item_types": ", ".join(sorted(item_types)) or "see examples",
+    }
+
+
+@pattern_registry.register("open_input_system_prompt")
+def _build_open_input_system_prompt() -> str:
+    """Render the open input instructions for the current menu."""
+    return _OPEN_INPUT_INSTRUCTIONS.format(**_menu_prompt_fields())
+
+
+def _open_input_prompt(user_input: str, context: str = "") -> str:
+    context_line = f"Context: {context}\n" if context else ""
+    return f'{context_line}The user said: "{user_input}"'
+
+
+# Instructions for the batched extraction of the segments of a multi-item
+# order that the deterministic parsers missed. Like the open input
+# instructions, they only change with the menu.
+_SEGMENT_EXTRACTION_INSTRUCTIONS = """Extract the items a customer ordered at a bagel shop from parts of their message.
+The rest of the message was already understood. Each part is listed with its number and is shown in its place in the message, marked with [[ ]].
+
+Return one entry per part: its number and the items that part orders, as parsed items:
+- Signature items ({signature_items}) and other menu items named by the customer:
+  {{"type": "menu_item", "menu_item_name": "...", "quantity": 1, "bagel_type": null, "toasted": null, "modifiers": [], "is_signature": true/false}}
+- Bagels: {{"type": "bagel", "bagel_type": "...", "quantity": 1, "toasted": true/false/null, "spread": "...", "spread_type": "...", "proteins": [], "cheeses": [], "toppings": []}}
+- Coffee, tea, sodas and other drinks: {{"type": "coffee", "drink_type": "...", "size": "small"/"large"/null, "temperature": "iced"/"hot"/null, "milk": "...", "quantity": 1}}
+- Sides ({side_items}): {{"type": "side", "side_name": "...", "quantity": 1}}
+- By-the-pound items: {{"type": "by_pound", "item_name": "...", "quantity": "1 lb"/"half lb"/"quarter lb", "category": "cheese"/"spread"/"cold_cut"/"fish"/"salad"}}
+
+Menu item types: {item_types}.
+Only extract what the marked part itself orders; the text around it is context. A part that orders nothing (filler, a question, a remark) gets an empty items list.
+"""
+
+
+@pattern_registry.register("segment_extraction_system_prompt")
+def _build_segment_extraction_system_prompt() -> str:
+    """Render the segment extraction instructions for the current menu."""
+    return _SEGMENT_EXTRACTION_INSTRUCTIONS.format(**_menu_prompt_fields())
+
+
+def _segment_extraction_prompt(unresolved: list[UnresolvedSegment]) -> str:
+    lines = ["Parts to extract:"]
+    for number, segment in enumerate(unresolved, 1):
+        lines.append(f'{number}. "{segment.text}" in: "{segment.context()}"')
+    return "\n".join(lines)
+
+
+def _merge_segment_items(
+    result: OpenInputResponse,
+    unresolved: list[UnresolvedSegment],
+    extraction: SegmentExtractionResponse,
+) -> OpenInputResponse:
+    """Insert the extracted items of each segment where the segment was in the order."""
+    items_by_number = {entry.segment: entry.items for entry in extraction.segments}
+    merged = list(result.parsed_items)
+    # From the last segment back, so the earlier positions stay valid
+    for number in range(len(unresolved), 0, -1):
+        segment = unresolved[number - 1]
+        items = items_by_number.get(number, [])
+        for item in items:
+            if isinstance(item, ParsedCoffeeEntry) and item.original_text is None:
+                item.original_text = segment.text
+        merged[segment.position:segment.position] = items
+    logger.info(
+        "Batched extraction: %d items from %d segments", len(merged) - len(result.parsed_items), len(unresolved),
     )
+    result.parsed_items = merged
+    return result
 
 
-def parse_delivery_choice(user_input: str, model: str = "gpt-4o-mini") -> DeliveryChoiceResponse:
-    """Parse user input when waiting for pickup/delivery choice."""
-    client = get_instructor_client()
+def _open_input_deterministic_stage(
+    user_input: str,
+    extract_segments: Callable[[OpenInputResponse, list[UnresolvedSegment]], OpenInputResponse | Awaitable[OpenInputResponse]],
+    **keywords: Any,
+) -> OpenInputResponse | PartialResult | None:
+    """
+    Run _try_open_input_deterministic, leaving the segments it missed to one LLM request.
+
+    Args:
+        user_input: The user's input string
+        extract_segments: Makes the segment extraction request for a list of
+            UnresolvedSegment (the sync or async completion)
+        **keywords: Menu keyword arguments for _try_open_input_deterministic
+
+    Returns:
+        The parsed order, a PartialResult whose completion extracts the
+        missed segments, or None when the whole input needs the LLM
+    """
+    unresolved: list[UnresolvedSegment] | None = [] if OPEN_INPUT_BATCH_EXTRACTION else None
+    result = _try_open_input_deterministic(user_input, unresolved=unresolved, **keywords)
+    if result is None or not unresolved:
+        return result
+    return PartialResult(result, lambda: extract_segments(result, unresolved))
+
+
+@memoize_parser("open_input")
+def parse_open_input(
+    user_input: str,
+    context: str = "",
+    model: str = "gpt-4o-mini",
+    spread_types: set[str] | None = None,
+    modifier_category_keywords: dict[str, str] | None = None,
+    modifier_item_keywords: dict[str, str] | None = None,
+    ingredient_to_items: dict[str, list[dict]] | None = None,
+) -> OpenInputResponse:
+    """Parse user input when open for new orders.
+
+    Tries deterministic parsing first for speed and consistency.
+    Falls back to LLM for complex orders (menu items, multi-config bagels, coffee).
+    Inputs predicted to fall back start the LLM request while deterministic
+    parsing runs (see speculation.py).
+
+    A multi-item order with segments the deterministic parsers don't
+    understand keeps the items of the other segments; the missed segments
+    alone go to the LLM, all in one request, and their items are merged in
+    order (turned off by OPEN_INPUT_BATCH_EXTRACTION=false).
+
+    Near-miss spellings of menu words ("everthing", "capuccino") are corrected
+    for the deterministic parsers; the LLM sees the input as typed, except
+    for the quoted segments of a batched extraction.
+
+    Args:
+        user_input: The user's input string
+        context: Optional context string for LLM fallback
+        model: Model to use for LLM fallback
+        spread_types: Optional set of spread type keywords from database
+        modifier_category_keywords: Mapping of keywords to category slugs
+            (e.g., {"sweetener": "sweeteners", "sugar": "sweeteners"})
+        modifier_item_keywords: Mapping of item keywords to item type slugs
+            (e.g., {"latte": "coffee", "cappuccino": "coffee"})
+        ingredient_to_items: Mapping of ingredient names to menu items containing them
+            (e.g., {"chicken": [{"name": "Chicken Salad Sandwich", ...}]})
+    """
+    def extract_segments(result: OpenInputResponse, unresolved: list[UnresolvedSegment]) -> OpenInputResponse:
+        extraction = _complete(
+            _segment_extraction_prompt(unresolved),
+            SegmentExtractionResponse,
+            model,
+            system=pattern_registry.get("segment_extraction_system_prompt"),
+        )
+        return _merge_segment_items(result, unresolved, extraction)
+
+    # Inputs likely to need the LLM start it alongside deterministic parsing
+    return run_speculative(
+        user_input,
+        lambda: _open_input_deterministic_stage(
+            user_input,
+            extract_segments,
+            spread_types=spread_types,
+            modifier_category_keywords=modifier_category_keywords,
+            modifier_item_keywords=modifier_item_keywords,
+            ingredient_to_items=ingredient_to_items,
+        ),
+        lambda: _complete(
+            _open_input_prompt(user_input, context),
+            OpenInputResponse,
+            model,
+            system=pattern_registry.get("open_input_system_prompt"),
+        ),
+    )
 
-    prompt = f"""We asked the user if their order is for pickup or delivery.
+
+@memoize_parser("open_input")
+async def parse_open_input_async(
+    user_input: str,
+    context: str = "",
+    model: str = "gpt-4o-mini",
+    spread_types: set[str] | None = None,
+    modifier_category_keywords: dict[str, str] | None = None,
+    modifier_item_keywords: dict[str, str] | None = None,
+    ingredient_to_items: dict[str, list[dict]] | None = None,
+) -> OpenInputResponse:
+    """
+    Async version of parse_open_input.
+
+    The deterministic stage runs inline, or in a worker thread while the
+    LLM request is in flight when the input is likely to need it.
+    """
+    async def extract_segments(result: OpenInputResponse, unresolved: list[UnresolvedSegment]) -> OpenInputResponse:
+        extraction = await _complete_async(
+            _segment_extraction_prompt(unresolved),
+            SegmentExtractionResponse,
+            model,
+            system=pattern_registry.get("segment_extraction_system_prompt"),
+        )
+        return _merge_segment_items(result, unresolved, extraction)
+
+    return await run_speculative_async(
+        user_input,
+        lambda: _open_input_deterministic_stage(
+            user_input,
+            extract_segments,
+            spread_types=spread_types,
+            modifier_category_keywords=modifier_category_keywords,
+            modifier_item_keywords=modifier_item_keywords,
+            ingredient_to_items=ingredient_to_items,
+        ),
+        lambda: _complete_async(
+            _open_input_prompt(user_input, context),
+            OpenInputResponse,
+            model,
+            system=pattern_registry.get("open_input_system_prompt"),
+        ),
+    )
+
+
+def _delivery_choice_prompt(user_input: str) -> str:
+    return f"""We asked the user if their order is for pickup or delivery.
 The user said: "{user_input}"
 
 Examples:
@@ -649,18 +1046,21 @@ Examples:
 - "delivery to 123 Main St" -> choice: "delivery", address: "123 Main St"
 """
 
-    return client.chat.completions.create(
-        model=model,
-        response_model=DeliveryChoiceResponse,
-        messages=[{"role": "user", "content": prompt}],
-    )
 
+@fast_path("delivery_choice", resolve_delivery_choice)
+def parse_delivery_choice(user_input: str, model: str = "gpt-4o-mini") -> DeliveryChoiceResponse:
+    """Parse user input when waiting for pickup/delivery choice."""
+    return _complete(_delivery_choice_prompt(user_input), DeliveryChoiceResponse, model, cache=False)
+
+
+@fast_path("delivery_choice", resolve_delivery_choice)
+async def parse_delivery_choice_async(user_input: str, model: str = "gpt-4o-mini") -> DeliveryChoiceResponse:
+    """Async version of parse_delivery_choice."""
+    return await _complete_async(_delivery_choice_prompt(user_input), DeliveryChoiceResponse, model, cache=False)
 
-def parse_name(user_input: str, model: str = "gpt-4o-mini") -> NameResponse:
-    """Parse user input when waiting for name."""
-    client = get_instructor_client()
 
-    prompt = f"""We asked the user for their name for the order.
+def _name_prompt(user_input: str) -> str:
+    return f"""We asked the user for their name for the order.
 The user said: "{user_input}"
 
 Extract just the name. Examples:
@@ -669,18 +1069,21 @@ Extract just the name. Examples:
 - "My name is Mike" -> name: "Mike"
 """
 
-    return client.chat.completions.create(
-        model=model,
-        response_model=NameResponse,
-        messages=[{"role": "user", "content": prompt}],
-    )
 
+@fast_path("name", resolve_name)
+def parse_name(user_input: str, model: str = "gpt-4o-mini") -> NameResponse:
+    """Parse user input when waiting for name."""
+    return _complete(_name_prompt(user_input), NameResponse, model, cache=False)
 
-def parse_confirmation(user_input: str, model: str = "gpt-4o-mini") -> ConfirmationResponse:
-    """Parse user input when waiting for order confirmation."""
-    client = get_instructor_client()
 
-    prompt = f"""We showed the user their order summary and asked if it looks right.
+@fast_path("name", resolve_name)
+async def parse_name_async(user_input: str, model: str = "gpt-4o-mini") -> NameResponse:
+    """Async version of parse_name."""
+    return await _complete_async(_name_prompt(user_input), NameResponse, model, cache=False)
+
+
+def _confirmation_prompt(user_input: str) -> str:
+    return f"""We showed the user their order summary and asked if it looks right.
 The user said: "{user_input}"
 
 Examples:
@@ -688,18 +1091,23 @@ Examples:
 - "no" / "wait" / "change" / "actually" -> wants_changes: true
 """
 
-    return client.chat.completions.create(
-        model=model,
-        response_model=ConfirmationResponse,
-        messages=[{"role": "user", "content": prompt}],
-    )
+
+@fast_path("confirmation", resolve_confirmation)
+@memoize_parser("confirmation")
+def parse_confirmation(user_input: str, model: str = "gpt-4o-mini") -> ConfirmationResponse:
+    """Parse user input when waiting for order confirmation."""
+    return _complete(_confirmation_prompt(user_input), ConfirmationResponse, model)
 
 
-def parse_payment_method(user_input: str, model: str = "gpt-4o-mini") -> PaymentMethodResponse:
-    """Parse user input when asking how to send order details."""
-    client = get_instructor_client()
+@fast_path("confirmation", resolve_confirmation)
+@memoize_parser("confirmation")
+async def parse_confirmation_async(user_input: str, model: str = "gpt-4o-mini") -> ConfirmationResponse:
+    """Async version of parse_confirmation."""
+    return await _complete_async(_confirmation_prompt(user_input), ConfirmationResponse, model)
 
-    prompt = f"""We asked the user for a phone number or email to send the order confirmation.
+
+def _payment_method_prompt(user_input: str) -> str:
+    return f"""We asked the user for a phone number or email to send the order confirmation.
 The user said: "{user_input}"
 
 Examples:
@@ -711,18 +1119,21 @@ Examples:
 - "john@example.com" -> choice: "email", email_address: "john@example.com"
 """
 
-    return client.chat.completions.create(
-        model=model,
-        response_model=PaymentMethodResponse,
-        messages=[{"role": "user", "content": prompt}],
-    )
+
+@fast_path("payment_method", resolve_payment_method)
+def parse_payment_method(user_input: str, model: str = "gpt-4o-mini") -> PaymentMethodResponse:
+    """Parse user input when asking how to send order details."""
+    return _complete(_payment_method_prompt(user_input), PaymentMethodResponse, model, cache=False)
 
 
-def parse_email(user_input: str, model: str = "gpt-4o-mini") -> EmailResponse:
-    """Parse user input when collecting email address."""
-    client = get_instructor_client()
+@fast_path("payment_method", resolve_payment_method)
+async def parse_payment_method_async(user_input: str, model: str = "gpt-4o-mini") -> PaymentMethodResponse:
+    """Async version of parse_payment_method."""
+    return await _complete_async(_payment_method_prompt(user_input), PaymentMethodResponse, model, cache=False)
 
-    prompt = f"""We asked the user for their email address.
+
+def _email_prompt(user_input: str) -> str:
+    return f"""We asked the user for their email address.
 The user said: "{user_input}"
 
 Extract the email address from their response.
@@ -732,18 +1143,21 @@ Examples:
 - "my email is test.user@company.org" -> email: "test.user@company.org"
 """
 
-    return client.chat.completions.create(
-        model=model,
-        response_model=EmailResponse,
-        messages=[{"role": "user", "content": prompt}],
-    )
+
+@fast_path("email", resolve_email)
+def parse_email(user_input: str, model: str = "gpt-4o-mini") -> EmailResponse:
+    """Parse user input when collecting email address."""
+    return _complete(_email_prompt(user_input), EmailResponse, model, cache=False)
 
 
-def parse_phone(user_input: str, model: str = "gpt-4o-mini") -> PhoneResponse:
-    """Parse user input when collecting phone number."""
-    client = get_instructor_client()
+@fast_path("email", resolve_email)
+async def parse_email_async(user_input: str, model: str = "gpt-4o-mini") -> EmailResponse:
+    """Async version of parse_email."""
+    return await _complete_async(_email_prompt(user_input), EmailResponse, model, cache=False)
 
-    prompt = f"""We asked the user for their phone number to text order confirmation.
+
+def _phone_prompt(user_input: str) -> str:
+    return f"""We asked the user for their phone number to text order confirmation.
 The user said: "{user_input}"
 
 Extract the phone number from their response. Return just the digits (10 digits for US numbers).
@@ -754,8 +1168,14 @@ Examples:
 - "my number is 201.555.0000" -> phone: "2015550000"
 """
 
-    return client.chat.completions.create(
-        model=model,
-        response_model=PhoneResponse,
-        messages=[{"role": "user", "content": prompt}],
-    )
+
+@fast_path("phone", resolve_phone)
+def parse_phone(user_input: str, model: str = "gpt-4o-mini") -> PhoneResponse:
+    """Parse user input when collecting phone number."""
+    return _complete(_phone_prompt(user_input), PhoneResponse, model, cache=False)
+
+
+@fast_path("phone", resolve_phone)
+async def parse_phone_async(user_input: str, model: str = "gpt-4o-mini") -> PhoneResponse:
+    """Async version of parse_phone."""
+    return await _complete_async(_phone_prompt(user_input), PhoneResponse, model, cache=False)
@@ -0,0 +1,114 @@
+"""
+Per-Turn Parse Budget.
+
+Deterministic parsing normally takes well under a millisecond, but one
+garbled speech-to-text message can run every sub-parser against a long,
+repetitive input. A single regex search cannot be interrupted, so the
+parsers bound each one by input length (DETERMINISTIC_PARSE_MAX_CHARS) and
+bound the whole turn with a budget checked between steps.
+
+A ``ParseBudget`` holds the wall-clock time left for deterministic parsing
+in one turn. ``TurnParseContext`` activates its budget around every parser
+it runs, so all parses of a message share it; outside a turn each top-level
+parse gets a fresh budget. ``parse_deadline`` spends from the active budget
+while its block runs, and ``check_parse_deadline`` raises
+``ParseDeadlineExceeded`` once it is used up, which the parser catches to
+fall back to the LLM.
+
+Usage:
+    with parse_deadline():
+        for name, parser in sub_parsers:
+            check_parse_deadline(name)
+            ...
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from sandwich_bot.config import PARSE_DEADLINE_MS
+
+
+class ParseDeadlineExceeded(Exception):
+    """Raised when deterministic parsing runs past the turn's budget."""
+
+    def __init__(self, stage: str, budget: "ParseBudget"):
+        super().__init__(f"parse budget of {budget.seconds * 1000:.0f} ms exhausted before {stage}")
+        self.stage = stage
+
+
+class ParseBudget:
+    """
+    Wall-clock time left for deterministic parsing in one turn.
+
+    Attributes:
+        seconds: The full budget (0 disables the deadline)
+        remaining: Time not yet spent by parse_deadline blocks
+        exceeded: Whether a parse ran out of budget
+    """
+
+    def __init__(self, seconds: float | None = None):
+        self.seconds = PARSE_DEADLINE_MS / 1000 if seconds is None else seconds
+        self.remaining = self.seconds
+        self.exceeded = False
+        # Absolute deadline while a parse_deadline block is running
+        self._deadline: float | None = None
+
+    def __repr__(self) -> str:
+        return f"ParseBudget(remaining={self.remaining * 1000:.1f}ms of {self.seconds * 1000:.0f}ms)"
+
+
+_active_budget: ContextVar[ParseBudget | None] = ContextVar("parse_budget", default=None)
+
+
+@contextmanager
+def use_parse_budget(budget: ParseBudget) -> Iterator[ParseBudget]:
+    """Make a budget the one parse_deadline spends from inside the block."""
+    token = _active_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _active_budget.reset(token)
+
+
+@contextmanager
+def parse_deadline() -> Iterator[ParseBudget]:
+    """
+    Spend from the active budget while the block runs.
+
+    Nested blocks (a parser re-entering itself on part of the input) share
+    the outer block's deadline. Without an active budget the block gets a
+    fresh one of PARSE_DEADLINE_MS.
+    """
+    budget = _active_budget.get()
+    if budget is None:
+        with use_parse_budget(ParseBudget()) as budget, parse_deadline():
+            yield budget
+        return
+    if budget._deadline is not None or not budget.seconds:
+        yield budget
+        return
+
+    start = time.monotonic()
+    budget._deadline = start + budget.remaining
+    try:
+        yield budget
+    finally:
+        budget._deadline = None
+        budget.remaining = max(0.0, budget.remaining - (time.monotonic() - start))
+
+
+def check_parse_deadline(stage: str) -> None:
+    """
+    Raise ParseDeadlineExceeded if the running parse is out of budget.
+
+    Args:
+        stage: Name of the step about to run, for the log message
+    """
+    budget = _active_budget.get()
+    if budget is None or budget._deadline is None:
+        return
+    if time.monotonic() >= budget._deadline:
+        budget.exceeded = True
+        raise ParseDeadlineExceeded(stage, budget)
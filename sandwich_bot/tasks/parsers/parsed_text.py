@@ -0,0 +1,269 @@
+"""
+Shared Tokenized View of a User Message.
+
+Every deterministic sub-parser and several handlers start by re-deriving the
+same things from the raw input: ``.lower().strip()``, filler-word stripping,
+number words and "is there a bagel / ' with ' / ' and ' in here" scans.
+``ParsedText`` computes these once per message and the parsers consume it.
+
+``get_parsed_text()`` returns the instance the turn's TurnParseContext
+holds for the exact string (see parse_context.py), so every parser that is
+handed the same text during a turn shares one instance without changing
+parser signatures, and nothing outlives the turn. Instances are never
+mutated after construction; lazily computed views are cached on first
+access.
+
+Usage:
+    from sandwich_bot.tasks.parsers.parsed_text import get_parsed_text
+
+    parsed = get_parsed_text("Um, two plain bagels and a coffee")
+    parsed.lower              # "um, two plain bagels and a coffee"
+    parsed.has_bagel          # True
+    parsed.numbers            # [NumberToken(Token("two", 4, 7), 2)]
+    parsed.filler_stripped.lower  # "two plain bagels and a coffee"
+"""
+
+import re
+from functools import cached_property
+from typing import Iterable, NamedTuple
+
+from sandwich_bot.phrase_matcher import PhraseMatch, PhraseMatcher
+from .constants import WORD_TO_NUM
+
+
+# =============================================================================
+# Filler Words
+# =============================================================================
+
+# Filler words pattern - words that add no meaning and should be stripped before parsing
+# e.g., "actually, make it two" -> "make it two"
+# Note: "actually" is only stripped when followed by comma (filler), not when followed directly
+# by an item name (e.g., "actually coke" means replacement, not filler + new order)
+FILLER_WORDS_PATTERN = re.compile(
+    r"^(?:"
+    r"actually,\s*"  # "actually," with comma is filler
+    r"|actually\s+(?=cancel|remove|forget|nevermind|never\s+mind|scratch|take\s+off)"  # "actually cancel/remove" etc.
+    r"|oh[,\s]+"     # "oh" is always filler
+    r"|wait,\s*"     # "wait," with comma is filler
+    r"|um+[,\s]+"    # "um" is always filler
+    r"|uh+[,\s]+"    # "uh" is always filler
+    r"|hmm+[,\s]+"   # "hmm" is always filler
+    r"|well[,\s]+"   # "well" is always filler
+    r"|so[,\s]+"     # "so" is always filler
+    r"|ok(?:ay)?[,\s]+"  # "ok/okay" is always filler
+    r"|hey[,\s]+"    # "hey" is always filler
+    r"|like[,\s]+"   # "like" is always filler
+    r"|sorry[,\s]+"  # "sorry" is filler (e.g., "sorry, I meant plain bagel")
+    r")",
+    re.IGNORECASE
+)
+
+
+def strip_filler_words(text: str) -> str:
+    """
+    Remove common filler words from the start of user input.
+
+    These words add no semantic meaning and can confuse parsing.
+    e.g., "actually, make it two" -> "make it two"
+    """
+    result = text
+    # Keep stripping filler words until none remain at the start
+    while True:
+        match = FILLER_WORDS_PATTERN.match(result)
+        if match:
+            result = result[match.end():].strip()
+        else:
+            break
+    return result
+
+
+# =============================================================================
+# List Separators
+# =============================================================================
+
+# Separators between items of a list: ", and " first so it is taken whole.
+# A bare "," only splits a list that already has another separator.
+_LIST_SEPARATOR_PATTERN = re.compile(r", and |, | and |,")
+
+
+# =============================================================================
+# ParsedText
+# =============================================================================
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+class Token(NamedTuple):
+    """A word in the lowercased text with its character offsets."""
+
+    text: str
+    start: int
+    end: int
+
+
+class NumberToken(NamedTuple):
+    """A quantity word or digit run and its value."""
+
+    token: Token
+    value: int
+
+
+# Single-word quantities; "a"/"an" are left out since they are mostly articles
+_NUMBER_WORDS = {
+    word: value for word, value in WORD_TO_NUM.items()
+    if " " not in word and word not in ("a", "an")
+}
+
+
+class ParsedText:
+    """
+    Normalized views of one user message.
+
+    Attributes:
+        raw: The text exactly as given
+        text: The text with surrounding whitespace removed
+        lower: ``text`` lowercased; token offsets refer to this string
+    """
+
+    def __init__(self, raw: str):
+        self.raw = raw
+        self.text = raw.strip()
+        self.lower = self.text.lower()
+        # id(matcher) -> (matcher, matches); the matcher is kept so its id stays valid
+        self._item_phrases: dict[int, tuple[PhraseMatcher, list[PhraseMatch]]] = {}
+
+    def __repr__(self) -> str:
+        return f"ParsedText({self.raw!r})"
+
+    @cached_property
+    def tokens(self) -> tuple[Token, ...]:
+        """Word tokens (``\\w+`` runs, so they agree with regex ``\\b``)."""
+        return tuple(
+            Token(m.group(0), m.start(), m.end())
+            for m in _TOKEN_PATTERN.finditer(self.lower)
+        )
+
+    @cached_property
+    def words(self) -> frozenset[str]:
+        """Distinct word tokens, for O(1) keyword checks."""
+        return frozenset(token.text for token in self.tokens)
+
+    @cached_property
+    def numbers(self) -> tuple[NumberToken, ...]:
+        """Quantity words ("two", "dozen") and digit runs, in reading order."""
+        numbers = []
+        for token in self.tokens:
+            if token.text.isdigit():
+                numbers.append(NumberToken(token, int(token.text)))
+            elif token.text in _NUMBER_WORDS:
+                numbers.append(NumberToken(token, _NUMBER_WORDS[token.text]))
+        return tuple(numbers)
+
+    @property
+    def leading_quantity(self) -> int | None:
+        """Quantity given by the first word, e.g. 3 for "three plain bagels"."""
+        numbers = self.numbers
+        if numbers and numbers[0].token.start == 0:
+            return numbers[0].value
+        return None
+
+    @cached_property
+    def filler_stripped(self) -> "ParsedText":
+        """This message with leading filler words ("um,", "actually,") removed."""
+        stripped = strip_filler_words(self.text)
+        if stripped == self.text:
+            return self
+        return get_parsed_text(stripped)
+
+    def item_phrases(self, matcher: PhraseMatcher) -> list[PhraseMatch]:
+        """
+        Every phrase of a phrase matcher found in ``lower``.
+
+        Scans are kept per matcher, so parsers sharing this instance scan
+        once per matcher and menu version.
+        """
+        cached = self._item_phrases.get(id(matcher))
+        if cached is None or cached[0] is not matcher:
+            cached = (matcher, matcher.find_all(self.lower))
+            self._item_phrases[id(matcher)] = cached
+        return cached[1]
+
+    def single_item_spans(self, matcher: PhraseMatcher) -> list[tuple[int, int]]:
+        """Spans of names like "bacon egg and cheese" whose "and" joins one item."""
+        return [
+            (match.start, match.end)
+            for match in self.item_phrases(matcher)
+            if match.category == "single_item"
+        ]
+
+    def list_separators(self, protected: Iterable[tuple[int, int]] = ()) -> list[tuple[int, int]]:
+        """
+        Spans of ", and ", ", ", " and " and "," outside the protected spans.
+
+        Args:
+            protected: Spans (e.g. from single_item_spans) whose separators
+                       do not separate items
+        """
+        occupied = bytearray(len(self.lower) + 1)
+        for start, end in protected:
+            occupied[start:end] = b"\x01" * (end - start)
+        return [
+            match.span()
+            for match in _LIST_SEPARATOR_PATTERN.finditer(self.lower)
+            if not any(occupied[match.start():match.end()])
+        ]
+
+    def has_list_separator_outside(self, protected: Iterable[tuple[int, int]]) -> bool:
+        """Whether " and " or ", " appears outside the protected spans."""
+        return any(end - start > 1 for start, end in self.list_separators(protected))
+
+    def split_list(self, protected: Iterable[tuple[int, int]] = ()) -> list[str]:
+        """
+        Split ``lower`` at list separators outside the protected spans.
+
+        e.g. "bacon egg and cheese and a coffee" -> ["bacon egg and cheese", "a coffee"]
+        when "bacon egg and cheese" is protected. Empty parts are dropped.
+        """
+        parts = []
+        position = 0
+        for start, end in self.list_separators(protected):
+            parts.append(self.lower[position:start])
+            position = end
+        parts.append(self.lower[position:])
+        return [part.strip() for part in parts if part.strip()]
+
+    def has_word(self, *words: str) -> bool:
+        """Check whether any of the given words is a token of the message."""
+        return not self.words.isdisjoint(words)
+
+    @cached_property
+    def has_bagel(self) -> bool:
+        """Whether "bagel" or "bagels" appears as a word."""
+        return self.has_word("bagel", "bagels")
+
+    @cached_property
+    def has_with(self) -> bool:
+        return " with " in self.lower
+
+    @cached_property
+    def has_and(self) -> bool:
+        return " and " in self.lower
+
+    @cached_property
+    def has_list_separator(self) -> bool:
+        """Whether the message has " and " or ", " between parts."""
+        return self.has_and or ", " in self.lower
+
+
+def get_parsed_text(text: str) -> ParsedText:
+    """
+    Get the shared ParsedText for a message.
+
+    Parsers handed the same string during a turn get the same instance, so
+    tokenization and the derived views are computed once. Outside a turn
+    a new instance is built every time.
+    """
+    # Imported here: the parse context module imports the parsers package
+    from ..parse_context import get_parse_context
+
+    return get_parse_context().parsed_text(text)
@@ -0,0 +1,202 @@
+"""
+Worst-Case Regex Benchmark for the Parser Stack.
+
+Chat messages may be up to MAX_MESSAGE_LENGTH characters, and garbled
+speech-to-text output is full of repeated words and long whitespace runs.
+Patterns that combine lazy ``.+?`` captures with ``\\s+`` runs and optional
+trailers can backtrack polynomially on such input, pinning a worker for
+seconds on a single message.
+
+This module collects every compiled pattern the deterministic parsers use
+(module-level patterns in ``parsers/constants.py`` and
+``parsers/deterministic.py``, including lists and tuples of patterns, plus
+the menu-driven patterns in the pattern registry), runs each against a set
+of adversarial inputs and reports the slowest.
+
+The adversarial inputs are built for each pattern from the words in its
+own source, since backtracking blows up when the engine keeps almost
+matching: long runs of one trigger word, a trigger word followed by a
+whitespace run, and the generic whitespace, separator and digit runs.
+
+Usage:
+    python -m sandwich_bot.tasks.parsers.pattern_bench --length 2000 --top 15
+
+    from sandwich_bot.tasks.parsers.pattern_bench import benchmark_patterns
+    slowest = benchmark_patterns(length=2000)[0]
+"""
+
+import argparse
+import re
+import time
+from types import ModuleType
+from typing import Iterator, NamedTuple
+
+from sandwich_bot.config import MAX_MESSAGE_LENGTH
+from sandwich_bot.pattern_registry import pattern_registry
+
+from . import constants, deterministic
+
+# Literal words in a pattern's source, used to build near-miss inputs
+_PATTERN_WORD = re.compile(r"(?<![\\(?])\b[a-z][a-z']+\b")
+
+# Regex syntax that reads as words in a pattern's source
+_SYNTAX_WORDS = frozenset({"s", "w", "d", "b", "ed", "es"})
+
+# How many of a pattern's literal words to build inputs from
+MAX_WORDS_PER_PATTERN = 24
+
+
+class PatternTiming(NamedTuple):
+    """Worst search time of one pattern over the adversarial inputs."""
+
+    name: str
+    seconds: float
+    input_kind: str
+
+
+def _patterns_in(value: object) -> Iterator[tuple[str, re.Pattern]]:
+    """Yield patterns in a value: a pattern, or a list/tuple/dict holding them."""
+    if isinstance(value, re.Pattern):
+        yield "", value
+    elif isinstance(value, (list, tuple)):
+        for i, item in enumerate(value):
+            for suffix, pattern in _patterns_in(item):
+                yield f"[{i}]{suffix}", pattern
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            for suffix, pattern in _patterns_in(item):
+                yield f"[{key!r}]{suffix}", pattern
+
+
+def collect_patterns(*modules: ModuleType) -> list[tuple[str, re.Pattern]]:
+    """
+    Collect the compiled patterns a set of parser modules use.
+
+    Args:
+        modules: Modules to scan; defaults to parsers.constants and
+                 parsers.deterministic. Registry patterns whose builders
+                 can run (menu loaded, or built from defaults) are added.
+
+    Returns:
+        (name, pattern) pairs, e.g. ("deterministic.BY_POUND_PATTERN", ...)
+        or ("constants.PRICE_INQUIRY_PATTERNS[2]", ...).
+    """
+    modules = modules or (constants, deterministic)
+    seen: set[int] = set()
+    patterns: list[tuple[str, re.Pattern]] = []
+
+    def add(name: str, value: object) -> None:
+        for suffix, pattern in _patterns_in(value):
+            if id(pattern) not in seen:
+                seen.add(id(pattern))
+                patterns.append((name + suffix, pattern))
+
+    for module in modules:
+        module_name = module.__name__.rsplit(".", 1)[-1]
+        for name, value in vars(module).items():
+            if name.isupper():
+                add(f"{module_name}.{name}", value)
+    for name in pattern_registry.names():
+        try:
+            add(f"registry.{name}", pattern_registry.get(name))
+        except Exception:
+            # Some builders need menu data loaded from the database
+            continue
+    return patterns
+
+
+def adversarial_inputs(pattern: re.Pattern, length: int = MAX_MESSAGE_LENGTH) -> Iterator[tuple[str, str]]:
+    """
+    Generate inputs likely to make a pattern backtrack.
+
+    Args:
+        pattern: The pattern to attack
+        length: Length of each input (e.g. MAX_MESSAGE_LENGTH)
+
+    Yields:
+        (kind, text) pairs; kind names the shape for reporting.
+    """
+    def fill(unit: str, prefix: str = "", suffix: str = "!") -> str:
+        body = (unit * (length // max(len(unit), 1) + 1))[: max(length - len(prefix) - len(suffix), 0)]
+        return prefix + body + suffix
+
+    yield "whitespace", fill(" ", "a")
+    yield "letters", fill("a")
+    yield "digits", fill("1")
+    yield "separators", fill("a, and ")
+    yield "with", fill("with ")
+
+    words = []
+    for word in _PATTERN_WORD.findall(pattern.pattern.lower()):
+        if word not in _SYNTAX_WORDS and word not in words:
+            words.append(word)
+    words = words[:MAX_WORDS_PER_PATTERN]
+    if words:
+        yield "all words", fill(" ".join(words) + " ")
+    for word in words:
+        yield f"{word!r} run", fill(word + " ")
+        yield f"{word!r} then whitespace", fill(" ", word + " ", "x")
+
+
+def time_pattern(pattern: re.Pattern, length: int = MAX_MESSAGE_LENGTH) -> tuple[float, str]:
+    """
+    Time a pattern's worst search over its adversarial inputs.
+
+    search() is used for every pattern: for anchored patterns it costs the
+    same as match(), and unanchored patterns are searched in practice.
+
+    Returns:
+        (worst seconds, kind of the worst input)
+    """
+    worst, worst_kind = 0.0, ""
+    for kind, text in adversarial_inputs(pattern, length):
+        start = time.perf_counter()
+        pattern.search(text)
+        elapsed = time.perf_counter() - start
+        if elapsed > worst:
+            worst, worst_kind = elapsed, kind
+    return worst, worst_kind
+
+
+def benchmark_patterns(
+    patterns: list[tuple[str, re.Pattern]] | None = None,
+    length: int = MAX_MESSAGE_LENGTH,
+) -> list[PatternTiming]:
+    """
+    Benchmark patterns against adversarial inputs.
+
+    Args:
+        patterns: (name, pattern) pairs; defaults to collect_patterns()
+        length: Input length, defaulting to MAX_MESSAGE_LENGTH
+
+    Returns:
+        Timings sorted slowest first.
+    """
+    if patterns is None:
+        patterns = collect_patterns()
+    timings = [PatternTiming(name, *time_pattern(pattern, length)) for name, pattern in patterns]
+    timings.sort(key=lambda timing: timing.seconds, reverse=True)
+    return timings
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Print the slowest patterns; exit 1 if any exceeds --max-ms."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--length", type=int, default=MAX_MESSAGE_LENGTH, help="input length in characters")
+    parser.add_argument("--top", type=int, default=15, help="number of patterns to show")
+    parser.add_argument("--max-ms", type=float, default=None, help="fail if any pattern is slower")
+    args = parser.parse_args(argv)
+
+    patterns = collect_patterns()
+    timings = benchmark_patterns(patterns, args.length)
+    print(f"{len(patterns)} patterns, {args.length}-character inputs")
+    for timing in timings[: args.top]:
+        print(f"{timing.seconds * 1000:10.2f} ms  {timing.name}  ({timing.input_kind})")
+
+    if args.max_ms is not None and timings and timings[0].seconds * 1000 > args.max_ms:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
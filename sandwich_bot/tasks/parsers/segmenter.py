@@ -0,0 +1,216 @@
+"""
+Multi-Item Order Segmenter.
+
+``_parse_multi_item_order`` used to split a message at every " and " and
+",", then re-scan the pieces with keyword lists to undo splits that cut a
+modifier off its item ("latte with oat milk and 2 sugars", "plain bagel,
+butter, not toasted"). The segmenter does both in one left-to-right pass
+over spans tagged from the menu-cache phrase matchers:
+
+    head       menu items, sides, signature names, drinks, bagel types,
+               generic food nouns ("bagel", "muffin")
+    modifier   spreads, proteins, cheeses, toppings, qualifiers, milks,
+               sweeteners and syrups
+    quantity   number words and digits ("two", "dozen", "2")
+    separator  ", and ", ", ", " and ", "," outside any tagged phrase
+
+A separator only starts a new segment when the text after it is more than
+modifiers for the item before it, so each segment holds one item. Cost is
+two automaton scans plus one regex scan of the message, so it grows with
+the message length rather than with the number of separators.
+
+Usage:
+    from sandwich_bot.tasks.parsers.segmenter import segment_order
+
+    segment_order(parsed, item_matcher, modifier_matcher)
+    # "two everything bagels with lox, a large iced oat latte and a dozen plain"
+    # -> ["two everything bagels with lox", "a large iced oat latte", "a dozen plain"]
+"""
+
+from bisect import bisect_left
+from typing import NamedTuple
+
+from sandwich_bot.phrase_matcher import PhraseMatch, PhraseMatcher
+
+from .parsed_text import ParsedText
+
+
+# Categories that name an item (a segment holding one of these is never
+# folded into the previous one)
+HEAD_CATEGORIES = frozenset({"single_item", "item_head", "drink", "bagel_type"})
+
+# Categories that may continue the previous segment, by that segment's kind
+FOOD_MODIFIER_CATEGORIES = frozenset({
+    "bagel_modifier", "spread", "protein", "cheese", "topping", "qualifier",
+})
+DRINK_MODIFIER_CATEGORIES = frozenset({"coffee_modifier"})
+
+# Untagged words that may appear in a modifier-only segment
+ATTACHMENT_WORDS = frozenset({
+    "a", "an", "the", "some", "with", "and", "of", "on", "in", "to", "it",
+    "extra", "light", "lightly", "little", "bit", "no", "not", "just", "also",
+    "toasted", "untoasted", "scooped", "please", "thanks", "thank", "you",
+    "splash", "shots", "pump", "pumps",
+})
+
+
+class Tag(NamedTuple):
+    """A claimed phrase span and every category the phrase belongs to."""
+
+    start: int
+    end: int
+    phrase: str
+    categories: frozenset[str]
+
+
+class Segment(NamedTuple):
+    """One item's span of the message, with the tags inside it."""
+
+    text: str
+    start: int
+    end: int
+    tags: tuple[Tag, ...]
+
+    def has_category(self, *categories: str) -> bool:
+        """Whether any tag in the segment belongs to one of the categories."""
+        return any(not tag.categories.isdisjoint(categories) for tag in self.tags)
+
+    @property
+    def is_drink(self) -> bool:
+        """Whether the segment's item is a drink rather than food."""
+        return self.has_category("drink") and not self.has_category(
+            "single_item", "item_head", "bagel_type"
+        )
+
+
+def tag_message(
+    parsed: ParsedText,
+    item_matcher: PhraseMatcher,
+    modifier_matcher: PhraseMatcher | None = None,
+) -> list[Tag]:
+    """
+    Tag the phrases of a message, longest span first.
+
+    Overlapping phrases are resolved by length ("oat milk" beats "milk",
+    "coffee cake" beats "coffee"), then position. A span matched under
+    several categories keeps all of them, so callers decide which reading
+    applies in context ("milk" as a drink or as a latte's milk).
+
+    Args:
+        parsed: The message
+        item_matcher: Matcher from MenuDataCache.get_item_phrase_matcher
+        modifier_matcher: Matcher from MenuDataCache.get_modifier_matcher,
+                          or None before the menu is loaded
+
+    Returns:
+        Tags in reading order.
+    """
+    matches: list[PhraseMatch] = list(parsed.item_phrases(item_matcher))
+    if modifier_matcher is not None:
+        matches.extend(modifier_matcher.find_all(parsed.lower))
+
+    categories_by_span: dict[tuple[int, int], set[str]] = {}
+    for match in matches:
+        categories_by_span.setdefault((match.start, match.end), set()).add(match.category)
+
+    claimed = bytearray(len(parsed.lower) + 1)
+    tags = []
+    for start, end in sorted(categories_by_span, key=lambda span: (span[0] - span[1], span[0])):
+        if any(claimed[start:end]):
+            continue
+        claimed[start:end] = b"\x01" * (end - start)
+        tags.append(Tag(
+            start, end, parsed.lower[start:end], frozenset(categories_by_span[(start, end)]),
+        ))
+    tags.sort()
+    return tags
+
+
+def _continues(
+    parsed: ParsedText,
+    start: int,
+    end: int,
+    tags: list[Tag],
+    previous: Segment,
+    numbers: frozenset[int],
+) -> bool:
+    """Whether ``parsed.lower[start:end]`` only adds modifiers to the previous item."""
+    allowed = DRINK_MODIFIER_CATEGORIES if previous.is_drink else FOOD_MODIFIER_CATEGORIES
+    for tag in tags:
+        if tag.categories & allowed and not tag.categories & (HEAD_CATEGORIES - {"drink"}):
+            continue
+        return False
+
+    # Every untagged word must be a quantity or filler
+    tokens = parsed.tokens
+    tag_index = 0
+    for i in range(bisect_left(tokens, start, key=lambda token: token.start), len(tokens)):
+        token = tokens[i]
+        if token.end > end:
+            break
+        while tag_index < len(tags) and tags[tag_index].end <= token.start:
+            tag_index += 1
+        if tag_index < len(tags) and tags[tag_index].start <= token.start:
+            continue
+        if token.start in numbers or token.text in ATTACHMENT_WORDS:
+            continue
+        return False
+    return True
+
+
+def segment_order(
+    parsed: ParsedText,
+    item_matcher: PhraseMatcher,
+    modifier_matcher: PhraseMatcher | None = None,
+) -> list[Segment]:
+    """
+    Split a message into one segment per ordered item.
+
+    Text after a separator that holds only modifiers, quantities and filler
+    words ("and 2 sugars", ", not toasted please") stays with the item before
+    it. Drinks only take milks, sweeteners and syrups; food only takes
+    spreads, proteins, cheeses, toppings and qualifiers.
+
+    Args:
+        parsed: The message
+        item_matcher: Matcher from MenuDataCache.get_item_phrase_matcher
+        modifier_matcher: Matcher from MenuDataCache.get_modifier_matcher,
+                          or None before the menu is loaded
+
+    Returns:
+        Segments in reading order; segment text is lowercased and stripped.
+    """
+    lower = parsed.lower
+    tags = tag_message(parsed, item_matcher, modifier_matcher)
+    separators = parsed.list_separators((tag.start, tag.end) for tag in tags)
+    numbers = frozenset(number.token.start for number in parsed.numbers)
+
+    segments: list[Segment] = []
+    tag_index = 0
+    position = 0
+    for start, end in [*separators, (len(lower), len(lower))]:
+        piece_tags = []
+        while tag_index < len(tags) and tags[tag_index].end <= start:
+            piece_tags.append(tags[tag_index])
+            tag_index += 1
+        piece_start, piece_end = position, start
+        position = end
+        if not lower[piece_start:piece_end].strip():
+            continue
+
+        if segments and _continues(
+            parsed, piece_start, piece_end, piece_tags, segments[-1], numbers,
+        ):
+            previous = segments[-1]
+            segments[-1] = Segment(
+                lower[previous.start:piece_end].strip(),
+                previous.start,
+                piece_end,
+                previous.tags + tuple(piece_tags),
+            )
+            continue
+
+        segments.append(Segment(
+            lower[piece_start:piece_end].strip(), piece_start, piece_end, tuple(piece_tags),
+        ))
+    return segments
@@ -0,0 +1,379 @@
+"""
+Speculative LLM Fallback for Open Input.
+
+``parse_open_input`` runs the multi-item and single-item deterministic
+parsers to completion before it falls back to the LLM, so every fallback
+pays for both in sequence. Some inputs are very likely to fall back: long
+messages, and messages with many words the menu vocabulary doesn't know
+("something for my kid, she likes whatever's sweet"). For those, the LLM
+request is started at the same time as deterministic parsing:
+
+- if the deterministic parsers succeed, their result is used and the
+  request is cancelled (async) or its result discarded (sync, where an
+  in-flight HTTP request cannot be interrupted)
+- otherwise the already running request is awaited, hiding the
+  deterministic parsing time
+
+The deterministic stage may also return a ``PartialResult``: most of the
+input parsed, plus a smaller LLM request that finishes the rest (the
+segments of a multi-item order no parser understood). Without speculation
+that request is made; with speculation, the full request already in flight
+is used instead, so neither way costs more than one LLM round trip.
+
+``predict_llm_fallback`` scores an input from 0 (surely deterministic) to 1
+(surely LLM) by word count and by how much of it the menu vocabulary
+covers. Inputs scoring at or above OPEN_INPUT_SPECULATION_THRESHOLD are
+speculated on. The stats record how much latency speculation hid and how
+many LLM calls it spent for nothing, so the threshold can be tuned.
+
+Usage:
+    return run_speculative(
+        user_input,
+        lambda: _try_open_input_deterministic(user_input),
+        lambda: _complete(prompt, OpenInputResponse, model),
+    )
+
+    get_speculation_stats()
+    # {"calls": 120, "speculated": 14, "hits": 11, "wasted": 3, "missed": 6,
+    #  "hidden_ms_total": 42.7, ...}
+"""
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, NamedTuple, TypeVar
+
+from sandwich_bot.config import (
+    OPEN_INPUT_SPECULATION_MAX_WORKERS,
+    OPEN_INPUT_SPECULATION_THRESHOLD,
+)
+from sandwich_bot.menu_data_cache import menu_cache
+from sandwich_bot.pattern_registry import pattern_registry
+from sandwich_bot.spell_corrector import COMMON_WORDS, ORDER_WORDS
+
+from .parsed_text import get_parsed_text
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+# =============================================================================
+# Prediction
+# =============================================================================
+
+# Words shorter than this are mostly articles, pronouns and quantities; they
+# say nothing about whether the parsers will understand the message
+_MIN_CONTENT_WORD_LENGTH = 4
+
+# Order words beyond the spell corrector's, none of which confuse the parsers
+_ORDER_WORDS = frozenset({
+    "delivery", "pound", "pounds", "half", "quarter", "dozen", "toasted",
+    "plain", "spread", "drink", "drinks", "juice", "soda", "sodas", "tea",
+    "hello", "hiya", "morning", "please", "thanks", "today", "also",
+})
+
+# Word count at which length alone contributes its full weight
+_LONG_INPUT_WORDS = 20
+
+# Unknown word count at which it contributes its full weight
+_MANY_UNKNOWN_WORDS = 3
+
+
+class PartialResult(NamedTuple):
+    """A deterministic result that needs one smaller LLM request to finish."""
+
+    result: Any
+    # Makes the request and returns the finished result (for
+    # run_speculative_async, returns an awaitable of it)
+    complete: Callable[[], Any]
+
+
+class FallbackPrediction(NamedTuple):
+    """How likely an input is to need the LLM, and why."""
+
+    score: float
+    words: int
+    unknown_words: int
+    coverage: float
+
+
+@pattern_registry.register("open_input_vocabulary")
+def _build_open_input_vocabulary() -> frozenset[str]:
+    phrases = [
+        *menu_cache.get_bagel_types(),
+        *menu_cache.get_spreads(),
+        *menu_cache.get_spread_types(),
+        *menu_cache.get_proteins(),
+        *menu_cache.get_cheeses(),
+        *menu_cache.get_toppings(),
+        *menu_cache.get_coffee_types(),
+        *menu_cache.get_soda_types(),
+        *menu_cache.get_beverage_milks(),
+        *menu_cache.get_beverage_sweeteners(),
+        *menu_cache.get_beverage_syrups(),
+        *menu_cache.get_known_menu_items(),
+        *menu_cache.get_signature_item_aliases(),
+        *menu_cache.get_side_items(),
+        *menu_cache.get_by_pound_aliases(),
+        *menu_cache.get_available_category_keywords(),
+    ]
+    words = {token.text for phrase in phrases for token in get_parsed_text(phrase).tokens}
+    return frozenset(words | ORDER_WORDS | COMMON_WORDS | _ORDER_WORDS)
+
+
+def _is_known(word: str, vocabulary: frozenset[str]) -> bool:
+    """Check a word, or the singular of a plural, against the vocabulary."""
+    if word in vocabulary:
+        return True
+    if word.endswith("es") and word[:-2] in vocabulary:
+        return True
+    return word.endswith("s") and word[:-1] in vocabulary
+
+
+def predict_llm_fallback(user_input: str) -> FallbackPrediction:
+    """
+    Score how likely open input is to fall back to the LLM.
+
+    Half of the score is the share of content words the menu vocabulary
+    doesn't know, 30% the number of unknown words and 20% the length.
+
+    Args:
+        user_input: The user's input string
+
+    Returns:
+        FallbackPrediction with a score from 0 to 1.
+    """
+    tokens = get_parsed_text(user_input).tokens
+    content = [
+        token.text for token in tokens
+        if len(token.text) >= _MIN_CONTENT_WORD_LENGTH and not token.text.isdigit()
+    ]
+    vocabulary = pattern_registry.get("open_input_vocabulary")
+    unknown = sum(1 for word in content if not _is_known(word, vocabulary))
+    coverage = 1 - unknown / len(content) if content else 1.0
+
+    score = (
+        0.5 * (1 - coverage)
+        + 0.3 * min(unknown / _MANY_UNKNOWN_WORDS, 1.0)
+        + 0.2 * min(len(tokens) / _LONG_INPUT_WORDS, 1.0)
+    )
+    return FallbackPrediction(round(score, 3), len(tokens), unknown, round(coverage, 3))
+
+
+# =============================================================================
+# Stats
+# =============================================================================
+
+class _SpeculationStats:
+    """Outcome counts and hidden latency of speculative fallbacks."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.speculated = 0
+        # Speculated and the LLM was needed: its latency overlapped parsing
+        self.hits = 0
+        # Speculated but the deterministic parsers succeeded: an extra call
+        self.wasted = 0
+        # Not speculated but the LLM was needed: parsing and LLM in sequence
+        self.missed = 0
+        self.hidden_seconds = 0.0
+
+    def record(self, speculated: bool, used_llm: bool, hidden_seconds: float = 0.0) -> None:
+        with self._lock:
+            self.calls += 1
+            if speculated:
+                self.speculated += 1
+                if used_llm:
+                    self.hits += 1
+                    self.hidden_seconds += hidden_seconds
+                else:
+                    self.wasted += 1
+            elif used_llm:
+                self.missed += 1
+
+
+_stats = _SpeculationStats()
+
+
+def get_speculation_stats() -> dict[str, Any]:
+    """
+    Get speculative fallback counts for open input.
+
+    Returns:
+        Dict with the threshold, "calls", "speculated", "hits" (speculated
+        and the LLM was needed), "wasted" (speculated but parsed
+        deterministically, i.e. extra LLM calls), "missed" (LLM needed but not
+        speculated), precision and recall of the prediction, the extra call
+        rate, and the total and average deterministic parsing time hidden
+        behind the LLM call.
+    """
+    s = _stats
+    needed = s.hits + s.missed
+    return {
+        "threshold": OPEN_INPUT_SPECULATION_THRESHOLD,
+        "calls": s.calls,
+        "speculated": s.speculated,
+        "hits": s.hits,
+        "wasted": s.wasted,
+        "missed": s.missed,
+        "precision": round(s.hits / s.speculated, 4) if s.speculated else 0.0,
+        "recall": round(s.hits / needed, 4) if needed else 0.0,
+        "extra_call_rate": round(s.wasted / s.calls, 4) if s.calls else 0.0,
+        "hidden_ms_total": round(s.hidden_seconds * 1000, 1),
+        "hidden_ms_avg": round(s.hidden_seconds * 1000 / s.hits, 2) if s.hits else 0.0,
+    }
+
+
+def reset_speculation_stats() -> None:
+    """Reset all speculation counts to zero."""
+    with _stats._lock:
+        _stats.reset()
+
+
+# =============================================================================
+# Running
+# =============================================================================
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Threads that run speculative sync LLM calls, created on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=OPEN_INPUT_SPECULATION_MAX_WORKERS,
+                thread_name_prefix="llm-speculation",
+            )
+        return _executor
+
+
+def _should_speculate(user_input: str, threshold: float | None) -> bool:
+    threshold = OPEN_INPUT_SPECULATION_THRESHOLD if threshold is None else threshold
+    prediction = predict_llm_fallback(user_input)
+    if prediction.score < threshold:
+        return False
+    logger.info(
+        "Speculating LLM fallback (score %.2f, %d unknown words): %s",
+        prediction.score, prediction.unknown_words, user_input[:50],
+    )
+    return True
+
+
+def _timed(fallback: Callable[[], T]) -> Callable[[], tuple[T, float]]:
+    def run() -> tuple[T, float]:
+        started = time.perf_counter()
+        return fallback(), time.perf_counter() - started
+    return run
+
+
+def run_speculative(
+    user_input: str,
+    deterministic: Callable[[], T | None],
+    fallback: Callable[[], T],
+    threshold: float | None = None,
+) -> T:
+    """
+    Parse deterministically, starting the LLM fallback early when it is likely needed.
+
+    Args:
+        user_input: The user's input string (used for the prediction)
+        deterministic: Returns the parsed result, a PartialResult, or None
+            to fall back
+        fallback: Runs the LLM parse
+        threshold: Prediction score to speculate at (default:
+            OPEN_INPUT_SPECULATION_THRESHOLD)
+    """
+    if not _should_speculate(user_input, threshold):
+        result = deterministic()
+        if isinstance(result, PartialResult):
+            _stats.record(speculated=False, used_llm=True)
+            return result.complete()
+        if result is not None:
+            _stats.record(speculated=False, used_llm=False)
+            return result
+        logger.info("Falling back to LLM for: %s", user_input[:50])
+        _stats.record(speculated=False, used_llm=True)
+        return fallback()
+
+    # The early call runs in the turn's context, so it keeps its LLM deadline
+    future: Future = _get_executor().submit(contextvars.copy_context().run, _timed(fallback))
+    started = time.perf_counter()
+    try:
+        result = deterministic()
+    except BaseException:
+        future.cancel()
+        raise
+    parse_seconds = time.perf_counter() - started
+
+    if result is not None and not isinstance(result, PartialResult):
+        # A request already in flight finishes in the background
+        future.cancel()
+        _stats.record(speculated=True, used_llm=False)
+        return result
+
+    logger.info("Falling back to LLM for: %s", user_input[:50])
+    response, llm_seconds = future.result()
+    _stats.record(speculated=True, used_llm=True, hidden_seconds=min(parse_seconds, llm_seconds))
+    return response
+
+
+async def run_speculative_async(
+    user_input: str,
+    deterministic: Callable[[], T | None],
+    fallback: Callable[[], Awaitable[T]],
+    threshold: float | None = None,
+) -> T:
+    """
+    Async version of run_speculative.
+
+    When speculating, deterministic parsing runs in a worker thread so the
+    event loop can send the LLM request meanwhile; a request that turns out
+    not to be needed is cancelled.
+    """
+    if not _should_speculate(user_input, threshold):
+        result = deterministic()
+        if isinstance(result, PartialResult):
+            _stats.record(speculated=False, used_llm=True)
+            return await result.complete()
+        if result is not None:
+            _stats.record(speculated=False, used_llm=False)
+            return result
+        logger.info("Falling back to LLM for: %s", user_input[:50])
+        _stats.record(speculated=False, used_llm=True)
+        return await fallback()
+
+    async def timed_fallback() -> tuple[T, float]:
+        started = time.perf_counter()
+        return await fallback(), time.perf_counter() - started
+
+    task = asyncio.create_task(timed_fallback())
+    # Retrieve the exception of a discarded request so it isn't logged as unhandled
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    started = time.perf_counter()
+    try:
+        result = await asyncio.to_thread(deterministic)
+    except BaseException:
+        task.cancel()
+        raise
+    parse_seconds = time.perf_counter() - started
+
+    if result is not None and not isinstance(result, PartialResult):
+        task.cancel()
+        _stats.record(speculated=True, used_llm=False)
+        return result
+
+    logger.info("Falling back to LLM for: %s", user_input[:50])
+    response, llm_seconds = await task
+    _stats.record(speculated=True, used_llm=True, hidden_seconds=min(parse_seconds, llm_seconds))
+    return response
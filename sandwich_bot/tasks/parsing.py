@@ -8,8 +8,10 @@ user messages into actionable order data.
 from typing import Any, Literal
 from pydantic import BaseModel, Field
 import instructor
-from openai import OpenAI
-import os
+
+from sandwich_bot.llm_breaker import llm_breaker
+from sandwich_bot.llm_clients import llm_clients
+from sandwich_bot.llm_usage import track_llm_call
 
 
 # =============================================================================
@@ -497,13 +499,8 @@ CRITICAL - CLARIFICATION RULES:
 # =============================================================================
 
 def create_instructor_client() -> instructor.Instructor:
-    """Create an instructor-wrapped OpenAI client."""
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY environment variable not set")
-
-    client = OpenAI(api_key=api_key)
-    return instructor.from_openai(client)
+    """Get the shared, pooled instructor-wrapped OpenAI client."""
+    return llm_clients.instructor()
 
 
 def parse_user_message(
@@ -539,16 +536,18 @@ def parse_user_message(
         context_str = "\n".join(f"- {k}: {v}" for k, v in context.items())
         user_prompt += f"\n\nCurrent order context:\n{context_str}"
 
-    # Parse with instructor
-    result = client.chat.completions.create(
-        model=model,
-        response_model=ParsedInput,
-        messages=[
-            {"role": "system", "content": PARSING_SYSTEM_PROMPT},
-            {"role": "user", "content": user_prompt},
-        ],
-        max_retries=2,
-    )
+    # Parse with instructor, recording the call's usage (see llm_usage.py)
+    with llm_breaker.guard("parse_user_message"), track_llm_call("parse_user_message", model) as call:
+        result = client.chat.completions.create(
+            model=model,
+            response_model=ParsedInput,
+            messages=[
+                {"role": "system", "content": PARSING_SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt},
+            ],
+            max_retries=2,
+            hooks=call.hooks(),
+        )
 
     return result
 
@@ -574,13 +573,7 @@ async def parse_user_message_async(
         ParsedInput with structured data extracted from the message
     """
     if client is None:
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY environment variable not set")
-
-        from openai import AsyncOpenAI
-        async_client = AsyncOpenAI(api_key=api_key)
-        client = instructor.from_openai(async_client)
+        client = llm_clients.async_instructor()
 
     # Build the user prompt with context
     user_prompt = f"User message: {message}"
@@ -592,15 +585,17 @@ async def parse_user_message_async(
         context_str = "\n".join(f"- {k}: {v}" for k, v in context.items())
         user_prompt += f"\n\nCurrent order context:\n{context_str}"
 
-    # Parse with instructor
-    result = await client.chat.completions.create(
-        model=model,
-        response_model=ParsedInput,
-        messages=[
-            {"role": "system", "content": PARSING_SYSTEM_PROMPT},
-            {"role": "user", "content": user_prompt},
-        ],
-        max_retries=2,
-    )
+    # Parse with instructor, recording the call's usage (see llm_usage.py)
+    with llm_breaker.guard("parse_user_message"), track_llm_call("parse_user_message", model) as call:
+        result = await client.chat.completions.create(
+            model=model,
+            response_model=ParsedInput,
+            messages=[
+                {"role": "system", "content": PARSING_SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt},
+            ],
+            max_retries=2,
+            hooks=call.hooks(),
+        )
 
     return result
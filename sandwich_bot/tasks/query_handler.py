@@ -12,6 +12,7 @@ import re
 from typing import TYPE_CHECKING
 
 from .schemas import OrderPhase
+from .turn_context import get_turn_context
 from .parsers.constants import (
     DEFAULT_PAGINATION_SIZE,
     get_by_pound_items,
@@ -75,7 +76,9 @@ class QueryHandler:
 
     @property
     def store_info(self) -> dict:
-        return self._store_info
+        """Get the current turn's store info (the one set here outside a turn)."""
+        context = get_turn_context()
+        return context.store_info if context is not None else self._store_info
 
     @store_info.setter
     def store_info(self, value: dict | None):
@@ -87,8 +90,8 @@ class QueryHandler:
 
     def handle_store_hours_inquiry(self, order: "OrderTask") -> StateMachineResult:
         """Handle inquiry about store hours."""
-        hours = self._store_info.get("hours")
-        store_name = self._store_info.get("name")
+        hours = self.store_info.get("hours")
+        store_name = self.store_info.get("name")
 
         if hours:
             if store_name:
@@ -110,11 +113,11 @@ class QueryHandler:
 
     def handle_store_location_inquiry(self, order: "OrderTask") -> StateMachineResult:
         """Handle inquiry about store location/address."""
-        address = self._store_info.get("address")
-        city = self._store_info.get("city")
-        state = self._store_info.get("state")
-        zip_code = self._store_info.get("zip_code")
-        store_name = self._store_info.get("name")
+        address = self.store_info.get("address")
+        city = self.store_info.get("city")
+        state = self.store_info.get("state")
+        zip_code = self.store_info.get("zip_code")
+        store_name = self.store_info.get("name")
 
         if address:
             address_parts = [address]
@@ -148,7 +151,7 @@ class QueryHandler:
         self, query: str | None, order: "OrderTask"
     ) -> StateMachineResult:
         """Handle inquiry about whether we deliver to a specific location."""
-        all_stores = self._store_info.get("all_stores", [])
+        all_stores = self.store_info.get("all_stores", [])
 
         if not query:
             return StateMachineResult(
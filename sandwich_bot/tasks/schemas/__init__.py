@@ -36,6 +36,8 @@ from .parser_responses import (
     MenuItemOrderDetails,
     ByPoundOrderItem,
     OpenInputResponse,
+    SegmentItems,
+    SegmentExtractionResponse,
     ByPoundCategoryResponse,
     DeliveryChoiceResponse,
     NameResponse,
@@ -82,6 +84,8 @@ __all__ = [
     "MenuItemOrderDetails",
     "ByPoundOrderItem",
     "OpenInputResponse",
+    "SegmentItems",
+    "SegmentExtractionResponse",
     "ByPoundCategoryResponse",
     "DeliveryChoiceResponse",
     "NameResponse",
@@ -846,6 +846,23 @@ class OpenInputResponse(BaseModel):
         return self
 
 
+class SegmentItems(BaseModel):
+    """The items ordered in one segment of a multi-item order."""
+    segment: int = Field(description="Number of the segment, as listed in the prompt")
+    items: list[ParsedItem] = Field(
+        default_factory=list,
+        description="Items ordered in the segment; empty if it orders nothing"
+    )
+
+
+class SegmentExtractionResponse(BaseModel):
+    """Parser output for the segments of a multi-item order the deterministic parsers missed."""
+    segments: list[SegmentItems] = Field(
+        default_factory=list,
+        description="One entry per segment listed in the prompt"
+    )
+
+
 class ByPoundCategoryResponse(BaseModel):
     """Parser output when user is selecting a by-the-pound category."""
     category: str | None = Field(
@@ -9,10 +9,16 @@ Key insight: When pending_item_id points to an incomplete item, ALL input
 is interpreted in the context of that item - no new items can be created.
 """
 
+import asyncio
 import logging
 import re
 import uuid
 
+from sandwich_bot.llm_breaker import LLMCircuitOpen
+from sandwich_bot.llm_deadline import LLMDeadlineExceeded
+from sandwich_bot.menu_data_cache import menu_cache
+from sandwich_bot.pattern_registry import pattern_registry
+
 from .models import (
     OrderTask,
     MenuItemTask,
@@ -38,6 +44,8 @@ from .slot_orchestration_handler import SlotOrchestrationHandler
 from .configuring_item_handler import ConfiguringItemHandler
 from .taking_items_handler import TakingItemsHandler
 from .handler_config import HandlerConfig
+from .parse_context import TurnParseContext, get_parse_context, use_parse_context
+from .turn_context import TurnContext, use_turn_context
 
 # Import from new modular structure
 from .schemas import (
@@ -143,6 +151,17 @@ logger = logging.getLogger(__name__)
 # Logger for slot orchestrator comparison (can be enabled/disabled independently)
 slot_logger = logging.getLogger(__name__ + ".slot_comparison")
 
+# Clarifying questions for a turn that ran out of LLM time, by pending field:
+# the item type and attribute whose configured question is asked, and a default
+_DEGRADED_FIELD_QUESTIONS = {
+    "bagel_choice": ("bagel", "bread", "What kind of bagel would you like?"),
+    "toasted": ("bagel", "toasted", "Would you like it toasted?"),
+    "spread": ("bagel", "spread", "Would you like anything on it?"),
+    "coffee_size": ("sized_beverage", "size", "What size would you like?"),
+    "coffee_style": ("sized_beverage", "temperature", "Hot or iced?"),
+    "coffee_modifiers": ("sized_beverage", "drink_modifier", "Any milk, sweetener, or syrup?"),
+}
+
 
 # =============================================================================
 # State Machine
@@ -151,6 +170,14 @@ slot_logger = logging.getLogger(__name__ + ".slot_comparison")
 # - parsers/deterministic.py (regex-based parsing)
 # - parsers/llm_parsers.py (LLM-based parsing)
 
+@pattern_registry.register("bagel_type_answer")
+def _build_bagel_type_answer_pattern() -> re.Pattern:
+    """Build the pattern for bare bagel type answers ("plain", "sesame bagel")."""
+    return re.compile(
+        r'^(' + '|'.join(re.escape(bt) for bt in get_bagel_types()) + r')(?:\s+bagel)?s?(?:\s+please)?$'
+    )
+
+
 def _looks_like_new_order_attempt(user_input: str) -> bool:
     """
     Detect if user input looks like an attempt to order a new item
@@ -164,8 +191,7 @@ def _looks_like_new_order_attempt(user_input: str) -> bool:
     # First, check if this looks like a simple answer rather than a new order
     # "[type] bagel" or just "[type]" are valid answers, not new orders
     # e.g., "plain bagel", "everything", "sesame bagel"
-    bagel_type_pattern = r'^(' + '|'.join(re.escape(bt) for bt in get_bagel_types()) + r')(?:\s+bagel)?s?(?:\s+please)?$'
-    if re.search(bagel_type_pattern, text):
+    if pattern_registry.get("bagel_type_answer").search(text):
         return False
 
     # Pattern: "bagel with X" (ordering a new item with modifiers)
@@ -215,6 +241,7 @@ def _check_redirect_to_pending_item(
     order: "OrderTask",
     question: str,
     valid_answers: set[str] | None = None,
+    parse_context: TurnParseContext | None = None,
 ) -> "StateMachineResult | None":
     """
     Check if user is trying to order a new item instead of answering a pending question.
@@ -231,6 +258,8 @@ def _check_redirect_to_pending_item(
         valid_answers: Optional set of valid answer keywords that should NOT be
                        considered new order attempts (e.g., {"bagel", "fruit salad"}
                        for side_choice questions)
+        parse_context: Optional parse context of the current turn, so repeated
+                       checks of the same input reuse one result
 
     Returns:
         StateMachineResult with redirect message if user is ordering new item,
@@ -243,7 +272,9 @@ def _check_redirect_to_pending_item(
             if answer in text_lower:
                 return None
 
-    if _looks_like_new_order_attempt(user_input):
+    if parse_context is None:
+        parse_context = TurnParseContext()
+    if parse_context.run(_looks_like_new_order_attempt, user_input):
         item_desc = _get_pending_item_description(item)
         return StateMachineResult(
             message=f"Let's finish up your {item_desc} first. {question}",
@@ -294,7 +325,7 @@ class OrderStateMachine:
         self.menu_lookup = MenuLookup(self._menu_data)
         # Initialize pricing engine with menu lookup callback
         self.pricing = PricingEngine(self._menu_data, self.menu_lookup.lookup_menu_item)
-        # Initialize query handler (store_info set per-request in process())
+        # Initialize query handler (store_info comes from the turn's TurnContext)
         self.query_handler = QueryHandler(self._menu_data, None, self.pricing)
         # Initialize message builder
         self.message_builder = MessageBuilder()
@@ -305,9 +336,9 @@ class OrderStateMachine:
             menu_lookup=self.menu_lookup,
             menu_data=self._menu_data,
             message_builder=self.message_builder,
-            check_redirect=_check_redirect_to_pending_item,
+            check_redirect=self._check_redirect_to_pending_item,
         )
-        # Initialize checkout handler (context set per-request in process())
+        # Initialize checkout handler (customer details come from the turn's TurnContext)
         self.checkout_handler = CheckoutHandler(
             config=self._handler_config,
             transition_callback=self._transition_to_next_slot,
@@ -411,6 +442,9 @@ class OrderStateMachine:
         )
         # Set taking_items_handler on configuring_item_handler (after both are created)
         self.configuring_item_handler.taking_items_handler = self.taking_items_handler
+        # Give the handlers that parse new items the menu's spread types
+        self.checkout_handler.set_spread_types(self._spread_types)
+        self.taking_items_handler.set_spread_types(self._spread_types)
 
     @property
     def menu_data(self) -> dict:
@@ -441,6 +475,10 @@ class OrderStateMachine:
         self.item_adder_handler.menu_data = self._menu_data
         # Update taking items handler menu data
         self.taking_items_handler.menu_data = self._menu_data
+        # Update checkout handler menu data and spread types
+        self.checkout_handler.menu_data = self._menu_data
+        self.checkout_handler.set_spread_types(self._spread_types)
+        self.taking_items_handler.set_spread_types(self._spread_types)
 
     def process(
         self,
@@ -448,6 +486,7 @@ class OrderStateMachine:
         order: OrderTask | None = None,
         returning_customer: dict | None = None,
         store_info: dict | None = None,
+        parse_context: TurnParseContext | None = None,
     ) -> StateMachineResult:
         """
         Process user input through the state machine.
@@ -457,6 +496,8 @@ class OrderStateMachine:
             order: Current order (None for new conversation)
             returning_customer: Returning customer data (name, phone, last_order_items)
             store_info: Store configuration (delivery_zip_codes, tax rates, etc.)
+            parse_context: Parse context already holding results for this
+                input; a new one is created by default
 
         Returns:
             StateMachineResult with response message and updated order
@@ -464,50 +505,53 @@ class OrderStateMachine:
         if order is None:
             order = OrderTask()
 
-        # Store returning customer data for repeat order handling
-        self._returning_customer = returning_customer
-        # Store store info for delivery validation
-        self._store_info = store_info or {}
-        # Update query handler with current store info
-        self.query_handler.store_info = self._store_info
-        # Update checkout handler with current context (including confirmation context)
-        self.checkout_handler.set_context(
-            store_info=self._store_info,
-            returning_customer=returning_customer,
-            is_repeat_order=getattr(self, '_is_repeat_order', False),
-            last_order_type=getattr(self, '_last_order_type', None),
-            spread_types=self._spread_types,
-            menu_data=self._menu_data,
-        )
-        # Update store info handler with current store info
-        self.store_info_handler.set_store_info(self._store_info)
-        # Update order utils handler with current store info
-        self.order_utils_handler.set_store_info(self._store_info)
-        # Update checkout utils handler with repeat order info
-        self.checkout_utils_handler.set_repeat_order_info(
-            is_repeat=getattr(self, '_is_repeat_order', False),
-            last_order_type=getattr(self, '_last_order_type', None),
-        )
-        # Update taking items handler with context
-        def set_repeat_info(is_repeat: bool, last_order_type: str | None) -> None:
-            self._is_repeat_order = is_repeat
-            self._last_order_type = last_order_type
-            self.checkout_utils_handler.set_repeat_order_info(is_repeat, last_order_type)
-        self.taking_items_handler.set_context(
-            spread_types=self._spread_types,
-            returning_customer=returning_customer,
-            set_repeat_info_callback=set_repeat_info,
-        )
+        with use_turn_context(self._begin_turn(order, returning_customer, store_info)):
+            return self._run_turn(user_input, order, parse_context)
+
+    def _begin_turn(
+        self,
+        order: OrderTask,
+        returning_customer: dict | None,
+        store_info: dict | None,
+    ) -> TurnContext:
+        """
+        Get the context the handlers read this turn's customer and store details from.
 
+        This instance serves every session, so nothing about the turn is kept
+        on it or its handlers (see turn_context.py).
+        """
         # Reset repeat order flag - only set when user explicitly requests repeat order
-        # This prevents the flag from persisting across different sessions on the singleton
-        if not hasattr(self, '_is_repeat_order') or order.items.get_item_count() == 0:
-            self._is_repeat_order = False
-            self._last_order_type = None
+        if order.items.get_item_count() == 0:
+            order.is_repeat_order = False
+            order.last_order_type = None
+        return TurnContext(store_info=store_info or {}, returning_customer=returning_customer)
 
+    def _run_turn(
+        self,
+        user_input: str,
+        order: OrderTask,
+        parse_context: TurnParseContext | None,
+    ) -> StateMachineResult:
+        """Process the message inside the turn's TurnContext."""
         # Add user message to history
         order.add_message("user", user_input)
 
+        # Parsers run through this context are memoized for the rest of the
+        # turn; like the turn context it is per call, since turns from
+        # different sessions run in parallel on this instance
+        try:
+            with use_parse_context(parse_context or TurnParseContext(user_input)):
+                return self._process_message(user_input, order)
+        except (LLMDeadlineExceeded, LLMCircuitOpen) as e:
+            # Out of LLM time, or the LLM is unavailable: ask again rather
+            # than leave the caller waiting
+            logger.warning("Answering with a clarifying question: %s", e)
+            result = self._degraded_result(order)
+            order.add_message("assistant", result.message)
+            return result
+
+    def _process_message(self, user_input: str, order: OrderTask) -> StateMachineResult:
+        """Route the message to the handler for the order's state."""
         # Check for order status request (works from any state)
         if ORDER_STATUS_PATTERN.search(user_input):
             logger.info("ORDER STATUS: User asked for order status")
@@ -647,6 +691,86 @@ class OrderStateMachine:
 
         return result
 
+
+    def _degraded_result(self, order: OrderTask) -> StateMachineResult:
+        """
+        Answer a turn whose LLM budget ran out, or that needed the LLM while
+        the circuit breaker was open, with a clarifying question.
+
+        While an item is being configured, the pending field's question from
+        the menu's item type configuration is asked again; in the open phases
+        the customer is asked what they would like.
+        """
+        question = None
+        if order.is_configuring_item():
+            entry = _DEGRADED_FIELD_QUESTIONS.get(order.pending_field)
+            if entry is not None:
+                item_type, field_name, default = entry
+                question = menu_cache.get_question_for_field(item_type, field_name) or default
+        elif order.phase in (OrderPhase.GREETING.value, OrderPhase.TAKING_ITEMS.value):
+            question = "What can I get for you?"
+        return StateMachineResult(
+            message=f"Sorry, I didn't quite catch that. {question or 'Could you say that again?'}",
+            order=order,
+        )
+
+    async def process_async(
+        self,
+        user_input: str,
+        order: OrderTask | None = None,
+        returning_customer: dict | None = None,
+        store_info: dict | None = None,
+    ) -> StateMachineResult:
+        """
+        Async version of process for async endpoints.
+
+        When the turn will parse an open order (greeting or taking items,
+        nothing being configured), parse_open_input's LLM fallback is awaited
+        on the event loop through the async client. The rest of the turn
+        then runs in a worker thread, reusing that result, so neither the
+        fallback nor a handler's own LLM call blocks the event loop.
+
+        The turn's context is made current before the prefetch and is
+        copied into the worker thread, so turns of other sessions can run
+        at the same time.
+
+        Args:
+            Same as process
+
+        Returns:
+            StateMachineResult with response message and updated order
+        """
+        if order is None:
+            order = OrderTask()
+
+        with use_turn_context(self._begin_turn(order, returning_customer, store_info)):
+            parse_context = TurnParseContext(user_input)
+            open_phases = (OrderPhase.GREETING.value, OrderPhase.TAKING_ITEMS.value)
+            if not order.is_configuring_item() and order.phase in open_phases:
+                try:
+                    await self.taking_items_handler.prefetch_open_input(
+                        user_input, parse_context, spread_types=self._spread_types,
+                    )
+                except (LLMDeadlineExceeded, LLMCircuitOpen):
+                    # The turn runs into the spent budget or open breaker too and asks again
+                    pass
+
+            return await asyncio.to_thread(self._run_turn, user_input, order, parse_context)
+
+    def _check_redirect_to_pending_item(
+        self,
+        user_input: str,
+        item: ItemTask,
+        order: OrderTask,
+        question: str,
+        valid_answers: set[str] | None = None,
+    ) -> StateMachineResult | None:
+        """Check for a new-order attempt, reusing this turn's parse results."""
+        return _check_redirect_to_pending_item(
+            user_input, item, order, question, valid_answers,
+            parse_context=get_parse_context(),
+        )
+
     def _log_slot_comparison(self, order: OrderTask) -> None:
         """Delegate to slot orchestration handler."""
         self.slot_orchestration_handler.log_slot_comparison(order)
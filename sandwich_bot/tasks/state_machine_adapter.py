@@ -97,6 +97,62 @@ def process_message_with_state_machine(
     Returns:
         Tuple of (reply, updated_order_state_dict, actions)
     """
+    order = _load_order(user_message, order_state_dict, history, session_id, menu_data)
+
+    # Get state machine and process
+    sm = get_state_machine(menu_data)
+    result: StateMachineResult = sm.process(
+        user_input=user_message,
+        order=order,
+        returning_customer=returning_customer,
+        store_info=store_info,
+    )
+
+    return _to_endpoint_result(sm, order_state_dict, result, store_info)
+
+
+async def process_message_with_state_machine_async(
+    user_message: str,
+    order_state_dict: Dict[str, Any],
+    history: List[Dict[str, str]],
+    session_id: str = None,
+    menu_data: Dict = None,
+    store_info: Dict = None,
+    returning_customer: Dict[str, Any] = None,
+) -> Tuple[str, Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Async version of process_message_with_state_machine for async endpoints.
+
+    Processes the turn with OrderStateMachine.process_async, so LLM
+    fallbacks do not block the event loop.
+
+    Args:
+        Same as process_message_with_state_machine
+
+    Returns:
+        Tuple of (reply, updated_order_state_dict, actions)
+    """
+    order = _load_order(user_message, order_state_dict, history, session_id, menu_data)
+
+    sm = get_state_machine(menu_data)
+    result: StateMachineResult = await sm.process_async(
+        user_input=user_message,
+        order=order,
+        returning_customer=returning_customer,
+        store_info=store_info,
+    )
+
+    return _to_endpoint_result(sm, order_state_dict, result, store_info)
+
+
+def _load_order(
+    user_message: str,
+    order_state_dict: Dict[str, Any],
+    history: List[Dict[str, str]],
+    session_id: str | None,
+    menu_data: Dict | None,
+):
+    """Convert the endpoint's order state and history to an OrderTask."""
     logger.info(
         "STATE MACHINE: Processing message '%s', menu_data has %d keys",
         user_message[:50],
@@ -112,16 +168,16 @@ def process_message_with_state_machine(
             {"role": msg["role"], "content": msg["content"]}
             for msg in history
         ]
+    return order
 
-    # Get state machine and process
-    sm = get_state_machine(menu_data)
-    result: StateMachineResult = sm.process(
-        user_input=user_message,
-        order=order,
-        returning_customer=returning_customer,
-        store_info=store_info,
-    )
 
+def _to_endpoint_result(
+    sm: OrderStateMachine,
+    order_state_dict: Dict[str, Any],
+    result: StateMachineResult,
+    store_info: Dict | None,
+) -> Tuple[str, Dict[str, Any], List[Dict[str, Any]]]:
+    """Convert a state machine result to (reply, updated_order_state_dict, actions)."""
     # Convert state back to dict (phase and pending fields are stored in OrderTask)
     # Pass store_info to calculate taxes for real-time display in order panel
     # Pass pricing engine for consistent modifier price lookups
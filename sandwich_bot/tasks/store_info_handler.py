@@ -12,6 +12,7 @@ import re
 
 from .models import OrderTask
 from .schemas import StateMachineResult
+from .turn_context import get_turn_context
 from .parsers.constants import DEFAULT_PAGINATION_SIZE
 
 # Note: NYC_NEIGHBORHOOD_ZIPS was moved to the database (neighborhood_zip_codes table)
@@ -50,8 +51,14 @@ class StoreInfoHandler:
     def menu_data(self, value: dict) -> None:
         self._menu_data = value or {}
 
+    @property
+    def store_info(self) -> dict | None:
+        """Get the current turn's store info (the one set here outside a turn)."""
+        context = get_turn_context()
+        return context.store_info if context is not None else self._store_info
+
     def set_store_info(self, store_info: dict | None) -> None:
-        """Set the store info for this request."""
+        """Set the store info used outside a turn."""
         self._store_info = store_info
 
     def handle_store_hours_inquiry(self, order: OrderTask) -> StateMachineResult:
@@ -60,7 +67,7 @@ class StoreInfoHandler:
         Uses store_info from the process() call to get hours.
         If store_info is not available (no store context), asks the user which store.
         """
-        store_info = self._store_info or {}
+        store_info = self.store_info or {}
         hours = store_info.get("hours")
         store_name = store_info.get("name")
 
@@ -92,7 +99,7 @@ class StoreInfoHandler:
         Uses store_info from the process() call to get address.
         If store_info is not available (no store context), asks the user which store.
         """
-        store_info = self._store_info or {}
+        store_info = self.store_info or {}
         address = store_info.get("address")
         city = store_info.get("city")
         state = store_info.get("state")
@@ -143,7 +150,7 @@ class StoreInfoHandler:
         Returns:
             StateMachineResult with contact information for customer service
         """
-        store_info = self._store_info or {}
+        store_info = self.store_info or {}
         store_phone = store_info.get("phone")
         store_name = store_info.get("name")
 
@@ -196,7 +203,7 @@ class StoreInfoHandler:
             query: The location they're asking about (zip, neighborhood, or address)
             order: Current order state
         """
-        store_info = self._store_info or {}
+        store_info = self.store_info or {}
         all_stores = store_info.get("all_stores", [])
 
         if not query:
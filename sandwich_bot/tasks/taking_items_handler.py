@@ -10,7 +10,7 @@ Extracted from state_machine.py for better separation of concerns.
 import logging
 import re
 import uuid
-from typing import Callable, TYPE_CHECKING
+from typing import TYPE_CHECKING
 
 from sandwich_bot.menu_data_cache import menu_cache
 
@@ -33,7 +33,9 @@ from .schemas import (
     ParsedSideItemEntry,
     ParsedItem,
 )
-from .parsers import parse_open_input, extract_modifiers_from_input
+from .parsers import parse_open_input, parse_open_input_async, extract_modifiers_from_input, get_parsed_text
+from .parse_context import TurnParseContext, get_parse_context
+from .turn_context import get_turn_context
 from .modifier_operations import (
     find_modifier_on_any_item,
     remove_modifier_from_item,
@@ -354,10 +356,21 @@ class TakingItemsHandler:
         self.checkout_utils_handler = checkout_utils_handler or kwargs.get("checkout_utils_handler")
         self.checkout_handler = checkout_handler or kwargs.get("checkout_handler")
 
-        # Context set per-request
+        # Set from the menu by the state machine
         self._spread_types: list[str] = []
+        # Used outside a turn; a turn's comes from its TurnContext
         self._returning_customer: dict | None = None
-        self._set_repeat_info_callback: Callable[[bool, str | None], None] | None = None
+
+    @property
+    def parse_context(self) -> TurnParseContext:
+        """Get the current turn's parse context (a fresh one outside a turn)."""
+        return get_parse_context()
+
+    @property
+    def returning_customer(self) -> dict | None:
+        """Get the current turn's returning customer (the one set here outside a turn)."""
+        context = get_turn_context()
+        return context.returning_customer if context is not None else self._returning_customer
 
     @property
     def menu_data(self) -> dict:
@@ -409,16 +422,34 @@ class TakingItemsHandler:
 
         return None
 
-    def set_context(
+    def set_spread_types(self, spread_types: list[str]) -> None:
+        """Set the spread types from the menu's cheese types."""
+        self._spread_types = spread_types
+
+    async def prefetch_open_input(
         self,
-        spread_types: list[str],
-        returning_customer: dict | None,
-        set_repeat_info_callback: Callable[[bool, str | None], None] | None = None,
+        user_input: str,
+        parse_context: TurnParseContext,
+        spread_types: set[str] | None = None,
     ) -> None:
-        """Set per-request context."""
-        self._spread_types = spread_types
-        self._returning_customer = returning_customer
-        self._set_repeat_info_callback = set_repeat_info_callback
+        """
+        Parse the input as an open order with the async parser, ahead of the turn.
+
+        The result is stored in the turn's parse context under
+        parse_open_input with the arguments handle_greeting and
+        handle_taking_items use, so they reuse it instead of calling the LLM
+        from a handler.
+        """
+        await parse_context.run_async(
+            parse_open_input,
+            parse_open_input_async,
+            user_input,
+            model=self.model,
+            spread_types=spread_types,
+            modifier_category_keywords=self._modifier_category_keywords,
+            modifier_item_keywords=self._modifier_item_keywords,
+            ingredient_to_items=self._ingredient_to_items,
+        )
 
     def handle_greeting(
         self,
@@ -426,7 +457,8 @@ class TakingItemsHandler:
         order: OrderTask,
     ) -> StateMachineResult:
         """Handle greeting phase."""
-        parsed = parse_open_input(
+        parsed = self.parse_context.run(
+            parse_open_input,
             user_input,
             model=self.model,
             spread_types=self._spread_types,
@@ -451,7 +483,7 @@ class TakingItemsHandler:
 
         # User might have ordered something directly - pass the already parsed result
         # Also extract modifiers from the raw input
-        extracted_modifiers = extract_modifiers_from_input(user_input)
+        extracted_modifiers = self.parse_context.run(extract_modifiers_from_input, user_input)
         if extracted_modifiers.has_modifiers():
             logger.info("Extracted modifiers from greeting input: %s", extracted_modifiers)
 
@@ -511,7 +543,7 @@ class TakingItemsHandler:
 
         # Check for "add [modifier]" patterns early (before LLM parsing)
         # This allows "add vanilla syrup" to be handled without LLM
-        input_lower = user_input.lower().strip()
+        input_lower = get_parsed_text(user_input).lower
         active_items = order.items.get_active_items()
 
         add_modifier_patterns = [
@@ -700,7 +732,8 @@ class TakingItemsHandler:
                         order=order,
                     )
 
-        parsed = parse_open_input(
+        parsed = self.parse_context.run(
+            parse_open_input,
             user_input,
             model=self.model,
             spread_types=self._spread_types,
@@ -710,7 +743,7 @@ class TakingItemsHandler:
         )
 
         # Extract modifiers from raw input (keyword-based, no LLM)
-        extracted_modifiers = extract_modifiers_from_input(user_input)
+        extracted_modifiers = self.parse_context.run(extract_modifiers_from_input, user_input)
         if extracted_modifiers.has_modifiers():
             logger.info("Extracted modifiers from input: %s", extracted_modifiers)
 
@@ -794,7 +827,7 @@ class TakingItemsHandler:
         # Handle "add [modifier]" patterns that should modify the last coffee
         # e.g., "add vanilla syrup", "add oat milk", "with caramel"
         if raw_user_input:
-            input_lower = raw_user_input.lower().strip()
+            input_lower = get_parsed_text(raw_user_input).lower
             active_items = order.items.get_active_items()
 
             # Check if this looks like a modifier addition for the last coffee
@@ -1284,7 +1317,7 @@ class TakingItemsHandler:
 
                 # If no new items parsed and last item is a bagel, try applying as modifiers
                 if not has_new_items and getattr(last_item, 'is_bagel', False) and raw_user_input:
-                    modifiers = extract_modifiers_from_input(raw_user_input)
+                    modifiers = self.parse_context.run(extract_modifiers_from_input, raw_user_input)
                     has_modifiers = modifiers.proteins or modifiers.cheeses or modifiers.toppings
 
                     if has_modifiers:
@@ -1915,9 +1948,10 @@ class TakingItemsHandler:
         if parsed.wants_repeat_order:
             active_items = order.items.get_active_items()
             has_cart_items = len(active_items) > 0
+            returning_customer = self.returning_customer
             has_previous_order = (
-                self._returning_customer
-                and self._returning_customer.get("last_order_items")
+                returning_customer
+                and returning_customer.get("last_order_items")
             )
 
             # Case 1: Both previous order AND items in cart - ask for clarification
@@ -1953,8 +1987,7 @@ class TakingItemsHandler:
             if has_previous_order:
                 return self.checkout_handler.handle_repeat_order(
                     order,
-                    returning_customer=self._returning_customer,
-                    set_repeat_info_callback=self._set_repeat_info_callback,
+                    returning_customer=returning_customer,
                 )
 
             # Case 3: Only cart items (no previous order) - treat as duplicate
@@ -2881,7 +2914,7 @@ class TakingItemsHandler:
 
         items = pending_info.get("items", [])
         count = pending_info.get("count", 1)
-        text = user_input.strip().lower()
+        text = get_parsed_text(user_input).lower
 
         # Check for "all items" / "everything" response
         if DUPLICATE_ALL_PATTERN.match(text):
@@ -3004,7 +3037,7 @@ class TakingItemsHandler:
         bot described it and asked 'Would you like to order one?'.
         """
         suggested_item = order.pending_suggested_item
-        user_lower = user_input.lower().strip()
+        user_lower = get_parsed_text(user_input).lower
 
         # Clear context first (will be processed either way)
         order.pending_suggested_item = None
@@ -3100,7 +3133,7 @@ class TakingItemsHandler:
             )
 
         cart_items = pending_info.get("cart_items", [])
-        text = user_input.strip().lower()
+        text = get_parsed_text(user_input).lower
 
         # Check if user wants to repeat previous order
         previous_order_patterns = [
@@ -3112,8 +3145,7 @@ class TakingItemsHandler:
             order.pending_field = None
             return self.checkout_handler.handle_repeat_order(
                 order,
-                returning_customer=self._returning_customer,
-                set_repeat_info_callback=self._set_repeat_info_callback,
+                returning_customer=self.returning_customer,
             )
 
         # Check if user wants to duplicate all items in cart
@@ -0,0 +1,62 @@
+"""
+Per-Turn Customer and Store Context.
+
+One ``OrderStateMachine`` serves every session in the process (see
+state_machine_adapter.py), so the store and returning customer a turn is
+for can't be kept on it or its handlers: turns from different sessions run
+at the same time, in worker threads and on the event loop.
+
+``OrderStateMachine.process`` creates a ``TurnContext`` for every message
+and makes it current with ``use_turn_context`` for the rest of the turn.
+Like the parse context (see parse_context.py) it is held in a ContextVar,
+so it follows the turn into ``asyncio.to_thread`` workers and parallel
+turns each see their own. Handlers read it through their ``store_info`` and
+``returning_customer`` properties, which fall back to the values set on the
+handler outside a turn (e.g. directly in tests).
+
+State that lasts for the whole conversation, such as whether the customer
+asked to repeat their previous order, is kept on the ``OrderTask``.
+
+Usage:
+    with use_turn_context(TurnContext(store_info, returning_customer)):
+        ...
+
+    context = get_turn_context()  # None outside a turn
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator
+
+
+@dataclass
+class TurnContext:
+    """
+    Customer and store details of the turn being processed.
+
+    Attributes:
+        store_info: Store configuration (delivery_zip_codes, tax rates, etc.)
+        returning_customer: Returning customer data (name, phone, last_order_items)
+    """
+
+    store_info: dict = field(default_factory=dict)
+    returning_customer: dict | None = None
+
+
+_current_turn: ContextVar[TurnContext | None] = ContextVar("turn_context", default=None)
+
+
+@contextmanager
+def use_turn_context(context: TurnContext) -> Iterator[TurnContext]:
+    """Make a context the current turn's inside the block."""
+    token = _current_turn.set(context)
+    try:
+        yield context
+    finally:
+        _current_turn.reset(token)
+
+
+def get_turn_context() -> TurnContext | None:
+    """Get the context of the turn being processed, or None outside a turn."""
+    return _current_turn.get()
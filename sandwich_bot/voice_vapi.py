@@ -25,7 +25,9 @@ from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
 
+from .config import VOICE_LLM_TURN_BUDGET_SECONDS
 from .db import get_db
+from .llm_breaker import llm_breaker
 from .models import ChatSession, Store, Company, SessionAnalytics
 from .menu_index_builder import get_menu_version
 from .menu_data_cache import menu_cache
@@ -600,12 +602,13 @@ async def vapi_chat_completions(
     logger.info("Using MessageProcessor for voice message")
     try:
         processor = MessageProcessor(db)
-        result = processor.process(ProcessingContext(
+        result = await processor.process_async(ProcessingContext(
             user_message=user_message,
             session_id=session_id,
             caller_id=phone_number,
             store_id=session_store_id,
             session=session_data,  # Pass pre-loaded session
+            llm_budget_seconds=VOICE_LLM_TURN_BUDGET_SECONDS,
         ))
 
         reply = result.reply
@@ -801,9 +804,15 @@ async def vapi_webhook(
 
 @vapi_router.get("/health")
 async def vapi_health():
-    """Health check endpoint for Vapi to verify server is reachable."""
+    """
+    Health check endpoint for Vapi to verify server is reachable.
+
+    "llm" is the LLM circuit breaker's state; while it is "open", callers
+    get clarifying questions instead of waiting on the LLM.
+    """
     return {
         "status": "ok",
         "service": "sammy-bot-voice",
         "timestamp": datetime.utcnow().isoformat(),
+        "llm": llm_breaker.get_health(),
     }
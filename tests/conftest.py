@@ -178,3 +178,19 @@ def menu_cache_loaded():
         db.close()
 
     return menu_cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_parse_memo():
+    """Start every test with an empty parse memo so results never leak between tests."""
+    from sandwich_bot.parse_memo import parse_memo
+    parse_memo.clear()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def closed_llm_breaker():
+    """Start every test with the LLM circuit breaker closed so failures never leak between tests."""
+    from sandwich_bot.llm_breaker import llm_breaker
+    llm_breaker.reset()
+    yield
@@ -0,0 +1,164 @@
+"""
+Tests for the async LLM parser variants.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from sandwich_bot.parse_memo import memoize_parser, parse_memo
+from sandwich_bot.tasks.parse_context import TurnParseContext
+from sandwich_bot.tasks.parsers import llm_parsers
+from sandwich_bot.tasks.parsers.fast_paths import Resolution, fast_path, get_fast_path_stats
+from sandwich_bot.tasks.schemas import CoffeeSizeResponse
+
+
+class _FakeAsyncCompletions:
+    """Async instructor completions that record calls and return a fixed response."""
+
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.response
+
+
+@pytest.fixture
+def async_completions(monkeypatch):
+    completions = _FakeAsyncCompletions(CoffeeSizeResponse(size="large"))
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    monkeypatch.setattr(llm_parsers, "get_async_instructor_client", lambda: client)
+    return completions
+
+
+@pytest.fixture
+def memo_enabled():
+    parse_memo.reset("test-menu-version")
+    yield parse_memo
+    parse_memo.reset(None)
+
+
+class TestAsyncParsers:
+    """Tests for parsers awaiting the async client."""
+
+    def test_awaits_async_client(self, async_completions):
+        """Test the async variant sends the sync parser's prompt to the async client."""
+        result = asyncio.run(llm_parsers.parse_coffee_size_async("hmm what do you recommend"))
+        assert result.size == "large"
+        [call] = async_completions.calls
+        assert call["model"] == "gpt-4o-mini"
+        assert call["response_model"] is CoffeeSizeResponse
+        assert call["messages"][0]["content"] == llm_parsers._coffee_size_prompt("hmm what do you recommend")
+
+    def test_async_result_serves_sync_parser(self, async_completions, memo_enabled, monkeypatch):
+        """Test a memoized async result is returned by the sync parser."""
+        asyncio.run(llm_parsers.parse_coffee_size_async("hmm   what do you recommend"))
+
+        def no_sync_client():
+            raise AssertionError("sync parser should be served from the memo")
+
+        monkeypatch.setattr(llm_parsers, "get_instructor_client", no_sync_client)
+        assert llm_parsers.parse_coffee_size("hmm what do you recommend").size == "large"
+
+
+class TestAsyncDecorators:
+    """Tests for fast_path and memoize_parser on coroutine functions."""
+
+    def test_fast_path_stats_shared(self):
+        """Test sync and async variants count into one fast path entry."""
+        def resolve(user_input):
+            return Resolution(user_input.upper(), 1.0) if user_input == "yes" else None
+
+        @fast_path("test_async_shared", resolve)
+        def parse(user_input: str, model: str = "m"):
+            return "llm"
+
+        @fast_path("test_async_shared", resolve)
+        async def parse_async(user_input: str, model: str = "m"):
+            return "llm"
+
+        assert parse("yes") == "YES"
+        assert asyncio.run(parse_async("yes")) == "YES"
+        assert asyncio.run(parse_async("maybe")) == "llm"
+        stats = get_fast_path_stats()["test_async_shared"]
+        assert (stats["calls"], stats["resolved"], stats["fallbacks"]) == (3, 2, 1)
+
+    def test_memoized_coroutine(self, memo_enabled):
+        """Test an async parser is awaited once per key."""
+        calls = []
+
+        @memoize_parser("test_async_memo")
+        async def parse_async(user_input: str, model: str = "m"):
+            calls.append(user_input)
+            return CoffeeSizeResponse(size="small")
+
+        first = asyncio.run(parse_async("a  small"))
+        second = asyncio.run(parse_async("a small"))
+        assert calls == ["a small"]
+        assert first == second
+        assert first is not second
+
+
+class TestParseContextAsync:
+    """Tests for TurnParseContext.run_async."""
+
+    def test_async_result_reused_by_run(self):
+        """Test a result awaited ahead of the turn is reused by the sync run."""
+        def parse(text, model="m"):
+            raise AssertionError("sync parser should not run")
+
+        async def parse_async(text, model="m"):
+            return CoffeeSizeResponse(size="small")
+
+        context = TurnParseContext("a small")
+        asyncio.run(context.run_async(parse, parse_async, "a small", model="m"))
+        assert context.run(parse, "a small", model="m").size == "small"
+        assert context.get_stats() == {"runs": 1, "reuses": 1}
+
+
+class TestProcessAsync:
+    """Tests for OrderStateMachine.process_async."""
+
+    def test_parallel_turns_overlap_and_keep_their_customer(self, monkeypatch):
+        """Test turns on the shared state machine run at once and each sees its own customer."""
+        import threading
+
+        from sandwich_bot.tasks.models import OrderTask
+        from sandwich_bot.tasks.schemas import OrderPhase, StateMachineResult
+        from sandwich_bot.tasks.state_machine import OrderStateMachine
+
+        sm = OrderStateMachine()
+        handler = sm.taking_items_handler
+        both_running = threading.Barrier(2, timeout=5)
+        seen = []
+
+        async def prefetch_open_input(user_input, parse_context, spread_types=None):
+            seen.append((user_input, handler.returning_customer["name"]))
+            await asyncio.sleep(0.01)
+
+        def run_turn(user_input, order, parse_context):
+            # Only passes once the other turn is in its worker thread too
+            both_running.wait()
+            seen.append((user_input, handler.returning_customer["name"]))
+            return StateMachineResult(message="ok", order=order)
+
+        monkeypatch.setattr(handler, "prefetch_open_input", prefetch_open_input)
+        monkeypatch.setattr(sm, "_run_turn", run_turn)
+
+        def order():
+            order = OrderTask()
+            order.phase = OrderPhase.TAKING_ITEMS.value
+            return order
+
+        async def both():
+            await asyncio.gather(
+                sm.process_async("a latte", order(), returning_customer={"name": "Ana"}),
+                sm.process_async("a bagel", order(), returning_customer={"name": "Ben"}),
+            )
+
+        asyncio.run(both())
+        assert sorted(seen) == sorted([("a latte", "Ana"), ("a bagel", "Ben")] * 2)
+        assert handler.returning_customer is None
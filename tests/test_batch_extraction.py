@@ -0,0 +1,141 @@
+"""
+Tests for the batched LLM extraction of multi-item order segments.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from sandwich_bot.tasks.parsers import llm_parsers, speculation
+from sandwich_bot.tasks.parsers.deterministic import UnresolvedSegment
+from sandwich_bot.tasks.schemas import (
+    OpenInputResponse,
+    ParsedBagelEntry,
+    ParsedCoffeeEntry,
+    ParsedMenuItemEntry,
+    ParsedSideItemEntry,
+    SegmentExtractionResponse,
+    SegmentItems,
+)
+
+ORDER = "two plain bagels, a large latte, the thing my wife always gets, a coke and whatever my kid had last time"
+MISSED = ["the thing my wife always gets", "whatever my kid had last time"]
+
+EXTRACTION = SegmentExtractionResponse(segments=[
+    SegmentItems(segment=1, items=[ParsedMenuItemEntry(menu_item_name="The Leo", is_signature=True)]),
+    SegmentItems(segment=2, items=[ParsedSideItemEntry(side_name="Hash Browns")]),
+])
+
+
+def _parse_multi_item_order(user_input, unresolved=None):
+    """Stands in for the deterministic parser: understands three of the five segments."""
+    if unresolved is None:
+        return None
+    for text, position in zip(MISSED, (2, 3)):
+        start = user_input.index(text)
+        unresolved.append(UnresolvedSegment(text, start, start + len(text), user_input, position))
+    return OpenInputResponse(parsed_items=[
+        ParsedBagelEntry(bagel_type="plain", quantity=2),
+        ParsedCoffeeEntry(drink_type="latte", size="large"),
+        ParsedCoffeeEntry(drink_type="coke"),
+    ])
+
+
+class _FakeCompletions:
+    """Instructor completions that record calls and answer by response model."""
+
+    def __init__(self):
+        self.calls = []
+
+    def respond(self, kwargs):
+        self.calls.append(kwargs)
+        if kwargs["response_model"] is SegmentExtractionResponse:
+            return EXTRACTION
+        return OpenInputResponse(new_coffee=True, new_coffee_type="full-parse")
+
+    def create(self, **kwargs):
+        return self.respond(kwargs)
+
+
+class _FakeAsyncCompletions(_FakeCompletions):
+    async def create(self, **kwargs):
+        return self.respond(kwargs)
+
+
+@pytest.fixture
+def completions(monkeypatch):
+    monkeypatch.setattr(llm_parsers, "_parse_multi_item_order", _parse_multi_item_order)
+    monkeypatch.setattr(speculation, "OPEN_INPUT_SPECULATION_THRESHOLD", 2.0)
+    fake = _FakeCompletions()
+    monkeypatch.setattr(llm_parsers, "get_instructor_client", lambda: SimpleNamespace(
+        chat=SimpleNamespace(completions=fake)
+    ))
+    return fake
+
+
+def _item_names(result):
+    return [
+        getattr(item, "bagel_type", None) or getattr(item, "drink_type", None)
+        or getattr(item, "menu_item_name", None) or item.side_name
+        for item in result.parsed_items
+    ]
+
+
+class TestBatchExtraction:
+    """Tests for sending only the missed segments to the LLM."""
+
+    def test_one_request_for_missed_segments(self, completions):
+        """Test a mixed five-item order costs one request, holding only the missed segments."""
+        result = llm_parsers.parse_open_input(ORDER)
+
+        [call] = completions.calls
+        assert call["response_model"] is SegmentExtractionResponse
+        prompt = call["messages"][-1]["content"]
+        assert '1. "the thing my wife always gets" in:' in prompt
+        assert "[[whatever my kid had last time]]" in prompt
+        assert len([line for line in prompt.splitlines() if line[:1].isdigit()]) == 2
+        assert call["messages"][0]["content"] == llm_parsers._build_segment_extraction_system_prompt()
+        assert _item_names(result) == ["plain", "latte", "The Leo", "coke", "Hash Browns"]
+
+    def test_async_variant(self, completions, monkeypatch):
+        """Test the async parser makes the same single request."""
+        fake = _FakeAsyncCompletions()
+        monkeypatch.setattr(llm_parsers, "get_async_instructor_client", lambda: SimpleNamespace(
+            chat=SimpleNamespace(completions=fake)
+        ))
+        result = asyncio.run(llm_parsers.parse_open_input_async(ORDER))
+        assert [call["response_model"] for call in fake.calls] == [SegmentExtractionResponse]
+        assert _item_names(result) == ["plain", "latte", "The Leo", "coke", "Hash Browns"]
+
+    def test_speculated_request_is_used_instead(self, completions, monkeypatch):
+        """Test a full request already in flight answers instead of a second, batched one."""
+        monkeypatch.setattr(speculation, "OPEN_INPUT_SPECULATION_THRESHOLD", 0.0)
+        result = llm_parsers.parse_open_input(ORDER)
+        assert [call["response_model"] for call in completions.calls] == [OpenInputResponse]
+        assert result.new_coffee_type == "full-parse"
+
+    def test_disabled_falls_back_to_full_parse(self, completions, monkeypatch):
+        """Test OPEN_INPUT_BATCH_EXTRACTION=false sends the whole message as before."""
+        monkeypatch.setattr(llm_parsers, "OPEN_INPUT_BATCH_EXTRACTION", False)
+        monkeypatch.setattr(llm_parsers, "parse_open_input_deterministic", lambda *a, **k: None)
+        llm_parsers.parse_open_input(ORDER)
+        assert [call["response_model"] for call in completions.calls] == [OpenInputResponse]
+
+
+def test_merge_keeps_order_and_segment_text():
+    """Test extracted items go where their segment was, and drinks keep their text."""
+    utterance = "a latte, something sweet and a coke"
+    start = utterance.index("something sweet")
+    segment = UnresolvedSegment("something sweet", start, start + 15, utterance, 1)
+    result = OpenInputResponse(parsed_items=[
+        ParsedCoffeeEntry(drink_type="latte"), ParsedCoffeeEntry(drink_type="coke"),
+    ])
+    extraction = SegmentExtractionResponse(segments=[
+        SegmentItems(segment=1, items=[ParsedCoffeeEntry(drink_type="hot chocolate")]),
+    ])
+
+    merged = llm_parsers._merge_segment_items(result, [segment], extraction)
+    assert _item_names(merged) == ["latte", "hot chocolate", "coke"]
+    assert merged.parsed_items[1].original_text == "something sweet"
+    assert segment.context(width=8) == "latte, [[something sweet]] and a c"
@@ -0,0 +1,118 @@
+"""
+Tests for the beverage order grammar.
+"""
+
+from sandwich_bot.tasks.parsers.beverage_grammar import BeverageGrammar
+from sandwich_bot.tasks.parsers.parsed_text import ParsedText
+
+
+GRAMMAR = BeverageGrammar(
+    drinks={"coffee", "latte", "espresso", "tea", "chai tea", "mocha", "hot chocolate"},
+    milks=["oat", "almond", "whole", "2%", "half & half", "cream"],
+    sweeteners=["splenda", "sugar"],
+    syrups=["vanilla", "hazelnut", "almond", "mocha"],
+    sizes={"lg": "large"},
+    shots={"quad": 4},
+)
+
+
+def parse(text: str):
+    return GRAMMAR.parse(ParsedText(text))
+
+
+class TestDrinkSlots:
+    """Tests for the drink, quantity, size and preparation slots."""
+
+    def test_full_order_in_one_pass(self):
+        """Test every slot of a rush-hour order is filled."""
+        slots = parse("two large iced decaf oat lattes with 2 splendas and a vanilla syrup")
+        assert slots.drink == "latte"
+        assert slots.quantity == 2
+        assert slots.size == "large"
+        assert slots.iced is True
+        assert slots.decaf is True
+        assert slots.milk == "oat"
+        assert (slots.sweetener, slots.sweetener_quantity) == ("splenda", 2)
+        assert (slots.flavor_syrup, slots.syrup_quantity) == ("vanilla", 1)
+
+    def test_longest_drink_wins(self):
+        """Test "chai tea" is read over "tea"."""
+        assert parse("i want a chai tea").drink == "chai tea"
+
+    def test_quantity_phrases(self):
+        """Test number words, digits and multi-word counts."""
+        assert parse("a half dozen hot coffees").quantity == 6
+        assert parse("12 coffees").quantity == 12
+        assert parse("a couple of lattes").quantity == 2
+        assert parse("coffee for 2").quantity == 1
+
+    def test_percent_milk_is_not_a_quantity(self):
+        """Test the "2" of "2% milk" does not count the drinks."""
+        slots = parse("a 2% milk latte")
+        assert slots.quantity == 1
+        assert slots.milk == "2%"
+
+    def test_size_option_phrases(self):
+        """Test size phrases from the global options map to their slug."""
+        assert parse("lg coffee").size == "large"
+
+    def test_hot_in_drink_name(self):
+        """Test "hot chocolate" is still read as hot."""
+        slots = parse("hot chocolate")
+        assert slots.drink == "hot chocolate"
+        assert slots.iced is False
+
+    def test_extra_shots(self):
+        """Test double/triple/quad espresso add shots."""
+        assert parse("double espresso").extra_shots == 1
+        assert parse("triple shot espresso").extra_shots == 2
+        assert parse("quad espresso").extra_shots == 3
+        assert parse("double vanilla latte").extra_shots == 0
+
+    def test_coffee_cake_is_not_a_drink(self):
+        """Test "coffee cake" flags the message as a pastry order."""
+        assert parse("a coffee cake").not_drink is True
+
+
+class TestModifierSlots:
+    """Tests for milk, cream, sweetener and syrup slots."""
+
+    def test_milk_spellings(self):
+        """Test milk variants are normalized."""
+        assert parse("coffee with half & half").milk == "half and half"
+        assert parse("coffee with milk").milk == "whole"
+        assert parse("black coffee").milk == "none"
+
+    def test_almond_syrup_is_not_almond_milk(self):
+        """Test "almond" needs "syrup" to be read as a syrup."""
+        slots = parse("latte with almond syrup")
+        assert slots.flavor_syrup == "almond"
+        assert slots.milk is None
+        slots = parse("latte with almond")
+        assert slots.milk == "almond"
+        assert slots.flavor_syrup is None
+
+    def test_phrase_fills_every_slot(self):
+        """Test a drink that is also a syrup fills both."""
+        slots = parse("a mocha")
+        assert slots.drink == "mocha"
+        assert slots.flavor_syrup == "mocha"
+
+    def test_syrup_quantities(self):
+        """Test syrup counts, including double/triple."""
+        assert parse("coffee with double hazelnut").syrup_quantity == 2
+        assert parse("coffee with 3 vanilla syrups").syrup_quantity == 3
+
+    def test_generic_syrup(self):
+        """Test a bare "syrup" asks for a flavor."""
+        slots = parse("coffee with 2 syrups")
+        assert slots.wants_syrup is True
+        assert slots.flavor_syrup is None
+        assert slots.syrup_quantity == 2
+
+    def test_cream_level(self):
+        """Test dark/light/regular, except "light roast"."""
+        assert parse("coffee dark").cream_level == "dark"
+        assert parse("coffee light").cream_level == "light"
+        assert parse("light roast coffee").cream_level is None
+        assert parse("regular coffee").cream_level == "regular"
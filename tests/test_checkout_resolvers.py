@@ -0,0 +1,128 @@
+"""
+Tests for the deterministic resolvers in front of the checkout-phase LLM
+parsers.
+"""
+
+import pytest
+
+from sandwich_bot.config import PARSER_FAST_PATH_MIN_CONFIDENCE
+from sandwich_bot.menu_data_cache import menu_cache
+from sandwich_bot.tasks.parsers.checkout_resolvers import (
+    resolve_confirmation,
+    resolve_delivery_choice,
+    resolve_email,
+    resolve_name,
+    resolve_payment_method,
+    resolve_phone,
+)
+
+
+@pytest.fixture
+def response_patterns(monkeypatch):
+    """Provide a small set of response patterns independent of the database."""
+    monkeypatch.setattr(menu_cache, "_response_patterns", {
+        "affirmative": {"yes", "yeah", "looks good"},
+        "negative": {"no", "nope"},
+        "cancel": {"cancel"},
+        "done": {"that's all"},
+    })
+
+
+class TestContactResolvers:
+    """Tests for phone numbers and email addresses, typed or spoken."""
+
+    @pytest.mark.parametrize("text", [
+        "555-123-4567",
+        "it's (555) 123-4567",
+        "1 555 123 4567",
+        "five five five one two three four five six seven",
+    ])
+    def test_phone(self, text):
+        resolution = resolve_phone(text)
+        assert resolution.response.phone == "5551234567"
+        assert resolution.confidence == 1.0
+
+    def test_phone_needs_ten_digits(self):
+        assert resolve_phone("call me tomorrow") is None
+        assert resolve_phone("555 1234") is None
+
+    def test_email(self):
+        assert resolve_email("john@example.com").response.email == "john@example.com"
+        spoken = resolve_email("my email is john at gmail dot com")
+        assert spoken.response.email == "john@gmail.com"
+        assert spoken.confidence == 1.0
+
+    def test_email_leaves_two_addresses_to_llm(self):
+        assert resolve_email("john@x.com or jane@y.com") is None
+
+    def test_payment_method(self):
+        assert resolve_payment_method("text me").response.choice == "text"
+        assert resolve_payment_method("email please").response.choice == "email"
+        by_phone = resolve_payment_method("555-123-4567").response
+        assert (by_phone.choice, by_phone.phone_number) == ("text", "5551234567")
+        by_email = resolve_payment_method("email it to john@example.com").response
+        assert (by_email.choice, by_email.email_address) == ("email", "john@example.com")
+        assert resolve_payment_method("text or email?") is None
+
+
+class TestDeliveryChoice:
+    """Tests for pickup/delivery answers."""
+
+    @pytest.mark.parametrize("text", ["pickup", "I'll pick it up", "for pickup", "to go"])
+    def test_pickup(self, text):
+        resolution = resolve_delivery_choice(text)
+        assert resolution.response.choice == "pickup"
+        assert resolution.confidence == 1.0
+
+    def test_delivery_address(self):
+        """Test an address after "delivery to", or on its own, means delivery."""
+        for text in ("delivery to 123 Main St", "123 Main St"):
+            response = resolve_delivery_choice(text).response
+            assert (response.choice, response.address) == ("delivery", "123 Main St")
+
+    def test_questions_are_not_confident(self):
+        assert resolve_delivery_choice("pickup or delivery?") is None
+        assert resolve_delivery_choice("how much is delivery").confidence < 0.9
+
+
+class TestPatternResolvers:
+    """Tests for resolvers that use the menu cache response patterns."""
+
+    def test_confirmation(self, response_patterns):
+        assert resolve_confirmation("Yes!").response.confirmed
+        assert resolve_confirmation("looks good").response.confirmed
+        assert resolve_confirmation("no").response.wants_changes
+        assert resolve_confirmation("yes but add a coffee") is None
+
+    @pytest.mark.parametrize("text,expected", [
+        ("my name is mike smith", "Mike Smith"),
+        ("name's Mary-Jane O'Neil", "Mary-Jane O'Neil"),
+        ("this is Dana", "Dana"),
+        ("put it under Lee", "Lee"),
+    ])
+    def test_name(self, response_patterns, text, expected):
+        resolution = resolve_name(text)
+        assert resolution.response.name == expected
+        assert resolution.confidence == 1.0
+
+    @pytest.mark.parametrize("text,expected", [
+        ("John", "John"), ("for sarah", "Sarah"), ("It's Sarah", "Sarah"), ("call me Al", "Al"),
+    ])
+    def test_bare_name_left_to_llm(self, response_patterns, text, expected):
+        resolution = resolve_name(text)
+        assert resolution.response.name == expected
+        assert resolution.confidence < PARSER_FAST_PATH_MIN_CONFIDENCE
+
+    @pytest.mark.parametrize("text", [
+        "I'm hungry", "call me back later", "it is correct", "I am driving",
+    ])
+    def test_everyday_reply_not_taken_as_name(self, response_patterns, text):
+        resolution = resolve_name(text)
+        assert resolution is None or resolution.confidence < PARSER_FAST_PATH_MIN_CONFIDENCE
+
+    @pytest.mark.parametrize("text", [
+        "yes", "for pickup", "can I add a bagel", "555-1234", "large latte",
+        "everything", "no thanks actually", "it's a coke", "cream cheese",
+    ])
+    def test_not_a_name(self, response_patterns, text):
+        assert resolve_name(text) is None
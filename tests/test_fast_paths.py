@@ -0,0 +1,143 @@
+"""
+Tests for the deterministic fast paths in front of the configuration-phase
+LLM parsers.
+"""
+
+import pytest
+
+from sandwich_bot.tasks.parsers import fast_paths
+from sandwich_bot.tasks.parsers.fast_paths import (
+    Resolution,
+    fast_path,
+    get_fast_path_stats,
+    reset_fast_path_stats,
+    resolve_bagel_choice,
+    resolve_by_pound_category,
+    resolve_coffee_size,
+    resolve_coffee_style,
+    resolve_multi_bagel_choice,
+    resolve_side_choice,
+    resolve_spread_choice,
+    resolve_toasted_choice,
+)
+
+
+class TestFastPathDecorator:
+    """Tests for confidence-gated dispatch and fallback stats."""
+
+    def _make_parser(self, name, confidence, llm_calls):
+        def resolver(user_input, quantity=1):
+            return Resolution(f"fast:{user_input}:{quantity}", confidence)
+
+        @fast_path(name, resolver)
+        def parser(user_input: str, quantity: int = 1, model: str = "gpt-4o-mini") -> str:
+            llm_calls.append((user_input, quantity, model))
+            return f"llm:{user_input}"
+
+        return parser
+
+    def test_confident_resolution_skips_parser(self):
+        """Test a confident resolver answers without calling the parser."""
+        llm_calls = []
+        parser = self._make_parser("test_confident", 1.0, llm_calls)
+        assert parser("plain", 2, model="other") == "fast:plain:2"
+        assert llm_calls == []
+        stats = get_fast_path_stats()["test_confident"]
+        assert stats["resolved"] == 1
+        assert stats["fallback_rate"] == 0.0
+
+    def test_low_confidence_falls_back(self, monkeypatch):
+        """Test answers below the threshold reach the parser and are counted."""
+        monkeypatch.setattr(fast_paths, "PARSER_FAST_PATH_MIN_CONFIDENCE", 0.9)
+        llm_calls = []
+        parser = self._make_parser("test_unsure", 0.5, llm_calls)
+        reset_fast_path_stats()
+        assert parser("plain with stuff") == "llm:plain with stuff"
+        assert llm_calls == [("plain with stuff", 1, "gpt-4o-mini")]
+        assert get_fast_path_stats()["test_unsure"] == {
+            "calls": 1, "resolved": 0, "fallbacks": 1, "fallback_rate": 1.0,
+        }
+
+
+class TestVocabularyFreeResolvers:
+    """Tests for resolvers that only need fixed yes/no and hot/iced words."""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("yes please", True),
+        ("toasted", True),
+        ("not toasted", False),
+        ("no thanks", False),
+    ])
+    def test_toasted_choice(self, text, expected):
+        resolution = resolve_toasted_choice(text)
+        assert resolution.confidence == 1.0
+        assert resolution.response.toasted is expected
+
+    def test_toasted_choice_with_extra_words_is_not_confident(self):
+        """Test unexplained words keep the answer below the threshold."""
+        assert resolve_toasted_choice("can you toast it lightly").confidence < 0.9
+
+    @pytest.mark.parametrize("text,expected", [
+        ("iced please", True),
+        ("cold", True),
+        ("hot", False),
+    ])
+    def test_coffee_style(self, text, expected):
+        assert resolve_coffee_style(text).response.iced is expected
+
+    @pytest.mark.parametrize("text", ["no ice", "hot or iced?", "iced, actually hot"])
+    def test_coffee_style_leaves_ambiguous_answers_to_llm(self, text):
+        assert resolve_coffee_style(text) is None
+
+
+class TestMenuVocabularyResolvers:
+    """Tests for resolvers that match the menu cache vocabulary."""
+
+    def test_bagel_choice_quantifiers(self):
+        """Test "both", "all" and explicit counts set the quantity."""
+        assert resolve_bagel_choice("plain").response.quantity == 1
+        assert resolve_bagel_choice("both sesame", 2).response.quantity == 2
+        assert resolve_bagel_choice("2 of them plain", 3).response.quantity == 2
+        resolution = resolve_bagel_choice("all everything", 3)
+        assert resolution.response.bagel_type == "everything"
+        assert resolution.response.quantity == 3
+        assert resolution.confidence == 1.0
+
+    def test_bagel_choice_rejects_negation_and_questions(self):
+        assert resolve_bagel_choice("not plain") is None
+        assert resolve_bagel_choice("what kind do you have") is None
+
+    def test_multi_bagel_choice(self):
+        resolution = resolve_multi_bagel_choice("one plain, one sesame", 2)
+        assert resolution.response.bagel_types == ["plain", "sesame"]
+        assert resolution.confidence == 1.0
+        assert resolve_multi_bagel_choice("both plain", 2).response.all_same_type == "plain"
+        # One type for three bagels might mean more than we understand
+        assert resolve_multi_bagel_choice("plain", 3).confidence < 0.9
+
+    def test_spread_choice(self):
+        resolution = resolve_spread_choice("extra butter")
+        assert resolution.response.spread == "butter"
+        assert resolution.response.special_instructions == "extra"
+        assert resolution.confidence == 1.0
+        assert resolve_spread_choice("nothing").response.no_spread
+        assert resolve_spread_choice("no butter") is None
+
+    def test_coffee_size(self):
+        assert resolve_coffee_size("a large one").response.size == "large"
+        assert resolve_coffee_size("small with two sugars").response.size == "small"
+        assert resolve_coffee_size("what sizes?") is None
+
+    def test_side_choice(self):
+        resolution = resolve_side_choice("plain bagel toasted with butter", "Veggie Omelette")
+        assert resolution.response.choice == "bagel"
+        assert resolution.response.bagel_type == "plain"
+        assert resolution.response.toasted is True
+        assert resolution.response.spread == "butter"
+        assert resolve_side_choice("fruit salad", "Veggie Omelette").response.choice == "fruit_salad"
+
+    def test_by_pound_category(self):
+        assert resolve_by_pound_category("what cheeses do you have").response.category == "cheese"
+        assert resolve_by_pound_category("cold cuts").response.category == "cold_cut"
+        declined = resolve_by_pound_category("never mind").response
+        assert declined.category is None and not declined.unclear
@@ -0,0 +1,216 @@
+"""
+Tests for the LLM circuit breaker.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+from sandwich_bot.llm_breaker import CircuitBreaker, LLMCircuitOpen, is_provider_failure, llm_breaker
+from sandwich_bot.llm_deadline import LLMDeadlineExceeded, TurnDeadline, use_turn_deadline
+from sandwich_bot.tasks.models import OrderTask
+from sandwich_bot.tasks.schemas import OrderPhase
+from sandwich_bot.tasks.state_machine import OrderStateMachine
+
+
+@pytest.fixture(autouse=True)
+def closed_breaker():
+    llm_breaker.reset()
+    yield
+    llm_breaker.reset()
+
+
+def _breaker(**kwargs) -> CircuitBreaker:
+    settings = dict(window_seconds=60, min_calls=4, error_rate=0.5, p95_seconds=1.0, open_seconds=0.05, probes=2)
+    settings.update(kwargs)
+    return CircuitBreaker(**settings)
+
+
+def _fail(breaker: CircuitBreaker, exc: Exception = TimeoutError()) -> None:
+    with pytest.raises(type(exc)):
+        with breaker.guard("test"):
+            raise exc
+
+
+def _succeed(breaker: CircuitBreaker) -> None:
+    with breaker.guard("test"):
+        pass
+
+
+def _open(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.min_calls):
+        _fail(breaker)
+    assert breaker.state == "open"
+
+
+class TestTripping:
+    """Tests for when the breaker opens."""
+
+    def test_opens_on_error_rate(self):
+        """Test the breaker opens once enough recent calls have failed."""
+        breaker = _breaker()
+        _succeed(breaker)
+        _succeed(breaker)
+        _fail(breaker)
+        assert breaker.state == "closed"
+        _fail(breaker)
+        assert breaker.state == "open"
+        assert breaker.get_status()["reason"] == "error rate 2/4"
+
+    def test_opens_on_p95_latency(self):
+        """Test the breaker opens when recent calls are slow even though they succeed."""
+        breaker = _breaker()
+        for latency in (0.2, 1.5, 1.8, 2.0):
+            breaker.record(False, latency)
+        assert breaker.state == "open"
+        assert breaker.get_status()["reason"] == "p95 latency 2.0s"
+
+    def test_old_outcomes_expire(self):
+        """Test failures older than the window don't count."""
+        breaker = _breaker(window_seconds=0.05)
+        for _ in range(3):
+            _fail(breaker)
+        time.sleep(0.06)
+        _fail(breaker)
+        assert breaker.state == "closed"
+        assert breaker.get_status()["window"]["calls"] == 1
+
+    def test_request_errors_are_not_provider_failures(self):
+        """Test only timeouts, connection errors, 429s and 5xx count against the provider."""
+        request = httpx.Request("POST", "http://testserver/v1/chat/completions")
+
+        def status_error(cls, code):
+            return cls("error", response=httpx.Response(code, request=request), body=None)
+
+        assert is_provider_failure(openai.APITimeoutError(request))
+        assert is_provider_failure(status_error(openai.InternalServerError, 503))
+        assert is_provider_failure(status_error(openai.RateLimitError, 429))
+        assert not is_provider_failure(status_error(openai.BadRequestError, 400))
+        assert not is_provider_failure(ValueError("response failed validation"))
+
+        breaker = _breaker()
+        for _ in range(4):
+            _fail(breaker, ValueError("response failed validation"))
+        assert breaker.state == "closed"
+
+    def test_deadline_counts_only_provider_errors(self):
+        """Test a spent turn budget counts only when the provider failed before it ran out."""
+        request = httpx.Request("POST", "http://testserver/v1/chat/completions")
+        response = httpx.Response(503, request=request)
+
+        def exceeded(cause):
+            try:
+                raise cause
+            except Exception:
+                try:
+                    raise LLMDeadlineExceeded("test", TurnDeadline(1.0))
+                except LLMDeadlineExceeded as e:
+                    return e
+
+        assert not is_provider_failure(LLMDeadlineExceeded("test", TurnDeadline(1.0)))
+        assert not is_provider_failure(exceeded(openai.APITimeoutError(request)))
+        assert is_provider_failure(exceeded(openai.InternalServerError("error", response=response, body=None)))
+
+    def test_spent_turn_budget_does_not_reach_breaker(self, monkeypatch):
+        """Test parser calls made after the turn's budget ran out neither open the breaker nor probe it."""
+        from sandwich_bot.tasks.parsers import llm_parsers
+        from sandwich_bot.tasks.schemas import OpenInputResponse
+
+        def create(**kwargs):
+            pytest.fail("LLM should not be called")
+
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+        monkeypatch.setattr(llm_parsers, "get_instructor_client", lambda: client)
+
+        with use_turn_deadline(TurnDeadline(0.001)):
+            time.sleep(0.01)
+            for _ in range(llm_breaker.min_calls * 2):
+                with pytest.raises(LLMDeadlineExceeded):
+                    llm_parsers._complete("hi", OpenInputResponse, "gpt-4o-mini", cache=False)
+        assert llm_breaker.state == "closed"
+        assert llm_breaker.get_status()["window"]["calls"] == 0
+
+
+class TestOpenAndHalfOpen:
+    """Tests for failing fast and probing."""
+
+    def test_open_rejects_without_calling(self):
+        """Test the block is not run while open."""
+        breaker = _breaker(open_seconds=30)
+        _open(breaker)
+        with pytest.raises(LLMCircuitOpen):
+            with breaker.guard("OpenInputResponse"):
+                pytest.fail("request should not be made")
+        status = breaker.get_status()
+        assert status["rejected"] == 1
+        assert 29 < status["retry_in_seconds"] <= 30
+
+    def test_probes_close_the_breaker(self):
+        """Test one probe at a time goes through, and enough successes close the breaker."""
+        breaker = _breaker()
+        _open(breaker)
+        time.sleep(0.06)
+
+        with breaker.guard("test"):
+            assert breaker.state == "half_open"
+            with pytest.raises(LLMCircuitOpen):
+                _succeed(breaker)
+        assert breaker.state == "half_open"
+        _succeed(breaker)
+        assert breaker.state == "closed"
+        assert breaker.get_status()["window"]["calls"] == 0
+
+    def test_failed_or_slow_probe_reopens(self):
+        """Test a probe that fails, or is as slow as the p95 limit, opens the breaker again."""
+        breaker = _breaker()
+        _open(breaker)
+        time.sleep(0.06)
+        _fail(breaker)
+        assert breaker.state == "open"
+        assert breaker.trips == 2
+
+        time.sleep(0.06)
+        breaker.acquire("test")
+        breaker.record(False, 1.2, probe=True)
+        assert (breaker.state, breaker.reason) == ("open", "probe took 1.2s")
+
+
+class TestDegradedService:
+    """Tests for turns and health checks while the breaker is open."""
+
+    def test_open_input_asks_for_order_without_llm(self, monkeypatch):
+        """Test an open order gets a clarifying question instead of an LLM request."""
+        from sandwich_bot.tasks.parsers import llm_parsers
+
+        monkeypatch.setattr(llm_parsers, "_try_open_input_deterministic", lambda *a, **k: None)
+
+        def create(**kwargs):
+            pytest.fail("LLM should not be called")
+
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+        monkeypatch.setattr(llm_parsers, "get_instructor_client", lambda: client)
+        monkeypatch.setattr(llm_breaker, "open_seconds", 30)
+        for _ in range(llm_breaker.min_calls):
+            llm_breaker.record(True, None)
+        order = OrderTask()
+        order.phase = OrderPhase.TAKING_ITEMS.value
+
+        started = time.perf_counter()
+        result = OrderStateMachine().process("uhh gimme the thing my cousin always gets", order)
+        assert result.message == "Sorry, I didn't quite catch that. What can I get for you?"
+        assert time.perf_counter() - started < 1.0
+
+    def test_vapi_health_reports_state(self):
+        """Test the Vapi health check includes the breaker state."""
+        from sandwich_bot.voice_vapi import vapi_health
+
+        assert asyncio.run(vapi_health())["llm"] == {"state": "closed", "reason": None, "retry_in_seconds": None}
+        for _ in range(llm_breaker.min_calls):
+            llm_breaker.record(True, None)
+        health = asyncio.run(vapi_health())
+        assert health["status"] == "ok"
+        assert health["llm"]["state"] == "open"
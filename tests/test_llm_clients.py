@@ -0,0 +1,99 @@
+"""
+Tests for the shared, pooled LLM clients.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from sandwich_bot.llm_clients import LLMClientProvider
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+class TestClientReuse:
+    """Tests for one client per kind and key across calls and threads."""
+
+    def test_same_client_across_threads(self, monkeypatch):
+        """Test every thread gets the same OpenAI and instructor client."""
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        provider = LLMClientProvider()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            clients = set(map(id, pool.map(lambda _: provider.openai(), range(32))))
+            wrappers = set(map(id, pool.map(lambda _: provider.instructor(), range(32))))
+        assert len(clients) == 1
+        assert len(wrappers) == 1
+        assert provider.openai()._client is provider.http_client()
+
+    def test_new_key_gets_new_client(self):
+        """Test a rotated API key is not served the old client."""
+        provider = LLMClientProvider()
+        assert provider.openai("sk-one") is not provider.openai("sk-two")
+        assert provider.openai("sk-one") is provider.openai("sk-one")
+
+    def test_missing_key(self, monkeypatch):
+        """Test a missing key raises ValueError as before."""
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        with pytest.raises(ValueError):
+            LLMClientProvider().instructor()
+
+    def test_async_client_per_event_loop(self):
+        """Test async clients are shared within a loop but not across loops."""
+        provider = LLMClientProvider()
+
+        async def get_twice():
+            return provider.async_openai("sk-test"), provider.async_openai("sk-test")
+
+        first, again = asyncio.run(get_twice())
+        other, _ = asyncio.run(get_twice())
+        assert first is again
+        assert first is not other
+
+
+class TestPoolStats:
+    """Tests for keep-alive reuse and pool utilization stats."""
+
+    def test_requests_reuse_connection(self, server_url):
+        """Test sequential requests go out on one kept-alive connection."""
+        provider = LLMClientProvider(max_connections=4, max_keepalive_connections=2)
+        http_client = provider.http_client()
+        for _ in range(5):
+            assert http_client.get(server_url).text == "ok"
+
+        pool = provider.get_status()["pools"][0]
+        assert pool["requests"] == 5
+        assert pool["in_flight"] == 0
+        assert pool["connections_opened"] == 1
+        assert pool["reuse_rate"] == 0.8
+
+    def test_status_reports_limits(self):
+        """Test configured limits and timeouts are reported."""
+        status = LLMClientProvider(timeout=7, connect_timeout=2, max_connections=3).get_status()
+        assert status["limits"]["max_connections"] == 3
+        assert status["limits"]["timeout"] == 7
+        assert status["limits"]["connect_timeout"] == 2
+        assert status["pools"] == []
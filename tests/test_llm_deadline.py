@@ -0,0 +1,175 @@
+"""
+Tests for the per-turn LLM deadline and hedged LLM requests.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from sandwich_bot import llm_deadline
+from sandwich_bot.llm_deadline import (
+    LLMDeadlineExceeded,
+    TurnDeadline,
+    call_with_hedge,
+    call_with_hedge_async,
+    get_llm_deadline_stats,
+    request_timeout,
+    reset_llm_deadline_stats,
+    use_turn_deadline,
+)
+from sandwich_bot.tasks.models import OrderTask
+from sandwich_bot.tasks.schemas import OrderPhase
+from sandwich_bot.tasks.state_machine import OrderStateMachine
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    reset_llm_deadline_stats()
+    yield
+    reset_llm_deadline_stats()
+
+
+@pytest.fixture
+def hedging(monkeypatch):
+    """Hedge "test" calls after 20 ms, the p95 of three observed latencies."""
+    monkeypatch.setattr(llm_deadline, "LLM_HEDGE_PERCENTILE", 95)
+    monkeypatch.setattr(llm_deadline, "LLM_HEDGE_MIN_SAMPLES", 3)
+    for seconds in (0.01, 0.015, 0.02):
+        llm_deadline._stats.observe("test", seconds)
+
+
+def _slow_then_fast():
+    """A request function whose first call is slow and later calls are fast."""
+    calls = []
+    lock = threading.Lock()
+
+    def call(timeout):
+        with lock:
+            calls.append(timeout)
+            first = len(calls) == 1
+        time.sleep(0.3 if first else 0.01)
+        return "slow" if first else "fast"
+
+    return call, calls
+
+
+class TestTurnDeadline:
+    """Tests for request timeouts within a turn."""
+
+    def test_timeout_outside_turn_is_default(self):
+        """Test requests outside a turn keep their default timeout."""
+        assert request_timeout("test", 60) == 60
+
+    def test_timeout_is_remaining_budget(self):
+        """Test requests in a turn get at most the time left."""
+        with use_turn_deadline(TurnDeadline(2.0)):
+            assert 1.5 < request_timeout("test", 60) <= 2.0
+            assert request_timeout("test", 1.0) == 1.0
+
+    def test_spent_budget_raises(self):
+        """Test a request after the budget is spent raises without being made."""
+        deadline = TurnDeadline(0.01)
+        time.sleep(0.02)
+        with use_turn_deadline(deadline), pytest.raises(LLMDeadlineExceeded):
+            call_with_hedge("test", lambda timeout: pytest.fail("request should not be made"))
+        assert deadline.exceeded
+        assert get_llm_deadline_stats()["deadline_exceeded"] == 1
+
+    def test_timed_out_request_raises_deadline_exceeded(self):
+        """Test a request that times out at the end of the budget reports the deadline."""
+        def call(timeout):
+            time.sleep(timeout)
+            raise TimeoutError("request timed out")
+
+        with use_turn_deadline(TurnDeadline(0.05)), pytest.raises(LLMDeadlineExceeded):
+            call_with_hedge("test", call)
+
+
+class TestHedging:
+    """Tests for hedged requests."""
+
+    def test_no_hedge_before_enough_samples(self, monkeypatch):
+        """Test calls are not hedged until enough latencies are observed."""
+        monkeypatch.setattr(llm_deadline, "LLM_HEDGE_MIN_SAMPLES", 3)
+        call, calls = _slow_then_fast()
+        assert call_with_hedge("test", call) == "slow"
+        assert len(calls) == 1
+        assert get_llm_deadline_stats()["hedged"] == 0
+
+    def test_hedge_wins(self, hedging):
+        """Test a slow request is duplicated and the first response wins."""
+        assert get_llm_deadline_stats()["latency"]["test"]["hedge_delay_ms"] == 20.0
+        call, calls = _slow_then_fast()
+        assert call_with_hedge("test", call) == "fast"
+        assert len(calls) == 2
+
+        time.sleep(0.4)  # the duplicated request finishes in the background
+        stats = get_llm_deadline_stats()
+        assert (stats["calls"], stats["hedged"], stats["hedge_wins"]) == (1, 1, 1)
+        assert stats["saved_ms_total"] > 100
+
+    def test_hedge_bounded_by_deadline(self, hedging):
+        """Test neither request may outlast the turn's budget."""
+        def call(timeout):
+            time.sleep(0.5)
+            return "late"
+
+        with use_turn_deadline(TurnDeadline(0.1)), pytest.raises(LLMDeadlineExceeded):
+            call_with_hedge("test", call)
+
+    def test_async_hedge_wins(self, hedging):
+        """Test the async variant hedges the same way."""
+        calls = []
+
+        async def call(timeout):
+            calls.append(timeout)
+            await asyncio.sleep(0.3 if len(calls) == 1 else 0.01)
+            return "slow" if len(calls) == 1 else "fast"
+
+        async def run():
+            result = await call_with_hedge_async("test", call)
+            await asyncio.sleep(0.35)
+            return result
+
+        assert asyncio.run(run()) == "fast"
+        stats = get_llm_deadline_stats()
+        assert (stats["hedged"], stats["hedge_wins"]) == (1, 1)
+        assert stats["saved_ms_total"] > 100
+
+
+class TestDegradedReply:
+    """Tests for the clarifying question when a turn runs out of LLM time."""
+
+    def test_open_input_asks_for_order(self, monkeypatch):
+        """Test an open order that runs out of LLM time asks what they'd like."""
+        from sandwich_bot.tasks.parsers import llm_parsers
+
+        def out_of_time(*args, **kwargs):
+            raise LLMDeadlineExceeded("OpenInputResponse", TurnDeadline(1.0))
+
+        monkeypatch.setattr(llm_parsers, "_try_open_input_deterministic", lambda *a, **k: None)
+        monkeypatch.setattr(llm_parsers, "_complete", out_of_time)
+        order = OrderTask()
+        order.phase = OrderPhase.TAKING_ITEMS.value
+
+        result = OrderStateMachine().process("uhh gimme the thing my cousin always gets", order)
+        assert result.message == "Sorry, I didn't quite catch that. What can I get for you?"
+        assert result.order.items.get_item_count() == 0
+
+    def test_pending_field_question_is_repeated(self, monkeypatch):
+        """Test a pending configuration question is asked again."""
+        sm = OrderStateMachine()
+
+        def out_of_time(user_input, order):
+            raise LLMDeadlineExceeded("CoffeeSizeResponse", TurnDeadline(1.0))
+
+        monkeypatch.setattr(sm, "_process_message", out_of_time)
+        order = OrderTask()
+        order.pending_item_ids = ["coffee-1"]
+        order.pending_field = "coffee_size"
+
+        result = sm.process("hmm", order)
+        assert result.message == "Sorry, I didn't quite catch that. What size would you like?"
+        assert order.pending_field == "coffee_size"
@@ -0,0 +1,201 @@
+"""
+Tests for the persistent LLM response cache.
+
+Each test uses a private LLMResponseCache on a temporary SQLite file.
+"""
+
+import pytest
+from pydantic import BaseModel
+
+from sandwich_bot.llm_response_cache import LLMResponseCache
+from sandwich_bot.tasks.parsers import llm_parsers
+
+
+class _Response(BaseModel):
+    value: str
+
+
+class _OtherResponse(BaseModel):
+    value: str
+    extra: int = 0
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "llm" / "responses.sqlite3")
+
+
+def _cache(path: str, **kwargs) -> LLMResponseCache:
+    cache = LLMResponseCache(path=path, **kwargs)
+    cache.set_menu_version("v1")
+    return cache
+
+
+class TestStorage:
+    """Tests for storing, persisting and expiring completions."""
+
+    def test_survives_restart(self, cache_path):
+        """Test a new cache instance on the same file answers from disk."""
+        cache = _cache(cache_path)
+        key = cache.make_key("llm_parsers", "gpt-4o-mini", _Response, "1", "prompt")
+        cache.put(key, "llm_parsers", _Response(value="butter"))
+        cache.put("text-key", "sammy", '{"reply": "hi"}')
+        cache.close()
+
+        restarted = _cache(cache_path)
+        assert restarted.get(key, _Response) == _Response(value="butter")
+        assert restarted.get("text-key") == '{"reply": "hi"}'
+        assert restarted.get_status()["hits"] == 2
+
+    def test_key_covers_model_schema_and_template(self, cache_path):
+        """Test each key component changes the key."""
+        cache = _cache(cache_path)
+        base = cache.make_key("llm_parsers", "m1", _Response, "1", "prompt")
+        assert base == cache.make_key("llm_parsers", "m1", _Response, "1", "prompt")
+        assert base != cache.make_key("llm_parsers", "m2", _Response, "1", "prompt")
+        assert base != cache.make_key("llm_parsers", "m1", _OtherResponse, "1", "prompt")
+        assert base != cache.make_key("llm_parsers", "m1", _Response, "2", "prompt")
+        assert base != cache.make_key("llm_parsers", "m1", _Response, "1", "prompt!")
+
+    def test_nothing_cached_before_menu_version(self, cache_path):
+        """Test the cache stays off until a menu version is set."""
+        cache = LLMResponseCache(path=cache_path)
+        cache.put("key", "sammy", "{}")
+        cache.set_menu_version("v1")
+        assert cache.get("key") is None
+
+    def test_ttl_expiry(self, cache_path):
+        """Test expired entries are misses and are deleted."""
+        cache = _cache(cache_path, ttl_seconds=0)
+        cache.put("key", "sammy", "{}")
+        assert cache.get("key") is None
+        status = cache.get_status()
+        assert status["expirations"] == 1
+        assert status["size"] == 0
+
+    def test_lru_eviction(self, cache_path, monkeypatch):
+        """Test the least recently used entries are evicted past the limit."""
+        clock = iter(range(100))
+        monkeypatch.setattr("sandwich_bot.llm_response_cache.time.time", lambda: next(clock))
+        cache = _cache(cache_path, max_entries=2)
+        cache.put("a", "sammy", "a")
+        cache.put("b", "sammy", "b")
+        assert cache.get("a") == "a"  # "a" is now more recently used than "b"
+        cache.put("c", "sammy", "c")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "a"
+        assert cache.get_status()["evictions"] == 1
+
+    def test_mocks_are_not_stored(self, cache_path):
+        """Test only pydantic models and strings are stored."""
+        cache = _cache(cache_path)
+        cache.put("key", "llm_parsers", object())
+        assert cache.get_status()["stores"] == 0
+
+
+class TestInvalidation:
+    """Tests for menu-version invalidation."""
+
+    def test_new_menu_version_drops_entries(self, cache_path):
+        """Test entries of another menu version are deleted."""
+        cache = _cache(cache_path)
+        cache.put("key", "sammy", "{}")
+        cache.set_menu_version("v2")
+        assert cache.get("key") is None
+        assert cache.get_status()["invalidations"] == 1
+
+
+class TestReadOnly:
+    """Tests for read-only replay mode."""
+
+    def test_replays_without_writing(self, cache_path):
+        """Test read-only mode serves recorded entries and stores nothing."""
+        recorder = _cache(cache_path)
+        recorder.put("recorded", "sammy", "{}")
+        recorder.close()
+
+        replay = _cache(cache_path, mode="readonly")
+        assert replay.get("recorded") == "{}"
+        replay.put("new", "sammy", "{}")
+        replay.set_menu_version("v2")
+        replay.close()
+
+        recorder = _cache(cache_path)
+        assert recorder.get("recorded") == "{}"
+        assert recorder.get("new") is None
+
+    def test_missing_file_is_a_miss(self, cache_path):
+        """Test replaying a file that doesn't exist misses instead of raising."""
+        replay = _cache(cache_path, mode="readonly")
+        assert replay.get("key") is None
+        assert replay.get_status()["errors"] >= 1
+
+    def test_invalid_mode(self, cache_path):
+        """Test an unknown mode is rejected."""
+        with pytest.raises(ValueError):
+            LLMResponseCache(path=cache_path, mode="sometimes")
+
+
+class TestParserIntegration:
+    """Tests for LLM parsers answering from the cache."""
+
+    def test_cold_worker_answers_from_disk(self, cache_path, monkeypatch):
+        """Test a recorded completion is served without calling the client."""
+        from sandwich_bot.tasks.schemas import CoffeeStyleResponse
+
+        prompt = llm_parsers._coffee_style_prompt("whatever is fine")
+        cache = _cache(cache_path)
+        key = llm_parsers._cache_key(prompt, CoffeeStyleResponse, "gpt-4o-mini")
+        cache.put(key, "llm_parsers", CoffeeStyleResponse(iced=True))
+        cache.close()
+
+        def no_client():
+            raise AssertionError("cached completion should not reach the client")
+
+        monkeypatch.setattr(llm_parsers, "llm_response_cache", _cache(cache_path))
+        monkeypatch.setattr(llm_parsers, "get_instructor_client", no_client)
+        assert llm_parsers._complete(prompt, CoffeeStyleResponse, "gpt-4o-mini").iced is True
+
+    @pytest.mark.parametrize("parser_name, response", [
+        ("parse_delivery_choice", {"choice": "delivery", "address": "12 Main St Apt 4"}),
+        ("parse_payment_method", {"choice": "email", "email_address": "pat@example.com"}),
+        ("parse_email", {"email": "pat@example.com"}),
+    ])
+    def test_customer_details_never_stored(self, cache_path, monkeypatch, parser_name, response):
+        """Test parsers whose responses carry customer details don't write the cache."""
+        from types import SimpleNamespace
+
+        def create(response_model, **kwargs):
+            return response_model(**response)
+
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+        cache = _cache(cache_path)
+        monkeypatch.setattr(llm_parsers, "llm_response_cache", cache)
+        monkeypatch.setattr(llm_parsers, "get_instructor_client", lambda: client)
+        getattr(llm_parsers, parser_name)("hmm so it's 12 main street apartment 4, pat at example dot com")
+        assert cache.get_status()["stores"] == 0
+        assert cache.get_status()["size"] == 0
+
+    @pytest.mark.parametrize("user_message, history, order_state", [
+        ("it's 732 555 0199", [], {}),
+        ("sure, pat at example dot com", [], {}),
+        ("that's all", [{"role": "user", "content": "text me at pat@example.com"}], {}),
+        ("what's my total", [], {"order_type": "pickup"}),
+        ("thanks", [], {"status": "confirmed"}),
+    ])
+    def test_sammy_skips_contact_details_and_checkout(self, user_message, history, order_state):
+        """Test sammy replies aren't cached on turns with contact details or in checkout."""
+        from sandwich_bot.sammy import llm_client
+
+        messages = [{"role": "user", "content": user_message}]
+        assert llm_client._response_cache_key("m", messages, order_state, history, user_message) is None
+
+    def test_sammy_caches_plain_order_turns(self):
+        """Test an order turn without customer details still gets a cache key."""
+        from sandwich_bot.sammy import llm_client
+
+        messages = [{"role": "user", "content": "2 turkey sandwiches"}]
+        history = [{"role": "assistant", "content": "What can I get you?"}]
+        key = llm_client._response_cache_key("m", messages, {"items": []}, history, "2 turkey sandwiches")
+        assert key is not None
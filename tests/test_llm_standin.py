@@ -0,0 +1,174 @@
+"""
+Tests for the local OpenAI-compatible LLM stand-in server.
+
+The OpenAI SDK and instructor talk to the stand-in app in process, in the
+same call shapes llm_parsers.py and sammy/llm_client.py use.
+"""
+
+import asyncio
+import json
+import time
+
+import httpx
+import instructor
+import pytest
+from fastapi.testclient import TestClient
+from openai import AsyncOpenAI, NotFoundError, OpenAI
+
+from sandwich_bot.llm_clients import LLMClientProvider
+from sandwich_bot.llm_standin import LatencyModel, create_app, prompt_key
+from sandwich_bot.tasks.schemas import CoffeeSizeResponse, OpenInputResponse
+
+MESSAGES = [{"role": "user", "content": 'The user said: "a large latte"'}]
+
+
+def _openai(app) -> OpenAI:
+    return OpenAI(api_key="sk-local", base_url="http://testserver/v1", http_client=TestClient(app))
+
+
+class TestSynthetic:
+    """Tests for synthetic responses."""
+
+    def test_structured_output(self):
+        """Test instructor gets a tool call that validates against the response model."""
+        client = instructor.from_openai(_openai(create_app("synthetic")))
+        result = client.chat.completions.create(
+            model="gpt-4o-mini", response_model=OpenInputResponse, messages=MESSAGES,
+        )
+        assert isinstance(result, OpenInputResponse)
+        assert result.new_bagel is False
+
+    def test_json_mode(self):
+        """Test JSON mode gets a reply in the shape sammy parses."""
+        completion = _openai(create_app("synthetic")).chat.completions.create(
+            model="gpt-4o", messages=MESSAGES, response_format={"type": "json_object"},
+        )
+        assert json.loads(completion.choices[0].message.content) == {
+            "reply": "Sure, what else can I get for you?", "actions": [],
+        }
+        assert completion.usage.total_tokens > 0
+
+    def test_streaming(self):
+        """Test a streamed JSON mode completion reassembles into the full reply."""
+        stream = _openai(create_app("synthetic")).chat.completions.create(
+            model="gpt-4o", messages=MESSAGES, response_format={"type": "json_object"}, stream=True,
+        )
+        content = "".join(chunk.choices[0].delta.content or "" for chunk in stream if chunk.choices)
+        assert json.loads(content)["actions"] == []
+
+    def test_latency(self):
+        """Test synthetic responses wait the sampled latency."""
+        app = create_app("synthetic", latency=LatencyModel(0.05))
+        started = time.perf_counter()
+        _openai(app).chat.completions.create(model="gpt-4o", messages=MESSAGES)
+        assert time.perf_counter() - started >= 0.05
+        assert TestClient(app).get("/stats").json()["latency_ms"]["p50"] == 50.0
+
+    def test_latency_distribution(self):
+        """Test the lognormal latency matches the configured median and p95."""
+        model = LatencyModel(0.8, 2.5, seed=7)
+        samples = sorted(model.sample() for _ in range(4000))
+        assert samples[2000] == pytest.approx(0.8, rel=0.1)
+        assert samples[3800] == pytest.approx(2.5, rel=0.15)
+
+
+class TestRecordReplay:
+    """Tests for recording real traffic and replaying it."""
+
+    def test_record_then_replay(self, tmp_path):
+        """Test a recorded completion is replayed by prompt hash without the upstream."""
+        recordings = tmp_path / "recordings.jsonl"
+        upstream = httpx.ASGITransport(app=create_app("synthetic"))
+        recorder = create_app("record", recordings=recordings, upstream="http://upstream/v1", upstream_transport=upstream)
+
+        client = instructor.from_openai(_openai(recorder))
+        _, recorded = client.chat.completions.create_with_completion(
+            model="gpt-4o-mini", response_model=CoffeeSizeResponse, messages=MESSAGES,
+        )
+        [line] = recordings.read_text().splitlines()
+        record = json.loads(line)
+        assert record["key"] == prompt_key(record["request"])
+
+        replayer = create_app("replay", recordings=recordings)
+        client = instructor.from_openai(_openai(replayer))
+        result, replayed = client.chat.completions.create_with_completion(
+            model="gpt-4o-mini", response_model=CoffeeSizeResponse, messages=MESSAGES,
+        )
+        assert isinstance(result, CoffeeSizeResponse)
+        assert replayed.id == recorded.id
+        stats = TestClient(replayer).get("/stats").json()
+        assert (stats["recordings"], stats["replayed"], stats["replay_misses"]) == (1, 1, 0)
+
+    def test_record_then_replay_stream(self, tmp_path):
+        """Test a streamed completion is recorded and replayed chunk by chunk."""
+        recordings = tmp_path / "recordings.jsonl"
+        upstream = httpx.ASGITransport(app=create_app("synthetic"))
+        recorder = create_app("record", recordings=recordings, upstream="http://upstream/v1", upstream_transport=upstream)
+        request = {"model": "gpt-4o", "messages": MESSAGES, "response_format": {"type": "json_object"}, "stream": True}
+
+        def read(app):
+            stream = _openai(app).chat.completions.create(**request)
+            return "".join(chunk.choices[0].delta.content or "" for chunk in stream if chunk.choices)
+
+        recorded = read(recorder)
+        assert read(create_app("replay", recordings=recordings)) == recorded
+
+    def test_replay_miss(self, tmp_path):
+        """Test an unrecorded prompt is a 404 unless synthetic fallback is on."""
+        recordings = tmp_path / "recordings.jsonl"
+        with pytest.raises(NotFoundError):
+            _openai(create_app("replay", recordings=recordings)).chat.completions.create(
+                model="gpt-4o", messages=MESSAGES,
+            )
+
+        app = create_app("replay", recordings=recordings, replay_fallback=True)
+        assert _openai(app).chat.completions.create(model="gpt-4o", messages=MESSAGES).choices
+
+    def test_upstream_error_passed_through(self, tmp_path):
+        """Test an upstream error with a non-JSON body reaches the caller as sent."""
+        from fastapi import FastAPI
+        from fastapi.responses import PlainTextResponse
+
+        gateway = FastAPI()
+
+        @gateway.post("/v1/chat/completions")
+        async def bad_gateway():
+            return PlainTextResponse("upstream connect error", status_code=502)
+
+        recorder = create_app(
+            "record", recordings=tmp_path / "recordings.jsonl", upstream="http://upstream/v1",
+            upstream_transport=httpx.ASGITransport(app=gateway),
+        )
+        response = TestClient(recorder).post("/v1/chat/completions", json={"model": "gpt-4o", "messages": MESSAGES})
+        assert (response.status_code, response.text) == (502, "upstream connect error")
+        assert TestClient(recorder).get("/stats").json()["upstream_errors"] == 1
+
+    def test_prompt_key_ignores_transport_options(self):
+        """Test timeouts and other request options don't change the replay key."""
+        body = {"model": "gpt-4o", "messages": MESSAGES}
+        assert prompt_key(body) == prompt_key({**body, "timeout": 5, "user": "abc"})
+        assert prompt_key(body) != prompt_key({**body, "model": "gpt-4o-mini"})
+
+
+def test_async_client():
+    """Test the async client used by async endpoints works against the stand-in."""
+    async def run():
+        client = AsyncOpenAI(
+            api_key="sk-local",
+            base_url="http://testserver/v1",
+            http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=create_app("synthetic"))),
+        )
+        structured = instructor.from_openai(client)
+        return await structured.chat.completions.create(
+            model="gpt-4o-mini", response_model=CoffeeSizeResponse, messages=MESSAGES,
+        )
+
+    assert isinstance(asyncio.run(run()), CoffeeSizeResponse)
+
+
+def test_clients_use_base_url():
+    """Test the pooled OpenAI clients send requests to the configured base URL."""
+    provider = LLMClientProvider(base_url="http://127.0.0.1:8100/v1")
+    assert str(provider.openai(api_key="sk-local").base_url) == "http://127.0.0.1:8100/v1/"
+    assert provider.get_status()["base_url"] == "http://127.0.0.1:8100/v1"
+    provider.close()
@@ -0,0 +1,211 @@
+"""
+Tests for per-call LLM token, latency and cost accounting.
+
+LLM calls go to the local stand-in server (see llm_standin.py), so the
+usage recorded is what the OpenAI SDK and instructor report.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import instructor
+import pytest
+from fastapi.testclient import TestClient
+from openai import OpenAI
+from pydantic import BaseModel, model_validator
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from sandwich_bot import llm_usage
+from sandwich_bot.llm_standin import create_app
+from sandwich_bot.llm_usage import (
+    LLMCall,
+    get_llm_usage_stats,
+    model_cost,
+    reset_llm_usage_stats,
+    track_llm_call,
+    use_llm_usage_scope,
+)
+from sandwich_bot.models import LLMUsageSummary
+from sandwich_bot.tasks.parsers import llm_parsers
+from sandwich_bot.tasks.schemas import CoffeeSizeResponse
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    reset_llm_usage_stats()
+    yield
+    reset_llm_usage_stats()
+
+
+@pytest.fixture
+def standin_openai():
+    return OpenAI(api_key="sk-local", base_url="http://testserver/v1", http_client=TestClient(create_app()))
+
+
+def _usage(prompt, completion, cached=0):
+    return SimpleNamespace(
+        prompt_tokens=prompt,
+        completion_tokens=completion,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=cached),
+    )
+
+
+class TestCost:
+    """Tests for model pricing."""
+
+    def test_dated_snapshot_uses_base_price(self):
+        """Test a dated model name is priced like its base model, with cached tokens discounted."""
+        assert model_cost("gpt-4o-mini-2024-07-18", 1_000_000, 0) == pytest.approx(0.15)
+        assert model_cost("gpt-4o-mini", 1_000_000, 1_000_000, cached_tokens=1_000_000) == pytest.approx(0.675)
+        assert model_cost("gpt-4o", 1_000_000, 0) == pytest.approx(2.50)
+
+    def test_unknown_model_is_unpriced(self):
+        """Test models without a price report no cost instead of a wrong one."""
+        assert model_cost("local-llama", 100, 100) is None
+
+
+class TestTracking:
+    """Tests for track_llm_call and the rolling aggregates."""
+
+    def test_records_tokens_latency_and_scope(self):
+        """Test a call is attributed to the turn's session and store."""
+        with use_llm_usage_scope("session-1", "store_eb_001"):
+            with track_llm_call("sammy", "gpt-4o") as call:
+                call.add_usage(_usage(1000, 50, cached=800))
+
+        stats = get_llm_usage_stats(group_by=("name", "store_id"), recent=5)
+        [group] = stats["groups"]
+        assert (group["name"], group["store_id"]) == ("sammy", "store_eb_001")
+        assert (group["calls"], group["prompt_tokens"], group["cached_tokens"]) == (1, 1000, 800)
+        assert group["sessions"] == 1
+        assert group["cost_usd"] == pytest.approx((200 * 2.50 + 800 * 1.25 + 50 * 10.00) / 1e6)
+        assert stats["recent_calls"][0]["session_id"] == "session-1"
+
+    def test_failed_call_is_counted(self):
+        """Test a call that raises is recorded as an error and the error propagates."""
+        with pytest.raises(TimeoutError):
+            with track_llm_call("OpenInputResponse", "gpt-4o-mini"):
+                raise TimeoutError()
+        assert get_llm_usage_stats()["totals"]["errors"] == 1
+
+    def test_groups_ranked_by_llm_time(self):
+        """Test the call names using the most LLM time are listed first."""
+        for name, latency in (("CoffeeSizeResponse", 0.2), ("OpenInputResponse", 1.5), ("OpenInputResponse", 2.5)):
+            call = LLMCall(name, "gpt-4o-mini")
+            call.latency = latency
+            llm_usage._usage.record(call)
+
+        groups = get_llm_usage_stats(group_by=("name",))["groups"]
+        assert [g["name"] for g in groups] == ["OpenInputResponse", "CoffeeSizeResponse"]
+        assert groups[0]["latency_histogram"]["<=2000ms"] == 1
+        assert groups[0]["latency_histogram"]["<=4000ms"] == 1
+        assert groups[0]["latency_p50_ms"] == 2000
+        assert groups[0]["latency_p95_ms"] == 2500.0
+
+    def test_window_drops_old_minutes(self):
+        """Test usage older than the window is not reported."""
+        old = LLMCall("sammy", "gpt-4o")
+        llm_usage._usage.record(old, now=time.time() - 3600 * 2)
+        llm_usage._usage.record(LLMCall("sammy", "gpt-4o"))
+        assert get_llm_usage_stats()["totals"]["calls"] == 1
+
+    def test_stats_while_recording(self):
+        """Test stats can be read while other threads record calls."""
+        stop = threading.Event()
+
+        def record():
+            n = 0
+            while not stop.is_set():
+                n += 1
+                call = LLMCall(f"Response{n % 50}", "gpt-4o-mini")
+                call.session_id = str(n)
+                llm_usage._usage.record(call)
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        try:
+            for _ in range(200):
+                stats = get_llm_usage_stats(group_by=("name",), recent=10)
+                assert stats["totals"]["calls"] == sum(g["calls"] for g in stats["groups"])
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+    def test_unknown_group_field(self):
+        """Test grouping by an unknown field is rejected."""
+        with pytest.raises(ValueError):
+            get_llm_usage_stats(group_by=("customer",))
+
+
+class TestInstrumentedCallers:
+    """Tests for the instrumented parser and sammy calls."""
+
+    def test_parser_completion_is_recorded(self, standin_openai, monkeypatch):
+        """Test a parser's LLM fallback records the usage instructor reports."""
+        monkeypatch.setattr(llm_parsers, "get_instructor_client", lambda: instructor.from_openai(standin_openai))
+        llm_parsers._complete("What size?", CoffeeSizeResponse, "gpt-4o-mini", cache=False)
+
+        [group] = get_llm_usage_stats()["groups"]
+        assert (group["name"], group["model"], group["calls"], group["retries"]) == (
+            "CoffeeSizeResponse", "gpt-4o-mini", 1, 0,
+        )
+        assert group["prompt_tokens"] > 0 and group["completion_tokens"] > 0
+
+    def test_validation_retries_are_counted(self, standin_openai):
+        """Test instructor's validation retries count and add their tokens."""
+        attempts = []
+
+        class Picky(BaseModel):
+            size: str | None = None
+
+            @model_validator(mode="after")
+            def second_time_lucky(self):
+                attempts.append(self.size)
+                if len(attempts) == 1:
+                    raise ValueError("try again")
+                return self
+
+        client = instructor.from_openai(standin_openai)
+        with track_llm_call("Picky", "gpt-4o-mini") as call:
+            client.chat.completions.create(
+                model="gpt-4o-mini", response_model=Picky, max_retries=2,
+                messages=[{"role": "user", "content": "large"}], hooks=call.hooks(),
+            )
+
+        assert len(attempts) == 2
+        assert (call.retries, call.requests) == (1, 2)
+
+    def test_sammy_stream_usage(self, standin_openai, monkeypatch):
+        """Test a streamed sammy reply records the usage of the stream's last chunk."""
+        from sandwich_bot.sammy import llm_client
+
+        monkeypatch.setattr(llm_client, "LLM_PROVIDER", "openai")
+        monkeypatch.setattr(llm_client, "openai_client", standin_openai)
+        assert "".join(llm_client.call_sandwich_bot_stream([], {}, {}, "hi"))
+
+        [group] = get_llm_usage_stats()["groups"]
+        assert group["name"] == "sammy_stream"
+        assert group["prompt_tokens"] > 0
+
+
+def test_flush_writes_finished_minutes():
+    """Test finished minutes are written once and the current minute is kept."""
+    engine = create_engine("sqlite://")
+    LLMUsageSummary.__table__.create(engine)
+    db = sessionmaker(bind=engine)()
+
+    now = time.time()
+    call = LLMCall("OpenInputResponse", "gpt-4o-mini")
+    call.add_usage(_usage(3000, 40))
+    llm_usage._usage.record(call, now=now - 120)
+    llm_usage._usage.record(LLMCall("sammy", "gpt-4o"), now=now)
+
+    assert llm_usage.flush_llm_usage(db, now=now) == 1
+    assert llm_usage.flush_llm_usage(db, now=now) == 0
+    [row] = db.query(LLMUsageSummary).all()
+    assert (row.name, row.calls, row.prompt_tokens, row.completion_tokens) == ("OpenInputResponse", 1, 3000, 40)
+    assert row.cost_usd == pytest.approx((3000 * 0.15 + 40 * 0.60) / 1e6)
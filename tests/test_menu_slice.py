@@ -0,0 +1,124 @@
+"""
+Tests for the relevant-menu slice sent in sammy prompts.
+"""
+
+import json
+
+import pytest
+
+from sandwich_bot.menu_data_cache import menu_cache
+from sandwich_bot.sammy import llm_client, menu_slice
+from sandwich_bot.sammy.menu_slice import render_menu_slice
+
+
+def _item(item_id, name, item_type, category, is_signature=False):
+    return {
+        "id": item_id,
+        "name": name,
+        "category": category,
+        "is_signature": is_signature,
+        "base_price": 9.5,
+        "item_type": item_type,
+        "recipe": {"name": name, "base_ingredients": [{"name": "Egg"}, {"name": "Cheddar"}], "choice_groups": []},
+        "default_config": {"bread": "Plain Bagel", "toasted": True},
+    }
+
+
+def _menu(extra_bagels=0):
+    leo = _item(1, "The Leo", "egg_sandwich", "signature", is_signature=True)
+    bec = _item(2, "The Classic BEC", "egg_sandwich", "signature", is_signature=True)
+    latte = _item(3, "Latte", "sized_beverage", "drink")
+    hash_browns = _item(4, "Hash Browns", "side", "side")
+    bagels = [_item(100 + i, f"Bagel Special {i}", "bagel", "signature") for i in range(extra_bagels)]
+    signature = [leo, bec, *bagels]
+    return {
+        "signature_sandwiches": signature,
+        "sides": [hash_browns],
+        "drinks": [latte],
+        "desserts": [],
+        "items_by_type": {"egg_sandwich": [leo, bec], "sized_beverage": [latte], "side": [hash_browns]},
+        "item_keywords": {"latte": "sized_beverage", "coffee": "sized_beverage"},
+        "ingredient_to_items": {"egg": [leo, bec]},
+        "bread_types": ["Plain Bagel", "Everything Bagel"],
+    }
+
+
+@pytest.fixture(autouse=True)
+def menu_keywords(monkeypatch):
+    """Menu cache keyword lookups for the test menu."""
+    known = {"the leo": "The Leo", "leo": "The Leo", "the classic bec": "The Classic BEC", "bec": "The Classic BEC"}
+    monkeypatch.setattr(
+        menu_cache, "find_menu_item_matches",
+        lambda query: sorted(name for word in query.split() for name in known if word == name),
+    )
+    monkeypatch.setattr(
+        menu_cache, "get_category_keyword_mapping",
+        lambda keyword: {"slug": "sized_beverage", "expands_to": None, "name_filter": None}
+        if keyword in ("coffee", "coffees") else None,
+    )
+    menu_slice._fragments.clear()
+
+
+def _slice(menu, message, order_state=None):
+    return json.loads(render_menu_slice(menu, message, order_state))
+
+
+class TestMenuSlice:
+    """Tests for picking the relevant items."""
+
+    def test_named_item_is_sent_in_full(self):
+        """Test an item found by the keyword index is sent whole and the rest by name."""
+        sliced = _slice(_menu(), "can I get a leo")
+        assert [item["name"] for item in sliced["signature_sandwiches"]] == ["The Leo"]
+        assert sliced["signature_sandwiches"][0]["recipe"]["base_ingredients"]
+        assert sliced["other_menu_items"] == {
+            "signature_sandwiches": ["The Classic BEC"],
+            "sides": ["Hash Browns"],
+            "drinks": ["Latte"],
+        }
+        assert sliced["bread_types"] == ["Plain Bagel", "Everything Bagel"]
+        for key in ("items_by_type", "item_keywords", "ingredient_to_items"):
+            assert key not in sliced
+
+    def test_item_type_keyword(self):
+        """Test a category keyword includes that item type's items."""
+        assert [item["name"] for item in _slice(_menu(), "an iced coffee please")["drinks"]] == ["Latte"]
+        assert [item["name"] for item in _slice(_menu(), "two lattes")["drinks"]] == ["Latte"]
+
+    def test_category_name_includes_whole_category(self):
+        """Test asking about a category list sends all of it."""
+        sliced = _slice(_menu(), "what sides do you have?")
+        assert [item["name"] for item in sliced["sides"]] == ["Hash Browns"]
+        assert "signature_sandwiches" not in sliced
+
+    def test_full_name_in_message(self):
+        """Test an item named in full is included without the keyword index."""
+        assert [item["name"] for item in _slice(_menu(), "and hash browns")["sides"]] == ["Hash Browns"]
+
+    def test_order_items_stay_relevant(self):
+        """Test items already ordered are sent even when the message doesn't name them."""
+        order_state = {"items": [{"item_type": "side", "menu_item_name": "Hash Browns"}]}
+        sliced = _slice(_menu(), "yes please", order_state)
+        assert [item["name"] for item in sliced["sides"]] == ["Hash Browns"]
+        assert "signature_sandwiches" not in sliced
+
+    def test_fragments_built_once_per_menu(self):
+        """Test a menu is serialized once and reused for later turns."""
+        menu = _menu()
+        render_menu_slice(menu, "a leo")
+        fragments = menu_slice._get_fragments(menu)
+        render_menu_slice(menu, "a latte")
+        assert menu_slice._get_fragments(menu) is fragments
+        assert menu_slice._get_fragments(_menu()) is not fragments
+
+
+def test_prompt_is_much_smaller_on_large_menus():
+    """Test the sammy prompt carries the slice, compactly, instead of the whole menu."""
+    menu = _menu(extra_bagels=200)
+    system, messages = llm_client._build_messages(
+        [], {"items": []}, menu, "a large latte", include_menu_in_system=True,
+    )
+    menu_text = system.split("\n\nMENU:\n", 1)[1]
+    assert len(menu_text) < len(json.dumps(menu, indent=2)) / 5
+    assert '"drinks":[{"id":3,"name":"Latte"' in system
+    assert messages[-1]["content"].endswith(llm_client.RESPONSE_SCHEMA_TEXT + "\n")
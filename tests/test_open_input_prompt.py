@@ -0,0 +1,83 @@
+"""
+Tests for the open input LLM prompt: a static per-menu system prefix and a
+short per-turn user message.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from sandwich_bot.menu_data_cache import menu_cache
+from sandwich_bot.tasks.parsers import llm_parsers
+from sandwich_bot.tasks.schemas import OpenInputResponse
+
+
+class _FakeCompletions:
+    """Instructor completions that record calls and return an empty response."""
+
+    def __init__(self):
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return OpenInputResponse()
+
+
+@pytest.fixture
+def completions(monkeypatch):
+    completions = _FakeCompletions()
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    monkeypatch.setattr(llm_parsers, "get_instructor_client", lambda: client)
+    monkeypatch.setattr(llm_parsers, "_try_open_input_deterministic", lambda *a, **k: None)
+    return completions
+
+
+class TestOpenInputPrompt:
+    """Tests for the open input prompt layout."""
+
+    def test_system_prompt_lists_menu_items(self, monkeypatch):
+        """Test signature items, sides and item types come from the menu cache."""
+        monkeypatch.setattr(menu_cache, "get_signature_item_aliases", lambda: {
+            "the leo": "The Leo", "leo": "The Leo", "bec": "The Classic BEC",
+        })
+        monkeypatch.setattr(menu_cache, "get_menu_index", lambda: {
+            "sides": [{"name": "Side of Bacon"}, {"name": "Hard Boiled Egg"}],
+            "items_by_type": {"omelette": [], "sized_beverage": [], "signature_items": []},
+        })
+
+        prompt = llm_parsers._build_open_input_system_prompt()
+        assert 'pre-configured: "The Classic BEC", "The Leo"\n' in prompt
+        assert "Available sides: Hard Boiled Egg, Side of Bacon\n" in prompt
+        assert "Menu item types: omelette, sized_beverage\n" in prompt
+        assert "The user said" not in prompt
+
+    def test_signature_examples_come_from_the_menu(self, monkeypatch):
+        """Test signature item examples use the menu's aliases, not another shop's items."""
+        monkeypatch.setattr(menu_cache, "get_signature_item_aliases", lambda: {
+            "the hudson": "The Hudson", "hudson": "The Hudson",
+        })
+        monkeypatch.setattr(menu_cache, "get_menu_index", lambda: {})
+
+        prompt = llm_parsers._build_open_input_system_prompt()
+        assert '  - "hudson" -> new_signature_item: true, new_signature_item_name: "The Hudson"\n' in prompt
+        assert '"the hudson" ->' not in prompt
+        for name in ("The Classic BEC", "The Leo", "Max Zucker", "Chelsea Club", "Lexington", "Delancey"):
+            assert name not in prompt
+
+    def test_user_message_is_only_the_turn(self):
+        """Test the per-turn message holds just the context and the input."""
+        assert llm_parsers._open_input_prompt("a coffee") == 'The user said: "a coffee"'
+        assert llm_parsers._open_input_prompt("a coffee", "Order has 1 item") == (
+            'Context: Order has 1 item\nThe user said: "a coffee"'
+        )
+
+    def test_turns_share_the_system_prefix(self, completions):
+        """Test every call starts with the same system message so it can be cached."""
+        llm_parsers.parse_open_input("something sweet for my kid")
+        llm_parsers.parse_open_input("whatever you recommend", context="Order has 2 items")
+
+        first, second = (call["messages"] for call in completions.calls)
+        assert first[0]["role"] == second[0]["role"] == "system"
+        assert first[0]["content"] == second[0]["content"]
+        assert first[1] == {"role": "user", "content": 'The user said: "something sweet for my kid"'}
+        assert second[1]["content"].startswith("Context: Order has 2 items\n")
@@ -0,0 +1,77 @@
+"""
+Tests for the per-turn deterministic parse budget.
+"""
+
+import pytest
+
+from sandwich_bot.tasks.parse_context import TurnParseContext
+from sandwich_bot.tasks.parsers import deterministic
+from sandwich_bot.tasks.parsers.parse_budget import (
+    ParseBudget,
+    ParseDeadlineExceeded,
+    check_parse_deadline,
+    parse_deadline,
+    use_parse_budget,
+)
+
+
+class TestParseDeadline:
+    """Tests for spending from the active budget."""
+
+    def test_no_deadline_outside_a_parse(self):
+        """Test checks outside a parse_deadline block never raise."""
+        with use_parse_budget(ParseBudget(0.001)) as budget:
+            budget.remaining = 0
+            check_parse_deadline("outside")
+
+    def test_exhausted_budget_raises(self):
+        """Test a parse with no budget left stops at the next check."""
+        budget = ParseBudget(0.25)
+        budget.remaining = 0
+        with use_parse_budget(budget), parse_deadline():
+            with pytest.raises(ParseDeadlineExceeded, match="before coffee"):
+                check_parse_deadline("coffee")
+        assert budget.exceeded
+
+    def test_blocks_spend_from_one_budget(self):
+        """Test time spent in a block is taken off the turn's budget."""
+        budget = ParseBudget(10.0)
+        with use_parse_budget(budget):
+            with parse_deadline():
+                pass
+            with parse_deadline():
+                pass
+        assert 0 < budget.remaining < 10.0
+
+    def test_zero_budget_disables_deadline(self):
+        """Test a budget of 0 never raises."""
+        with use_parse_budget(ParseBudget(0)), parse_deadline():
+            check_parse_deadline("anything")
+
+
+class TestDeterministicFallback:
+    """Tests for parse_open_input_deterministic degrading to the LLM."""
+
+    def test_spent_budget_falls_back(self):
+        """Test a turn with no budget left returns None instead of parsing."""
+        assert deterministic.parse_open_input_deterministic("how much is a bagel?") is not None
+
+        budget = ParseBudget(0.25)
+        budget.remaining = 0
+        with use_parse_budget(budget):
+            assert deterministic.parse_open_input_deterministic("how much is a bagel?") is None
+
+    def test_long_input_falls_back(self, monkeypatch):
+        """Test inputs over DETERMINISTIC_PARSE_MAX_CHARS skip the regexes."""
+        monkeypatch.setattr(deterministic, "DETERMINISTIC_PARSE_MAX_CHARS", 20)
+        assert deterministic.parse_open_input_deterministic("how much is a bagel please?") is None
+
+    def test_turn_context_shares_its_budget(self):
+        """Test parsers run through a TurnParseContext spend its budget."""
+        budget = ParseBudget(0.25)
+        budget.remaining = 0
+        context = TurnParseContext("how much is a bagel?", budget)
+        assert context.run(deterministic.parse_open_input_deterministic, "how much is a bagel?") is None
+
+        fresh = TurnParseContext("how much is a bagel?")
+        assert fresh.run(deterministic.parse_open_input_deterministic, "how much is a bagel?") is not None
@@ -0,0 +1,88 @@
+"""
+Tests for the per-turn parse context.
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+from sandwich_bot.tasks.handler_config import BaseHandler, HandlerConfig
+from sandwich_bot.tasks.parse_context import TurnParseContext, use_parse_context
+from sandwich_bot.tasks.schemas import OpenInputResponse
+
+
+class TestTurnParseContext:
+    """Tests for memoizing parser results within one turn."""
+
+    def test_parser_runs_once_per_input(self):
+        """Test repeated calls with the same input reuse the first result."""
+        parser = MagicMock(return_value=OpenInputResponse(new_bagel=True))
+        context = TurnParseContext("plain bagel")
+
+        first = context.run(parser, "plain bagel", model="gpt-4o-mini")
+        second = context.run(parser, "plain bagel", model="gpt-4o-mini")
+
+        assert parser.call_count == 1
+        assert first.new_bagel and second.new_bagel
+        assert context.get_stats() == {"runs": 1, "reuses": 1}
+
+    def test_arguments_are_part_of_the_key(self):
+        """Test different inputs, arguments or parsers each run."""
+        parser = MagicMock(return_value=OpenInputResponse())
+        other_parser = MagicMock(return_value=OpenInputResponse())
+        keywords = {"sugar": "sweeteners"}
+        context = TurnParseContext()
+
+        context.run(parser, "plain bagel")
+        context.run(parser, "sesame bagel")
+        context.run(parser, "plain bagel", modifier_category_keywords=keywords)
+        context.run(parser, "plain bagel", modifier_category_keywords=keywords)
+        context.run(other_parser, "plain bagel")
+
+        assert parser.call_count == 3
+        assert other_parser.call_count == 1
+
+    def test_results_are_copies(self):
+        """Test a caller mutating its result does not affect later callers."""
+        parser = MagicMock(return_value=OpenInputResponse(new_bagel_type="plain"))
+        context = TurnParseContext()
+
+        first = context.run(parser, "plain bagel")
+        first.new_bagel_type = "sesame"
+
+        assert context.run(parser, "plain bagel").new_bagel_type == "plain"
+
+
+class TestHandlerParseContext:
+    """Tests for handlers reaching the current turn's context."""
+
+    def test_handler_uses_current_context(self):
+        """Test handlers share the context made current for the turn."""
+        handler = BaseHandler(HandlerConfig())
+        context = TurnParseContext("hi")
+        with use_parse_context(context):
+            assert handler.parse_context is context
+        assert handler.parse_context is not context
+
+    def test_parallel_turns_keep_their_own_context(self):
+        """Test turns on one handler in parallel threads don't see each other's context."""
+        handler = BaseHandler(HandlerConfig())
+        both_set = threading.Barrier(2, timeout=5)
+        seen = {}
+
+        def turn(user_input):
+            context = TurnParseContext(user_input)
+            with use_parse_context(context):
+                both_set.wait()
+                seen[user_input] = handler.parse_context is context
+
+        threads = [threading.Thread(target=turn, args=(text,)) for text in ("plain bagel", "large latte")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert seen == {"plain bagel": True, "large latte": True}
+
+    def test_handler_outside_turn_gets_fresh_context(self):
+        """Test handlers without a turn get a new context each time."""
+        handler = BaseHandler()
+        assert handler.parse_context is not handler.parse_context
@@ -0,0 +1,167 @@
+"""
+Tests for the cross-session parse memo.
+
+These tests use small pydantic models and private ParseMemo instances (or
+reset the global one to a test menu version) so they don't depend on the
+menu cache.
+"""
+
+import pytest
+from pydantic import BaseModel
+
+from sandwich_bot.parse_memo import ParseMemo, memoize_parser, parse_memo
+
+
+class _Response(BaseModel):
+    value: str
+    items: list[str] = []
+
+
+@pytest.fixture
+def memo_version():
+    """Enable the global memo for a test menu version, restoring it afterwards."""
+    original_version = parse_memo.menu_version
+    parse_memo.reset("test-menu")
+    yield parse_memo
+    parse_memo.reset(original_version)
+
+
+class TestParseMemo:
+    """Tests for ParseMemo storage, eviction and invalidation."""
+
+    def test_hit_returns_independent_copy(self):
+        """Test callers can mutate a hit without changing the cached result."""
+        memo = ParseMemo(max_size=10, ttl_seconds=60)
+        memo.reset("v1")
+        key = memo.make_key("spread_choice", "butter", {})
+        memo.put(key, _Response(value="butter"))
+
+        first = memo.get(key)
+        first.items.append("mutated")
+        second = memo.get(key)
+        assert second.items == []
+        assert first is not second
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted at capacity."""
+        memo = ParseMemo(max_size=2, ttl_seconds=60)
+        memo.reset("v1")
+        keys = [memo.make_key("p", text, {}) for text in ("a", "b", "c")]
+        memo.put(keys[0], _Response(value="a"))
+        memo.put(keys[1], _Response(value="b"))
+        memo.get(keys[0])  # "a" is now most recently used
+        memo.put(keys[2], _Response(value="c"))
+
+        assert memo.get(keys[1]) is None
+        assert memo.get(keys[0]).value == "a"
+        assert memo.get_status()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        """Test expired entries count as misses."""
+        memo = ParseMemo(max_size=10, ttl_seconds=0)
+        memo.reset("v1")
+        key = memo.make_key("p", "a", {})
+        memo.put(key, _Response(value="a"))
+        assert memo.get(key) is None
+        assert memo.get_status()["expirations"] == 1
+
+    def test_reset_drops_entries_and_changes_keys(self):
+        """Test a menu refresh drops results and versions new keys."""
+        memo = ParseMemo(max_size=10, ttl_seconds=60)
+        memo.reset("v1")
+        old_key = memo.make_key("p", "a", {})
+        memo.put(old_key, _Response(value="a"))
+
+        memo.reset("v2")
+        assert memo.get_status()["size"] == 0
+        assert memo.make_key("p", "a", {}) != old_key
+
+        # A result parsed against the old menu is not stored
+        memo.put(old_key, _Response(value="a"))
+        assert memo.get_status()["size"] == 0
+
+    def test_disabled_without_menu_version(self):
+        """Test nothing is memoized before a menu version is set."""
+        memo = ParseMemo(max_size=10, ttl_seconds=60)
+        assert not memo.enabled
+        memo.reset("v1")
+        assert memo.enabled
+        assert not ParseMemo(max_size=0, ttl_seconds=60).enabled
+
+    def test_context_mappings_fingerprinted_by_content(self):
+        """Test equal mappings give equal keys and different mappings don't."""
+        memo = ParseMemo(max_size=10, ttl_seconds=60)
+        memo.reset("v1")
+        key_a = memo.make_key("p", "x", {"keywords": {"sugar": "sweeteners"}})
+        key_b = memo.make_key("p", "x", {"keywords": {"sugar": "sweeteners"}})
+        key_c = memo.make_key("p", "x", {"keywords": {"milk": "milks"}})
+        assert key_a == key_b
+        assert key_a != key_c
+
+
+class TestMemoizeParser:
+    """Tests for the memoize_parser decorator."""
+
+    def test_repeat_input_served_from_memo(self, memo_version):
+        """Test a repeated utterance is only parsed once."""
+        calls = []
+
+        @memoize_parser("test_repeat")
+        def parse(user_input: str, num_bagels: int = 1) -> _Response:
+            calls.append(user_input)
+            return _Response(value=user_input)
+
+        assert parse("plain  bagel ").value == "plain bagel"
+        assert parse("plain bagel").value == "plain bagel"
+        assert calls == ["plain bagel"]
+
+    def test_context_arguments_are_part_of_key(self, memo_version):
+        """Test the same text with different context is parsed separately."""
+        calls = []
+
+        @memoize_parser("test_context")
+        def parse(user_input: str, num_bagels: int = 1, descriptions: list[str] | None = None) -> _Response:
+            calls.append(num_bagels)
+            return _Response(value=str(num_bagels))
+
+        parse("all plain", 2, ["bagel 1", "bagel 2"])
+        parse("all plain", 3, ["bagel 1", "bagel 2", "bagel 3"])
+        parse("all plain", num_bagels=2, descriptions=["bagel 1", "bagel 2"])
+        assert calls == [2, 3]
+
+    def test_non_model_results_not_cached(self, memo_version):
+        """Test plain return values pass through without being memoized."""
+        calls = []
+
+        @memoize_parser("test_passthrough")
+        def parse(user_input: str):
+            calls.append(user_input)
+            return None
+
+        parse("hello")
+        parse("hello")
+        assert calls == ["hello", "hello"]
+
+    @pytest.mark.parametrize("parser_name, response", [
+        ("parse_delivery_choice", {"choice": "delivery", "address": "12 Main St Apt 4"}),
+        ("parse_payment_method", {"choice": "text", "phone_number": "7325551234"}),
+    ])
+    def test_customer_detail_parsers_not_memoized(self, memo_version, monkeypatch, parser_name, response):
+        """Test parsers whose responses carry addresses or contact details never use the memo."""
+        from sandwich_bot.tasks.parsers import llm_parsers
+
+        calls = []
+
+        def complete(prompt, response_model, model, **kwargs):
+            calls.append(prompt)
+            return response_model(**response)
+
+        monkeypatch.setattr(llm_parsers, "_complete", complete)
+        parser = getattr(llm_parsers, parser_name)
+        utterance = "hmm let me think, it's for my place at 12 main street apartment 4, 732 555 1234"
+        hits = memo_version.get_status()["hits"]
+        parser(utterance)
+        parser(utterance)
+        assert len(calls) == 2
+        status = memo_version.get_status()
+        assert (status["size"], status["hits"]) == (0, hits)
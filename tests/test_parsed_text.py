@@ -0,0 +1,98 @@
+"""
+Tests for the shared tokenized view of a user message.
+"""
+
+from sandwich_bot.menu_data_cache import _build_item_phrase_matcher
+from sandwich_bot.tasks.parse_context import TurnParseContext, use_parse_context
+from sandwich_bot.tasks.parsers.parsed_text import (
+    ParsedText,
+    Token,
+    get_parsed_text,
+    strip_filler_words,
+)
+
+
+class TestParsedText:
+    """Tests for ParsedText views and the per-turn instances."""
+
+    def test_normalized_text(self):
+        """Test raw, stripped and lowercased views."""
+        parsed = ParsedText("  Plain Bagel Toasted ")
+        assert parsed.raw == "  Plain Bagel Toasted "
+        assert parsed.text == "Plain Bagel Toasted"
+        assert parsed.lower == "plain bagel toasted"
+
+    def test_tokens_have_offsets_into_lower(self):
+        """Test token offsets index into the lowercased text."""
+        parsed = ParsedText("Two BLTs, please")
+        assert parsed.tokens == (
+            Token("two", 0, 3),
+            Token("blts", 4, 8),
+            Token("please", 10, 16),
+        )
+        for token in parsed.tokens:
+            assert parsed.lower[token.start:token.end] == token.text
+
+    def test_numbers(self):
+        """Test number words and digits are found and valued."""
+        parsed = ParsedText("three plain bagels and 2 coffees")
+        assert [(n.token.text, n.value) for n in parsed.numbers] == [("three", 3), ("2", 2)]
+        assert parsed.leading_quantity == 3
+        # Articles are not quantities
+        assert ParsedText("a plain bagel").numbers == ()
+        assert ParsedText("plain bagel").leading_quantity is None
+
+    def test_filler_stripped(self):
+        """Test leading filler words are removed and shared instances are reused."""
+        with use_parse_context(TurnParseContext()):
+            parsed = get_parsed_text("Um, actually, two bagels")
+            assert parsed.filler_stripped.text == "two bagels"
+            assert parsed.filler_stripped is get_parsed_text("two bagels")
+
+            plain = get_parsed_text("two bagels")
+            assert plain.filler_stripped is plain
+        assert strip_filler_words("actually coke") == "actually coke"
+
+    def test_keyword_flags(self):
+        """Test bagel/with/and flags use the same boundaries as the regexes they replace."""
+        assert ParsedText("two bagels").has_bagel
+        assert not ParsedText("bagelry special").has_bagel
+        parsed = ParsedText("plain bagel with lox and capers")
+        assert parsed.has_with and parsed.has_and and parsed.has_list_separator
+        assert ParsedText("lox, capers").has_list_separator
+        assert not ParsedText("lox").has_list_separator
+
+    def test_single_item_spans_protect_separators(self):
+        """Test compound item names containing "and" are not list separators."""
+        matcher = _build_item_phrase_matcher()
+        parsed = ParsedText("bacon egg and cheese on plain")
+        assert not parsed.has_list_separator_outside(parsed.single_item_spans(matcher))
+        parsed = ParsedText("a latte and a bagel")
+        assert parsed.has_list_separator_outside(parsed.single_item_spans(matcher))
+
+    def test_split_list(self):
+        """Test splitting at separators outside protected spans."""
+        matcher = _build_item_phrase_matcher(compound_names=["Ham & Swiss"])
+        parsed = ParsedText("a bacon egg and cheese, ham and swiss, and a latte")
+        assert parsed.split_list(parsed.single_item_spans(matcher)) == [
+            "a bacon egg and cheese", "ham and swiss", "a latte",
+        ]
+        assert ParsedText("lox, capers and onions").split_list() == ["lox", "capers", "onions"]
+
+    def test_item_phrases_rescanned_for_new_matcher(self):
+        """Test the cached scan is tied to the matcher that produced it."""
+        parsed = ParsedText("ham and swiss and a coffee")
+        assert parsed.single_item_spans(_build_item_phrase_matcher()) == []
+        matcher = _build_item_phrase_matcher(compound_names=["Ham & Swiss"])
+        assert parsed.single_item_spans(matcher) == [(0, 13)]
+        assert parsed.item_phrases(matcher) is parsed.item_phrases(matcher)
+
+    def test_get_parsed_text_is_shared_within_a_turn(self):
+        """Test the same string maps to the turn's instance, and to a new one outside turns."""
+        context = TurnParseContext("large iced latte")
+        with use_parse_context(context):
+            parsed = get_parsed_text("large iced latte")
+            assert get_parsed_text("large iced latte") is parsed
+            assert context.parsed_text("large iced latte") is parsed
+        assert get_parsed_text("large iced latte") is not parsed
+        assert TurnParseContext().parsed_text("large iced latte") is not parsed
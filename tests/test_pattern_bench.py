@@ -0,0 +1,40 @@
+"""
+Worst-case timing of the parser regexes on adversarial input.
+"""
+
+from sandwich_bot.config import MAX_MESSAGE_LENGTH
+from sandwich_bot.tasks.parsers.pattern_bench import (
+    adversarial_inputs,
+    benchmark_patterns,
+    collect_patterns,
+)
+
+# Far above a linear scan of MAX_MESSAGE_LENGTH characters, far below the
+# seconds a backtracking blowup takes
+WORST_CASE_SECONDS = 0.5
+
+
+class TestPatternBench:
+    """Tests for the regex benchmark and the patterns it covers."""
+
+    def test_collects_nested_patterns(self):
+        """Test patterns inside lists and tuples are collected with their index."""
+        names = {name for name, _ in collect_patterns()}
+        assert "deterministic.REPLACE_ITEM_PATTERN" in names
+        assert "constants.PRICE_INQUIRY_PATTERNS[0]" in names
+        assert "deterministic.MENU_QUERY_PATTERNS[1]" in names
+
+    def test_inputs_use_pattern_words(self):
+        """Test inputs are built from the literal words of the pattern."""
+        import re
+        kinds = [kind for kind, _ in adversarial_inputs(re.compile(r"deliver\s+to\s+(.+?)$"), 100)]
+        assert "'deliver' then whitespace" in kinds
+        assert all(len(text) == 100 for _, text in adversarial_inputs(re.compile("x"), 100))
+
+    def test_no_pattern_backtracks_on_long_input(self):
+        """Test every parser regex stays fast on MAX_MESSAGE_LENGTH inputs."""
+        slow = [
+            timing for timing in benchmark_patterns(length=MAX_MESSAGE_LENGTH)
+            if timing.seconds > WORST_CASE_SECONDS
+        ]
+        assert not slow, slow
@@ -0,0 +1,115 @@
+"""
+Tests for the menu-version-keyed compiled pattern registry.
+
+These tests use a private PatternRegistry instance so they don't disturb the
+patterns registered by the parsers on the global registry.
+"""
+
+import re
+
+import pytest
+
+from sandwich_bot.pattern_registry import PatternRegistry
+
+
+class TestPatternRegistry:
+    """Tests for PatternRegistry build, lookup and invalidation."""
+
+    def test_get_builds_lazily_once(self):
+        """Test a pattern is compiled on first use and then reused."""
+        registry = PatternRegistry()
+        calls = []
+
+        @registry.register("greeting")
+        def _build():
+            calls.append(1)
+            return re.compile(r"\bhello\b")
+
+        first = registry.get("greeting")
+        second = registry.get("greeting")
+        assert first is second
+        assert len(calls) == 1
+        assert registry.get_status()["lazy_builds"] == 1
+
+    def test_rebuild_recompiles_every_pattern(self):
+        """Test rebuild compiles all builders against the new vocabulary."""
+        registry = PatternRegistry()
+        vocabulary = {"plain"}
+
+        @registry.register("bagel_types")
+        def _build():
+            return re.compile("|".join(sorted(vocabulary)))
+
+        registry.rebuild("v1")
+        assert registry.get("bagel_types").fullmatch("plain")
+        assert not registry.get("bagel_types").fullmatch("sesame")
+
+        vocabulary.add("sesame")
+        # Still the v1 pattern until the menu is reloaded
+        assert not registry.get("bagel_types").fullmatch("sesame")
+
+        registry.rebuild("v2")
+        assert registry.menu_version == "v2"
+        assert registry.get("bagel_types").fullmatch("sesame")
+
+    def test_failed_builder_is_retried_lazily(self):
+        """Test a builder that fails during rebuild is retried on get()."""
+        registry = PatternRegistry()
+        state = {"ready": False}
+
+        @registry.register("flaky")
+        def _build():
+            if not state["ready"]:
+                raise RuntimeError("menu cache not loaded")
+            return re.compile("ok")
+
+        registry.rebuild("v1")
+        assert registry.get_status()["compiled"] == 0
+
+        with pytest.raises(RuntimeError):
+            registry.get("flaky")
+
+        state["ready"] = True
+        assert registry.get("flaky").pattern == "ok"
+
+    def test_unknown_pattern_raises(self):
+        """Test looking up an unregistered name raises KeyError."""
+        registry = PatternRegistry()
+        with pytest.raises(KeyError):
+            registry.get("missing")
+
+    def test_reregistering_replaces_compiled_value(self):
+        """Test registering a new builder under an existing name drops the old pattern."""
+        registry = PatternRegistry()
+
+        @registry.register("name")
+        def _old():
+            return re.compile("old")
+
+        registry.rebuild("v1")
+        assert registry.get("name").pattern == "old"
+
+        @registry.register("name")
+        def _new():
+            return re.compile("new")
+
+        assert registry.get("name").pattern == "new"
+
+    def test_status(self):
+        """Test status reports version and counts."""
+        registry = PatternRegistry()
+
+        @registry.register("a")
+        def _build_a():
+            return re.compile("a")
+
+        @registry.register("b")
+        def _build_b():
+            return re.compile("b")
+
+        registry.rebuild("abc123")
+        status = registry.get_status()
+        assert status["menu_version"] == "abc123"
+        assert status["registered"] == 2
+        assert status["compiled"] == 2
+        assert status["rebuilds"] == 1
@@ -0,0 +1,119 @@
+"""
+Tests for the single-pass phrase matcher.
+
+The matcher is a pure data structure, so these tests build small vocabularies
+directly rather than loading the menu cache.
+"""
+
+from sandwich_bot.phrase_matcher import PhraseMatch, PhraseMatcher
+
+
+# =============================================================================
+# find_all Tests
+# =============================================================================
+
+class TestPhraseMatcherFindAll:
+    """Tests for PhraseMatcher.find_all."""
+
+    def test_finds_every_occurrence_in_one_pass(self):
+        """Test overlapping phrases from several categories are all reported."""
+        matcher = PhraseMatcher({
+            "protein": {"bacon", "turkey bacon"},
+            "qualifier": {"extra", "on the side"},
+        })
+        matches = matcher.find_all("extra turkey bacon on the side")
+        assert PhraseMatch(0, 5, "extra", "qualifier") in matches
+        assert PhraseMatch(6, 18, "turkey bacon", "protein") in matches
+        assert PhraseMatch(13, 18, "bacon", "protein") in matches
+        assert PhraseMatch(19, 30, "on the side", "qualifier") in matches
+        assert len(matches) == 4
+
+    def test_respects_word_boundaries(self):
+        """Test 'ham' does not match inside 'graham' or 'hamburger'."""
+        matcher = PhraseMatcher({"protein": {"ham"}})
+        assert matcher.find_all("graham cracker and a hamburger") == []
+        assert matcher.find_all("ham, please") == [PhraseMatch(0, 3, "ham", "protein")]
+
+    def test_phrase_in_multiple_categories(self):
+        """Test a phrase shared by two categories is reported for both."""
+        matcher = PhraseMatcher({"bagel_type": {"egg"}, "protein": {"egg"}})
+        categories = {m.category for m in matcher.find_all("egg bagel")}
+        assert categories == {"bagel_type", "protein"}
+
+    def test_category_filter(self):
+        """Test only the requested categories are reported."""
+        matcher = PhraseMatcher({"protein": {"bacon"}, "topping": {"tomato"}})
+        matches = matcher.find_all("bacon and tomato", categories=["topping"])
+        assert matches == [PhraseMatch(10, 16, "tomato", "topping")]
+
+    def test_phrases_are_lowercased(self):
+        """Test vocabulary entries are matched case-insensitively against lowercased text."""
+        matcher = PhraseMatcher({"cheese": {"American"}})
+        assert matcher.find_all("american cheese")[0].phrase == "american"
+
+    def test_suffix_phrases_found_via_failure_links(self):
+        """Test a phrase that is a suffix of a partial match is still found."""
+        matcher = PhraseMatcher({"spread": {"cream cheese", "am"}})
+        matches = matcher.find_all("cream am")
+        assert matches == [PhraseMatch(6, 8, "am", "spread")]
+
+    def test_empty_vocabulary(self):
+        """Test an empty matcher finds nothing."""
+        matcher = PhraseMatcher({})
+        assert len(matcher) == 0
+        assert matcher.find_all("anything at all") == []
+
+
+# =============================================================================
+# find_longest Tests
+# =============================================================================
+
+class TestPhraseMatcherFindLongest:
+    """Tests for PhraseMatcher.find_longest."""
+
+    def test_longest_match_wins(self):
+        """Test 'turkey bacon' is claimed instead of 'bacon'."""
+        matcher = PhraseMatcher({"protein": {"bacon", "turkey bacon"}})
+        assert matcher.find_longest("turkey bacon") == [
+            PhraseMatch(0, 12, "turkey bacon", "protein"),
+        ]
+
+    def test_category_priority(self):
+        """Test earlier categories claim spans before later ones."""
+        matcher = PhraseMatcher({
+            "spread": {"cream cheese"},
+            "cheese": {"cheese"},
+        })
+        selected = matcher.find_longest("cream cheese", categories=["spread", "cheese"])
+        assert [m.phrase for m in selected] == ["cream cheese"]
+
+        selected = matcher.find_longest("cream cheese", categories=["cheese", "spread"])
+        assert [m.phrase for m in selected] == ["cheese"]
+
+    def test_blocked_spans(self):
+        """Test blocked spans cannot be claimed."""
+        matcher = PhraseMatcher({"topping": {"onion"}})
+        assert matcher.find_longest("onion bagel", blocked=[(0, 5)]) == []
+
+    def test_claim_order_is_longest_then_position(self):
+        """Test claimed matches come back longest first, then by position."""
+        matcher = PhraseMatcher({"protein": {"ham", "bacon", "egg"}})
+        selected = matcher.find_longest("ham egg and bacon")
+        assert [m.phrase for m in selected] == ["bacon", "ham", "egg"]
+
+    def test_reuses_precomputed_matches(self):
+        """Test a find_all result can be shared between selections."""
+        matcher = PhraseMatcher({"protein": {"bacon"}, "qualifier": {"extra"}})
+        matches = matcher.find_all("extra bacon")
+        qualifiers = matcher.find_longest("extra bacon", ["qualifier"], matches=matches)
+        proteins = matcher.find_longest("extra bacon", ["protein"], matches=matches)
+        assert [m.phrase for m in qualifiers] == ["extra"]
+        assert [m.phrase for m in proteins] == ["bacon"]
+
+    def test_membership_and_categories(self):
+        """Test phrase membership and per-category vocabularies."""
+        matcher = PhraseMatcher({"protein": {"bacon"}, "topping": {"tomato"}})
+        assert "bacon" in matcher
+        assert "lettuce" not in matcher
+        assert matcher.get_category("topping") == frozenset({"tomato"})
+        assert matcher.get_category("unknown") == frozenset()
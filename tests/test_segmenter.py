@@ -0,0 +1,77 @@
+"""
+Tests for the multi-item order segmenter.
+"""
+
+from sandwich_bot.menu_data_cache import _build_item_phrase_matcher
+from sandwich_bot.phrase_matcher import PhraseMatcher
+from sandwich_bot.tasks.parsers.parsed_text import ParsedText
+from sandwich_bot.tasks.parsers.segmenter import segment_order, tag_message
+
+
+ITEM_MATCHER = _build_item_phrase_matcher(
+    coffee_types=["latte", "cappuccino"],
+    item_names=["the lexington", "lexington"],
+    coffee_modifiers=["Oat Milk", "Vanilla Syrup"],
+)
+MODIFIER_MATCHER = PhraseMatcher({
+    "spread": ["cream cheese", "butter", "lox"],
+    "protein": ["bacon"],
+    "topping": ["mayo", "mustard", "ketchup"],
+    "bagel_type": ["plain", "everything", "sesame"],
+})
+
+
+def segments(text: str) -> list[str]:
+    parsed = ParsedText(text)
+    return [segment.text for segment in segment_order(parsed, ITEM_MATCHER, MODIFIER_MATCHER)]
+
+
+class TestTagMessage:
+    """Tests for longest-first span tagging."""
+
+    def test_longest_span_wins(self):
+        """Test "oat milk" is one tag rather than "oat" and "milk"."""
+        tags = tag_message(ParsedText("latte with oat milk"), ITEM_MATCHER, MODIFIER_MATCHER)
+        assert [tag.phrase for tag in tags] == ["latte", "oat milk"]
+
+    def test_span_keeps_every_category(self):
+        """Test a phrase in several vocabularies carries all of them."""
+        tags = tag_message(ParsedText("milk"), ITEM_MATCHER)
+        assert {"drink", "coffee_modifier"} <= tags[0].categories
+
+
+class TestSegmentOrder:
+    """Tests for splitting a message into one segment per item."""
+
+    def test_long_phone_order(self):
+        """Test each item gets its own segment with its modifiers."""
+        assert segments("two everything bagels with lox, a large iced oat latte and a dozen plain") == [
+            "two everything bagels with lox", "a large iced oat latte", "a dozen plain",
+        ]
+
+    def test_drink_modifiers_stay_with_drink(self):
+        """Test milks and sweeteners after "and" do not start an item."""
+        assert segments("large latte with oat milk and 2 sugars") == ["large latte with oat milk and 2 sugars"]
+        assert segments("coffee with half and half and a muffin") == ["coffee with half and half", "a muffin"]
+
+    def test_food_modifiers_stay_with_food(self):
+        """Test comma-separated spreads and toasting stay on the bagel."""
+        assert segments("pumpernickel bagel, butter, not toasted please") == [
+            "pumpernickel bagel, butter, not toasted please",
+        ]
+        assert segments("the lexington with mayo, mustard and ketchup") == [
+            "the lexington with mayo, mustard and ketchup",
+        ]
+
+    def test_item_after_modifier_splits(self):
+        """Test an item head after a separator always starts a segment."""
+        assert segments("coffee with milk and a bagel") == ["coffee with milk", "a bagel"]
+        assert segments("plain bagel and sesame bagel") == ["plain bagel", "sesame bagel"]
+
+    def test_drink_does_not_take_food_modifiers(self):
+        """Test a spread after a drink is its own segment."""
+        assert segments("a latte and cream cheese") == ["a latte", "cream cheese"]
+
+    def test_unknown_words_split(self):
+        """Test text the vocabularies do not cover is kept as its own part."""
+        assert segments("the lexington and a knish") == ["the lexington", "a knish"]
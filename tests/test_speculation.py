@@ -0,0 +1,144 @@
+"""
+Tests for the speculative LLM fallback of open input.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from sandwich_bot.tasks.parsers import speculation
+from sandwich_bot.tasks.parsers.speculation import (
+    get_speculation_stats,
+    predict_llm_fallback,
+    reset_speculation_stats,
+    run_speculative,
+    run_speculative_async,
+)
+
+VAGUE_INPUT = "something for my kid, she likes whatever is sweet and maybe chocolatey, nothing spicy"
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    reset_speculation_stats()
+    yield
+    reset_speculation_stats()
+
+
+class TestPrediction:
+    """Tests for predict_llm_fallback."""
+
+    def test_vocabulary_input_scores_low(self):
+        """Test a short order in menu words is not predicted to fall back."""
+        prediction = predict_llm_fallback("plain bagel with cream cheese")
+        assert prediction.unknown_words == 0
+        assert prediction.coverage == 1.0
+        assert prediction.score < 0.2
+
+    def test_vague_input_scores_high(self):
+        """Test a long input with many unknown words is predicted to fall back."""
+        prediction = predict_llm_fallback(VAGUE_INPUT)
+        assert prediction.unknown_words >= 3
+        assert prediction.score >= 0.5
+
+
+class TestRunSpeculative:
+    """Tests for the sync speculative runner."""
+
+    def test_deterministic_result_wins(self):
+        """Test a deterministic result is returned and the early call counted as extra."""
+        started = threading.Event()
+
+        def fallback():
+            started.set()
+            return "llm"
+
+        assert run_speculative(VAGUE_INPUT, lambda: "parsed", fallback, threshold=0.0) == "parsed"
+        stats = get_speculation_stats()
+        assert (stats["speculated"], stats["wasted"], stats["hits"]) == (1, 1, 0)
+        assert stats["extra_call_rate"] == 1.0
+
+    def test_fallback_overlaps_parsing(self):
+        """Test the LLM call runs while deterministic parsing does and its time is hidden."""
+        llm_started = threading.Event()
+
+        def deterministic():
+            assert llm_started.wait(timeout=5), "LLM call should start before parsing ends"
+            time.sleep(0.01)
+            return None
+
+        def fallback():
+            llm_started.set()
+            time.sleep(0.02)
+            return "llm"
+
+        assert run_speculative(VAGUE_INPUT, deterministic, fallback, threshold=0.0) == "llm"
+        stats = get_speculation_stats()
+        assert (stats["speculated"], stats["hits"], stats["precision"]) == (1, 1, 1.0)
+        assert stats["hidden_ms_total"] > 0
+
+    def test_below_threshold_runs_in_sequence(self):
+        """Test unlikely fallbacks don't start the LLM and count as missed when needed."""
+        calls = []
+
+        def fallback():
+            calls.append("llm")
+            return "llm"
+
+        assert run_speculative("plain bagel", lambda: "parsed", fallback, threshold=0.9) == "parsed"
+        assert calls == []
+        assert run_speculative("plain bagel", lambda: None, fallback, threshold=0.9) == "llm"
+        stats = get_speculation_stats()
+        assert (stats["calls"], stats["speculated"], stats["missed"]) == (2, 0, 1)
+        assert stats["recall"] == 0.0
+
+    def test_parse_open_input_uses_configured_threshold(self, monkeypatch):
+        """Test parse_open_input speculates according to OPEN_INPUT_SPECULATION_THRESHOLD."""
+        from sandwich_bot.tasks.parsers import llm_parsers
+
+        monkeypatch.setattr(speculation, "OPEN_INPUT_SPECULATION_THRESHOLD", 0.0)
+        monkeypatch.setattr(llm_parsers, "_try_open_input_deterministic", lambda *a, **k: None)
+        monkeypatch.setattr(llm_parsers, "_complete", lambda prompt, model_cls, model, **kwargs: "llm")
+        assert llm_parsers.parse_open_input(VAGUE_INPUT) == "llm"
+        assert get_speculation_stats()["hits"] == 1
+
+
+class TestRunSpeculativeAsync:
+    """Tests for the async speculative runner."""
+
+    def test_unneeded_request_is_cancelled(self):
+        """Test the in-flight request is cancelled when parsing succeeds."""
+        cancelled = []
+
+        async def fallback():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return "llm"
+
+        def deterministic():
+            time.sleep(0.01)  # lets the request start
+            return "parsed"
+
+        async def run():
+            result = await run_speculative_async(VAGUE_INPUT, deterministic, fallback, threshold=0.0)
+            await asyncio.sleep(0)
+            return result
+
+        assert asyncio.run(run()) == "parsed"
+        assert cancelled == [True]
+        assert get_speculation_stats()["wasted"] == 1
+
+    def test_awaits_request_when_parsing_fails(self):
+        """Test the already running request answers when parsing fails."""
+        async def fallback():
+            await asyncio.sleep(0.01)
+            return "llm"
+
+        result = asyncio.run(run_speculative_async(VAGUE_INPUT, lambda: None, fallback, threshold=0.0))
+        assert result == "llm"
+        assert get_speculation_stats()["hits"] == 1
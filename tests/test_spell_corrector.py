@@ -0,0 +1,73 @@
+"""
+Tests for the menu-vocabulary spell corrector.
+"""
+
+import pytest
+
+from sandwich_bot.spell_corrector import SpellCorrector
+
+
+@pytest.fixture(scope="module")
+def corrector():
+    return SpellCorrector([
+        "everything", "sesame", "pumpernickel", "wheat", "lime",
+        "scallion cream cheese", "cappuccino", "espresso", "latte",
+        "bacon", "turkey bacon", "sprite", "bell pepper", "nova lox",
+    ])
+
+
+class TestSpellCorrector:
+    """Tests for near-miss correction and the words it must leave alone."""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("everthing bagel", "everything bagel"),
+        ("a capuccino", "a cappuccino"),
+        ("scallion cream chese", "scallion cream cheese"),
+        ("turkey bacn", "turkey bacon"),
+        ("expresso", "espresso"),
+        ("pumpernickle", "pumpernickel"),
+    ])
+    def test_corrects_near_misses(self, corrector, text, expected):
+        assert corrector.correct(text) == expected
+
+    def test_keeps_leading_capital_and_other_words(self, corrector):
+        assert corrector.correct("Turkey Bacn, toasted!") == "Turkey Bacon, toasted!"
+
+    def test_short_words_only_corrected_within_a_phrase(self, corrector):
+        assert corrector.correct_word("sesme") == "sesame"
+        assert corrector.correct("sesme") == "sesme"
+        assert corrector.correct("bell peper") == "bell pepper"
+
+    @pytest.mark.parametrize("text", [
+        "what do you have",  # "what" is one edit from "wheat"
+        "I like it",         # "like" is one edit from "lime"
+        "two lattes",        # plural of a known word
+        "a tea",             # too short to correct
+        "a mocha",           # not near anything in the vocabulary
+    ])
+    def test_leaves_known_and_unrelated_words(self, corrector, text):
+        assert corrector.correct(text) == text
+
+    @pytest.mark.parametrize("text", [
+        "i live on main street",  # "live" is one edit from "lime"
+        "i said bacon",
+        "i want two teas",
+        "the bill please",        # "bill" is one edit from "bell"
+        "noah",                   # a customer name, near "nova"
+    ])
+    def test_leaves_everyday_replies(self, corrector, text):
+        assert corrector.correct(text) == text
+
+    def test_requires_matching_first_letter(self, corrector):
+        assert corrector.correct_word("esame") is None
+
+    def test_long_words_allow_two_edits(self, corrector):
+        assert corrector.correct_word("capucino") == "cappuccino"
+        # Short words only allow one
+        assert corrector.correct_word("bcn") is None
+        assert corrector.correct_word("latee") == "latte"
+
+    def test_ambiguous_corrections_are_skipped(self):
+        corrector = SpellCorrector(["bacon", "baron"])
+        assert corrector.correct_word("bacon") is None
+        assert corrector.correct_word("bason") is None
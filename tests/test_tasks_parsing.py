@@ -2896,3 +2896,169 @@ class TestAddModifierToItem:
             modifiers_lower = [m.lower() for m in result.modify_add_modifiers]
             assert "american cheese" not in modifiers_lower, \
                 f"American Cheese should not match 'cc' (cream cheese): {result.modify_add_modifiers}"
+
+
+class TestModifierQualifierExtraction:
+    """Tests for extract_modifiers_with_qualifiers (single-pass matcher)."""
+
+    def test_qualifier_before_modifier(self):
+        """Test 'extra bacon' attaches the qualifier to bacon."""
+        from sandwich_bot.tasks.parsers.deterministic import extract_modifiers_with_qualifiers
+        modifiers, conflicts = extract_modifiers_with_qualifiers("extra bacon", {"bacon"})
+        assert len(modifiers) == 1
+        assert "bacon" in modifiers[0].lower()
+        assert "(extra)" in modifiers[0]
+        assert conflicts is None
+
+    def test_longest_qualifier_wins(self):
+        """Test 'a little bit of' is not also matched as 'a little' (no self-conflict)."""
+        from sandwich_bot.tasks.parsers.deterministic import extract_modifiers_with_qualifiers
+        modifiers, conflicts = extract_modifiers_with_qualifiers("a little bit of bacon", {"bacon"})
+        assert len(modifiers) == 1
+        assert conflicts is None
+
+    def test_conflicting_amount_qualifiers(self):
+        """Test 'light extra bacon' reports the conflict in reading order."""
+        from sandwich_bot.tasks.parsers.deterministic import extract_modifiers_with_qualifiers
+        _, conflicts = extract_modifiers_with_qualifiers("light extra bacon", {"bacon"})
+        assert conflicts is not None
+        _, first, second = conflicts[0]
+        assert (first, second) == ("light", "extra")
+
+    def test_modifier_outside_menu_vocabulary(self):
+        """Test modifiers not in the menu cache are still matched."""
+        from sandwich_bot.tasks.parsers.deterministic import extract_modifiers_with_qualifiers
+        modifiers, _ = extract_modifiers_with_qualifiers("extra zzqux", {"zzqux"})
+        assert modifiers == ["zzqux (extra)"]
+
+
+class TestMenuPatternRegistry:
+    """Tests for menu-driven patterns compiled by the pattern registry."""
+
+    def test_patterns_compiled_for_current_menu_version(self):
+        """Test load_from_db compiles the registry for the loaded menu version."""
+        from sandwich_bot.menu_data_cache import menu_cache
+        from sandwich_bot.pattern_registry import pattern_registry
+        assert menu_cache.menu_version is not None
+        assert pattern_registry.menu_version == menu_cache.menu_version
+
+    def test_coffee_order_pattern_from_registry(self):
+        """Test the coffee order pattern is served from the registry."""
+        from sandwich_bot.pattern_registry import pattern_registry
+        from sandwich_bot.tasks.parsers.deterministic import _get_coffee_order_pattern
+        assert _get_coffee_order_pattern() is pattern_registry.get("coffee_order")
+        assert _get_coffee_order_pattern().search("i'd like a large iced latte")
+
+    def test_signature_item_bagel_choice(self):
+        """Test signature items pick up the bagel type from precompiled patterns."""
+        from sandwich_bot.tasks.parsers.deterministic import _parse_signature_item_deterministic
+        result = _parse_signature_item_deterministic("bec on an everything bagel")
+        assert result is not None
+        assert result.new_signature_item_bagel_choice == "everything"
+
+
+class TestAbbreviationExpansion:
+    """Tests for single-pass abbreviation expansion."""
+
+    def test_combined_pattern_prefers_longest(self):
+        """Test the combined alternation matches longer abbreviations first."""
+        from sandwich_bot.menu_data_cache import MenuDataCache
+        abbreviations = {"cc": "cream cheese", "scc": "scallion cream cheese"}
+        pattern = MenuDataCache._build_abbreviation_pattern(abbreviations)
+        expanded = pattern.sub(lambda m: abbreviations[m.group(0).lower()], "scc and CC")
+        assert expanded == "scallion cream cheese and cream cheese"
+
+    def test_combined_pattern_respects_word_boundaries(self):
+        """Test abbreviations inside words are not expanded."""
+        from sandwich_bot.menu_data_cache import MenuDataCache
+        pattern = MenuDataCache._build_abbreviation_pattern({"cc": "cream cheese"})
+        assert pattern.search("success") is None
+
+    def test_no_abbreviations(self):
+        """Test no pattern is built when there are no abbreviations."""
+        from sandwich_bot.menu_data_cache import MenuDataCache
+        assert MenuDataCache._build_abbreviation_pattern({}) is None
+
+    def test_expand_cream_cheese_abbreviation(self):
+        """Test 'cc' expands through the menu cache's precompiled pattern."""
+        from sandwich_bot.menu_data_cache import menu_cache
+        assert menu_cache.expand_abbreviations("strawberry cc") == "strawberry cream cheese"
+        assert menu_cache.expand_abbreviations("success") == "success"
+
+
+class TestParserDispatchGates:
+    """Tests for keyword-gated sub-parser dispatch in parse_open_input_deterministic."""
+
+    def test_egg_cheese_gate_covers_every_abbreviation(self):
+        """Test every egg-and-cheese abbreviation contains one of its gate triggers."""
+        from sandwich_bot.tasks.parsers.deterministic import (
+            EGG_CHEESE_SANDWICH_ABBREVS,
+            PARSER_GATES,
+            get_parsed_text,
+        )
+        gate = PARSER_GATES["egg_cheese_abbrev"]
+        for abbrev in EGG_CHEESE_SANDWICH_ABBREVS:
+            assert gate.is_candidate(get_parsed_text(abbrev)), abbrev
+
+    def test_word_triggers_respect_word_boundaries(self):
+        """Test word triggers match whole tokens only."""
+        from sandwich_bot.tasks.parsers.deterministic import PARSER_GATES, get_parsed_text
+        gate = PARSER_GATES["split_quantity_bagels"]
+        assert gate.is_candidate(get_parsed_text("two bagels, one toasted"))
+        assert not gate.is_candidate(get_parsed_text("bagelry special"))
+
+    def test_precheck_receives_parser_args(self):
+        """Test prechecks see the same extra arguments as the parser."""
+        from sandwich_bot.tasks.parsers.deterministic import PARSER_GATES, get_parsed_text
+        gate = PARSER_GATES["ingredient_search"]
+        parsed = get_parsed_text("chicken")
+        assert not gate.is_candidate(parsed, None)
+        assert gate.is_candidate(parsed, {"chicken": [{"name": "Chicken Salad Sandwich"}]})
+
+    def test_skips_and_hits_are_counted(self):
+        """Test the router records skipped and hitting sub-parsers."""
+        from sandwich_bot.tasks.parsers.deterministic import (
+            get_dispatch_stats,
+            parse_open_input_deterministic,
+            reset_dispatch_stats,
+        )
+        reset_dispatch_stats()
+        result = parse_open_input_deterministic("how much is a bagel?")
+        assert result is not None and result.asks_about_price
+
+        stats = get_dispatch_stats()
+        assert stats["price_inquiry"] == {"runs": 1, "skips": 0, "hits": 1}
+        # Parsers after the hit are never reached
+        assert stats["multi_item"] == {"runs": 0, "skips": 0, "hits": 0}
+
+        reset_dispatch_stats()
+        parse_open_input_deterministic("everything bagel toasted")
+        stats = get_dispatch_stats()
+        assert stats["price_inquiry"]["skips"] == 1
+        assert stats["multi_item"]["skips"] == 1
+
+    def test_gated_dispatch_matches_ungated_results(self):
+        """Test gating does not change which parser wins."""
+        from sandwich_bot.tasks.parsers import deterministic
+        inputs = [
+            "two bagels one with lox one with cream cheese",
+            "plain bagel with bacon and egg",
+            "a coffee and a bagel",
+            "what's in the health nut?",
+            "half a pound of whitefish salad",
+            "add bacon",
+            "add another coffee",
+            "do you deliver to 10001?",
+            "what do you recommend?",
+        ]
+        gated = [deterministic.parse_open_input_deterministic(text) for text in inputs]
+
+        original_gates = deterministic.PARSER_GATES.copy()
+        try:
+            for name in deterministic.PARSER_GATES:
+                deterministic.PARSER_GATES[name] = deterministic.ParserGate()
+            ungated = [deterministic.parse_open_input_deterministic(text) for text in inputs]
+        finally:
+            deterministic.PARSER_GATES.update(original_gates)
+
+        assert gated == ungated